@@ -16,6 +16,8 @@ class BrowserSearchPlugin(interface.AnalysisPlugin):
 
   NAME = 'browser_search'
 
+  PARTITIONABLE = True
+
   _EVENT_TAG_LABELS = ['browser_search']
 
   _SUPPORTED_EVENT_DATA_TYPES = frozenset([
@@ -323,5 +325,33 @@ class BrowserSearchPlugin(interface.AnalysisPlugin):
       lookup_key = ':'.join([engine, search_query])
       self._analysis_counter[lookup_key] += 1
 
+  def ReducePartitions(self, partition_reports, partition_results):
+    """Reduces the reports and analysis results of the partitions.
+
+    Args:
+      partition_reports (list[AnalysisReport]): reports of the partitions.
+      partition_results (list[BrowserSearchAnalysisResult]): analysis results
+          of the partitions.
+
+    Returns:
+      tuple[AnalysisReport, list[BrowserSearchAnalysisResult]]: report and
+          analysis results of all the events, where the report is None if none
+          of the partitions produced a report.
+    """
+    analysis_results_per_query = {}
+    for analysis_result in partition_results:
+      lookup_key = (analysis_result.search_engine, analysis_result.search_term)
+
+      existing_analysis_result = analysis_results_per_query.get(
+          lookup_key, None)
+      if existing_analysis_result:
+        existing_analysis_result.number_of_queries += (
+            analysis_result.number_of_queries)
+      else:
+        analysis_results_per_query[lookup_key] = analysis_result
+
+    return super(BrowserSearchPlugin, self).ReducePartitions(
+        partition_reports, list(analysis_results_per_query.values()))
+
 
 manager.AnalysisPluginManager.RegisterPlugin(BrowserSearchPlugin)
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 """Analysis plugin to gather information about Chrome extensions."""
 
+import collections
 import re
 
 import requests
@@ -16,6 +17,8 @@ class ChromeExtensionPlugin(interface.AnalysisPlugin):
 
   NAME = 'chrome_extension'
 
+  PARTITIONABLE = True
+
   _SUPPORTED_EVENT_DATA_TYPES = frozenset([
       'fs:stat'])
 
@@ -186,5 +189,46 @@ class ChromeExtensionPlugin(interface.AnalysisPlugin):
     if extension_tuple not in self._extensions_per_user[username]:
       self._extensions_per_user[username].append(extension_tuple)
 
+  def ReducePartitions(self, partition_reports, partition_results):
+    """Reduces the reports and analysis results of the partitions.
+
+    The same extension can be found in multiple partitions, therefore
+    the analysis results are deduplicated and the number of extensions per
+    user is determined from the deduplicated analysis results.
+
+    Args:
+      partition_reports (list[AnalysisReport]): reports of the partitions.
+      partition_results (list[ChromeExtensionAnalysisResult]): analysis results
+          of the partitions.
+
+    Returns:
+      tuple[AnalysisReport, list[ChromeExtensionAnalysisResult]]: report and
+          analysis results of all the events, where the report is None if none
+          of the partitions produced a report.
+    """
+    analysis_results_per_extension = {}
+    for analysis_result in partition_results:
+      lookup_key = (
+          analysis_result.username, analysis_result.extension,
+          analysis_result.extension_identifier)
+      analysis_results_per_extension.setdefault(lookup_key, analysis_result)
+
+    reduced_results = [
+        analysis_result for _, analysis_result in sorted(
+            analysis_results_per_extension.items())]
+
+    analysis_report, reduced_results = super(
+        ChromeExtensionPlugin, self).ReducePartitions(
+            partition_reports, reduced_results)
+
+    if analysis_report:
+      analysis_counter = collections.Counter()
+      for analysis_result in reduced_results:
+        analysis_counter[analysis_result.username] += 1
+
+      analysis_report.analysis_counter = analysis_counter
+
+    return analysis_report, reduced_results
+
 
 manager.AnalysisPluginManager.RegisterPlugin(ChromeExtensionPlugin)
@@ -4,6 +4,7 @@
 import abc
 import collections
 import time
+import zlib
 
 import requests
 
@@ -41,6 +42,10 @@ class HashTaggingAnalysisPlugin(interface.AnalysisPlugin):
   # must override this attribute.
   DATA_TYPES = []
 
+  # Events are partitioned by lookup hash, so that every hash is looked up
+  # by a single instance of the plugin.
+  PARTITIONABLE = True
+
   # Lookup hashes supported by the hash tagging analysis plugin.
   SUPPORTED_HASHES = frozenset([])
 
@@ -243,6 +248,39 @@ class HashTaggingAnalysisPlugin(interface.AnalysisPlugin):
 
       time.sleep(self._wait_after_analysis)
 
+  def GetEventPartition(
+      self, event_number, event, event_data, event_data_stream,
+      number_of_partitions):
+    """Determines the partition of an event.
+
+    Events with the same lookup hash are assigned to the same partition.
+
+    Args:
+      event_number (int): number of the event in the order the events are
+          analyzed, starting with 0.
+      event (EventObject): event.
+      event_data (EventData): event data.
+      event_data_stream (EventDataStream): event data stream.
+      number_of_partitions (int): number of partitions.
+
+    Returns:
+      int: index of the partition, which is 0 or greater and less than
+          the number of partitions.
+    """
+    lookup_hash = None
+    if self._lookup_hash and event_data_stream:
+      lookup_hash = getattr(
+          event_data_stream, f'{self._lookup_hash:s}_hash', None)
+
+    if not lookup_hash:
+      return super(HashTaggingAnalysisPlugin, self).GetEventPartition(
+          event_number, event, event_data, event_data_stream,
+          number_of_partitions)
+
+    # Note that hash() is not used since it is not deterministic between
+    # processes.
+    return zlib.crc32(lookup_hash.encode('utf-8')) % number_of_partitions
+
   def SetLookupHash(self, lookup_hash):
     """Sets the hash to query.
 
@@ -21,6 +21,12 @@ class AnalysisPlugin(object):
   # explains the nature of the plugin easily. It also needs to be unique.
   NAME = 'analysis_plugin'
 
+  # Flag to indicate the plugin analyzes every event independently of other
+  # events, so that multiple instances of the plugin can analyze disjoint
+  # partitions of the events. The reports and analysis results of
+  # the instances are combined by ReducePartitions.
+  PARTITIONABLE = False
+
   # Flag to indicate the analysis is for testing purposes only.
   TEST_PLUGIN = False
 
@@ -96,3 +102,60 @@ class AnalysisPlugin(object):
       event_data (EventData): event data.
       event_data_stream (EventDataStream): event data stream.
     """
+
+  # pylint: disable=unused-argument
+  def GetEventPartition(
+      self, event_number, event, event_data, event_data_stream,
+      number_of_partitions):
+    """Determines the partition of an event.
+
+    By default the events are distributed round-robin over the partitions.
+    The partition must be deterministic, since every process that reads
+    all the events must determine the same partition.
+
+    Args:
+      event_number (int): number of the event in the order the events are
+          analyzed, starting with 0.
+      event (EventObject): event.
+      event_data (EventData): event data.
+      event_data_stream (EventDataStream): event data stream.
+      number_of_partitions (int): number of partitions.
+
+    Returns:
+      int: index of the partition, which is 0 or greater and less than
+          the number of partitions.
+    """
+    return event_number % number_of_partitions
+
+  def ReducePartitions(self, partition_reports, partition_results):
+    """Reduces the reports and analysis results of the partitions.
+
+    By default the analysis counters of the reports of the partitions are
+    summed and the analysis results are kept as-is.
+
+    Args:
+      partition_reports (list[AnalysisReport]): reports of the partitions.
+      partition_results (list[AttributeContainer]): analysis results of
+          the partitions.
+
+    Returns:
+      tuple[AnalysisReport, list[AttributeContainer]]: report and analysis
+          results of all the events, where the report is None if none of
+          the partitions produced a report.
+    """
+    if not partition_reports:
+      return None, partition_results
+
+    analysis_counter = collections.Counter()
+    for partition_report in partition_reports:
+      analysis_counter.update(partition_report.analysis_counter or {})
+
+    time_compiled = max(
+        partition_report.time_compiled or 0
+        for partition_report in partition_reports)
+
+    analysis_report = partition_reports[0]
+    analysis_report.analysis_counter = analysis_counter
+    analysis_report.time_compiled = time_compiled
+
+    return analysis_report, partition_results
@@ -11,6 +11,8 @@ class TaggingAnalysisPlugin(interface.AnalysisPlugin):
 
   NAME = 'tagging'
 
+  PARTITIONABLE = True
+
   def __init__(self):
     """Initializes a tagging analysis plugin."""
     super(TaggingAnalysisPlugin, self).__init__()
@@ -19,6 +19,10 @@ class VirusTotalAnalysisPlugin(hash_tagging.HashTaggingAnalysisPlugin):
 
   NAME = 'virustotal'
 
+  # The VirusTotal API rate limits the requests per API key, which multiple
+  # instances of the plugin would exceed.
+  PARTITIONABLE = False
+
   SUPPORTED_HASHES = frozenset(['md5', 'sha1', 'sha256'])
 
   _EICAR_SHA256 = (
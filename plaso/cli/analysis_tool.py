@@ -45,7 +45,9 @@ class AnalysisTool(
     self._command_line_arguments = None
     self._event_filter_expression = None
     self._event_filter = None
+    self._number_of_analysis_partitions = None
     self._number_of_stored_analysis_reports = 0
+    self._shared_memory_events = False
     self._status_view_interval = 0.5
     self._storage_file_path = None
     self._worker_memory_limit = None
@@ -75,6 +77,8 @@ class AnalysisTool(
 
     # TODO: add single process analysis engine support.
     analysis_engine = multi_analysis_engine.AnalysisMultiProcessEngine(
+        number_of_partitions=self._number_of_analysis_partitions,
+        use_event_broadcast=self._shared_memory_events,
         worker_memory_limit=self._worker_memory_limit,
         worker_timeout=self._worker_timeout)
 
@@ -34,9 +34,11 @@ from plaso.helpers import language_tags
 from plaso.lib import definitions
 from plaso.lib import errors
 from plaso.multi_process import extraction_engine as multi_extraction_engine
+from plaso.multi_process import worker_node_engine
 from plaso.parsers import manager as parsers_manager
 from plaso.parsers import presets as parsers_presets
 from plaso.storage import factory as storage_factory
+from plaso.storage.fake import writer as fake_writer
 
 
 class ExtractionTool(
@@ -85,10 +87,13 @@ class ExtractionTool(
     self._artifacts_registry = None
     self._buffer_size = 0
     self._command_line_arguments = None
+    self._enable_checkpoints = False
     self._enable_sigsegv_handler = False
     self._expanded_parser_filter_expression = None
     self._extract_winevt_resources = True
     self._extract_winreg_binary = True
+    self._incremental_mode = None
+    self._memory_budget = None
     self._number_of_extraction_workers = 0
     self._parser_filter_expression = None
     self._preferred_codepage = None
@@ -100,7 +105,10 @@ class ExtractionTool(
     self._process_compressed_streams = True
     self._process_memory_limit = None
     self._queue_size = self._DEFAULT_QUEUE_SIZE
+    self._redis_url = None
     self._resolver_context = dfvfs_context.Context()
+    self._resume = False
+    self._shared_memory_status = False
     self._single_process_mode = False
     self._status_view = status_view.StatusView(self._output_writer, self.NAME)
     self._status_view_file = 'status.info'
@@ -108,9 +116,15 @@ class ExtractionTool(
     self._status_view_mode = status_view.StatusView.MODE_WINDOW
     self._storage_file_path = None
     self._storage_format = definitions.STORAGE_FORMAT_SQLITE
+    self._task_storage_directory = None
     self._task_storage_format = definitions.STORAGE_FORMAT_SQLITE
     self._temporary_directory = None
+    self._winevtx_xml_templates = False
     self._worker_memory_limit = None
+    self._worker_node_hostname = None
+    self._worker_node_port = None
+    self._worker_nodes_address = None
+    self._worker_nodes_port = None
     self._worker_timeout = None
     self._yara_rules_string = None
 
@@ -164,11 +178,27 @@ class ExtractionTool(
     if single_process_mode:
       extraction_engine = single_extraction_engine.SingleProcessEngine(
           status_update_callback=status_update_callback)
+
+    elif self._worker_node_hostname:
+      extraction_engine = worker_node_engine.ExtractionWorkerNodeEngine(
+          number_of_worker_processes=self._number_of_extraction_workers,
+          status_update_callback=status_update_callback,
+          use_status_board=self._shared_memory_status,
+          worker_memory_limit=self._worker_memory_limit,
+          worker_timeout=self._worker_timeout)
+
     else:
+      # Extraction checkpoints are opt-in since writing a checkpoint commits
+      # the session storage. A resumed session continues to write them.
       extraction_engine = multi_extraction_engine.ExtractionMultiProcessEngine(
+          enable_checkpoints=self._enable_checkpoints or self._resume,
+          memory_budget=self._memory_budget,
           number_of_worker_processes=self._number_of_extraction_workers,
           status_update_callback=status_update_callback,
+          use_status_board=self._shared_memory_status,
           worker_memory_limit=self._worker_memory_limit,
+          worker_nodes_address=self._worker_nodes_address,
+          worker_nodes_port=self._worker_nodes_port,
           worker_timeout=self._worker_timeout)
 
     extraction_engine.SetStatusUpdateInterval(self._status_view_interval)
@@ -197,6 +227,8 @@ class ExtractionTool(
     configuration.extraction.hasher_names_string = self._hasher_names_string
     configuration.extraction.process_compressed_streams = (
         self._process_compressed_streams)
+    configuration.extraction.winevtx_xml_templates = (
+        self._winevtx_xml_templates)
     configuration.extraction.yara_rules_string = self._yara_rules_string
     configuration.filter_file = self._filter_file
     configuration.log_filename = self._log_file
@@ -209,6 +241,8 @@ class ExtractionTool(
     configuration.profiling.directory = self._profiling_directory
     configuration.profiling.sample_rate = self._profiling_sample_rate
     configuration.profiling.profilers = self._profilers
+    configuration.redis_url = self._redis_url
+    configuration.task_storage_directory = self._task_storage_directory
     configuration.task_storage_format = self._task_storage_format
     configuration.temporary_directory = self._temporary_directory
 
@@ -244,6 +278,33 @@ class ExtractionTool(
 
     return f'{datetime_string:s}-{source_name:s}.plaso'
 
+  def _GetResumableSession(self, storage_writer):
+    """Retrieves the session to resume.
+
+    Args:
+      storage_writer (StorageWriter): storage writer.
+
+    Returns:
+      Session: last session in the storage, which was not completed.
+
+    Raises:
+      BadConfigOption: if the storage has no session that can be resumed.
+    """
+    session = None
+    for session in storage_writer.GetSessions():
+      pass
+
+    if not session:
+      raise errors.BadConfigOption(
+          f'Storage file: {self._storage_file_path:s} contains no session.')
+
+    if session.completion_time and not session.aborted:
+      raise errors.BadConfigOption((
+          f'Unable to resume session: {session.identifier:s} that was '
+          f'already completed.'))
+
+    return session
+
   def _GetExpandedParserFilterExpression(self, system_configuration):
     """Determines the expanded parser filter expression.
 
@@ -371,11 +432,20 @@ class ExtractionTool(
     self._single_process_mode = getattr(options, 'single_process', False)
 
     argument_helper_names = [
-        'process_resources', 'temporary_directory', 'vfs_backend', 'workers',
-        'zeromq']
+        'process_resources', 'temporary_directory', 'vfs_backend',
+        'worker_nodes', 'workers', 'zeromq']
     helpers_manager.ArgumentHelperManager.ParseOptions(
         options, self, names=argument_helper_names)
 
+    if self._worker_node_hostname or self._worker_nodes_port:
+      if self._single_process_mode:
+        raise errors.BadConfigOption(
+            'Worker nodes are not supported in single process mode.')
+
+      if self._task_storage_format != definitions.STORAGE_FORMAT_REDIS:
+        raise errors.BadConfigOption(
+            'Worker nodes require the redis task storage format.')
+
     if self._vfs_back_end == 'fsext':
       dfvfs_definitions.PREFERRED_EXT_BACK_END = (
           dfvfs_definitions.TYPE_INDICATOR_EXT)
@@ -438,13 +508,25 @@ class ExtractionTool(
 
     # If the source is a directory or a storage media image run pre-processing.
 
+    # When resuming a session the preprocessing results were already stored
+    # and preprocessing is only run to rebuild the knowledge base.
+    preprocess_storage_writer = storage_writer
+    if self._resume:
+      preprocess_storage_writer = fake_writer.FakeStorageWriter()
+      preprocess_storage_writer.Open()
+
     system_configurations = []
     if self._source_type in self._SOURCE_TYPES_TO_PREPROCESS:
       try:
         logger.debug('Starting preprocessing.')
 
+        number_of_worker_processes = 1
+        if not single_process_mode:
+          number_of_worker_processes = self._number_of_extraction_workers
+
         system_configurations = extraction_engine.PreprocessSource(
-            self._file_system_path_specs, storage_writer,
+            self._file_system_path_specs, preprocess_storage_writer,
+            number_of_worker_processes=number_of_worker_processes,
             resolver_context=self._resolver_context)
 
         logger.debug('Preprocessing done.')
@@ -520,15 +602,17 @@ class ExtractionTool(
     session.preferred_time_zone = self._preferred_time_zone
     session.preferred_year = self._preferred_year
 
-    storage_writer.AddAttributeContainer(session)
+    if not self._resume:
+      storage_writer.AddAttributeContainer(session)
 
     processing_status = None
 
     try:
-      storage_writer.AddAttributeContainer(source_configuration)
+      if not self._resume:
+        storage_writer.AddAttributeContainer(source_configuration)
 
-      for system_configuration in system_configurations:
-        storage_writer.AddAttributeContainer(system_configuration)
+        for system_configuration in system_configurations:
+          storage_writer.AddAttributeContainer(system_configuration)
 
       if single_process_mode:
         logger.debug('Starting extraction in single process mode.')
@@ -537,6 +621,16 @@ class ExtractionTool(
             storage_writer, self._resolver_context, processing_configuration,
             system_configurations, self._file_system_path_specs)
 
+      elif self._worker_node_hostname:
+        logger.debug((
+            f'Starting extraction as worker node of: '
+            f'{self._worker_node_hostname:s}:{self._worker_node_port:d}.'))
+
+        processing_status = extraction_engine.ProcessTasksMulti(
+            storage_writer, processing_configuration, system_configurations,
+            self._worker_node_hostname, self._worker_node_port,
+            enable_sigsegv_handler=self._enable_sigsegv_handler)
+
       else:
         logger.debug('Starting extraction in multi process mode.')
 
@@ -547,6 +641,7 @@ class ExtractionTool(
             storage_writer, session.identifier, processing_configuration,
             system_configurations, self._file_system_path_specs,
             enable_sigsegv_handler=self._enable_sigsegv_handler,
+            incremental_mode=self._incremental_mode, resume=self._resume,
             storage_file_path=self._storage_file_path)
 
     finally:
@@ -685,7 +780,8 @@ class ExtractionTool(
             'Indicate that the tool should run in a single process.'))
 
     argument_helper_names = [
-        'temporary_directory', 'vfs_backend', 'workers', 'zeromq']
+        'temporary_directory', 'vfs_backend', 'worker_nodes', 'workers',
+        'zeromq']
     if self._CanEnforceProcessMemoryLimit():
       argument_helper_names.append('process_resources')
     helpers_manager.ArgumentHelperManager.AddCommandLineArguments(
@@ -704,13 +800,32 @@ class ExtractionTool(
           file system.
       UserAbort: if the user initiated an abort.
     """
-    self._CheckStorageFile(self._storage_file_path, warn_about_existing=True)
+    # A worker node stores the task results in the Redis task storage of
+    # the main (foreman) process instead of a storage file.
+    if not self._worker_node_hostname:
+      self._CheckStorageFile(
+          self._storage_file_path,
+          warn_about_existing=not (self._incremental_mode or self._resume))
 
     try:
       self.ScanSource(self._source_path)
     except dfvfs_errors.UserAbort as exception:
       raise errors.UserAbort(exception)
 
+    if self._resume and self._source_type == dfvfs_definitions.SOURCE_TYPE_FILE:
+      raise errors.BadConfigOption(
+          'Unable to resume a session of a single file source.')
+
+    if (self._incremental_mode and
+        self._source_type == dfvfs_definitions.SOURCE_TYPE_FILE):
+      raise errors.BadConfigOption(
+          'Incremental extraction of a single file source is not supported.')
+
+    if ((self._worker_node_hostname or self._worker_nodes_port) and
+        self._source_type == dfvfs_definitions.SOURCE_TYPE_FILE):
+      raise errors.BadConfigOption(
+          'Worker nodes do not support a single file source.')
+
     if self._source_type == dfvfs_definitions.SOURCE_TYPE_FILE:
       archive_path_spec = self._ScanSourceForArchive(
           self._file_system_path_specs[0])
@@ -729,14 +844,14 @@ class ExtractionTool(
     self._status_view.PrintExtractionStatusHeader(None)
     self._output_writer.Write('Processing started.\n')
 
-    # TODO: attach processing configuration to session?
-    session = engine.BaseEngine.CreateSession()
-
-    storage_writer = storage_factory.StorageFactory.CreateStorageWriter(
-        self._storage_format)
-    if not storage_writer:
-      raise errors.BadConfigOption(
-          f'Unsupported storage format: {self._storage_format:s}')
+    if self._worker_node_hostname:
+      storage_writer = fake_writer.FakeStorageWriter()
+    else:
+      storage_writer = storage_factory.StorageFactory.CreateStorageWriter(
+          self._storage_format)
+      if not storage_writer:
+        raise errors.BadConfigOption(
+            f'Unsupported storage format: {self._storage_format:s}')
 
     try:
       storage_writer.Open(path=self._storage_file_path)
@@ -747,6 +862,12 @@ class ExtractionTool(
     number_of_extraction_warnings = 0
 
     try:
+      if self._resume:
+        session = self._GetResumableSession(storage_writer)
+      else:
+        # TODO: attach processing configuration to session?
+        session = engine.BaseEngine.CreateSession()
+
       stored_number_of_extraction_warnings = (
           storage_writer.GetNumberOfAttributeContainers('extraction_warning'))
 
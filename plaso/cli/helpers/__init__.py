@@ -37,4 +37,5 @@ from plaso.cli.helpers import virustotal_analysis
 from plaso.cli.helpers import xlsx_output
 from plaso.cli.helpers import yara_rules
 from plaso.cli.helpers import vfs_backend
+from plaso.cli.helpers import worker_nodes
 from plaso.cli.helpers import workers
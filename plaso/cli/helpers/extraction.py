@@ -44,6 +44,15 @@ class ExtractionArgumentsHelper(interface.ArgumentsHelper):
             'Skip processing file content within compressed streams, such as '
             'syslog.gz and syslog.bz2.'))
 
+    argument_group.add_argument(
+        '--winevtx_xml_templates', '--winevtx-xml-templates',
+        dest='winevtx_xml_templates', action='store_true', default=False,
+        help=(
+            'Store the XML representation of Windows XML EventLog (EVTX) '
+            'records as a deduplicated XML template and substitution values '
+            'instead of a XML string. This reduces the size of the storage '
+            'file, where the XML string is rendered on output.'))
+
   @classmethod
   def ParseOptions(cls, options, configuration_object):
     """Parses and validates options.
@@ -65,12 +74,15 @@ class ExtractionArgumentsHelper(interface.ArgumentsHelper):
     extract_winreg_binary = getattr(options, 'extract_winreg_binary', False)
     process_compressed_streams = getattr(
         options, 'process_compressed_streams', True)
+    winevtx_xml_templates = getattr(options, 'winevtx_xml_templates', False)
 
     setattr(configuration_object, '_extract_winreg_binary',
             extract_winreg_binary)
     setattr(configuration_object, '_preferred_year', preferred_year)
     setattr(configuration_object, '_process_compressed_streams',
             process_compressed_streams)
+    setattr(configuration_object, '_winevtx_xml_templates',
+            winevtx_xml_templates)
 
 
 manager.ArgumentHelperManager.RegisterHelper(ExtractionArgumentsHelper)
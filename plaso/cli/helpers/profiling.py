@@ -26,7 +26,8 @@ class ProfilingArgumentsHelper(interface.ArgumentsHelper):
       'serializers': 'Profile CPU time of serialization',
       'storage': 'Profile storage reads and writes',
       'task_queue': 'Profile task queue status (multi-processing only)',
-      'tasks': 'Profile the status of tasks (multi-processing only)'}
+      'tasks': 'Profile the status of tasks (multi-processing only)',
+      'trace': 'Trace processing phases of all processes in Chrome format'}
 
   @classmethod
   def AddArguments(cls, argument_group):
@@ -1,6 +1,8 @@
 # -*- coding: utf-8 -*-
 """The storage format CLI arguments helper."""
 
+import os
+
 from plaso.cli import tools
 from plaso.cli.helpers import interface
 from plaso.cli.helpers import manager
@@ -28,6 +30,13 @@ class StorageFormatArgumentsHelper(interface.ArgumentsHelper):
     session_storage_formats = sorted(definitions.SESSION_STORAGE_FORMATS)
     task_storage_formats = sorted(definitions.TASK_STORAGE_FORMATS)
 
+    argument_group.add_argument(
+        '--redis_url', '--redis-url', action='store', dest='redis_url',
+        type=str, metavar='URL', default=None, help=(
+            'URL of the Redis database used for the redis task storage, for '
+            'example: redis://host:6379/0. The default is the Redis database '
+            'on the local host.'))
+
     storage_formats_string = ', '.join(session_storage_formats)
     argument_group.add_argument(
         '--storage_format', '--storage-format', action='store',
@@ -37,6 +46,15 @@ class StorageFormatArgumentsHelper(interface.ArgumentsHelper):
             f'{definitions.DEFAULT_STORAGE_FORMAT:s}. Supported options: '
             f'{storage_formats_string:s}'))
 
+    argument_group.add_argument(
+        '--task_storage_directory', '--task-storage-directory',
+        action='store', dest='task_storage_directory', type=str,
+        metavar='DIRECTORY', default=None, help=(
+            'Directory in which to create the sqlite task storage, for '
+            'example a RAM-backed file system such as /dev/shm. The default '
+            'is the directory of the storage file, which is also used if '
+            'the task storage directory has less than 1 GiB of free space.'))
+
     storage_formats_string = ', '.join(task_storage_formats)
     argument_group.add_argument(
         '--task_storage_format', '--task-storage-format', action='store',
@@ -58,7 +76,9 @@ class StorageFormatArgumentsHelper(interface.ArgumentsHelper):
     Raises:
       BadConfigObject: when the configuration object is of the wrong type.
       BadConfigOption: if the storage format or task storage is not defined
-          or supported.
+          or supported, if a Redis URL is specified without the redis task
+          storage format or if the task storage directory does not exist or
+          is specified without the sqlite task storage format.
     """
     if not isinstance(configuration_object, tools.CLITool):
       raise errors.BadConfigObject(
@@ -82,6 +102,25 @@ class StorageFormatArgumentsHelper(interface.ArgumentsHelper):
       raise errors.BadConfigOption(
           f'Unsupported task storage format: {task_storage_format:s}')
 
+    redis_url = cls._ParseStringOption(options, 'redis_url')
+    if redis_url and task_storage_format != definitions.STORAGE_FORMAT_REDIS:
+      raise errors.BadConfigOption(
+          'Redis URL requires the redis task storage format.')
+
+    task_storage_directory = cls._ParseStringOption(
+        options, 'task_storage_directory')
+    if task_storage_directory:
+      if task_storage_format != definitions.STORAGE_FORMAT_SQLITE:
+        raise errors.BadConfigOption(
+            'Task storage directory requires the sqlite task storage format.')
+
+      if not os.path.isdir(task_storage_directory):
+        raise errors.BadConfigOption(
+            f'No such task storage directory: {task_storage_directory:s}')
+
+    setattr(configuration_object, '_redis_url', redis_url)
+    setattr(
+        configuration_object, '_task_storage_directory', task_storage_directory)
     setattr(configuration_object, '_task_storage_format', task_storage_format)
 
 
@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+"""The worker nodes CLI arguments helper."""
+
+from plaso.cli import tools
+from plaso.cli.helpers import interface
+from plaso.cli.helpers import manager
+from plaso.lib import errors
+
+
+class WorkerNodesArgumentsHelper(interface.ArgumentsHelper):
+  """Worker nodes CLI arguments helper."""
+
+  NAME = 'worker_nodes'
+  DESCRIPTION = 'Worker nodes command line arguments.'
+
+  _DEFAULT_WORKER_NODES_ADDRESS = '127.0.0.1'
+
+  @classmethod
+  def _ParseWorkerNode(cls, worker_node):
+    """Parses a worker node option.
+
+    Args:
+      worker_node (str): hostname and TCP port of the task queue of the main
+          (foreman) process, formatted as HOST:PORT.
+
+    Returns:
+      tuple[str, int]: hostname and TCP port.
+
+    Raises:
+      BadConfigOption: if the worker node option is invalid.
+    """
+    hostname, _, port_string = worker_node.rpartition(':')
+
+    try:
+      port = int(port_string, 10)
+    except ValueError:
+      port = 0
+
+    if not hostname or port < 1 or port > 65535:
+      raise errors.BadConfigOption(
+          f'Invalid worker node: {worker_node:s}, expected HOST:PORT.')
+
+    return hostname, port
+
+  @classmethod
+  def AddArguments(cls, argument_group):
+    """Adds command line arguments to an argument group.
+
+    This function takes an argument parser or an argument group object and adds
+    to it all the command line arguments this helper supports.
+
+    Args:
+      argument_group (argparse._ArgumentGroup|argparse.ArgumentParser):
+          argparse group.
+    """
+    argument_group.add_argument(
+        '--worker_node', '--worker-node', dest='worker_node', action='store',
+        type=str, metavar='HOST:PORT', help=(
+            'Run as a worker node of the main (foreman) process on another '
+            'host, of which the task queue is available at HOST:PORT. The '
+            'worker processes store the task results in the Redis task '
+            'storage. The source must be available by the same path as on '
+            'the host of the main (foreman) process. The tasks received from '
+            'HOST:PORT are unpickled, hence only connect to a trusted host.'))
+
+    argument_group.add_argument(
+        '--worker_nodes_address', '--worker-nodes-address',
+        dest='worker_nodes_address', action='store', type=str,
+        metavar='ADDRESS', default=None, help=(
+            'IP address of the interface on which the main (foreman) process '
+            'accepts worker processes of worker nodes. The default is '
+            f'{cls._DEFAULT_WORKER_NODES_ADDRESS:s}, which only accepts worker '
+            'nodes that connect through a tunnel, such as SSH port '
+            'forwarding.'))
+
+    argument_group.add_argument(
+        '--worker_nodes_port', '--worker-nodes-port', dest='worker_nodes_port',
+        action='store', type=int, metavar='PORT', help=(
+            'TCP port on which the main (foreman) process accepts worker '
+            'processes of worker nodes on other hosts, in addition to its own '
+            'worker processes. Worker nodes require the Redis task storage. '
+            'The connection between the main (foreman) process and the worker '
+            'nodes is neither authenticated nor encrypted and tasks are sent '
+            'as pickled objects, hence worker nodes must only be used on a '
+            'trusted network.'))
+
+  @classmethod
+  def ParseOptions(cls, options, configuration_object):
+    """Parses and validates options.
+
+    Args:
+      options (argparse.Namespace): parser options.
+      configuration_object (CLITool): object to be configured by the argument
+          helper.
+
+    Raises:
+      BadConfigObject: when the configuration object is of the wrong type.
+      BadConfigOption: when a configuration parameter fails validation.
+    """
+    if not isinstance(configuration_object, tools.CLITool):
+      raise errors.BadConfigObject(
+          'Configuration object is not an instance of CLITool')
+
+    worker_node = cls._ParseStringOption(options, 'worker_node')
+    worker_nodes_address = cls._ParseStringOption(
+        options, 'worker_nodes_address')
+    worker_nodes_port = cls._ParseNumericOption(options, 'worker_nodes_port')
+
+    if worker_node and worker_nodes_port:
+      raise errors.BadConfigOption(
+          'Worker node and worker nodes port options are mutually exclusive.')
+
+    if worker_nodes_address and not worker_nodes_port:
+      raise errors.BadConfigOption(
+          'Worker nodes address option requires the worker nodes port option.')
+
+    if worker_nodes_port and not worker_nodes_address:
+      worker_nodes_address = cls._DEFAULT_WORKER_NODES_ADDRESS
+
+    worker_node_hostname = None
+    worker_node_port = None
+    if worker_node:
+      worker_node_hostname, worker_node_port = cls._ParseWorkerNode(
+          worker_node)
+
+    if worker_nodes_port is not None and (
+        worker_nodes_port < 1 or worker_nodes_port > 65535):
+      raise errors.BadConfigOption(
+          f'Invalid worker nodes port: {worker_nodes_port!s}.')
+
+    setattr(configuration_object, '_worker_node_hostname', worker_node_hostname)
+    setattr(configuration_object, '_worker_node_port', worker_node_port)
+    setattr(
+        configuration_object, '_worker_nodes_address', worker_nodes_address)
+    setattr(configuration_object, '_worker_nodes_port', worker_nodes_port)
+
+
+manager.ArgumentHelperManager.RegisterHelper(WorkerNodesArgumentsHelper)
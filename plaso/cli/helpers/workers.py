@@ -24,6 +24,23 @@ class WorkersArgumentsHelper(interface.ArgumentsHelper):
       argument_group (argparse._ArgumentGroup|argparse.ArgumentParser):
           argparse group.
     """
+    argument_group.add_argument(
+        '--memory_budget', '--memory-budget', dest='memory_budget',
+        action='store', type=int, metavar='SIZE', help=(
+            'Maximum amount of memory in bytes that the tasks scheduled to '
+            'the worker processes are predicted to consume, where 0 '
+            'represents no budget. The default is no budget. A task is '
+            'deferred by the main (foreman) process until its predicted '
+            'memory usage fits in the budget.'))
+
+    argument_group.add_argument(
+        '--shared_memory_status', '--shared-memory-status',
+        dest='shared_memory_status', action='store_true', default=False,
+        help=(
+            'Have the worker processes report their status to the main '
+            '(foreman) process via shared memory instead of XML-RPC. XML-RPC '
+            'is used as fallback if shared memory is not available.'))
+
     argument_group.add_argument(
         '--worker_memory_limit', '--worker-memory-limit',
         dest='worker_memory_limit', action='store', type=int,
@@ -71,6 +88,14 @@ class WorkersArgumentsHelper(interface.ArgumentsHelper):
       raise errors.BadConfigOption(
           'Invalid number of extraction workers value cannot be less than 0.')
 
+    memory_budget = cls._ParseNumericOption(options, 'memory_budget')
+
+    if memory_budget and memory_budget < 0:
+      raise errors.BadConfigOption(
+          'Invalid memory budget value cannot be less than 0.')
+
+    shared_memory_status = getattr(options, 'shared_memory_status', False)
+
     worker_memory_limit = cls._ParseNumericOption(
         options, 'worker_memory_limit')
 
@@ -84,9 +109,11 @@ class WorkersArgumentsHelper(interface.ArgumentsHelper):
       raise errors.BadConfigOption(
           'Invalid worker timeout value must be larger than 0.0 minutes.')
 
+    setattr(configuration_object, '_memory_budget', memory_budget)
     setattr(
         configuration_object, '_number_of_extraction_workers',
         number_of_extraction_workers)
+    setattr(configuration_object, '_shared_memory_status', shared_memory_status)
     setattr(configuration_object, '_worker_memory_limit', worker_memory_limit)
     setattr(configuration_object, '_worker_timeout', worker_timeout)
 
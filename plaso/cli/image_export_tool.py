@@ -7,7 +7,10 @@ import collections
 import io
 import json
 import os
+import queue
+import tempfile
 import textwrap
+import threading
 
 from dfvfs.lib import definitions as dfvfs_definitions
 from dfvfs.lib import errors as dfvfs_errors
@@ -28,6 +31,113 @@ from plaso.lib import specification
 from plaso.storage.fake import writer as fake_writer
 
 
+class ExportedDigestIndex(object):
+  """Index of the digest hashes of exported data streams.
+
+  The index is stored in a file with a JSON object per line that is appended
+  to as data streams are processed. This allows an export that was interrupted
+  to be restarted without exporting the same content again.
+
+  Attributes:
+    exported_digests (dict[str, str]): display names of the exported data
+        streams, keyed by their digest hash.
+    paths_by_digest (dict[str, list[str]]): relative paths of the data streams
+        read from an existing index file, keyed by their digest hash.
+  """
+
+  def __init__(self):
+    """Initializes a digest index."""
+    super(ExportedDigestIndex, self).__init__()
+    self._file_object = None
+
+    self.exported_digests = {}
+    self.paths_by_digest = collections.defaultdict(list)
+
+  def _ReadEntries(self, path):
+    """Reads the entries of an existing index file.
+
+    Lines that cannot be read, such as a partially written last line, are
+    ignored.
+
+    Args:
+      path (str): path of the index file.
+    """
+    with open(path, 'r', encoding='utf-8') as file_object:
+      for line in file_object:
+        try:
+          json_dict = json.loads(line)
+          digest = json_dict['sha256']
+          display_name = json_dict['display_name']
+          exported = json_dict['exported']
+          path = json_dict['path']
+        except (KeyError, TypeError, ValueError):
+          logger.warning(f'[skipping] invalid digest index entry: {line!r}')
+          continue
+
+        self.paths_by_digest[digest].append(path)
+        if exported and digest not in self.exported_digests:
+          self.exported_digests[digest] = display_name
+
+  def AddEntry(self, digest, display_name, path, exported):
+    """Adds an entry to the index.
+
+    Args:
+      digest (str): hexadecimal representation of the SHA-256 hash of the
+          content of the data stream.
+      display_name (str): display name of the source of the data stream.
+      path (str): path of the data stream relative to the export destination.
+      exported (bool): True if the data stream was exported, False if it was
+          skipped, for example because it is a duplicate.
+
+    Raises:
+      IOError: if the index is not opened.
+      OSError: if the index is not opened.
+    """
+    if not self._file_object:
+      raise IOError('Digest index not opened.')
+
+    json_string = json.dumps({
+        'display_name': display_name,
+        'exported': exported,
+        'path': path,
+        'sha256': digest})
+
+    self._file_object.write(f'{json_string:s}\n')
+    self._file_object.flush()
+
+  def Close(self):
+    """Closes the index.
+
+    Raises:
+      IOError: if the index is not opened.
+      OSError: if the index is not opened.
+    """
+    if not self._file_object:
+      raise IOError('Digest index not opened.')
+
+    self._file_object.close()
+    self._file_object = None
+
+  def Open(self, path):
+    """Opens the index.
+
+    Args:
+      path (str): path of the index file, where entries of an existing file
+          are read and new entries are appended.
+
+    Raises:
+      IOError: if the index is already opened.
+      OSError: if the index is already opened.
+    """
+    if self._file_object:
+      raise IOError('Digest index already opened.')
+
+    if os.path.exists(path):
+      self._ReadEntries(path)
+
+    self._file_object = open(path, 'a', encoding='utf-8')  # pylint: disable=consider-using-with
+
+
 class ImageExportTool(storage_media_tool.StorageMediaTool):
   """Class that implements the image export CLI tool.
 
@@ -50,6 +160,12 @@ class ImageExportTool(storage_media_tool.StorageMediaTool):
 
   _HASHES_FILENAME = 'hashes.json'
 
+  # Maximum number of path specifications queued per worker thread.
+  _MAXIMUM_QUEUED_PER_WORKER = 64
+
+  _PARTIAL_FILE_PREFIX = '.image_export-'
+  _PARTIAL_FILE_SUFFIX = '.partial'
+
   _READ_BUFFER_SIZE = 4096
 
   # TODO: remove this redirect.
@@ -80,16 +196,21 @@ class ImageExportTool(storage_media_tool.StorageMediaTool):
     self._artifacts_registry = None
     self._custom_artifacts_path = None
     self._destination_path = None
+    self._digest_index = None
+    self._digest_index_path = None
     self._digests = {}
     self._enable_artifacts_map = False
     self._filter_collection = file_entry_filters.FileEntryFilterCollection()
     self._filter_file = None
+    self._lock = threading.Lock()
     self._no_hashes = False
+    self._number_of_workers = 0
     self._path_spec_extractor = extractors.PathSpecExtractor()
     self._process_memory_limit = None
     self._paths_by_hash = collections.defaultdict(list)
     self._resolver_context = context.Context()
     self._skip_duplicates = True
+    self._target_path_events = {}
 
     self.has_filters = False
     self.list_signature_identifiers = False
@@ -110,14 +231,37 @@ class ImageExportTool(storage_media_tool.StorageMediaTool):
     if not file_object:
       return None
 
-    file_object.seek(0, os.SEEK_SET)
+    return self._CopyFileObject(file_object, None)
+
+  def _CopyFileObject(self, source_file_object, destination_file_object):
+    """Copies the contents of a file-like object and calculates its digest.
+
+    The SHA-256 digest is calculated while the data is copied so that the
+    source only needs to be read once.
+
+    Args:
+      source_file_object (dfvfs.FileIO): file-like object to read from.
+      destination_file_object (file): file-like object to write to or None if
+          the content should only be hashed.
+
+    Returns:
+      str: hexadecimal representation of the SHA-256 hash.
+    """
+    source_file_object.seek(0, os.SEEK_SET)
 
     hasher_object = hashers_manager.HashersManager.GetHasher('sha256')
 
-    data = file_object.read(self._READ_BUFFER_SIZE)
+    if destination_file_object:
+      read_buffer_size = self._COPY_BUFFER_SIZE
+    else:
+      read_buffer_size = self._READ_BUFFER_SIZE
+
+    data = source_file_object.read(read_buffer_size)
     while data:
       hasher_object.Update(data)
-      data = file_object.read(self._READ_BUFFER_SIZE)
+      if destination_file_object:
+        destination_file_object.write(data)
+      data = source_file_object.read(read_buffer_size)
 
     return hasher_object.GetStringDigest()
 
@@ -175,6 +319,11 @@ class ImageExportTool(storage_media_tool.StorageMediaTool):
       skip_duplicates=True):
     """Extracts a data stream.
 
+    The target path is claimed under the lock, so that only one thread
+    exports to it. The content of the data stream is written to a partial
+    file, while its digest is calculated, and moved to its target path when
+    the content is not a duplicate of previously exported content.
+
     Args:
       file_entry (dfvfs.FileEntry): file entry containing the data stream.
       data_stream_name (str): name of the data stream.
@@ -188,6 +337,54 @@ class ImageExportTool(storage_media_tool.StorageMediaTool):
     display_name = path_helper.PathHelper.GetDisplayNameForPathSpec(
         file_entry.path_spec)
 
+    target_directory, target_filename = self._CreateSanitizedDestination(
+        file_entry, file_entry.path_spec, data_stream_name, destination_path)
+    path = path_helper.PathHelper.GetRelativePath(
+        target_directory, target_filename, destination_path)
+    target_path = os.path.join(target_directory, target_filename)
+
+    while True:
+      with self._lock:
+        export_event = self._target_path_events.get(target_path, None)
+        if not export_event and not os.path.exists(target_path):
+          export_event = threading.Event()
+          self._target_path_events[target_path] = export_event
+          break
+
+      if not export_event:
+        self._ExtractDataStreamWithExistingTarget(
+            file_entry, data_stream_name, display_name, path, target_path,
+            skip_duplicates=skip_duplicates)
+        return
+
+      # Another thread has claimed the target path, wait for it to finish
+      # exporting before checking the target path again.
+      export_event.wait()
+
+    try:
+      self._ExtractDataStreamWithNewTarget(
+          file_entry, data_stream_name, display_name, path, destination_path,
+          target_directory, target_path, skip_duplicates=skip_duplicates)
+
+    finally:
+      with self._lock:
+        del self._target_path_events[target_path]
+      export_event.set()
+
+  def _ExtractDataStreamWithExistingTarget(
+      self, file_entry, data_stream_name, display_name, path, target_path,
+      skip_duplicates=True):
+    """Extracts a data stream for which the target path already exists.
+
+    Args:
+      file_entry (dfvfs.FileEntry): file entry containing the data stream.
+      data_stream_name (str): name of the data stream.
+      display_name (str): display name of the source of the data stream.
+      path (str): path of the data stream relative to the export destination.
+      target_path (str): path of the exported file.
+      skip_duplicates (Optional[bool]): True if files with duplicate content
+          should be skipped.
+    """
     try:
       digest = self._CalculateDigestHash(file_entry, data_stream_name)
     except (IOError, dfvfs_errors.BackEndError) as exception:
@@ -201,52 +398,100 @@ class ImageExportTool(storage_media_tool.StorageMediaTool):
           f'[skipping] unable to read content of file entry: {display_name:s}')
       return
 
-    target_directory, target_filename = self._CreateSanitizedDestination(
-        file_entry, file_entry.path_spec, data_stream_name, destination_path)
-    path = path_helper.PathHelper.GetRelativePath(
-        target_directory, target_filename, destination_path)
-    target_path = os.path.join(target_directory, target_filename)
-
-    self._paths_by_hash[digest].append(path)
+    if self._digest_index and path in self._digest_index.paths_by_digest.get(
+        digest, []):
+      logger.info((
+          f'[skipping] file entry: {display_name:s} was previously '
+          f'exported.'))
+      return
 
-    if skip_duplicates:
+    with self._lock:
       duplicate_display_name = self._digests.get(digest, None)
-      if duplicate_display_name:
-        logger.warning((
-            f'[skipping] file entry: {display_name:s} is a duplicate of: '
-            f'{duplicate_display_name:s} with digest: {digest:s}'))
-        return
-
-      self._digests[digest] = display_name
+      if not duplicate_display_name:
+        self._digests[digest] = display_name
 
-    if not os.path.isdir(target_directory):
-      os.makedirs(target_directory)
-
-    if os.path.exists(target_path):
+    if skip_duplicates and duplicate_display_name:
+      logger.warning((
+          f'[skipping] file entry: {display_name:s} is a duplicate of: '
+          f'{duplicate_display_name:s} with digest: {digest:s}'))
+    else:
       logger.warning((
           f'[skipping] unable to export contents of file entry: '
           f'{display_name:s} because exported file: {target_path:s} already '
           f'exists.'))
-      return
 
-    # Generate a map between artifacts and extracted paths.
-    if self._enable_artifacts_map:
-      for artifact_name in self._filter_collection.GetMatchingArtifacts(
-          path, os.sep):
-        path_list = self._artifacts_paths_map.setdefault(artifact_name, [])
-        path_list.append(path)
+    self._RegisterPath(digest, display_name, path, False)
+
+  def _ExtractDataStreamWithNewTarget(
+      self, file_entry, data_stream_name, display_name, path, destination_path,
+      target_directory, target_path, skip_duplicates=True):
+    """Extracts a data stream for which the target path has been claimed.
+
+    Args:
+      file_entry (dfvfs.FileEntry): file entry containing the data stream.
+      data_stream_name (str): name of the data stream.
+      display_name (str): display name of the source of the data stream.
+      path (str): path of the data stream relative to the export destination.
+      destination_path (str): path where the extracted files should be stored.
+      target_directory (str): directory of the exported file.
+      target_path (str): path of the exported file.
+      skip_duplicates (Optional[bool]): True if files with duplicate content
+          should be skipped.
+    """
+    partial_file_descriptor, partial_path = tempfile.mkstemp(
+        dir=destination_path, prefix=self._PARTIAL_FILE_PREFIX,
+        suffix=self._PARTIAL_FILE_SUFFIX)
+    os.close(partial_file_descriptor)
 
     try:
-      self._WriteFileEntry(file_entry, data_stream_name, target_path)
+      digest = self._WriteFileEntry(file_entry, data_stream_name, partial_path)
     except (IOError, dfvfs_errors.BackEndError) as exception:
       logger.error((
           f'[skipping] unable to export contents of file entry: '
           f'{display_name:s} with error: {exception!s}'))
+      self._RemovePartialFile(partial_path)
+      return
 
-      try:
-        os.remove(target_path)
-      except (IOError, OSError):
-        pass
+    if not digest:
+      logger.error(
+          f'[skipping] unable to read content of file entry: {display_name:s}')
+      self._RemovePartialFile(partial_path)
+      return
+
+    with self._lock:
+      duplicate_display_name = self._digests.get(digest, None)
+      is_duplicate = bool(skip_duplicates and duplicate_display_name)
+      if not is_duplicate:
+        self._digests.setdefault(digest, display_name)
+
+    if is_duplicate:
+      logger.warning((
+          f'[skipping] file entry: {display_name:s} is a duplicate of: '
+          f'{duplicate_display_name:s} with digest: {digest:s}'))
+      self._RemovePartialFile(partial_path)
+      self._RegisterPath(digest, display_name, path, False)
+      return
+
+    try:
+      os.makedirs(target_directory, exist_ok=True)
+      os.replace(partial_path, target_path)
+
+    except (IOError, OSError) as exception:
+      logger.error((
+          f'[skipping] unable to export contents of file entry: '
+          f'{display_name:s} with error: {exception!s}'))
+      self._RemovePartialFile(partial_path)
+      return
+
+    # Generate a map between artifacts and extracted paths.
+    if self._enable_artifacts_map:
+      with self._lock:
+        for artifact_name in self._filter_collection.GetMatchingArtifacts(
+            path, os.sep):
+          path_list = self._artifacts_paths_map.setdefault(artifact_name, [])
+          path_list.append(path)
+
+    self._RegisterPath(digest, display_name, path, True)
 
   def _ExtractFileEntry(
       self, file_entry, destination_path, skip_duplicates=True):
@@ -276,6 +521,78 @@ class ImageExportTool(storage_media_tool.StorageMediaTool):
       self._ExtractDataStream(
           file_entry, '', destination_path, skip_duplicates=skip_duplicates)
 
+  def _ExtractPathSpec(
+      self, path_spec, destination_path, excluded_paths_scan_tree,
+      resolver_context, skip_duplicates=True):
+    """Extracts the file entry of a path specification.
+
+    Args:
+      path_spec (dfvfs.PathSpec): path specification of the file entry.
+      destination_path (str): path where the extracted files should be stored.
+      excluded_paths_scan_tree (PathFilterScanTree): scan tree of paths to
+          exclude from the export or None if not available.
+      resolver_context (dfvfs.Context): resolver context.
+      skip_duplicates (Optional[bool]): True if files with duplicate content
+          should be skipped.
+    """
+    file_entry = path_spec_resolver.Resolver.OpenFileEntry(
+        path_spec, resolver_context=resolver_context)
+
+    if not file_entry:
+      path_spec_string = self._GetPathSpecificationString(path_spec)
+      logger.warning((
+          f'Unable to open file entry for path specfication: '
+          f'{path_spec_string:s}'))
+      return
+
+    location = getattr(file_entry.path_spec, 'location', None)
+    if excluded_paths_scan_tree and location:
+      file_system = file_entry.GetFileSystem()
+      path_segments = file_system.SplitPath(location)
+      if excluded_paths_scan_tree.CheckPathSegments(path_segments):
+        logger.info(f'Skipped: {location:s} because of exclusion filter.')
+        return
+
+    self._ExtractFileEntry(
+        file_entry, destination_path, skip_duplicates=skip_duplicates)
+
+  def _ExtractThreadMain(
+      self, path_spec_queue, destination_path, excluded_paths_scan_tree,
+      skip_duplicates=True):
+    """Main function of a worker thread that extracts file entries.
+
+    Every worker thread uses its own resolver context, since a resolver
+    context cannot be shared between threads.
+
+    Args:
+      path_spec_queue (queue.Queue): queue of path specifications to extract,
+          where None indicates the end of the queue.
+      destination_path (str): path where the extracted files should be stored.
+      excluded_paths_scan_tree (PathFilterScanTree): scan tree of paths to
+          exclude from the export or None if not available.
+      skip_duplicates (Optional[bool]): True if files with duplicate content
+          should be skipped.
+    """
+    resolver_context = context.Context()
+
+    path_spec = path_spec_queue.get()
+    while path_spec:
+      if not self._abort:
+        try:
+          self._ExtractPathSpec(
+              path_spec, destination_path, excluded_paths_scan_tree,
+              resolver_context, skip_duplicates=skip_duplicates)
+
+        except Exception as exception:  # pylint: disable=broad-except
+          path_spec_string = self._GetPathSpecificationString(path_spec)
+          logger.error((
+              f'Unable to export file entry: {path_spec_string:s} with '
+              f'error: {exception!s}'))
+
+      path_spec = path_spec_queue.get()
+
+    resolver_context.Empty()
+
   # TODO: merge with collector and/or engine.
   def _Extract(
       self, file_system_path_specs, destination_path, output_writer,
@@ -322,6 +639,7 @@ class ImageExportTool(storage_media_tool.StorageMediaTool):
         # preprocessing information.
         system_configurations = extraction_engine.PreprocessSource(
             self._file_system_path_specs, storage_writer,
+            number_of_worker_processes=self._number_of_workers or 1,
             resolver_context=self._resolver_context)
 
         logger.debug('Preprocessing done.')
@@ -350,41 +668,54 @@ class ImageExportTool(storage_media_tool.StorageMediaTool):
       atrifacts_trie = extraction_engine.GetArtifactsTrie()
       self._filter_collection.SetArtifactsTrie(atrifacts_trie)
 
-    excluded_find_specs = extraction_engine.GetCollectionExcludedFindSpecs()
+    excluded_paths_scan_tree = (
+        extraction_engine.GetCollectionExcludedPathsScanTree())
+    if (excluded_paths_scan_tree and
+        not excluded_paths_scan_tree.number_of_paths):
+      excluded_paths_scan_tree = None
+
     included_find_specs = extraction_engine.GetCollectionIncludedFindSpecs()
 
     output_writer.Write('Extracting file entries.\n')
 
-    for file_system_path_spec in file_system_path_specs:
-      path_spec_generator = self._path_spec_extractor.ExtractPathSpecs(
-          file_system_path_spec, find_specs=included_find_specs,
-          resolver_context=self._resolver_context)
+    path_spec_queue = None
+    worker_threads = []
 
-      for path_spec in path_spec_generator:
-        file_entry = path_spec_resolver.Resolver.OpenFileEntry(
-            path_spec, resolver_context=self._resolver_context)
+    if self._number_of_workers > 1:
+      path_spec_queue = queue.Queue(
+          maxsize=self._number_of_workers * self._MAXIMUM_QUEUED_PER_WORKER)
 
-        if not file_entry:
-          path_spec_string = self._GetPathSpecificationString(path_spec)
-          logger.warning((
-              f'Unable to open file entry for path specfication: '
-              f'{path_spec_string:s}'))
-          continue
+      for _ in range(self._number_of_workers):
+        worker_thread = threading.Thread(
+            target=self._ExtractThreadMain, args=(
+                path_spec_queue, destination_path, excluded_paths_scan_tree),
+            kwargs={'skip_duplicates': skip_duplicates})
+        worker_thread.start()
+        worker_threads.append(worker_thread)
+
+    try:
+      for file_system_path_spec in file_system_path_specs:
+        path_spec_generator = self._path_spec_extractor.ExtractPathSpecs(
+            file_system_path_spec, find_specs=included_find_specs,
+            resolver_context=self._resolver_context)
 
-        skip_file_entry = False
-        for find_spec in excluded_find_specs or []:
-          skip_file_entry = find_spec.CompareLocation(file_entry)
-          if skip_file_entry:
+        for path_spec in path_spec_generator:
+          if self._abort:
             break
 
-        if skip_file_entry:
-          logger.info((
-              f'Skipped: {file_entry.path_spec.location:s} because of '
-              f'exclusion filter.'))
-          continue
+          if path_spec_queue:
+            path_spec_queue.put(path_spec)
+          else:
+            self._ExtractPathSpec(
+                path_spec, destination_path, excluded_paths_scan_tree,
+                self._resolver_context, skip_duplicates=skip_duplicates)
 
-        self._ExtractFileEntry(
-            file_entry, destination_path, skip_duplicates=skip_duplicates)
+    finally:
+      for _ in worker_threads:
+        path_spec_queue.put(None)
+
+      for worker_thread in worker_threads:
+        worker_thread.join()
 
   def _ParseExtensionsString(self, extensions_string):
     """Parses the extensions string.
@@ -485,6 +816,20 @@ class ImageExportTool(storage_media_tool.StorageMediaTool):
         specification_store, signature_identifiers)
     self._filter_collection.AddFilter(file_entry_filter)
 
+  def _ReadDigestIndex(self, path):
+    """Opens the digest index and reads the previously exported digests.
+
+    Args:
+      path (str): path of the digest index file.
+    """
+    self._digest_index = ExportedDigestIndex()
+    self._digest_index.Open(path)
+
+    for digest, paths in self._digest_index.paths_by_digest.items():
+      self._paths_by_hash[digest].extend(paths)
+
+    self._digests.update(self._digest_index.exported_digests)
+
   def _ReadSpecificationFile(self, path):
     """Reads the format specification file.
 
@@ -531,6 +876,37 @@ class ImageExportTool(storage_media_tool.StorageMediaTool):
 
     return specification_store
 
+  def _RegisterPath(self, digest, display_name, path, exported):
+    """Registers the path of a data stream with its digest.
+
+    Args:
+      digest (str): hexadecimal representation of the SHA-256 hash of the
+          content of the data stream.
+      display_name (str): display name of the source of the data stream.
+      path (str): path of the data stream relative to the export destination.
+      exported (bool): True if the data stream was exported.
+    """
+    if self._digest_index and path in self._digest_index.paths_by_digest.get(
+        digest, []):
+      return
+
+    with self._lock:
+      self._paths_by_hash[digest].append(path)
+
+      if self._digest_index:
+        self._digest_index.AddEntry(digest, display_name, path, exported)
+
+  def _RemovePartialFile(self, path):
+    """Removes a partially written file.
+
+    Args:
+      path (str): path of the partially written file.
+    """
+    try:
+      os.remove(path)
+    except (IOError, OSError):
+      pass
+
   def _WriteFileEntry(self, file_entry, data_stream_name, destination_file):
     """Writes the contents of the source file entry to a destination file.
 
@@ -541,19 +917,19 @@ class ImageExportTool(storage_media_tool.StorageMediaTool):
       data_stream_name (str): name of the data stream whose content is to be
           written.
       destination_file (str): path of the destination file.
+
+    Returns:
+      str: hexadecimal representation of the SHA-256 hash of the content that
+          was written or None if the content cannot be read.
     """
     source_file_object = file_entry.GetFileObject(
         data_stream_name=data_stream_name)
     if not source_file_object:
-      return
+      return None
 
     with open(destination_file, 'wb') as destination_file_object:
-      source_file_object.seek(0, os.SEEK_SET)
-
-      data = source_file_object.read(self._COPY_BUFFER_SIZE)
-      while data:
-        destination_file_object.write(data)
-        data = source_file_object.read(self._COPY_BUFFER_SIZE)
+      return self._CopyFileObject(
+          source_file_object, destination_file_object)
 
   def AddFilterOptions(self, argument_group):
     """Adds the filter options to the argument group.
@@ -660,6 +1036,15 @@ class ImageExportTool(storage_media_tool.StorageMediaTool):
         metavar='PATH', default='export', help=(
             'The directory in which extracted files should be stored.'))
 
+    argument_parser.add_argument(
+        '--digest_index', '--digest-index', dest='digest_index',
+        action='store', type=str, metavar='PATH', default=None, help=(
+            'Path of a file in which the digest hashes (SHA-256) of exported '
+            'files are recorded while exporting. If the file already exists '
+            'the digest hashes it contains are used to skip previously '
+            'exported content, which allows an interrupted export to be '
+            'restarted.'))
+
     argument_parser.add_argument(
         '--include_duplicates', '--include-duplicates',
         dest='include_duplicates', action='store_true', default=False, help=(
@@ -673,6 +1058,13 @@ class ImageExportTool(storage_media_tool.StorageMediaTool):
         default=False, help=(
             f'Do not generate the {self._HASHES_FILENAME:s} file'))
 
+    argument_parser.add_argument(
+        '--workers', dest='workers', action='store', type=int, default=0,
+        help=(
+            'Number of worker threads that export files in parallel. The '
+            'default is 0, which represents that files are exported by the '
+            'main thread.'))
+
     argument_parser.add_argument(
         self._SOURCE_OPTION, nargs='?', action='store', metavar='IMAGE',
         default=None, type=str, help=(
@@ -784,6 +1176,13 @@ class ImageExportTool(storage_media_tool.StorageMediaTool):
 
     self._no_hashes = getattr(options, 'no_hashes', False)
 
+    self._digest_index_path = self.ParseStringOption(options, 'digest_index')
+
+    self._number_of_workers = getattr(options, 'workers', None) or 0
+    if self._number_of_workers < 0:
+      raise errors.BadConfigOption(
+          'Invalid number of workers value cannot be less than 0.')
+
     self._EnforceProcessMemoryLimit(self._process_memory_limit)
 
     self._enable_artifacts_map = getattr(
@@ -817,11 +1216,20 @@ class ImageExportTool(storage_media_tool.StorageMediaTool):
     if not os.path.isdir(self._destination_path):
       os.makedirs(self._destination_path)
 
-    self._Extract(
-        self._file_system_path_specs, self._destination_path,
-        self._output_writer, self._artifact_filters, self._filter_file,
-        self._artifact_definitions_path, self._custom_artifacts_path,
-        skip_duplicates=self._skip_duplicates)
+    if self._digest_index_path:
+      self._ReadDigestIndex(self._digest_index_path)
+
+    try:
+      self._Extract(
+          self._file_system_path_specs, self._destination_path,
+          self._output_writer, self._artifact_filters, self._filter_file,
+          self._artifact_definitions_path, self._custom_artifacts_path,
+          skip_duplicates=self._skip_duplicates)
+
+    finally:
+      if self._digest_index:
+        self._digest_index.Close()
+        self._digest_index = None
 
     json_data = []
 
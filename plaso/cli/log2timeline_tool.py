@@ -2,6 +2,7 @@
 """The log2timeline CLI tool."""
 
 import argparse
+import os
 import sys
 import textwrap
 
@@ -119,6 +120,36 @@ class Log2TimelineTool(extraction_tool.ExtractionTool):
             'The path of the storage file. If not specified, one will be made '
             'in the form <timestamp>-<source>.plaso'))
 
+    argument_group.add_argument(
+        '--checkpoints', dest='enable_checkpoints', action='store_true',
+        default=False, help=(
+            'Write extraction checkpoints to the storage file, which allows '
+            'the session to be resumed with --resume when it is interrupted. '
+            'Writing a checkpoint commits the storage file, which slows down '
+            'extraction. Not supported in single process mode.'))
+
+    argument_group.add_argument(
+        '--incremental', dest='incremental_mode', nargs='?', type=str,
+        action='store', const=definitions.INCREMENTAL_MODE_METADATA,
+        default=None, choices=sorted(definitions.INCREMENTAL_MODES),
+        metavar='MODE', help=(
+            'Extract into an existing storage file and only process file '
+            'entries that were changed since a previous session in the '
+            'storage file. Supported modes are: "metadata", which compares '
+            'the size and modification time of file entries, and "digest", '
+            'which compares the SHA-256 digest hash of their content. '
+            'A changed file entry is extracted again in its entirety and '
+            'the events extracted from it by previous sessions are kept, '
+            'therefore the storage file contains the events of the unchanged '
+            'content of the file entry multiple times. Requires the storage '
+            'file to be specified.'))
+
+    argument_group.add_argument(
+        '--resume', dest='resume', action='store_true', default=False, help=(
+            'Resume the last session in the storage file, which was '
+            'interrupted, from its last extraction checkpoint. Requires '
+            'the storage file to be specified.'))
+
   def ParseArguments(self, arguments):
     """Parses the command line arguments.
 
@@ -311,6 +342,51 @@ class Log2TimelineTool(extraction_tool.ExtractionTool):
     if not self._storage_file_path:
       raise errors.BadConfigOption('Missing storage file option.')
 
+    self._enable_checkpoints = getattr(options, 'enable_checkpoints', False)
+    if self._enable_checkpoints and self._single_process_mode:
+      raise errors.BadConfigOption(
+          'Extraction checkpoints are not supported in single process mode.')
+
+    self._resume = getattr(options, 'resume', False)
+    if self._resume:
+      if not self.ParseStringOption(options, 'storage_file'):
+        raise errors.BadConfigOption(
+            'Missing storage file option to resume a session.')
+
+      if not os.path.isfile(self._storage_file_path):
+        raise errors.BadConfigOption((
+            f'Unable to resume a session, no such storage file: '
+            f'{self._storage_file_path:s}.'))
+
+      if self._single_process_mode:
+        raise errors.BadConfigOption(
+            'Unable to resume a session in single process mode.')
+
+    self._incremental_mode = getattr(options, 'incremental_mode', None)
+    if self._incremental_mode:
+      if self._incremental_mode not in definitions.INCREMENTAL_MODES:
+        raise errors.BadConfigOption(
+            f'Unsupported incremental mode: {self._incremental_mode:s}')
+
+      if not self.ParseStringOption(options, 'storage_file'):
+        raise errors.BadConfigOption(
+            'Missing storage file option for incremental extraction.')
+
+      if not os.path.isfile(self._storage_file_path):
+        raise errors.BadConfigOption((
+            f'Unable to extract incrementally, no such storage file: '
+            f'{self._storage_file_path:s}.'))
+
+      if self._single_process_mode:
+        raise errors.BadConfigOption(
+            'Incremental extraction is not supported in single process mode.')
+
+    if self._worker_node_hostname and (
+        self._enable_checkpoints or self._incremental_mode or self._resume):
+      raise errors.BadConfigOption((
+          'Extraction checkpoints, incremental extraction and resuming '
+          'a session are not supported by a worker node.'))
+
     serializer_format = getattr(
         options, 'serializer_format', definitions.SERIALIZER_FORMAT_JSON)
     if serializer_format not in definitions.SERIALIZER_FORMATS:
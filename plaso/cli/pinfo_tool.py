@@ -14,6 +14,7 @@ from plaso.cli import tool_options
 from plaso.cli import tools
 from plaso.cli import views
 from plaso.cli.helpers import manager as helpers_manager
+from plaso.containers import counts
 from plaso.containers import events
 from plaso.containers import event_sources
 from plaso.containers import reports
@@ -74,13 +75,17 @@ class PinfoTool(tools.CLITool, tool_options.StorageFileOptions):
   _SUPPORTED_OUTPUT_FORMATS = ('json', 'markdown', 'text')
 
   _CONTAINER_TYPE_ANALYSIS_REPORT = reports.AnalysisReport.CONTAINER_TYPE
+  _CONTAINER_TYPE_EVENT_DATA = events.EventData.CONTAINER_TYPE
   _CONTAINER_TYPE_EVENT_DATA_STREAM = events.EventDataStream.CONTAINER_TYPE
+  _CONTAINER_TYPE_EVENT_DATA_TYPE_COUNT = (
+      counts.EventDataTypeCount.CONTAINER_TYPE)
   _CONTAINER_TYPE_EVENT_SOURCE = event_sources.EventSource.CONTAINER_TYPE
   _CONTAINER_TYPE_EXTRACTION_WARNING = warnings.ExtractionWarning.CONTAINER_TYPE
   _CONTAINER_TYPE_PREPROCESSING_WARNING = (
       warnings.PreprocessingWarning.CONTAINER_TYPE)
   _CONTAINER_TYPE_RECOVERY_WARNING = warnings.RecoveryWarning.CONTAINER_TYPE
   _CONTAINER_TYPE_TIMELINING_WARNING = warnings.TimeliningWarning.CONTAINER_TYPE
+  _CONTAINER_TYPE_WARNING_COUNT = counts.WarningCount.CONTAINER_TYPE
 
   def __init__(self, input_reader=None, output_writer=None):
     """Initializes the CLI tool object.
@@ -144,63 +149,116 @@ class PinfoTool(tools.CLITool, tool_options.StorageFileOptions):
 
     storage_counters = {}
 
-    extraction_warnings_by_path_spec = collections.Counter()
-    extraction_warnings_by_parser_chain = collections.Counter()
+    event_data_types_counter = self._GetEventDataTypesCounter(storage_reader)
+    if event_data_types_counter is not None:
+      storage_counters['event_data_types'] = event_data_types_counter
 
-    for warning in storage_reader.GetAttributeContainers(
-        self._CONTAINER_TYPE_EXTRACTION_WARNING):
-      path_spec_string = self._GetPathSpecificationString(warning.path_spec)
+    for container_type, warning_type in (
+        (self._CONTAINER_TYPE_EXTRACTION_WARNING, 'extraction'),
+        (self._CONTAINER_TYPE_RECOVERY_WARNING, 'recovery'),
+        (self._CONTAINER_TYPE_TIMELINING_WARNING, 'timelining')):
+      warnings_by_path_spec, warnings_by_parser_chain = (
+          self._GetWarningsCounters(storage_reader, container_type))
 
-      extraction_warnings_by_path_spec[path_spec_string] += 1
-      extraction_warnings_by_parser_chain[warning.parser_chain] += 1
+      storage_counters[f'{warning_type:s}_warnings_by_path_spec'] = (
+          warnings_by_path_spec)
+      storage_counters[f'{warning_type:s}_warnings_by_parser_chain'] = (
+          warnings_by_parser_chain)
 
-    storage_counters['extraction_warnings_by_path_spec'] = (
-        extraction_warnings_by_path_spec)
-    storage_counters['extraction_warnings_by_parser_chain'] = (
-        extraction_warnings_by_parser_chain)
+    if not analysis_reports_counter_error:
+      storage_counters['analysis_reports'] = analysis_reports_counter
 
-    recovery_warnings_by_path_spec = collections.Counter()
-    recovery_warnings_by_parser_chain = collections.Counter()
+    if not event_labels_counter_error:
+      storage_counters['event_labels'] = event_labels_counter
 
-    for warning in storage_reader.GetAttributeContainers(
-        self._CONTAINER_TYPE_RECOVERY_WARNING):
-      path_spec_string = self._GetPathSpecificationString(warning.path_spec)
+    if not parsers_counter_error:
+      storage_counters['parsers'] = parsers_counter
 
-      recovery_warnings_by_path_spec[path_spec_string] += 1
-      recovery_warnings_by_parser_chain[warning.parser_chain] += 1
+    return storage_counters
 
-    storage_counters['recovery_warnings_by_path_spec'] = (
-        recovery_warnings_by_path_spec)
-    storage_counters['recovery_warnings_by_parser_chain'] = (
-        recovery_warnings_by_parser_chain)
+  def _GetEventDataTypesCounter(self, storage_reader):
+    """Retrieves the number of event data per data type.
 
-    timelining_warnings_by_path_spec = collections.Counter()
-    timelining_warnings_by_parser_chain = collections.Counter()
+    Args:
+      storage_reader (StorageReader): storage reader.
 
-    if storage_reader.HasAttributeContainers(
-        self._CONTAINER_TYPE_TIMELINING_WARNING):
-      for warning in storage_reader.GetAttributeContainers(
-          self._CONTAINER_TYPE_TIMELINING_WARNING):
-        path_spec_string = self._GetPathSpecificationString(warning.path_spec)
+    Returns:
+      collections.Counter: number of event data per data type or None if
+          the store does not contain complete event data type counts.
+    """
+    if not storage_reader.HasAttributeContainers(
+        self._CONTAINER_TYPE_EVENT_DATA_TYPE_COUNT):
+      return None
 
-        timelining_warnings_by_path_spec[path_spec_string] += 1
-        timelining_warnings_by_parser_chain[warning.parser_chain] += 1
+    event_data_types_counter = collections.Counter()
+    for event_data_type_count in storage_reader.GetAttributeContainers(
+        self._CONTAINER_TYPE_EVENT_DATA_TYPE_COUNT):
+      event_data_types_counter[event_data_type_count.data_type] += (
+          event_data_type_count.number_of_event_data)
 
-    storage_counters['timelining_warnings_by_path_spec'] = (
-        timelining_warnings_by_path_spec)
-    storage_counters['timelining_warnings_by_parser_chain'] = (
-        timelining_warnings_by_parser_chain)
+    # Stores that were appended to by an older version do not contain counts
+    # for all event data.
+    number_of_event_data = storage_reader.GetNumberOfAttributeContainers(
+        self._CONTAINER_TYPE_EVENT_DATA)
+    if event_data_types_counter.total() != number_of_event_data:
+      return None
 
-    if not analysis_reports_counter_error:
-      storage_counters['analysis_reports'] = analysis_reports_counter
+    return event_data_types_counter
 
-    if not event_labels_counter_error:
-      storage_counters['event_labels'] = event_labels_counter
+  def _GetWarningsCounters(self, storage_reader, container_type):
+    """Retrieves the number of warnings per path specification and parser chain.
 
-    if not parsers_counter_error:
-      storage_counters['parsers'] = parsers_counter
+    The counters are determined from the warning count attribute containers
+    stored during extraction. If the store does not contain complete warning
+    counts, for example because it was created by an older version, the
+    counters are aggregated by the store.
 
-    return storage_counters
+    Args:
+      storage_reader (StorageReader): storage reader.
+      container_type (str): attribute container type of the warnings.
+
+    Returns:
+      tuple[collections.Counter, collections.Counter]: number of warnings per
+          path specification string and per parser chain.
+    """
+    warnings_by_path_spec = collections.Counter()
+    warnings_by_parser_chain = collections.Counter()
+
+    if not storage_reader.HasAttributeContainers(container_type):
+      return warnings_by_path_spec, warnings_by_parser_chain
+
+    number_of_warnings = storage_reader.GetNumberOfAttributeContainers(
+        container_type)
+
+    if storage_reader.HasAttributeContainers(
+        self._CONTAINER_TYPE_WARNING_COUNT):
+      filter_expression = f'warning_type == "{container_type:s}"'
+      for warning_count in storage_reader.GetAttributeContainers(
+          self._CONTAINER_TYPE_WARNING_COUNT,
+          filter_expression=filter_expression):
+        path_spec_string = self._GetPathSpecificationString(
+            warning_count.path_spec)
+
+        warnings_by_path_spec[path_spec_string] += (
+            warning_count.number_of_warnings)
+        warnings_by_parser_chain[warning_count.parser_chain] += (
+            warning_count.number_of_warnings)
+
+      if warnings_by_parser_chain.total() == number_of_warnings:
+        return warnings_by_path_spec, warnings_by_parser_chain
+
+      warnings_by_path_spec = collections.Counter()
+      warnings_by_parser_chain = collections.Counter()
+
+    for (parser_chain, path_spec), number_of_warnings in (
+        storage_reader.GetAttributeValuesCounts(
+            container_type, ['parser_chain', 'path_spec'])):
+      path_spec_string = self._GetPathSpecificationString(path_spec)
+
+      warnings_by_path_spec[path_spec_string] += number_of_warnings
+      warnings_by_parser_chain[parser_chain] += number_of_warnings
+
+    return warnings_by_path_spec, warnings_by_parser_chain
 
   def _CheckStorageFile(self, storage_file_path, warn_about_existing=False):
     """Checks if the storage file path is valid.
@@ -62,9 +62,11 @@ class PsortTool(
     self._deduplicate_events = True
     self._preferred_language = None
     self._process_memory_limit = None
+    self._sort_memory_limit = None
     self._status_view = status_view.StatusView(self._output_writer, self.NAME)
     self._status_view_file = 'status.info'
     self._status_view_mode = status_view.StatusView.MODE_WINDOW
+    self._temporary_directory = None
     self._time_slice = None
     self._use_time_slicer = False
 
@@ -225,6 +227,22 @@ class PsortTool(
     helpers_manager.ArgumentHelperManager.ParseOptions(
         options, self, names=argument_helper_names)
 
+    number_of_analysis_partitions = getattr(
+        options, 'analysis_partitions', None)
+
+    if (number_of_analysis_partitions is not None and
+        number_of_analysis_partitions < 1):
+      raise errors.BadConfigOption((
+          f'Invalid number of analysis partitions: '
+          f'{number_of_analysis_partitions:d}, value must be 1 or greater.'))
+
+    sort_memory_limit = getattr(options, 'sort_memory_limit', None)
+
+    if sort_memory_limit and sort_memory_limit < 0:
+      raise errors.BadConfigOption((
+          f'Invalid sort memory limit: {sort_memory_limit:d}, value must '
+          f'be 0 or greater.'))
+
     worker_memory_limit = getattr(options, 'worker_memory_limit', None)
 
     if worker_memory_limit and worker_memory_limit < 0:
@@ -239,6 +257,10 @@ class PsortTool(
           f'Invalid worker timeout: {worker_timeout:f}, value must be greater '
           f'than 0.0 minutes.'))
 
+    self._number_of_analysis_partitions = number_of_analysis_partitions
+    self._shared_memory_events = getattr(
+        options, 'shared_memory_events', False)
+    self._sort_memory_limit = sort_memory_limit
     self._worker_memory_limit = worker_memory_limit
     self._worker_timeout = worker_timeout
 
@@ -254,6 +276,38 @@ class PsortTool(
     helpers_manager.ArgumentHelperManager.AddCommandLineArguments(
         argument_group, names=argument_helper_names)
 
+    argument_group.add_argument(
+        '--sort_memory_limit', '--sort-memory-limit',
+        dest='sort_memory_limit', action='store', type=int,
+        metavar='SIZE', help=(
+            'Maximum amount of memory in bytes used to sort the events in '
+            'chronological order, where 0 represents that the events are '
+            'sorted by the storage. If set, the events are sorted with an '
+            'external merge sort that writes sorted runs to the temporary '
+            'directory when this limit is exceeded. A limit of 268435456 '
+            '(256 MiB) is suited to storage files with hundreds of millions '
+            'of events.'))
+
+    argument_group.add_argument(
+        '--analysis_partitions', '--analysis-partitions',
+        dest='analysis_partitions', action='store', type=int,
+        metavar='NUMBER', help=(
+            'Number of analysis processes that run an analysis plugin that '
+            'supports partitioning, such as tagging, where every process '
+            'analyzes a disjoint partition of the events and the results of '
+            'the partitions are combined afterwards. The default is 1, which '
+            'represents a single analysis process per analysis plugin.'))
+
+    argument_group.add_argument(
+        '--shared_memory_events', '--shared-memory-events',
+        dest='shared_memory_events', action='store_true', default=False,
+        help=(
+            'Broadcast the events to the analysis processes via a shared '
+            'memory ring buffer, that is written once and read by all '
+            'analysis processes, instead of a ZeroMQ queue per analysis '
+            'process. ZeroMQ queues are used as fallback if shared memory is '
+            'not available.'))
+
     argument_group.add_argument(
         '--worker_memory_limit', '--worker-memory-limit',
         dest='worker_memory_limit', action='store', type=int,
@@ -506,6 +560,10 @@ class PsortTool(
 
       output_engine.SetStatusUpdateInterval(self._status_view_interval)
 
+      if self._sort_memory_limit:
+        storage_reader.SetExternalSort(
+            self._sort_memory_limit, scratch_path=self._temporary_directory)
+
       output_engine.ExportEvents(
           storage_reader, self._output_module, configuration,
           deduplicate_events=self._deduplicate_events,
@@ -474,6 +474,17 @@ class StatusView(object):
       self._output_writer.Write('\n')
       table_view.Write(self._output_writer)
 
+      if tasks_status.memory_budget:
+        predicted_memory_usage = self._FormatSizeInUnitsOf1024(
+            tasks_status.predicted_memory_usage)
+        memory_budget = self._FormatSizeInUnitsOf1024(
+            tasks_status.memory_budget)
+
+        self._output_writer.Write((
+            f'Memory budget: {predicted_memory_usage:s} of '
+            f'{memory_budget:s} predicted, deferred tasks: '
+            f'{tasks_status.number_of_deferred_tasks:d}\n'))
+
   def GetAnalysisStatusUpdateCallback(self):
     """Retrieves the analysis status update callback function.
 
@@ -558,6 +569,15 @@ class StatusView(object):
             ''])
         self._output_writer.Write(output_text)
 
+      if processing_status.number_of_unchanged_file_entries:
+        output_text = '\n'.join([
+            '',
+            (f'Number of unchanged file entries that were not processed '
+             f'again: {processing_status.number_of_unchanged_file_entries:d} '
+             f'({processing_status.size_of_unchanged_file_entries:d} bytes).'),
+            ''])
+        self._output_writer.Write(output_text)
+
       if processing_status.error_path_specs:
         output_text = '\n'.join([
             '',
@@ -752,6 +752,63 @@ class WindowsEventLogProviderArtifact(ArtifactAttributeContainer):
       self.log_types.append(log_type)
 
 
+class WindowsEventLogXMLTemplateArtifact(ArtifactAttributeContainer):
+  """Windows XML EventLog (EVTX) XML template artifact attribute container.
+
+  The XML template contains the parts of the XML representation of an event
+  record that remain when its substitution values, such as attribute values
+  and element text, are removed. The XML representation can be rendered by
+  interleaving the template fragments with the substitution values.
+
+  Attributes:
+    fragments (list[str]): template fragments, which contains one more
+        fragment than the number of substitution values.
+    identifier (str): identifier of the template, which is a digest hash of
+        the template fragments.
+  """
+
+  CONTAINER_TYPE = 'windows_eventlog_xml_template'
+
+  SCHEMA = {
+      'fragments': 'List[str]',
+      'identifier': 'str'}
+
+  def __init__(self, fragments=None, identifier=None):
+    """Initializes a Windows XML EventLog (EVTX) XML template artifact.
+
+    Args:
+      fragments (Optional[list[str]]): template fragments.
+      identifier (Optional[str]): identifier of the template.
+    """
+    super(WindowsEventLogXMLTemplateArtifact, self).__init__()
+    self.fragments = fragments
+    self.identifier = identifier
+
+  def RenderXMLString(self, values):
+    """Renders the XML representation of an event record.
+
+    Args:
+      values (list[str]): substitution values.
+
+    Returns:
+      str: XML representation of the event record.
+
+    Raises:
+      ValueError: if the number of substitution values does not match
+          the template.
+    """
+    if len(values) + 1 != len(self.fragments):
+      raise ValueError((
+          f'Number of substitution values: {len(values):d} does not match '
+          f'template: {self.identifier!s}'))
+
+    xml_string_parts = [self.fragments[0]]
+    for value, fragment in zip(values, self.fragments[1:]):
+      xml_string_parts.extend([value, fragment])
+
+    return ''.join(xml_string_parts)
+
+
 class WindowsMountedDeviceArtifact(ArtifactAttributeContainer):
   """Windows mounted device artifact attribute container.
 
@@ -895,5 +952,5 @@ manager.AttributeContainersManager.RegisterAttributeContainers([
     PathArtifact, SourceConfigurationArtifact, SystemConfigurationArtifact,
     TimeZoneArtifact, UserAccountArtifact, WindowsEventLogMessageFileArtifact,
     WindowsEventLogMessageStringArtifact, WindowsEventLogProviderArtifact,
-    WindowsMountedDeviceArtifact, WindowsServiceConfigurationArtifact,
-    WindowsWevtTemplateEvent])
+    WindowsEventLogXMLTemplateArtifact, WindowsMountedDeviceArtifact,
+    WindowsServiceConfigurationArtifact, WindowsWevtTemplateEvent])
@@ -5,6 +5,33 @@ from acstore.containers import interface
 from acstore.containers import manager
 
 
+class EventDataTypeCount(interface.AttributeContainer):
+  """Event data type count attribute container.
+
+  Attributes:
+    data_type (str): event data type indicator.
+    number_of_event_data (int): number of event data with data type.
+  """
+
+  CONTAINER_TYPE = 'event_data_type_count'
+
+  SCHEMA = {
+      'data_type': 'str',
+      'number_of_event_data': 'int'}
+
+  def __init__(self, data_type=None, number_of_event_data=None):
+    """Initializes an event data type count attribute container.
+
+    Args:
+      data_type (Optional[str]): event data type indicator.
+      number_of_event_data (Optional[int]): number of event data with
+          data type.
+    """
+    super(EventDataTypeCount, self).__init__()
+    self.data_type = data_type
+    self.number_of_event_data = number_of_event_data
+
+
 class EventLabelCount(interface.AttributeContainer):
   """Event label count attribute container.
 
@@ -60,5 +87,46 @@ class ParserCount(interface.AttributeContainer):
     self.number_of_events = number_of_events
 
 
+class WarningCount(interface.AttributeContainer):
+  """Warning count attribute container.
+
+  Attributes:
+    number_of_warnings (int): number of warnings of the warning type produced
+        by the parser chain for the path specification.
+    parser_chain (str): parser chain the warnings were produced by.
+    path_spec (dfvfs.PathSpec): path specification the warnings were produced
+        for.
+    warning_type (str): attribute container type of the warnings, for example
+        "extraction_warning".
+  """
+
+  CONTAINER_TYPE = 'warning_count'
+
+  SCHEMA = {
+      'number_of_warnings': 'int',
+      'parser_chain': 'str',
+      'path_spec': 'dfvfs.PathSpec',
+      'warning_type': 'str'}
+
+  def __init__(
+      self, number_of_warnings=None, parser_chain=None, path_spec=None,
+      warning_type=None):
+    """Initializes a warning count attribute container.
+
+    Args:
+      number_of_warnings (Optional[int]): number of warnings of the warning
+          type produced by the parser chain for the path specification.
+      parser_chain (Optional[str]): parser chain the warnings were produced by.
+      path_spec (Optional[dfvfs.PathSpec]): path specification the warnings
+          were produced for.
+      warning_type (Optional[str]): attribute container type of the warnings.
+    """
+    super(WarningCount, self).__init__()
+    self.number_of_warnings = number_of_warnings
+    self.parser_chain = parser_chain
+    self.path_spec = path_spec
+    self.warning_type = warning_type
+
+
 manager.AttributeContainersManager.RegisterAttributeContainers([
-    EventLabelCount, ParserCount])
+    EventDataTypeCount, EventLabelCount, ParserCount, WarningCount])
@@ -59,4 +59,117 @@ class FileEntryEventSource(EventSource):
   DATA_TYPE = 'file_entry'
 
 
-manager.AttributeContainersManager.RegisterAttributeContainer(EventSource)
+class EventSourcePartition(interface.AttributeContainer):
+  """Event source partition attribute container.
+
+  An event source partition represents a part of a data stream, for example
+  a range of records, that a parser can process independently from the rest
+  of the data stream. The partitions of a large data stream can be processed
+  by separate tasks.
+
+  Attributes:
+    file_entry_type (str): dfVFS file entry type.
+    parser_name (str): name of the parser that processes the partition.
+    partition_end (int): end of the partition, which is parser specific, for
+        example the index of the record that follows the last record of the
+        partition.
+    partition_start (int): start of the partition, which is parser specific,
+        for example the index of the first record of the partition.
+    path_spec (dfvfs.PathSpec): path specification of the data stream.
+  """
+  CONTAINER_TYPE = 'event_source_partition'
+
+  SCHEMA = {
+      '_event_data_stream_identifier': 'AttributeContainerIdentifier',
+      'file_entry_type': 'str',
+      'parser_name': 'str',
+      'partition_end': 'int',
+      'partition_start': 'int',
+      'path_spec': 'dfvfs.PathSpec'}
+
+  _SERIALIZABLE_PROTECTED_ATTRIBUTES = [
+      '_event_data_stream_identifier']
+
+  def __init__(
+      self, file_entry_type=None, parser_name=None, partition_end=None,
+      partition_start=None, path_spec=None):
+    """Initializes an event source partition.
+
+    Args:
+      file_entry_type (Optional[str]): dfVFS file entry type.
+      parser_name (Optional[str]): name of the parser that processes
+          the partition.
+      partition_end (Optional[int]): end of the partition.
+      partition_start (Optional[int]): start of the partition.
+      path_spec (Optional[dfvfs.PathSpec]): path specification of the data
+          stream.
+    """
+    super(EventSourcePartition, self).__init__()
+    self._event_data_stream_identifier = None
+    self.file_entry_type = file_entry_type
+    self.parser_name = parser_name
+    self.partition_end = partition_end
+    self.partition_start = partition_start
+    self.path_spec = path_spec
+
+  def GetEventDataStreamIdentifier(self):
+    """Retrieves the identifier of the associated event data stream.
+
+    The event data stream identifier is a storage specific value that requires
+    special handling during serialization.
+
+    Returns:
+      AttributeContainerIdentifier: event data stream or None when not set.
+    """
+    return self._event_data_stream_identifier
+
+  def SetEventDataStreamIdentifier(self, event_data_stream_identifier):
+    """Sets the identifier of the associated event data stream.
+
+    The event data stream identifier is a storage specific value that requires
+    special handling during serialization.
+
+    Args:
+      event_data_stream_identifier (AttributeContainerIdentifier): event data
+          stream identifier.
+    """
+    self._event_data_stream_identifier = event_data_stream_identifier
+
+
+class FileEntryFingerprint(interface.AttributeContainer):
+  """File entry fingerprint attribute container.
+
+  The file entry fingerprint is used to determine if a file entry was changed
+  since it was processed in a previous session.
+
+  Attributes:
+    modification_time (str): modification date and time of the file entry,
+        formatted as an ISO 8601 date and time string.
+    path_spec (dfvfs.PathSpec): path specification.
+    sha256_hash (str): SHA-256 digest hash of the default data stream or None
+        if not calculated.
+    size (int): size of the file entry in bytes.
+  """
+  CONTAINER_TYPE = 'file_entry_fingerprint'
+
+  SCHEMA = {
+      'modification_time': 'str',
+      'path_spec': 'dfvfs.PathSpec',
+      'sha256_hash': 'str',
+      'size': 'int'}
+
+  def __init__(self, path_spec=None):
+    """Initializes a file entry fingerprint.
+
+    Args:
+      path_spec (Optional[dfvfs.PathSpec]): path specification.
+    """
+    super(FileEntryFingerprint, self).__init__()
+    self.modification_time = None
+    self.path_spec = path_spec
+    self.sha256_hash = None
+    self.size = None
+
+
+manager.AttributeContainersManager.RegisterAttributeContainers([
+    EventSource, EventSourcePartition, FileEntryFingerprint])
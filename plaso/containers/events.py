@@ -3,6 +3,7 @@
 
 import hashlib
 import re
+import sys
 
 from acstore.containers import interface
 from acstore.containers import manager
@@ -82,6 +83,217 @@ def CalculateEventValuesHash(event_data, event_data_stream):
   return md5_context.hexdigest()
 
 
+class _CompactIdentifier(object):
+  """Descriptor of an attribute container identifier stored compactly.
+
+  The name and sequence number of the identifier are stored in slots of
+  the attribute container instead of as an AttributeContainerIdentifier,
+  which uses significantly less memory per attribute container. A new
+  AttributeContainerIdentifier is created every time the identifier is
+  retrieved.
+  """
+
+  def __init__(self, name_slot, sequence_number_slot):
+    """Initializes a compact identifier descriptor.
+
+    Args:
+      name_slot (str): name of the slot that contains the name of
+          the identifier.
+      sequence_number_slot (str): name of the slot that contains the sequence
+          number of the identifier.
+    """
+    super(_CompactIdentifier, self).__init__()
+    self._name_slot = name_slot
+    self._sequence_number_slot = sequence_number_slot
+
+  def __get__(self, instance, owner=None):
+    """Retrieves the identifier.
+
+    Args:
+      instance (AttributeContainer): attribute container or None if
+          the descriptor is accessed on the class.
+      owner (Optional[type]): class of the attribute container.
+
+    Returns:
+      AttributeContainerIdentifier: identifier or None when not set.
+    """
+    if instance is None:
+      return self
+
+    name = getattr(instance, self._name_slot)
+    sequence_number = getattr(instance, self._sequence_number_slot)
+    if name is None and sequence_number is None:
+      return None
+
+    return interface.AttributeContainerIdentifier(
+        name=name, sequence_number=sequence_number)
+
+  def __set__(self, instance, identifier):
+    """Sets the identifier.
+
+    Args:
+      instance (AttributeContainer): attribute container.
+      identifier (AttributeContainerIdentifier|str): identifier, string
+          representation of the identifier or None.
+    """
+    if isinstance(identifier, str):
+      identifier_string = identifier
+      identifier = interface.AttributeContainerIdentifier()
+      identifier.CopyFromString(identifier_string)
+
+    if identifier is None:
+      name = None
+      sequence_number = None
+    else:
+      name = identifier.name
+      sequence_number = identifier.sequence_number
+
+      # Names of deserialized identifiers are new strings, where most
+      # identifiers share the same name.
+      if isinstance(name, str):
+        name = sys.intern(name)
+
+    setattr(instance, self._name_slot, name)
+    setattr(instance, self._sequence_number_slot, sequence_number)
+
+
+class _SlottedAttributeContainer(interface.AttributeContainer):
+  """Attribute container that stores its attributes in slots.
+
+  The attributes of a slotted attribute container are defined by its schema
+  and stored in slots instead of an attribute dictionary, which significantly
+  reduces the memory used by containers that are kept in memory in large
+  numbers, such as events.
+
+  Since the base attribute container does not define slots, an attribute that
+  is not defined by the schema can still be set, but it is stored in
+  an attribute dictionary that is created on demand, and it is not returned
+  by GetAttributeNames and GetAttributes and is therefore not serialized.
+  """
+
+  __slots__ = ('_identifier_name', '_identifier_sequence_number')
+
+  _identifier = _CompactIdentifier(
+      '_identifier_name', '_identifier_sequence_number')
+
+  def __getstate__(self):
+    """Retrieves the state of the attribute container for pickling.
+
+    Returns:
+      dict[str, object]: values per slot name.
+    """
+    return {
+        slot_name: getattr(self, slot_name)
+        for container_class in type(self).__mro__
+        for slot_name in container_class.__dict__.get('__slots__', ())}
+
+  def __setstate__(self, state):
+    """Sets the state of the attribute container after unpickling.
+
+    Args:
+      state (dict[str, object]): values per slot name.
+    """
+    for slot_name, value in state.items():
+      setattr(self, slot_name, value)
+
+  def CopyFromDict(self, attributes):
+    """Copies the attribute container from a dictionary.
+
+    Args:
+      attributes (dict[str, object]): attribute values per name.
+    """
+    for attribute_name, attribute_value in attributes.items():
+      # Not using startswith to improve performance.
+      if attribute_name in self.SCHEMA and (
+          attribute_name[0] != '_' or
+          attribute_name in self._SERIALIZABLE_PROTECTED_ATTRIBUTES):
+        setattr(self, attribute_name, attribute_value)
+
+  def GetAttributeNames(self):
+    """Retrieves the names of all attributes.
+
+    Returns:
+      list[str]: attribute names.
+    """
+    attribute_names = list(self._SERIALIZABLE_PROTECTED_ATTRIBUTES)
+    for attribute_name in self.SCHEMA:
+      # Not using startswith to improve performance.
+      if attribute_name[0] != '_':
+        attribute_names.append(attribute_name)
+
+    return attribute_names
+
+  def GetAttributes(self):
+    """Retrieves the attribute names and values.
+
+    Attributes that are set to None are ignored.
+
+    Yields:
+      tuple[str, object]: attribute name and value.
+    """
+    for attribute_name in self.SCHEMA:
+      # Not using startswith to improve performance.
+      if (attribute_name[0] != '_' or
+          attribute_name in self._SERIALIZABLE_PROTECTED_ATTRIBUTES):
+        attribute_value = getattr(self, attribute_name)
+        if attribute_value is not None:
+          yield attribute_name, attribute_value
+
+  def GetAttributeValuesString(self):
+    """Retrieves a comparable string of the attribute values.
+
+    Identifiers are represented by their string representation, since
+    identifiers are created every time they are retrieved.
+
+    Returns:
+      str: comparable string of the attribute values.
+    """
+    attributes = []
+    for attribute_name, attribute_value in sorted(
+        self.GetAttributes(), key=lambda attribute: attribute[0]):
+      if isinstance(attribute_value, interface.AttributeContainerIdentifier):
+        attribute_value = attribute_value.CopyToString()
+
+      elif isinstance(attribute_value, dict):
+        attribute_value = sorted(attribute_value.items())
+
+      elif isinstance(attribute_value, bytes):
+        attribute_value = repr(attribute_value)
+
+      attributes.append(f'{attribute_name:s}: {attribute_value!s}')
+
+    return ', '.join(attributes)
+
+  def MatchesExpression(self, expression):
+    """Determines if an attribute container matches the expression.
+
+    Args:
+      expression (code|str): expression.
+
+    Returns:
+      bool: True if the attribute container matches the expression, False
+          otherwise.
+    """
+    result = not expression
+    if expression:
+      namespace = {}
+      for attribute_name, attribute_value in self.GetAttributes():
+        if isinstance(attribute_value, interface.AttributeContainerIdentifier):
+          attribute_value = attribute_value.CopyToString()
+
+        namespace[attribute_name] = attribute_value
+
+      # Make sure __builtins__ contains an empty dictionary.
+      namespace['__builtins__'] = {}
+
+      try:
+        result = eval(expression, namespace)  # pylint: disable=eval-used
+      except Exception:  # pylint: disable=broad-except
+        pass
+
+    return result
+
+
 class DateLessLogHelper(interface.AttributeContainer):
   """Attribute container to assist with logs without full dates.
 
@@ -318,13 +530,15 @@ class EventDataStream(interface.AttributeContainer):
     self.yara_match = None
 
 
-class EventObject(interface.AttributeContainer):
+class EventObject(_SlottedAttributeContainer):
   """Event attribute container.
 
   The framework is designed to parse files and create events
   from individual records, log lines or keys extracted from files.
-  The event object provides an extensible data store for event
-  attributes.
+  The event object stores the date and time values of an event, the other
+  attributes are stored in the associated event data. Since many events are
+  kept in memory, for example to sort them, the attributes defined by
+  the schema are stored in slots. Other attributes are not serialized.
 
   Attributes:
     date_time (dfdatetime.DateTimeValues): date and time values.
@@ -333,6 +547,10 @@ class EventObject(interface.AttributeContainer):
     timestamp_desc (str): description of the meaning of the timestamp.
   """
 
+  __slots__ = (
+      '_event_data_identifier_name', '_event_data_identifier_sequence_number',
+      'date_time', 'timestamp', 'timestamp_desc')
+
   CONTAINER_TYPE = 'event'
 
   SCHEMA = {
@@ -344,6 +562,9 @@ class EventObject(interface.AttributeContainer):
   _SERIALIZABLE_PROTECTED_ATTRIBUTES = [
       '_event_data_identifier']
 
+  _event_data_identifier = _CompactIdentifier(
+      '_event_data_identifier_name', '_event_data_identifier_sequence_number')
+
   def __init__(self):
     """Initializes an event attribute container."""
     super(EventObject, self).__init__()
@@ -10,6 +10,73 @@ from acstore.containers import manager
 import plaso
 
 
+class ExtractionCheckpoint(interface.AttributeContainer):
+  """Extraction checkpoint attribute container.
+
+  An extraction checkpoint records the state of an extraction session at the
+  time the session store was last committed, which allows an interrupted
+  session to be resumed.
+
+  Attributes:
+    checkpoint_time (int): time that the checkpoint was written. Contains the
+        number of micro seconds since January 1, 1970, 00:00:00 UTC.
+    collection_completed (bool): True if the collection of the source was
+        completed.
+    container_types (list[str]): attribute container types.
+    event_source_index (int): index of the first event source that was not
+        read by the foreman.
+    number_of_collected_path_specs (int): number of path specifications
+        collected from the source.
+    numbers_of_containers (list[int]): number of attribute containers per type
+        in container_types.
+    pending_event_source_indexes (list[int]): indexes of the event sources
+        that were read by the foreman, but whose tasks were not merged.
+    session_identifier (str): identifier of the session.
+  """
+
+  CONTAINER_TYPE = 'extraction_checkpoint'
+
+  SCHEMA = {
+      'checkpoint_time': 'int',
+      'collection_completed': 'bool',
+      'container_types': 'List[str]',
+      'event_source_index': 'int',
+      'number_of_collected_path_specs': 'int',
+      'numbers_of_containers': 'List[int]',
+      'pending_event_source_indexes': 'List[int]',
+      'session_identifier': 'str'}
+
+  def __init__(self, session_identifier=None):
+    """Initializes an extraction checkpoint attribute container.
+
+    Args:
+      session_identifier (Optional[str]): identifier of the session.
+    """
+    super(ExtractionCheckpoint, self).__init__()
+    self.checkpoint_time = None
+    self.collection_completed = False
+    self.container_types = None
+    self.event_source_index = 0
+    self.number_of_collected_path_specs = 0
+    self.numbers_of_containers = None
+    self.pending_event_source_indexes = None
+    self.session_identifier = session_identifier
+
+  def GetNumberOfContainers(self, container_type):
+    """Retrieves the number of attribute containers of a specific type.
+
+    Args:
+      container_type (str): attribute container type.
+
+    Returns:
+      int: number of attribute containers of the type at the time of the
+          checkpoint, which is 0 if the type was not stored.
+    """
+    numbers_of_containers = dict(zip(
+        self.container_types or [], self.numbers_of_containers or []))
+    return numbers_of_containers.get(container_type, 0)
+
+
 class Session(interface.AttributeContainer):
   """Session attribute container.
 
@@ -82,4 +149,5 @@ class Session(interface.AttributeContainer):
     self.start_time = int(time.time() * 1000000)
 
 
-manager.AttributeContainersManager.RegisterAttributeContainer(Session)
+manager.AttributeContainersManager.RegisterAttributeContainers([
+    ExtractionCheckpoint, Session])
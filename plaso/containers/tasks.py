@@ -1,5 +1,5 @@
 # -*- coding: utf-8 -*-
-"""Task attribute container definition."""
+"""Task related attribute container definitions."""
 
 import time
 import uuid
@@ -18,6 +18,9 @@ class Task(interface.AttributeContainer):
 
   Attributes:
     aborted (bool): True if the task was aborted.
+    collect_only (bool): True if only the sub file entries of the file entry
+        the path specification is referencing should be collected, for example
+        since the file entry was not changed since a previous session.
     completion_time (int): time that the task was completed. Contains the
         number of micro seconds since January 1, 1970, 00:00:00 UTC.
     file_entry_type (str): dfVFS type of the file entry the path specification
@@ -29,6 +32,10 @@ class Task(interface.AttributeContainer):
         processed as number of milliseconds since January 1, 1970, 00:00:00 UTC.
     merge_priority (int): priority used for the task storage file merge, where
         a lower value indicates a higher priority to merge.
+    parser_name (str): name of the parser that processes the event source
+        partition or None if the task does not process a partition.
+    partition_end (int): end of the event source partition.
+    partition_start (int): start of the event source partition.
     path_spec (dfvfs.PathSpec): path specification.
     session_identifier (str): the identifier of the session the task is part of.
     start_time (int): time that the task was started. Contains the number
@@ -40,19 +47,27 @@ class Task(interface.AttributeContainer):
   CONTAINER_TYPE = 'task'
 
   SCHEMA = {
+      '_event_data_stream_identifier': 'AttributeContainerIdentifier',
       'aborted': 'bool',
+      'collect_only': 'bool',
       'completion_time': 'int',
       'file_entry_type': 'str',
       'has_retry': 'bool',
       'identifier': 'str',
       'last_processing_time': 'int',
       'merge_priority': 'int',
+      'parser_name': 'str',
+      'partition_end': 'int',
+      'partition_start': 'int',
       'path_spec': 'dfvfs.PathSpec',
       'session_identifier': 'str',
       'start_time': 'int',
       'storage_file_size': 'int',
       'storage_format': 'str'}
 
+  _SERIALIZABLE_PROTECTED_ATTRIBUTES = [
+      '_event_data_stream_identifier']
+
   def __init__(self, session_identifier=None):
     """Initializes a task attribute container.
 
@@ -61,13 +76,18 @@ class Task(interface.AttributeContainer):
           is part of.
     """
     super(Task, self).__init__()
+    self._event_data_stream_identifier = None
     self.aborted = False
+    self.collect_only = False
     self.completion_time = None
     self.file_entry_type = None
     self.has_retry = False
     self.identifier = '{0:s}'.format(uuid.uuid4().hex)
     self.last_processing_time = None
     self.merge_priority = None
+    self.parser_name = None
+    self.partition_end = None
+    self.partition_start = None
     self.path_spec = None
     self.session_identifier = session_identifier
     self.start_time = int(time.time() * definitions.MICROSECONDS_PER_SECOND)
@@ -96,20 +116,86 @@ class Task(interface.AttributeContainer):
       Task: a task to retry a previously abandoned task.
     """
     retry_task = Task(session_identifier=self.session_identifier)
+    retry_task.collect_only = self.collect_only
     retry_task.file_entry_type = self.file_entry_type
     retry_task.merge_priority = self.merge_priority
+    retry_task.parser_name = self.parser_name
+    retry_task.partition_end = self.partition_end
+    retry_task.partition_start = self.partition_start
     retry_task.path_spec = self.path_spec
     retry_task.storage_file_size = self.storage_file_size
     retry_task.storage_format = self.storage_format
+    retry_task.SetEventDataStreamIdentifier(self._event_data_stream_identifier)
 
     self.has_retry = True
 
     return retry_task
 
+  def GetEventDataStreamIdentifier(self):
+    """Retrieves the identifier of the associated event data stream.
+
+    The event data stream identifier is a storage specific value that requires
+    special handling during serialization.
+
+    Returns:
+      AttributeContainerIdentifier: event data stream or None when not set.
+    """
+    return self._event_data_stream_identifier
+
+  def SetEventDataStreamIdentifier(self, event_data_stream_identifier):
+    """Sets the identifier of the associated event data stream.
+
+    The event data stream identifier is a storage specific value that requires
+    special handling during serialization.
+
+    Args:
+      event_data_stream_identifier (AttributeContainerIdentifier): event data
+          stream identifier.
+    """
+    self._event_data_stream_identifier = event_data_stream_identifier
+
   def UpdateProcessingTime(self):
     """Updates the processing time to now."""
     self.last_processing_time = int(
         time.time() * definitions.MICROSECONDS_PER_SECOND)
 
 
-manager.AttributeContainersManager.RegisterAttributeContainer(Task)
+class TaskCostEstimates(interface.AttributeContainer):
+  """Task cost estimates attribute container.
+
+  The task cost estimates record the estimates of the task cost model learned
+  from the tasks completed by extraction sessions, so that a next session can
+  start with these estimates. Since the schema does not support floating-point
+  values the throughputs are stored as integers and the memory factors in
+  millionths.
+
+  Attributes:
+    cost_classes (list[str]): cost classes, which are lower case extensions of
+        file names, for example ".evtx".
+    memory_factors (list[int]): estimated memory usage per byte of data stream
+        in millionths per cost class in cost_classes.
+    throughputs (list[int]): estimated throughput in bytes per second per
+        cost class in cost_classes.
+    worker_memory (int): estimated memory usage of an idle worker process in
+        bytes.
+  """
+
+  CONTAINER_TYPE = 'task_cost_estimates'
+
+  SCHEMA = {
+      'cost_classes': 'List[str]',
+      'memory_factors': 'List[int]',
+      'throughputs': 'List[int]',
+      'worker_memory': 'int'}
+
+  def __init__(self):
+    """Initializes a task cost estimates attribute container."""
+    super(TaskCostEstimates, self).__init__()
+    self.cost_classes = None
+    self.memory_factors = None
+    self.throughputs = None
+    self.worker_memory = None
+
+
+manager.AttributeContainersManager.RegisterAttributeContainers([
+    Task, TaskCostEstimates])
@@ -64,6 +64,9 @@ class ExtractionConfiguration(interface.AttributeContainer):
         processing.
     process_compressed_streams (bool): True if file content in compressed
         streams should be processed.
+    winevtx_xml_templates (bool): True if the XML representation of Windows
+        XML EventLog (EVTX) records should be stored as a XML template and
+        substitution values.
     yara_rules_string (str): Yara rule definitions.
   """
   CONTAINER_TYPE = 'extraction_configuration'
@@ -77,6 +80,7 @@ class ExtractionConfiguration(interface.AttributeContainer):
     self.hasher_file_size_limit = None
     self.hasher_names_string = None
     self.process_compressed_streams = True
+    self.winevtx_xml_templates = False
     self.yara_rules_string = None
 
 
@@ -96,7 +100,10 @@ class ProfilingConfiguration(interface.AttributeContainer):
           processing;
         * 'serializers', which profiles CPU time consumed by individual
           serializers.
-        * 'storage', which profiles storage reads and writes.
+        * 'storage', which profiles storage reads and writes;
+        * 'task_queue', which profiles the status of the task queue;
+        * 'tasks', which profiles the status of tasks;
+        * 'trace', which traces the processing phases of all processes.
     sample_rate (int): the profiling sample rate. Contains the number of event
         sources processed.
   """
@@ -181,6 +188,14 @@ class ProfilingConfiguration(interface.AttributeContainer):
     """
     return 'tasks' in self.profilers
 
+  def HaveProfileTrace(self):
+    """Determines if tracing is configured.
+
+    Returns:
+      bool: True if tracing is configured.
+    """
+    return 'trace' in self.profilers
+
 
 class ProcessingConfiguration(interface.AttributeContainer):
   """Configuration settings for processing.
@@ -215,6 +230,11 @@ class ProcessingConfiguration(interface.AttributeContainer):
     preferred_year (int): preferred initial year value for year-less date and
         time values.
     profiling (ProfilingConfiguration): profiling configuration.
+    redis_url (str): URL of the Redis database used for the Redis task
+        storage, where None represents the default URL.
+    task_storage_directory (str): path of the directory in which to create
+        the SQLite task storage, where None represents the directory of
+        the storage file.
     task_storage_format (str): format to use for storing task results.
     task_storage_path (str): path of the directory containing SQLite task
         storage files.
@@ -246,6 +266,8 @@ class ProcessingConfiguration(interface.AttributeContainer):
     self.preferred_time_zone = None
     self.preferred_year = None
     self.profiling = ProfilingConfiguration()
+    self.redis_url = None
+    self.task_storage_directory = None
     self.task_storage_format = None
     self.task_storage_path = None
     self.temporary_directory = None
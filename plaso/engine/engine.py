@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 """The processing engine."""
 
+import multiprocessing
 import os
 
 from artifacts import errors as artifacts_errors
@@ -9,6 +10,7 @@ from artifacts import registry as artifacts_registry
 
 from dfvfs.lib import errors as dfvfs_errors
 from dfvfs.path import factory as path_spec_factory
+from dfvfs.resolver import context as dfvfs_context
 from dfvfs.resolver import resolver as path_spec_resolver
 
 from plaso.containers import artifacts
@@ -25,6 +27,42 @@ from plaso.preprocessors import manager as preprocess_manager
 from plaso.preprocessors import mediator as preprocess_mediator
 
 
+class PreprocessAttributeContainersCollector(object):
+  """Collects the attribute containers produced by preprocessing.
+
+  The collector is used instead of a storage writer when a file system is
+  preprocessed in a separate process.
+
+  Attributes:
+    attribute_containers (list[AttributeContainer]): attribute containers
+        in the order they were added.
+  """
+
+  def __init__(self):
+    """Initializes a preprocess attribute containers collector."""
+    super(PreprocessAttributeContainersCollector, self).__init__()
+    self.attribute_containers = []
+
+  def AddAttributeContainer(self, container):
+    """Adds an attribute container.
+
+    Args:
+      container (AttributeContainer): attribute container.
+    """
+    self.attribute_containers.append(container)
+
+  def UpdateAttributeContainer(self, container):
+    """Updates an attribute container.
+
+    Since the collector keeps a reference to the attribute container, which
+    is updated in place, nothing needs to be done.
+
+    Args:
+      container (AttributeContainer): attribute container.
+    """
+    return
+
+
 class BaseEngine(object):
   """Processing engine interface.
 
@@ -35,6 +73,9 @@ class BaseEngine(object):
   _WINDOWS_REGISTRY_FILES_ARTIFACT_NAMES = [
       'WindowsSystemRegistryFiles', 'WindowsUserRegistryFiles']
 
+  # Artifact definitions registry of a preprocessing worker process.
+  _preprocess_artifacts_registry = None
+
   def __init__(self):
     """Initializes an engine."""
     super(BaseEngine, self).__init__()
@@ -43,6 +84,7 @@ class BaseEngine(object):
     self._artifacts_registry = None
     self._artifacts_trie = None
     self._excluded_file_system_find_specs = None
+    self._excluded_paths_scan_tree = None
     self._included_file_system_find_specs = None
     self._memory_profiler = None
     self._name = 'Main'
@@ -54,9 +96,99 @@ class BaseEngine(object):
     self._status_update_interval = 0.5
     self._storage_profiler = None
     self._task_queue_profiler = None
+    self._trace_profiler = None
 
     self.knowledge_base = knowledge_base.KnowledgeBase()
 
+  @classmethod
+  def _InitializePreprocessProcess(cls, artifacts_registry):
+    """Initializes a preprocessing worker process.
+
+    Args:
+      artifacts_registry (artifacts.ArtifactDefinitionsRegistry): artifacts
+          definitions registry.
+    """
+    cls._preprocess_artifacts_registry = artifacts_registry
+
+  def _PreprocessFileSystem(self, path_spec, mediator, resolver_context=None):
+    """Preprocesses a file system.
+
+    Args:
+      path_spec (dfvfs.PathSpec): path specification of the file system.
+      mediator (PreprocessMediator): mediates interactions between preprocess
+          plugins and other components, such as storage and knowledge base.
+      resolver_context (Optional[dfvfs.Context]): resolver context.
+
+    Returns:
+      SystemConfigurationArtifact: system configuration or None if no
+          operating system was detected.
+    """
+    try:
+      file_system, mount_point = self.GetSourceFileSystem(
+          path_spec, resolver_context=resolver_context)
+    except (RuntimeError, dfvfs_errors.BackEndError) as exception:
+      logger.error(exception)
+      return None
+
+    preprocess_manager.PreprocessPluginsManager.RunPlugins(
+        self._artifacts_registry, file_system, mount_point, mediator)
+
+    if not mediator.GetValue('operating_system'):
+      return None
+
+    system_configuration = artifacts.SystemConfigurationArtifact(
+        code_page=mediator.code_page, language=mediator.language)
+    # Ensure environment_variables is a list otherwise serialization will
+    # fail.
+    system_configuration.environment_variables = list(
+        mediator.GetEnvironmentVariables())
+    system_configuration.hostname = mediator.hostname
+    system_configuration.keyboard_layout = mediator.GetValue(
+        'keyboard_layout')
+    system_configuration.operating_system = mediator.GetValue(
+        'operating_system')
+    system_configuration.operating_system_product = mediator.GetValue(
+        'operating_system_product')
+    system_configuration.operating_system_version = mediator.GetValue(
+        'operating_system_version')
+    # TODO: add support for multi file system system configurations.
+    system_configuration.path_specs = [path_spec]
+
+    if mediator.time_zone:
+      system_configuration.time_zone = mediator.time_zone.zone
+
+    return system_configuration
+
+  @classmethod
+  def _PreprocessFileSystemInProcess(cls, path_spec):
+    """Preprocesses a file system in a preprocessing worker process.
+
+    Args:
+      path_spec (dfvfs.PathSpec): path specification of the file system.
+
+    Returns:
+      tuple[SystemConfigurationArtifact, list[AttributeContainer],
+          dict[str, float]]: system configuration or None if no operating
+          system was detected, attribute containers produced by
+          the preprocessing and duration in seconds per preprocess plugin.
+    """
+    engine = BaseEngine()
+    engine._artifacts_registry = cls._preprocess_artifacts_registry
+
+    collector = PreprocessAttributeContainersCollector()
+    mediator = preprocess_mediator.PreprocessMediator(collector)
+
+    # A separate resolver context is used so that the file-like objects that
+    # were opened before the process was started are not shared.
+    resolver_context = dfvfs_context.Context()
+
+    system_configuration = engine._PreprocessFileSystem(
+        path_spec, mediator, resolver_context=resolver_context)
+
+    return (
+        system_configuration, collector.attribute_containers,
+        mediator.GetPluginDurations())
+
   def _StartProfiling(self, configuration):
     """Starts profiling.
 
@@ -66,6 +198,10 @@ class BaseEngine(object):
     if not configuration:
       return
 
+    if configuration.HaveProfileTrace():
+      self._trace_profiler = profilers.TraceProfiler(self._name, configuration)
+      self._trace_profiler.Start()
+
     if configuration.HaveProfileMemory():
       self._memory_profiler = profilers.MemoryProfiler(
           self._name, configuration)
@@ -79,8 +215,13 @@ class BaseEngine(object):
     if configuration.HaveProfileProcessing():
       self._processing_profiler = profilers.ProcessingProfiler(
           f'{self._name:s}-processing', configuration)
+      self._processing_profiler.SetTraceProfiler(self._trace_profiler)
       self._processing_profiler.Start()
 
+    elif self._trace_profiler:
+      # Trace the processing phases without profiling their CPU time.
+      self._processing_profiler = self._trace_profiler
+
     if configuration.HaveProfileSerializers():
       self._serializers_profiler = profilers.SerializersProfiler(
           f'{self._name:s}-serializers', configuration)
@@ -107,7 +248,8 @@ class BaseEngine(object):
       self._analyzers_profiler = None
 
     if self._processing_profiler:
-      self._processing_profiler.Stop()
+      if self._processing_profiler != self._trace_profiler:
+        self._processing_profiler.Stop()
       self._processing_profiler = None
 
     if self._serializers_profiler:
@@ -122,6 +264,10 @@ class BaseEngine(object):
       self._task_queue_profiler.Stop()
       self._task_queue_profiler = None
 
+    if self._trace_profiler:
+      self._trace_profiler.Stop()
+      self._trace_profiler = None
+
   def BuildArtifactsRegistry(
       self, artifact_definitions_path, custom_artifacts_path):
     """Builds an artificats definition registry.
@@ -242,6 +388,7 @@ class BaseEngine(object):
 
       self._excluded_file_system_find_specs = (
           filters_helper.excluded_file_system_find_specs)
+      self._excluded_paths_scan_tree = filters_helper.excluded_paths_scan_tree
       self._included_file_system_find_specs = (
           filters_helper.included_file_system_find_specs)
 
@@ -290,6 +437,15 @@ class BaseEngine(object):
     """
     return self._excluded_file_system_find_specs or []
 
+  def GetCollectionExcludedPathsScanTree(self):
+    """Retrieves the scan tree of paths to exclude from collection.
+
+    Returns:
+      PathFilterScanTree: scan tree of paths to exclude from collection or None
+          if not available.
+    """
+    return self._excluded_paths_scan_tree
+
   def GetCollectionIncludedFindSpecs(self):
     """Retrieves find specifications to include in collection.
 
@@ -331,70 +487,83 @@ class BaseEngine(object):
     return file_system, mount_point
 
   def PreprocessSource(
-      self, file_system_path_specs, storage_writer, resolver_context=None):
+      self, file_system_path_specs, storage_writer,
+      number_of_worker_processes=1, resolver_context=None):
     """Preprocesses a source.
 
+    File systems are preprocessed independently of each other, concurrently
+    if more than 1 worker process is used. The preprocessing results are
+    merged in the order of the path specifications, regardless of the order
+    in which the file systems were preprocessed.
+
     Args:
       file_system_path_specs (list[dfvfs.PathSpec]): path specifications of
           the source file systems to process.
       storage_writer (StorageWriter): storage writer.
+      number_of_worker_processes (Optional[int]): maximum number of worker
+          processes to preprocess the file systems, where 0 represents the
+          number of CPUs and 1 represents preprocessing in the current process.
       resolver_context (Optional[dfvfs.Context]): resolver context.
 
     Returns:
       list[SystemConfigurationArtifact]: system configurations found in
           the source.
     """
-    mediator = preprocess_mediator.PreprocessMediator(storage_writer)
+    if number_of_worker_processes < 1:
+      try:
+        number_of_worker_processes = multiprocessing.cpu_count()
+      except NotImplementedError:
+        number_of_worker_processes = 1
+
+    number_of_worker_processes = min(
+        number_of_worker_processes, len(file_system_path_specs))
 
-    detected_operating_systems = []
+    plugin_durations = {}
     system_configurations = []
-    for path_spec in file_system_path_specs:
-      try:
-        file_system, mount_point = self.GetSourceFileSystem(
-            path_spec, resolver_context=resolver_context)
-      except (RuntimeError, dfvfs_errors.BackEndError) as exception:
-        logger.error(exception)
-        continue
-
-      preprocess_manager.PreprocessPluginsManager.RunPlugins(
-          self._artifacts_registry, file_system, mount_point, mediator)
-
-      operating_system = mediator.GetValue('operating_system')
-      if not operating_system:
-        continue
-
-      detected_operating_systems.append(operating_system)
-
-      system_configuration = artifacts.SystemConfigurationArtifact(
-          code_page=mediator.code_page, language=mediator.language)
-      # Ensure environment_variables is a list otherwise serialization will
-      # fail.
-      system_configuration.environment_variables = list(
-          mediator.GetEnvironmentVariables())
-      system_configuration.hostname = mediator.hostname
-      system_configuration.keyboard_layout = mediator.GetValue(
-          'keyboard_layout')
-      system_configuration.operating_system = mediator.GetValue(
-          'operating_system')
-      system_configuration.operating_system_product = mediator.GetValue(
-          'operating_system_product')
-      system_configuration.operating_system_version = mediator.GetValue(
-          'operating_system_version')
-      # TODO: add support for multi file system system configurations.
-      system_configuration.path_specs = [path_spec]
-
-      if mediator.time_zone:
-        system_configuration.time_zone = mediator.time_zone.zone
-
-      system_configurations.append(system_configuration)
-
-      mediator.Reset()
+
+    if number_of_worker_processes <= 1:
+      mediator = preprocess_mediator.PreprocessMediator(storage_writer)
+
+      for path_spec in file_system_path_specs:
+        system_configuration = self._PreprocessFileSystem(
+            path_spec, mediator, resolver_context=resolver_context)
+        if system_configuration:
+          system_configurations.append(system_configuration)
+
+        mediator.Reset()
+
+      plugin_durations = mediator.GetPluginDurations()
+
+    else:
+      with multiprocessing.Pool(
+          processes=number_of_worker_processes,
+          initializer=BaseEngine._InitializePreprocessProcess,
+          initargs=(self._artifacts_registry, )) as pool:
+        results = pool.map(
+            BaseEngine._PreprocessFileSystemInProcess, file_system_path_specs)
+
+      for system_configuration, attribute_containers, durations in results:
+        if storage_writer:
+          for container in attribute_containers:
+            storage_writer.AddAttributeContainer(container)
+
+        if system_configuration:
+          system_configurations.append(system_configuration)
+
+        for plugin_name, duration in durations.items():
+          plugin_durations[plugin_name] = (
+              plugin_durations.get(plugin_name, 0.0) + duration)
+
+    for plugin_name, duration in sorted(plugin_durations.items()):
+      logger.debug(
+          f'preprocessor plugin: {plugin_name:s} duration: {duration:.3f}s')
 
     if system_configurations:
       # TODO: kept for backwards compatibility.
       self.knowledge_base.ReadSystemConfigurationArtifact(
           system_configurations[0])
-      for environment_variable in system_configuration.environment_variables:
+      for environment_variable in (
+          system_configurations[-1].environment_variables):
         self.knowledge_base.AddEnvironmentVariable(environment_variable)
 
     return system_configurations
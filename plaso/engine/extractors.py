@@ -299,6 +299,43 @@ class EventDataExtractor(object):
           parser_mediator, self._usnjrnl_parser, file_entry,
           file_object=file_object)
 
+  def ParseEventSourcePartition(self, parser_mediator, file_entry, parser_name):
+    """Parses an event source partition of a file entry.
+
+    The event source partition to parse is set in the parser mediator.
+
+    Args:
+      parser_mediator (ParserMediator): mediates interactions between parsers
+          and other components, such as storage and dfVFS.
+      file_entry (dfvfs.FileEntry): file entry.
+      parser_name (str): name of the parser that produced the event source
+          partition.
+
+    Raises:
+      RuntimeError: if the file-like object or the parser object is missing.
+    """
+    if parser_name == 'usnjrnl':
+      parent_path_spec = getattr(file_entry.path_spec, 'parent', None)
+      if not self._usnjrnl_parser or not parent_path_spec:
+        raise RuntimeError(
+            'Unable to parse event source partition of: usnjrnl')
+
+      # The UsnJrnl parser reads directly from the volume.
+      volume_file_object = path_spec_resolver.Resolver.OpenFileObject(
+          parent_path_spec, resolver_context=parser_mediator.resolver_context)
+
+      self._ParseFileEntryWithParser(
+          parser_mediator, self._usnjrnl_parser, file_entry,
+          file_object=volume_file_object)
+      return
+
+    parser = self._parsers.get(parser_name, None)
+    if not parser:
+      raise RuntimeError(
+          'Parser object missing for parser: {0:s}'.format(parser_name))
+
+    self._ParseDataStreamWithParser(parser_mediator, parser, file_entry, '')
+
   def ParseFileEntryMetadata(self, parser_mediator, file_entry):
     """Parses the file entry metadata such as file system data.
 
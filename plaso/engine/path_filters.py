@@ -5,6 +5,8 @@ Path filters are specified in filter files and are used during collection to
 include or exclude file system paths.
 """
 
+import re
+
 from dfvfs.helpers import file_system_searcher
 
 from plaso.engine import logger
@@ -50,12 +52,142 @@ class PathFilter(object):
     self.paths = paths or []
 
 
+class PathFilterScanTreeNode(object):
+  """Path filter scan tree node.
+
+  Attributes:
+    is_end_of_path (bool): True if a path filter ends in this node.
+    literal_sub_nodes (dict[str, PathFilterScanTreeNode]): sub nodes of path
+        segments that contain no regular expression, keyed by the lower case
+        path segment.
+    regex_sub_nodes (dict[str, tuple[re.Pattern, PathFilterScanTreeNode]]):
+        compiled regular expressions and sub nodes of path segments that
+        contain a regular expression, keyed by the path segment.
+  """
+
+  def __init__(self):
+    """Initializes a path filter scan tree node."""
+    super(PathFilterScanTreeNode, self).__init__()
+    self.is_end_of_path = False
+    self.literal_sub_nodes = {}
+    self.regex_sub_nodes = {}
+
+
+class PathFilterScanTree(object):
+  """Path filter scan tree.
+
+  The scan tree is used to determine if a path matches any of the path filters
+  without comparing the path against every path filter. Path segments without
+  regular expression characters are looked up by name, other path segments
+  are compiled once and matched case insensitive.
+
+  A path matches if a prefix of its path segments matches a path filter, which
+  is consistent with how dfVFS find specifications compare locations.
+  """
+
+  # Regular expression that matches path segments that contain no regular
+  # expression characters, other than escaped non-alphanumeric characters.
+  _LITERAL_PATH_SEGMENT_RE = re.compile(
+      r'^(?:[^.^$*+?{}\[\]\\|()]|\\[^0-9A-Za-z])*$')
+
+  _UNESCAPE_RE = re.compile(r'\\(.)')
+
+  def __init__(self):
+    """Initializes a path filter scan tree."""
+    super(PathFilterScanTree, self).__init__()
+    self._number_of_paths = 0
+    self._root_node = PathFilterScanTreeNode()
+
+  @property
+  def number_of_paths(self):
+    """int: number of paths in the scan tree."""
+    return self._number_of_paths
+
+  def AddPathSegments(self, path_segments):
+    """Adds the path segments of a path filter.
+
+    Args:
+      path_segments (list[str]): path segments, without the root path segment,
+          that contain regular expressions.
+
+    Raises:
+      ValueError: if a path segment contains an invalid regular expression.
+    """
+    scan_tree_node = self._root_node
+    for path_segment in path_segments:
+      if self._LITERAL_PATH_SEGMENT_RE.match(path_segment):
+        path_segment = self._UNESCAPE_RE.sub(r'\1', path_segment).lower()
+        sub_node = scan_tree_node.literal_sub_nodes.get(path_segment, None)
+        if not sub_node:
+          sub_node = PathFilterScanTreeNode()
+          scan_tree_node.literal_sub_nodes[path_segment] = sub_node
+
+      else:
+        _, sub_node = scan_tree_node.regex_sub_nodes.get(
+            path_segment, (None, None))
+        if not sub_node:
+          try:
+            compiled_regex = re.compile(
+                f'^{path_segment:s}$', flags=re.DOTALL | re.IGNORECASE)
+          except re.error as exception:
+            raise ValueError((
+                f'Invalid regular expression in path segment: '
+                f'{path_segment:s} with error: {exception!s}'))
+
+          sub_node = PathFilterScanTreeNode()
+          scan_tree_node.regex_sub_nodes[path_segment] = (
+              compiled_regex, sub_node)
+
+      scan_tree_node = sub_node
+
+    scan_tree_node.is_end_of_path = True
+    self._number_of_paths += 1
+
+  def CheckPathSegments(self, path_segments):
+    """Checks if path segments match a path filter in the scan tree.
+
+    Args:
+      path_segments (list[str]): path segments, without the root path segment.
+
+    Returns:
+      bool: True if the path segments match a path filter.
+    """
+    scan_tree_nodes = [self._root_node]
+    for path_segment in path_segments:
+      lower_path_segment = path_segment.lower()
+
+      sub_nodes = []
+      for scan_tree_node in scan_tree_nodes:
+        sub_node = scan_tree_node.literal_sub_nodes.get(
+            lower_path_segment, None)
+        if sub_node:
+          if sub_node.is_end_of_path:
+            return True
+          sub_nodes.append(sub_node)
+
+        for compiled_regex, sub_node in (
+            scan_tree_node.regex_sub_nodes.values()):
+          if compiled_regex.match(path_segment):
+            if sub_node.is_end_of_path:
+              return True
+            sub_nodes.append(sub_node)
+
+      if not sub_nodes:
+        break
+
+      scan_tree_nodes = sub_nodes
+
+    return False
+
+
 class PathCollectionFiltersHelper(object):
   """Path collection filters helper.
 
   Attributes:
     excluded_file_system_find_specs (list[dfvfs.FindSpec]): file system find
         specifications of paths to exclude from the collection.
+    excluded_paths_scan_tree (PathFilterScanTree): scan tree of paths to
+        exclude from the collection.
     included_file_system_find_specs (list[dfvfs.FindSpec]): file system find
         specifications of paths to include in the collection.
   """
@@ -64,6 +196,7 @@ class PathCollectionFiltersHelper(object):
     """Initializes a collection filters helper."""
     super(PathCollectionFiltersHelper, self).__init__()
     self.excluded_file_system_find_specs = []
+    self.excluded_paths_scan_tree = PathFilterScanTree()
     self.included_file_system_find_specs = []
 
   def BuildFindSpecs(self, path_filters, environment_variables=None):
@@ -117,6 +250,14 @@ class PathCollectionFiltersHelper(object):
             case_sensitive=False, location_regex=path_segments)
 
         if path_filter.filter_type == PathFilter.FILTER_TYPE_EXCLUDE:
+          try:
+            self.excluded_paths_scan_tree.AddPathSegments(path_segments)
+          except ValueError as exception:
+            logger.warning((
+                f'Unable to add exclude path: {path:s} with error: '
+                f'{exception!s}'))
+            continue
+
           self.excluded_file_system_find_specs.append(find_spec)
 
         elif path_filter.filter_type == PathFilter.FILTER_TYPE_INCLUDE:
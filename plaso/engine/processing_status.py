@@ -257,6 +257,11 @@ class ProcessingStatus(object):
         caused critical errors during processing.
     events_status (EventsStatus): status information about events.
     foreman_status (ProcessingStatus): foreman processing status.
+    number_of_unchanged_file_entries (int): number of file entries that were
+        not processed since they were not changed since a previous session.
+    size_of_unchanged_file_entries (int): total size in bytes of the file
+        entries that were not processed since they were not changed since
+        a previous session.
     start_time (float): time that the processing was started. Contains the
         number of micro seconds since January 1, 1970, 00:00:00 UTC.
     tasks_status (TasksStatus): status information about tasks.
@@ -271,6 +276,8 @@ class ProcessingStatus(object):
     self.error_path_specs = []
     self.events_status = None
     self.foreman_status = None
+    self.number_of_unchanged_file_entries = 0
+    self.size_of_unchanged_file_entries = 0
     self.start_time = time.time()
     self.tasks_status = None
 
@@ -489,18 +496,27 @@ class TasksStatus(object):
   """The status of the tasks.
 
   Attributes:
+    memory_budget (int): maximum amount of memory in bytes the scheduled
+        tasks are predicted to consume, where 0 represents no budget.
     number_of_abandoned_tasks (int): number of abandoned tasks.
+    number_of_deferred_tasks (int): number of tasks that were deferred because
+        they did not fit in the memory budget.
     number_of_queued_tasks (int): number of active tasks.
     number_of_tasks_pending_merge (int): number of tasks pending merge.
     number_of_tasks_processing (int): number of tasks processing.
+    predicted_memory_usage (int): predicted memory usage in bytes of the tasks
+        that are scheduled but not yet completed.
     total_number_of_tasks (int): total number of tasks.
   """
 
   def __init__(self):
     """Initializes a tasks status."""
     super(TasksStatus, self).__init__()
+    self.memory_budget = 0
     self.number_of_abandoned_tasks = 0
+    self.number_of_deferred_tasks = 0
     self.number_of_queued_tasks = 0
     self.number_of_tasks_pending_merge = 0
     self.number_of_tasks_processing = 0
+    self.predicted_memory_usage = 0
     self.total_number_of_tasks = 0
@@ -3,8 +3,12 @@
 
 import codecs
 import gzip
+import json
 import os
 import time
+import zlib
+
+from plaso.engine import logger
 
 
 class CPUTimeMeasurement(object):
@@ -103,6 +107,26 @@ class CPUTimeProfiler(SampleFileProfiler):
 
   _FILE_HEADER = 'Time\tName\tProcessing time\n'
 
+  def __init__(self, identifier, configuration):
+    """Initializes a CPU time profiler.
+
+    Args:
+      identifier (str): identifier of the profiling session used to create
+          the sample filename.
+      configuration (ProfilingConfiguration): profiling configuration.
+    """
+    super(CPUTimeProfiler, self).__init__(identifier, configuration)
+    self._trace_profiler = None
+
+  def SetTraceProfiler(self, trace_profiler):
+    """Sets the trace profiler.
+
+    Args:
+      trace_profiler (TraceProfiler): trace profiler that records the timed
+          profiles as spans or None to disable tracing.
+    """
+    self._trace_profiler = trace_profiler
+
   def StartTiming(self, profile_name):
     """Starts timing CPU time.
 
@@ -114,12 +138,18 @@ class CPUTimeProfiler(SampleFileProfiler):
 
     self._profile_measurements[profile_name].SampleStart()
 
+    if self._trace_profiler:
+      self._trace_profiler.StartTiming(profile_name)
+
   def StopTiming(self, profile_name):
     """Stops timing CPU time.
 
     Args:
       profile_name (str): name of the profile to sample.
     """
+    if self._trace_profiler:
+      self._trace_profiler.StopTiming(profile_name)
+
     measurements = self._profile_measurements.get(profile_name)
     if measurements:
       measurements.SampleStop()
@@ -220,6 +250,30 @@ class StorageProfiler(SampleFileProfiler):
         f'{processing_time:f}\t{data_size:d}\t{compressed_data_size:d}\n'))
 
 
+class TaskDurationsProfiler(SampleFileProfiler):
+  """The task durations profiler."""
+
+  _FILENAME_PREFIX = 'task_durations'
+
+  _FILE_HEADER = (
+      'Time\tIdentifier\tCost class\tSize\tPredicted duration\t'
+      'Actual duration\n')
+
+  def Sample(self, task, task_estimate, actual_duration):
+    """Takes a sample of the predicted and actual duration of a task.
+
+    Args:
+      task (Task): a task.
+      task_estimate (TaskCostEstimate): cost estimate of the task.
+      actual_duration (float): actual duration of the task in seconds.
+    """
+    sample_time = time.time()
+    self._WritesString((
+        f'{sample_time:f}\t{task.identifier:s}\t'
+        f'{task_estimate.cost_class:s}\t{task_estimate.size:d}\t'
+        f'{task_estimate.estimated_duration:f}\t{actual_duration:f}\n'))
+
+
 class TaskQueueProfiler(SampleFileProfiler):
   """The task queue profiler."""
 
@@ -243,6 +297,157 @@ class TaskQueueProfiler(SampleFileProfiler):
         f'{tasks_status.total_number_of_tasks:d}\n'))
 
 
+class TraceProfiler(SampleFileProfiler):
+  """The trace profiler.
+
+  The trace profiler records the wall-clock start time and duration of spans,
+  such as processing phases, of a single process. To keep the overhead low
+  the spans are kept in a fixed size buffer that is written to the sample file
+  in one go when it is full.
+
+  The sample files of the individual processes can be merged into a single
+  trace in the Chrome trace event format, that can be viewed with for example
+  Perfetto or chrome://tracing.
+  """
+
+  _FILENAME_PREFIX = 'trace'
+
+  _FILE_HEADER = 'Time\tName\tDuration\n'
+
+  # Maximum number of spans that are buffered before they are written to
+  # the sample file.
+  _MAXIMUM_NUMBER_OF_BUFFERED_SPANS = 4096
+
+  def __init__(self, identifier, configuration):
+    """Initializes a trace profiler.
+
+    Args:
+      identifier (str): identifier of the profiling session used to create
+          the sample filename.
+      configuration (ProfilingConfiguration): profiling configuration.
+    """
+    super(TraceProfiler, self).__init__(identifier, configuration)
+    self._spans = []
+    self._start_times = {}
+
+  def _FlushSpans(self):
+    """Writes the buffered spans to the sample file."""
+    if self._spans:
+      self._WritesString(''.join([
+          f'{start_time:f}\t{span_name:s}\t{duration:f}\n'
+          for start_time, span_name, duration in self._spans]))
+
+      self._spans = []
+
+  @classmethod
+  def MergeSampleFiles(cls, configuration, identifiers):
+    """Merges the sample files of multiple processes into a Chrome trace.
+
+    The trace is written to a file named "trace.json" in the profiling
+    directory.
+
+    Args:
+      configuration (ProfilingConfiguration): profiling configuration.
+      identifiers (list[str]): identifiers of the profiling sessions of
+          the processes, where sessions without a sample file are ignored.
+
+    Returns:
+      str: path of the Chrome trace file.
+    """
+    trace_events = []
+    spans_per_process = []
+    for identifier in identifiers:
+      filename = f'{cls._FILENAME_PREFIX:s}-{identifier:s}.csv.gz'
+      if configuration.directory:
+        filename = os.path.join(configuration.directory, filename)
+
+      if not os.path.exists(filename):
+        continue
+
+      spans = []
+      try:
+        with gzip.open(filename, 'rt', encoding='utf-8') as file_object:
+          # Skip the header.
+          file_object.readline()
+
+          for line in file_object:
+            # Ignore an incomplete last line of a truncated sample file.
+            values = line.rstrip('\n').split('\t')
+            if not line.endswith('\n') or len(values) != 3:
+              continue
+
+            start_time, span_name, duration = values
+            spans.append((float(start_time), span_name, float(duration)))
+
+      # The sample file of a process that was killed or aborted can be
+      # truncated, in which case the complete spans are kept.
+      except (EOFError, OSError, UnicodeDecodeError, ValueError,
+              zlib.error) as exception:
+        logger.warning((
+            f'Unable to read trace sample file: {filename:s} with error: '
+            f'{exception!s}'))
+
+      spans_per_process.append((identifier, spans))
+
+    first_start_time = min([
+        spans[0][0] for _, spans in spans_per_process if spans] or [0.0])
+
+    for process_index, (identifier, spans) in enumerate(spans_per_process):
+      trace_events.append({
+          'args': {'name': identifier},
+          'name': 'process_name',
+          'ph': 'M',
+          'pid': process_index,
+          'tid': 0})
+
+      for start_time, span_name, duration in spans:
+        trace_events.append({
+            'dur': int(duration * 1000000),
+            'name': span_name,
+            'ph': 'X',
+            'pid': process_index,
+            'tid': 0,
+            'ts': int((start_time - first_start_time) * 1000000)})
+
+    path = 'trace.json'
+    if configuration.directory:
+      path = os.path.join(configuration.directory, path)
+
+    with open(path, 'w', encoding='utf-8') as file_object:
+      json.dump(
+          {'displayTimeUnit': 'ms', 'traceEvents': trace_events}, file_object)
+
+    return path
+
+  def StartTiming(self, profile_name):
+    """Starts timing a span.
+
+    Args:
+      profile_name (str): name of the span.
+    """
+    self._start_times[profile_name] = time.time()
+
+  def Stop(self):
+    """Stops the profiler."""
+    self._FlushSpans()
+
+    super(TraceProfiler, self).Stop()
+
+  def StopTiming(self, profile_name):
+    """Stops timing a span.
+
+    Args:
+      profile_name (str): name of the span.
+    """
+    start_time = self._start_times.pop(profile_name, None)
+    if start_time is not None:
+      self._spans.append((
+          start_time, profile_name, time.time() - start_time))
+
+      if len(self._spans) >= self._MAXIMUM_NUMBER_OF_BUFFERED_SPANS:
+        self._FlushSpans()
+
+
 class TasksProfiler(SampleFileProfiler):
   """The tasks profiler."""
 
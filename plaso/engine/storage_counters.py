@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+"""Storage counters, which are used to tally attribute containers."""
+
+import collections
+
+from plaso.containers import counts
+from plaso.containers import events
+from plaso.containers import warnings
+
+
+class StorageCounters(object):
+  """Storage counters.
+
+  The storage counters tally the event data and warnings written to a session
+  store so that the totals can be persisted as count attribute containers,
+  instead of having to be recalculated from all stored attribute containers.
+
+  Attributes:
+    event_data_types_counter (collections.Counter): number of event data per
+        data type.
+    warnings_counter (collections.Counter): number of warnings per warning
+        type, parser chain and path specification.
+  """
+
+  _CONTAINER_TYPE_EVENT_DATA = events.EventData.CONTAINER_TYPE
+  _CONTAINER_TYPE_EVENT_DATA_TYPE_COUNT = (
+      counts.EventDataTypeCount.CONTAINER_TYPE)
+  _CONTAINER_TYPE_WARNING_COUNT = counts.WarningCount.CONTAINER_TYPE
+
+  _WARNING_CONTAINER_TYPES = frozenset([
+      warnings.ExtractionWarning.CONTAINER_TYPE,
+      warnings.RecoveryWarning.CONTAINER_TYPE,
+      warnings.TimeliningWarning.CONTAINER_TYPE])
+
+  def __init__(self):
+    """Initializes storage counters."""
+    super(StorageCounters, self).__init__()
+    self.event_data_types_counter = collections.Counter()
+    self.warnings_counter = collections.Counter()
+
+  def CountAttributeContainer(self, container):
+    """Counts an attribute container.
+
+    Args:
+      container (AttributeContainer): attribute container.
+    """
+    if container.CONTAINER_TYPE == self._CONTAINER_TYPE_EVENT_DATA:
+      data_type = getattr(container, 'data_type', None) or ''
+      self.event_data_types_counter[data_type] += 1
+
+    elif container.CONTAINER_TYPE in self._WARNING_CONTAINER_TYPES:
+      parser_chain = getattr(container, 'parser_chain', None)
+      path_spec = getattr(container, 'path_spec', None)
+
+      lookup_key = (container.CONTAINER_TYPE, parser_chain, path_spec)
+      self.warnings_counter[lookup_key] += 1
+
+  def WriteCounters(self, storage_writer):
+    """Writes the counters as count attribute containers.
+
+    Count attribute containers that already exist in the store, for example
+    from a previous session, are updated and the counters are reset
+    afterwards.
+
+    Args:
+      storage_writer (StorageWriter): storage writer.
+    """
+    if self.event_data_types_counter:
+      stored_counts = {
+          event_data_type_count.data_type: event_data_type_count
+          for event_data_type_count in storage_writer.GetAttributeContainers(
+              self._CONTAINER_TYPE_EVENT_DATA_TYPE_COUNT)}
+
+      for data_type, value in self.event_data_types_counter.items():
+        event_data_type_count = stored_counts.get(data_type, None)
+        if event_data_type_count:
+          event_data_type_count.number_of_event_data += value
+          storage_writer.UpdateAttributeContainer(event_data_type_count)
+        else:
+          event_data_type_count = counts.EventDataTypeCount(
+              data_type=data_type, number_of_event_data=value)
+          storage_writer.AddAttributeContainer(event_data_type_count)
+
+    if self.warnings_counter:
+      stored_counts = {
+          (warning_count.warning_type, warning_count.parser_chain,
+           warning_count.path_spec): warning_count
+          for warning_count in storage_writer.GetAttributeContainers(
+              self._CONTAINER_TYPE_WARNING_COUNT)}
+
+      for lookup_key, value in self.warnings_counter.items():
+        warning_count = stored_counts.get(lookup_key, None)
+        if warning_count:
+          warning_count.number_of_warnings += value
+          storage_writer.UpdateAttributeContainer(warning_count)
+        else:
+          warning_type, parser_chain, path_spec = lookup_key
+          warning_count = counts.WarningCount(
+              number_of_warnings=value, parser_chain=parser_chain,
+              path_spec=path_spec, warning_type=warning_type)
+          storage_writer.AddAttributeContainer(warning_count)
+
+    self.event_data_types_counter = collections.Counter()
+    self.warnings_counter = collections.Counter()
@@ -991,13 +991,56 @@ class EventExtractionWorker(object):
     """
     return [analyzer_instance.NAME for analyzer_instance in self._analyzers]
 
-  def ProcessFileEntry(self, parser_mediator, file_entry):
+  def ProcessEventSourcePartition(
+      self, parser_mediator, file_entry, parser_name, partition):
+    """Processes an event source partition of a file entry.
+
+    Only the parser that produced the event source partition is used and no
+    event data stream is produced, since both the analyzers and the event data
+    stream are handled when processing the file entry that was partitioned.
+
+    Args:
+      parser_mediator (ParserMediator): mediates interactions between parsers
+          and other components, such as storage and dfVFS.
+      file_entry (dfvfs.FileEntry): file entry.
+      parser_name (str): name of the parser that produced the event source
+          partition.
+      partition (tuple[int, int]): start and end of the event source
+          partition.
+    """
+    self.last_activity_timestamp = time.time()
+    self.processing_status = definitions.STATUS_INDICATOR_EXTRACTING
+
+    parser_mediator.SetFileEntry(file_entry)
+    parser_mediator.SetEventSourcePartition(partition)
+
+    if self._processing_profiler:
+      self._processing_profiler.StartTiming('extracting')
+
+    try:
+      self._event_data_extractor.ParseEventSourcePartition(
+          parser_mediator, file_entry, parser_name)
+
+    finally:
+      if self._processing_profiler:
+        self._processing_profiler.StopTiming('extracting')
+
+      parser_mediator.SetEventSourcePartition(None)
+      parser_mediator.ResetFileEntry()
+
+      self.last_activity_timestamp = time.time()
+      self.processing_status = definitions.STATUS_INDICATOR_IDLE
+
+  def ProcessFileEntry(self, parser_mediator, file_entry, collect_only=False):
     """Processes a file entry.
 
     Args:
       parser_mediator (ParserMediator): mediates interactions between parsers
           and other components, such as storage and dfVFS.
       file_entry (dfvfs.FileEntry): file entry.
+      collect_only (Optional[bool]): True if only the sub file entries of
+          a directory should be collected and the file entry itself should
+          not be processed.
     """
     self.last_activity_timestamp = time.time()
     self.processing_status = definitions.STATUS_INDICATOR_RUNNING
@@ -1008,7 +1051,8 @@ class EventExtractionWorker(object):
       if file_entry.IsDirectory():
         self._ProcessDirectory(parser_mediator, file_entry)
 
-      self._ProcessFileEntry(parser_mediator, file_entry)
+      if not collect_only:
+        self._ProcessFileEntry(parser_mediator, file_entry)
 
     finally:
       parser_mediator.ResetFileEntry()
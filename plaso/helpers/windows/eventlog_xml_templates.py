@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+"""Windows XML EventLog (EVTX) XML templates helper."""
+
+import hashlib
+import re
+
+from plaso.containers import artifacts
+
+
+class WindowsEventLogXMLTemplatesHelper(object):
+  """Windows XML EventLog (EVTX) XML templates helper.
+
+  The helper splits the XML representation of an event record into a template
+  and substitution values, where the substitution values are the attribute
+  values and the element text that is not only whitespace. Event records that
+  only differ in their substitution values share the same template, which
+  allows the template to be stored once.
+  """
+
+  _CONTAINER_TYPE_XML_TEMPLATE = (
+      artifacts.WindowsEventLogXMLTemplateArtifact.CONTAINER_TYPE)
+
+  _SUBSTITUTION_VALUES_RE = re.compile(
+      r'="([^"]*)"|>([^<]*[^<\s][^<]*)<')
+
+  def __init__(self):
+    """Initializes a Windows XML EventLog (EVTX) XML templates helper."""
+    super(WindowsEventLogXMLTemplatesHelper, self).__init__()
+    self._templates_per_identifier = {}
+    self._templates_read = False
+
+  @classmethod
+  def CreateXMLTemplate(cls, xml_string):
+    """Creates a XML template from the XML representation of an event record.
+
+    Args:
+      xml_string (str): XML representation of the event record.
+
+    Returns:
+      tuple[WindowsEventLogXMLTemplateArtifact, list[str]]: XML template and
+          substitution values.
+    """
+    fragments = []
+    values = []
+
+    fragment_start_offset = 0
+    for match in cls._SUBSTITUTION_VALUES_RE.finditer(xml_string):
+      group_index = 1 if match.group(1) is not None else 2
+      value_start_offset, value_end_offset = match.span(group_index)
+
+      fragments.append(xml_string[fragment_start_offset:value_start_offset])
+      values.append(match.group(group_index))
+
+      fragment_start_offset = value_end_offset
+
+    fragments.append(xml_string[fragment_start_offset:])
+
+    template_data = '\x00'.join(fragments).encode(
+        'utf-8', errors='surrogatepass')
+    identifier = hashlib.md5(template_data).hexdigest()
+
+    xml_template = artifacts.WindowsEventLogXMLTemplateArtifact(
+        fragments=fragments, identifier=identifier)
+
+    return xml_template, values
+
+  def RenderXMLString(self, storage_reader, event_data):
+    """Renders the XML representation of an event record from its template.
+
+    On success the XML representation is stored in the xml_string attribute
+    of the event data and the xml_template_identifier and xml_values
+    attributes are removed.
+
+    Args:
+      storage_reader (StorageReader): storage reader.
+      event_data (EventData): event data.
+
+    Returns:
+      bool: True if the XML representation was rendered.
+    """
+    template_identifier = getattr(event_data, 'xml_template_identifier', None)
+    if not template_identifier:
+      return False
+
+    xml_template = self._templates_per_identifier.get(
+        template_identifier, None)
+    if not xml_template and not self._templates_read:
+      for xml_template in storage_reader.GetAttributeContainers(
+          self._CONTAINER_TYPE_XML_TEMPLATE):
+        self._templates_per_identifier[xml_template.identifier] = xml_template
+
+      self._templates_read = True
+
+      xml_template = self._templates_per_identifier.get(
+          template_identifier, None)
+
+    if not xml_template:
+      return False
+
+    try:
+      event_data.xml_string = xml_template.RenderXMLString(
+          getattr(event_data, 'xml_values', None) or [])
+    except ValueError:
+      return False
+
+    event_data.xml_template_identifier = None
+    event_data.xml_values = None
+
+    return True
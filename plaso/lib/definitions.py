@@ -33,6 +33,15 @@ COMPRESSION_FORMATS = frozenset([
     COMPRESSION_FORMAT_NONE,
     COMPRESSION_FORMAT_ZLIB])
 
+# Incremental extraction modes, which define how unchanged file entries are
+# detected.
+INCREMENTAL_MODE_DIGEST = 'digest'
+INCREMENTAL_MODE_METADATA = 'metadata'
+
+INCREMENTAL_MODES = frozenset([
+    INCREMENTAL_MODE_DIGEST,
+    INCREMENTAL_MODE_METADATA])
+
 # Operating system families.
 OPERATING_SYSTEM_FAMILY_LINUX = 'Linux'
 OPERATING_SYSTEM_FAMILY_MACOS = 'MacOS'
@@ -2,7 +2,10 @@
 """The dtFabric helper mix-in."""
 
 import os
+import struct
 
+from dtfabric import data_types as dtfabric_data_types
+from dtfabric import definitions as dtfabric_definitions
 from dtfabric import errors as dtfabric_errors
 from dtfabric.runtime import data_maps as dtfabric_data_maps
 from dtfabric.runtime import fabric as dtfabric_fabric
@@ -10,6 +13,57 @@ from dtfabric.runtime import fabric as dtfabric_fabric
 from plaso.lib import errors
 
 
+class StructureReader(object):
+  """Precompiled reader of a fixed-size structure.
+
+  The structure reader maps a byte stream onto a structure values object with
+  a single Python struct operation. It is used instead of the generic dtFabric
+  runtime for structures that consist only of integer and floating-point
+  members without supported values.
+
+  Attributes:
+    byte_size (int): size of the structure in bytes.
+    name (str): name of the structure.
+  """
+
+  def __init__(self, name, format_string, create_structure_values):
+    """Initializes a structure reader.
+
+    Args:
+      name (str): name of the structure.
+      format_string (str): Python struct format string, including the byte
+          order, of the structure.
+      create_structure_values (function): function to create a structure
+          values object from the unpacked member values.
+    """
+    super(StructureReader, self).__init__()
+    self._create_structure_values = create_structure_values
+    self._struct = struct.Struct(format_string)
+    self.byte_size = self._struct.size
+    self.name = name
+
+  def Read(self, byte_stream):
+    """Reads the structure from a byte stream.
+
+    Args:
+      byte_stream (bytes): byte stream.
+
+    Returns:
+      object: structure values object.
+
+    Raises:
+      ValueError: if the byte stream is too small.
+    """
+    byte_stream_size = len(byte_stream)
+    if byte_stream_size < self.byte_size:
+      raise ValueError((
+          'Byte stream too small requested: {0:d} available: {1:d}').format(
+              self.byte_size, byte_stream_size))
+
+    return self._create_structure_values(*self._struct.unpack_from(
+        byte_stream))
+
+
 class DtFabricHelper(object):
   """dtFabric format definition helper mix-in.
 
@@ -50,17 +104,93 @@ class DtFabricHelper(object):
   following byte stream: 01 00 00 00 02 00 00 00 03 00 00 00
 
   The corresponding "point3d" Python object would be: point3d(x=1, y=2, z=3)
+
+  The data type fabric, data type maps and structure readers of a definition
+  file are cached at class level and shared by all instances that use the
+  same definition file.
   """
 
   # The dtFabric definition file, which must be overwritten by a subclass.
   _DEFINITION_FILE = None
 
+  _MEMBER_DEFINITION_TYPES_WITH_STRUCTURE_READER = (
+      dtfabric_data_types.FloatingPointDefinition,
+      dtfabric_data_types.IntegerDefinition)
+
+  # Data type fabrics, data type maps and structure readers per definition
+  # file path.
+  _data_type_maps_per_definition_file = {}
+  _fabrics_per_definition_file = {}
+  _structure_readers_per_definition_file = {}
+
   def __init__(self):
     """Initializes the dtFabric format definition helper mix-in."""
     super(DtFabricHelper, self).__init__()
-    self._data_type_maps = {}
     self._fabric = self._ReadDefinitionFile(self._DEFINITION_FILE)
 
+    if not self._DEFINITION_FILE:
+      self._data_type_maps = {}
+      self._structure_readers = {}
+    else:
+      self._data_type_maps = (
+          DtFabricHelper._data_type_maps_per_definition_file.setdefault(
+              self._DEFINITION_FILE, {}))
+      self._structure_readers = (
+          DtFabricHelper._structure_readers_per_definition_file.setdefault(
+              self._DEFINITION_FILE, {}))
+
+  def _CreateStructureReader(self, name, data_type_map):
+    """Creates a precompiled structure reader.
+
+    Args:
+      name (str): name of the data type as defined by the definition file.
+      data_type_map (dtfabric.DataTypeMap): data type map of the data type.
+
+    Returns:
+      StructureReader: structure reader or None if the data type is not
+          a fixed-size structure that can be read by a single Python struct
+          operation.
+    """
+    if not isinstance(data_type_map, dtfabric_data_maps.StructureMap):
+      return None
+
+    data_type_definition = self._fabric.GetDefinitionByName(name)
+    members = getattr(data_type_definition, 'members', None)
+    if not members:
+      return None
+
+    byte_orders = set([data_type_definition.byte_order])
+    for member_definition in members:
+      if (member_definition.IsComposite() or
+          getattr(member_definition, 'values', None)):
+        return None
+
+      member_data_type_definition = getattr(
+          member_definition, 'member_data_type_definition', None)
+      if not isinstance(
+          member_data_type_definition,
+          self._MEMBER_DEFINITION_TYPES_WITH_STRUCTURE_READER):
+        return None
+
+      byte_orders.add(member_definition.byte_order)
+
+    byte_orders.discard(dtfabric_definitions.BYTE_ORDER_NATIVE)
+    if len(byte_orders) > 1:
+      return None
+
+    byte_order_string = data_type_map.GetStructByteOrderString()
+    format_string = data_type_map.GetStructFormatString()
+    if not byte_order_string or not format_string:
+      return None
+
+    structure_reader = StructureReader(
+        data_type_map.name, ''.join([byte_order_string, format_string]),
+        data_type_map.CreateStructureValues)
+    if structure_reader.byte_size != data_type_definition.GetByteSize():
+      return None
+
+    return structure_reader
+
   def _FormatPackedIPv4Address(self, packed_ip_address):
     """Formats a packed IPv4 address as a human readable string.
 
@@ -91,7 +221,9 @@ class DtFabricHelper(object):
   def _GetDataTypeMap(self, name):
     """Retrieves a data type map defined by the definition file.
 
-    The data type maps are cached for reuse.
+    The data type maps are cached for reuse. If the data type is a fixed-size
+    structure a precompiled structure reader is created as well, which is
+    used instead of the data type map to read the structure.
 
     Args:
       name (str): name of the data type as defined by the definition file.
@@ -105,6 +237,10 @@ class DtFabricHelper(object):
       data_type_map = self._fabric.CreateDataTypeMap(name)
       self._data_type_maps[name] = data_type_map
 
+      structure_reader = self._CreateStructureReader(name, data_type_map)
+      if structure_reader:
+        self._structure_readers[data_type_map] = structure_reader
+
     return data_type_map
 
   def _ReadData(self, file_object, file_offset, data_size):
@@ -151,6 +287,9 @@ class DtFabricHelper(object):
   def _ReadDefinitionFile(self, path):
     """Reads a dtFabric definition file.
 
+    The data type fabric is cached for reuse by all instances that use
+    the same definition file.
+
     Args:
       path (str): path of the dtFabric definition file.
 
@@ -162,10 +301,15 @@ class DtFabricHelper(object):
     if not path:
       return None
 
-    with open(path, 'rb') as file_object:
-      definition = file_object.read()
+    fabric = DtFabricHelper._fabrics_per_definition_file.get(path, None)
+    if not fabric:
+      with open(path, 'rb') as file_object:
+        definition = file_object.read()
+
+      fabric = dtfabric_fabric.DataTypeFabric(yaml_definition=definition)
+      DtFabricHelper._fabrics_per_definition_file[path] = fabric
 
-    return dtfabric_fabric.DataTypeFabric(yaml_definition=definition)
+    return fabric
 
   def _ReadStructureFromByteStream(
       self, byte_stream, file_offset, data_type_map, context=None):
@@ -194,6 +338,22 @@ class DtFabricHelper(object):
     if not data_type_map:
       raise ValueError('Missing data type map.')
 
+    structure_reader = self._structure_readers.get(data_type_map, None)
+    if structure_reader:
+      try:
+        structure_values_object = structure_reader.Read(byte_stream)
+      except ValueError as exception:
+        raise errors.ParseError((
+            'Unable to map {0:s} data at offset: 0x{1:08x} with error: '
+            '{2!s}').format(structure_reader.name, file_offset, exception))
+
+      if context:
+        context.byte_size = structure_reader.byte_size
+        context.requested_size = structure_reader.byte_size
+        context.state = {}
+
+      return structure_values_object
+
     try:
       return data_type_map.MapByteStream(byte_stream, context=context)
     except (dtfabric_errors.ByteStreamTooSmallError,
@@ -226,6 +386,14 @@ class DtFabricHelper(object):
       ParseError: if the structure cannot be read.
       ValueError: if file-like object or data type map is missing.
     """
+    structure_reader = self._structure_readers.get(data_type_map, None)
+    if structure_reader:
+      data = self._ReadData(
+          file_object, file_offset, structure_reader.byte_size)
+      structure_values_object = self._ReadStructureFromByteStream(
+          data, file_offset, data_type_map)
+      return structure_values_object, structure_reader.byte_size
+
     context = None
     data = b''
     last_data_size = 0
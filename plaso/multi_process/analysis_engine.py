@@ -9,13 +9,16 @@ from plaso.containers import counts
 from plaso.containers import events
 from plaso.containers import reports
 from plaso.containers import tasks
+from plaso.containers import warnings
 from plaso.engine import processing_status
+from plaso.helpers.windows import eventlog_xml_templates
 from plaso.lib import definitions
 from plaso.lib import errors
 from plaso.multi_process import analysis_process
 from plaso.multi_process import logger
 from plaso.multi_process import merge_helpers
 from plaso.multi_process import plaso_queue
+from plaso.multi_process import shared_memory_queue
 from plaso.multi_process import task_engine
 from plaso.multi_process import zeromq_queue
 
@@ -31,16 +34,30 @@ class AnalysisMultiProcessEngine(task_engine.TaskMultiProcessEngine):
   # pylint: disable=abstract-method
 
   _CONTAINER_TYPE_ANALYSIS_REPORT = reports.AnalysisReport.CONTAINER_TYPE
+  _CONTAINER_TYPE_ANALYSIS_WARNING = warnings.AnalysisWarning.CONTAINER_TYPE
   _CONTAINER_TYPE_EVENT_TAG = events.EventTag.CONTAINER_TYPE
 
+  # Maximum number of events that are sent to an analysis process in a single
+  # batch.
+  _EVENT_QUEUE_MAXIMUM_BATCH_SIZE = 256
+
   _PROCESS_JOIN_TIMEOUT = 5.0
 
   _QUEUE_TIMEOUT = 10 * 60
 
-  def __init__(self, worker_memory_limit=None, worker_timeout=None):
+  def __init__(
+      self, number_of_partitions=None, use_event_broadcast=False,
+      worker_memory_limit=None, worker_timeout=None):
     """Initializes a task-based multi-process analysis engine.
 
     Args:
+      number_of_partitions (Optional[int]): number of analysis processes that
+          run a partitionable analysis plugin, where each process analyzes
+          a disjoint partition of the events, where None or 1 represents
+          a single analysis process per analysis plugin.
+      use_event_broadcast (Optional[bool]): True if the events should be
+          broadcast to the analysis processes via a shared memory ring buffer
+          instead of pushed onto a ZeroMQ queue per analysis process.
       worker_memory_limit (Optional[int]): maximum amount of memory a worker is
           allowed to consume, where None represents the default memory limit
           and 0 represents no limit.
@@ -55,6 +72,8 @@ class AnalysisMultiProcessEngine(task_engine.TaskMultiProcessEngine):
     self._analysis_plugins = {}
     self._completed_analysis_processes = set()
     self._data_location = None
+    self._event_broadcast_queue = None
+    self._event_broadcast_reader_indexes = {}
     self._event_filter_expression = None
     self._event_labels_counter = None
     self._event_queues = {}
@@ -66,16 +85,20 @@ class AnalysisMultiProcessEngine(task_engine.TaskMultiProcessEngine):
     self._number_of_consumed_event_tags = 0
     self._number_of_consumed_events = 0
     self._number_of_consumed_sources = 0
+    self._number_of_partitions = number_of_partitions or 1
     self._number_of_produced_analysis_reports = 0
     self._number_of_produced_event_data = 0
     self._number_of_produced_event_tags = 0
     self._number_of_produced_events = 0
     self._number_of_produced_sources = 0
+    self._partition_indexes = {}
+    self._process_names_per_plugin = {}
     self._processing_profiler = None
     self._serializers_profiler = None
     self._session = None
     self._status = definitions.STATUS_INDICATOR_IDLE
     self._status_update_callback = None
+    self._use_event_broadcast = use_event_broadcast
     self._user_accounts = None
     self._worker_memory_limit = worker_memory_limit
     self._worker_timeout = worker_timeout or definitions.DEFAULT_WORKER_TIMEOUT
@@ -114,11 +137,30 @@ class AnalysisMultiProcessEngine(task_engine.TaskMultiProcessEngine):
 
     filter_limit = getattr(event_filter, 'limit', None)
 
+    xml_templates_helper = (
+        eventlog_xml_templates.WindowsEventLogXMLTemplatesHelper())
+
+    # The events of a partitionable analysis plugin that is run by multiple
+    # analysis processes are pushed onto the event queue of the process that
+    # analyzes the partition of the event. Note that with the event broadcast
+    # every process reads all the events and skips the events of the other
+    # partitions.
+    event_queues_per_plugin = []
+    if self._event_queues:
+      for analysis_plugin in analysis_plugins.values():
+        event_queues = [
+            self._event_queues.get(process_name, None)
+            for process_name in self._process_names_per_plugin.get(
+                analysis_plugin.NAME, [])]
+        event_queues_per_plugin.append((analysis_plugin, event_queues))
+
     for event in storage_writer.GetSortedEvents():
       event_data_identifier = event.GetEventDataIdentifier()
       event_data = storage_writer.GetAttributeContainerByIdentifier(
           events.EventData.CONTAINER_TYPE, event_data_identifier)
 
+      xml_templates_helper.RenderXMLString(storage_writer, event_data)
+
       event_data_stream_identifier = event_data.GetEventDataStreamIdentifier()
       if event_data_stream_identifier:
         event_data_stream = storage_writer.GetAttributeContainerByIdentifier(
@@ -140,9 +182,22 @@ class AnalysisMultiProcessEngine(task_engine.TaskMultiProcessEngine):
         number_of_filtered_events += 1
         continue
 
-      for event_queue in self._event_queues.values():
+      if self._event_broadcast_queue:
+        self._event_broadcast_queue.PushItem(
+            (event, event_data, event_data_stream))
+
+      for analysis_plugin, event_queues in event_queues_per_plugin:
+        if len(event_queues) == 1:
+          event_queue = event_queues[0]
+        else:
+          partition_index = analysis_plugin.GetEventPartition(
+              self._number_of_consumed_events, event, event_data,
+              event_data_stream, len(event_queues))
+          event_queue = event_queues[partition_index]
+
         # TODO: Check for premature exit of analysis plugins.
-        event_queue.PushItem((event, event_data, event_data_stream))
+        if event_queue:
+          event_queue.PushItem((event, event_data, event_data_stream))
 
       self._number_of_consumed_events += 1
 
@@ -152,22 +207,41 @@ class AnalysisMultiProcessEngine(task_engine.TaskMultiProcessEngine):
 
     logger.debug('Finished pushing events to analysis plugins.')
     # Signal that we have finished adding events.
+    if self._event_broadcast_queue:
+      self._event_broadcast_queue.PushItem(plaso_queue.QueueAbort())
+
     for event_queue in self._event_queues.values():
       event_queue.PushItem(plaso_queue.QueueAbort(), block=False)
 
     logger.debug('Processing analysis plugin results.')
 
+    # The reports and analysis results of the processes that run
+    # a partitionable analysis plugin are reduced by the plugin once all
+    # partitions have been merged.
+    partition_reports = collections.defaultdict(list)
+    partition_results = collections.defaultdict(list)
+    number_of_unmerged_partitions = collections.Counter()
+
+    process_names = []
+    for analysis_plugin in analysis_plugins.values():
+      plugin_process_names = self._process_names_per_plugin.get(
+          analysis_plugin.NAME, [])
+      if len(plugin_process_names) > 1:
+        number_of_unmerged_partitions[analysis_plugin.NAME] = len(
+            plugin_process_names)
+
+      process_names.extend(plugin_process_names)
+
     # TODO: use a task based approach.
-    plugin_names = list(analysis_plugins.keys())
-    while plugin_names:
-      for plugin_name in list(plugin_names):
+    while process_names:
+      for process_name in list(process_names):
         if self._abort:
           break
 
         # TODO: temporary solution.
         task = tasks.Task()
         task.storage_format = definitions.STORAGE_FORMAT_SQLITE
-        task.identifier = plugin_name
+        task.identifier = process_name
 
         merge_ready = self._CheckTaskReadyForMerge(
             definitions.STORAGE_FORMAT_SQLITE, task)
@@ -175,10 +249,18 @@ class AnalysisMultiProcessEngine(task_engine.TaskMultiProcessEngine):
           self._PrepareMergeTaskStorage(definitions.STORAGE_FORMAT_SQLITE, task)
           self._status = definitions.STATUS_INDICATOR_MERGING
 
-          event_queue = self._event_queues[plugin_name]
-          del self._event_queues[plugin_name]
+          event_queue = self._event_queues.pop(process_name, None)
+          if event_queue:
+            event_queue.Close()
+
+          analysis_plugin = self._analysis_plugins[process_name]
+          plugin_name = analysis_plugin.NAME
 
-          event_queue.Close()
+          if number_of_unmerged_partitions[plugin_name]:
+            reduce_containers = (
+                partition_reports[plugin_name], partition_results[plugin_name])
+          else:
+            reduce_containers = None
 
           task_storage_reader = self._GetMergeTaskStorage(
               definitions.STORAGE_FORMAT_SQLITE, task)
@@ -191,7 +273,8 @@ class AnalysisMultiProcessEngine(task_engine.TaskMultiProcessEngine):
                 merge_helper.task_identifier))
 
             number_of_containers = self._MergeAttributeContainers(
-                storage_writer, merge_helper)
+                storage_writer, merge_helper,
+                reduce_containers=reduce_containers)
 
             logger.debug('Merged {0:d} containers of task: {1:s}'.format(
                 number_of_containers, merge_helper.task_identifier))
@@ -202,10 +285,18 @@ class AnalysisMultiProcessEngine(task_engine.TaskMultiProcessEngine):
           self._RemoveMergeTaskStorage(
               definitions.STORAGE_FORMAT_SQLITE, task)
 
+          if reduce_containers:
+            number_of_unmerged_partitions[plugin_name] -= 1
+            if not number_of_unmerged_partitions[plugin_name]:
+              self._ReducePartitions(
+                  storage_writer, analysis_plugin,
+                  partition_reports.pop(plugin_name),
+                  partition_results.pop(plugin_name))
+
           self._status = definitions.STATUS_INDICATOR_RUNNING
 
           # TODO: temporary solution.
-          plugin_names.remove(plugin_name)
+          process_names.remove(process_name)
 
     events_counter = collections.Counter()
     events_counter['Events filtered'] = number_of_filtered_events
@@ -290,14 +381,49 @@ class AnalysisMultiProcessEngine(task_engine.TaskMultiProcessEngine):
               process.name, pid, status_indicator))
 
       self._TerminateProcessByPid(pid)
+      self._DetachEventBroadcastReader(process.name)
+
+  def _CloseEventBroadcastQueue(self, abort=False):
+    """Closes the event broadcast queue.
 
-  def _MergeAttributeContainers(self, storage_writer, merge_helper):
+    Args:
+      abort (Optional[bool]): True to indicated the close is issued on abort.
+    """
+    if self._event_broadcast_queue:
+      try:
+        self._event_broadcast_queue.Close(abort=abort)
+      except errors.QueueFull:
+        logger.warning('Unable to write remaining events to broadcast queue.')
+
+      self._event_broadcast_queue = None
+
+    self._event_broadcast_reader_indexes = {}
+
+  def _DetachEventBroadcastReader(self, process_name):
+    """Detaches the reader of an analysis process from the event broadcast.
+
+    This prevents the main (foreman) process from waiting for an analysis
+    process that no longer reads events.
+
+    Args:
+      process_name (str): process name.
+    """
+    reader_index = self._event_broadcast_reader_indexes.get(process_name, None)
+    if self._event_broadcast_queue and reader_index is not None:
+      self._event_broadcast_queue.DetachReader(reader_index)
+
+  def _MergeAttributeContainers(
+      self, storage_writer, merge_helper, reduce_containers=None):
     """Merges attribute containers from a task store into the storage writer.
 
     Args:
       storage_writer (StorageWriter): storage writer.
       merge_helper (AnalysisTaskMergeHelper): helper to merge attribute
           containers.
+      reduce_containers (Optional[tuple[list[AnalysisReport],
+          list[AttributeContainer]]]): lists to which the analysis reports and
+          analysis results are added instead of being written to the storage
+          writer, such that they can be reduced.
 
     Returns:
       int: number of containers merged.
@@ -311,23 +437,60 @@ class AnalysisMultiProcessEngine(task_engine.TaskMultiProcessEngine):
 
       if container.CONTAINER_TYPE == self._CONTAINER_TYPE_EVENT_TAG:
         storage_writer.AddOrUpdateEventTag(container)
-      else:
-        storage_writer.AddAttributeContainer(container)
 
-      if container.CONTAINER_TYPE == self._CONTAINER_TYPE_ANALYSIS_REPORT:
-        self._number_of_produced_analysis_reports += 1
-
-      elif container.CONTAINER_TYPE == self._CONTAINER_TYPE_EVENT_TAG:
         self._number_of_produced_event_tags += 1
 
         for label in container.labels:
           self._event_labels_counter[label] += 1
           self._event_labels_counter['total'] += 1
 
+      elif reduce_containers and (
+          container.CONTAINER_TYPE == self._CONTAINER_TYPE_ANALYSIS_REPORT):
+        reduce_containers[0].append(container)
+
+      elif reduce_containers and (
+          container.CONTAINER_TYPE != self._CONTAINER_TYPE_ANALYSIS_WARNING):
+        reduce_containers[1].append(container)
+
+      else:
+        storage_writer.AddAttributeContainer(container)
+
+        if container.CONTAINER_TYPE == self._CONTAINER_TYPE_ANALYSIS_REPORT:
+          self._number_of_produced_analysis_reports += 1
+
       container = merge_helper.GetAttributeContainer()
 
     return number_of_containers
 
+  def _ReducePartitions(
+      self, storage_writer, analysis_plugin, partition_reports,
+      partition_results):
+    """Reduces the results of the partitions of an analysis plugin.
+
+    Args:
+      storage_writer (StorageWriter): storage writer.
+      analysis_plugin (AnalysisPlugin): partitionable analysis plugin.
+      partition_reports (list[AnalysisReport]): reports of the partitions.
+      partition_results (list[AttributeContainer]): analysis results of
+          the partitions.
+    """
+    logger.debug((
+        'Reducing {0:d} reports and {1:d} analysis results of plugin: '
+        '{2:s}').format(
+            len(partition_reports), len(partition_results),
+            analysis_plugin.NAME))
+
+    analysis_report, analysis_results = analysis_plugin.ReducePartitions(
+        partition_reports, partition_results)
+
+    for analysis_result in analysis_results:
+      storage_writer.AddAttributeContainer(analysis_result)
+
+    if analysis_report:
+      storage_writer.AddAttributeContainer(analysis_report)
+
+      self._number_of_produced_analysis_reports += 1
+
   def _StartAnalysisProcesses(self, analysis_plugins):
     """Starts the analysis processes.
 
@@ -337,13 +500,49 @@ class AnalysisMultiProcessEngine(task_engine.TaskMultiProcessEngine):
     """
     logger.info('Starting analysis plugins.')
 
+    self._event_broadcast_reader_indexes = {}
+    self._partition_indexes = {}
+    self._process_names_per_plugin = {}
+
     for analysis_plugin in analysis_plugins.values():
-      self._analysis_plugins[analysis_plugin.NAME] = analysis_plugin
+      if analysis_plugin.PARTITIONABLE and self._number_of_partitions > 1:
+        process_names = []
+        for partition_index in range(self._number_of_partitions):
+          process_name = '{0:s}-{1:d}'.format(
+              analysis_plugin.NAME, partition_index)
+          process_names.append(process_name)
+
+          self._partition_indexes[process_name] = partition_index
+
+      else:
+        process_names = [analysis_plugin.NAME]
+
+      for process_name in process_names:
+        self._analysis_plugins[process_name] = analysis_plugin
+
+      self._process_names_per_plugin[analysis_plugin.NAME] = process_names
+
+    if self._use_event_broadcast:
+      self._event_broadcast_queue = (
+          shared_memory_queue.SharedMemoryBroadcastWriterQueue(
+              len(self._analysis_plugins),
+              maximum_batch_size=self._EVENT_QUEUE_MAXIMUM_BATCH_SIZE,
+              name='analysis event broadcast queue',
+              timeout_seconds=self._QUEUE_TIMEOUT))
 
-      process = self._StartWorkerProcess(analysis_plugin.NAME)
+      try:
+        self._event_broadcast_queue.Open()
+      except (IOError, OSError) as exception:
+        logger.warning((
+            'Unable to create event broadcast queue with error: {0!s}, '
+            'falling back to ZeroMQ queues.').format(exception))
+        self._event_broadcast_queue = None
+
+    for process_name in self._analysis_plugins.keys():
+      process = self._StartWorkerProcess(process_name)
       if not process:
         logger.error('Unable to create analysis process: {0:s}'.format(
-            analysis_plugin.NAME))
+            process_name))
 
     logger.info('Analysis plugins running')
 
@@ -361,25 +560,47 @@ class AnalysisMultiProcessEngine(task_engine.TaskMultiProcessEngine):
       logger.error('Missing analysis plugin: {0:s}'.format(process_name))
       return None
 
-    queue_name = '{0:s} output event queue'.format(process_name)
-    output_event_queue = zeromq_queue.ZeroMQPushBindQueue(
-        name=queue_name, timeout_seconds=self._QUEUE_TIMEOUT)
-    # Open the queue so it can bind to a random port, and we can get the
-    # port number to use in the input queue.
-    output_event_queue.Open()
+    queue_name = '{0:s} input event queue'.format(process_name)
 
-    self._event_queues[process_name] = output_event_queue
+    number_of_partitions = None
+    partition_index = self._partition_indexes.get(process_name, None)
 
-    queue_name = '{0:s} input event queue'.format(process_name)
-    input_event_queue = zeromq_queue.ZeroMQPullConnectQueue(
-        name=queue_name, delay_open=True, port=output_event_queue.port,
-        timeout_seconds=self._QUEUE_TIMEOUT)
+    if self._event_broadcast_queue:
+      # Every process reads all the events from the event broadcast and
+      # therefore needs to skip the events of the other partitions.
+      if partition_index is not None:
+        number_of_partitions = self._number_of_partitions
+
+      reader_index = len(self._event_broadcast_reader_indexes)
+      self._event_broadcast_reader_indexes[process_name] = reader_index
+
+      input_event_queue = shared_memory_queue.SharedMemoryBroadcastReaderQueue(
+          self._event_broadcast_queue.segment_name, reader_index,
+          name=queue_name, timeout_seconds=self._QUEUE_TIMEOUT)
+
+    else:
+      output_queue_name = '{0:s} output event queue'.format(process_name)
+      output_event_queue = zeromq_queue.ZeroMQPushBindQueue(
+          maximum_batch_size=self._EVENT_QUEUE_MAXIMUM_BATCH_SIZE,
+          name=output_queue_name, timeout_seconds=self._QUEUE_TIMEOUT)
+      # Open the queue so it can bind to a random port, and we can get the
+      # port number to use in the input queue.
+      output_event_queue.Open()
+
+      self._event_queues[process_name] = output_event_queue
+
+      input_event_queue = zeromq_queue.ZeroMQPullConnectQueue(
+          delay_open=True,
+          maximum_batch_size=self._EVENT_QUEUE_MAXIMUM_BATCH_SIZE,
+          name=queue_name, port=output_event_queue.port,
+          timeout_seconds=self._QUEUE_TIMEOUT)
 
     process = analysis_process.AnalysisProcess(
         input_event_queue, analysis_plugin, self._processing_configuration,
         self._user_accounts, data_location=self._data_location,
         event_filter_expression=self._event_filter_expression,
-        name=process_name)
+        number_of_partitions=number_of_partitions,
+        partition_index=partition_index, name=process_name)
 
     process.start()
 
@@ -394,6 +615,7 @@ class AnalysisMultiProcessEngine(task_engine.TaskMultiProcessEngine):
           'with error: {2!s}').format(process_name, process.pid, exception))
 
       process.terminate()
+      self._DetachEventBroadcastReader(process_name)
       return None
 
     self._RegisterProcess(process)
@@ -417,6 +639,10 @@ class AnalysisMultiProcessEngine(task_engine.TaskMultiProcessEngine):
     for event_queue in self._event_queues.values():
       event_queue.PushItem(plaso_queue.QueueAbort(), block=False)
 
+    # Closing the event broadcast queue wakes the processes that are still
+    # reading it.
+    self._CloseEventBroadcastQueue(abort=abort)
+
     # Try waiting for the processes to exit normally.
     self._AbortJoin(timeout=self._PROCESS_JOIN_TIMEOUT)
     for event_queue in self._event_queues.values():
@@ -693,9 +919,13 @@ class AnalysisMultiProcessEngine(task_engine.TaskMultiProcessEngine):
     self._UpdateStatus()
 
     # Reset values.
+    self._CloseEventBroadcastQueue(abort=True)
+
     self._analysis_plugins = {}
     self._data_location = None
     self._event_filter_expression = None
+    self._partition_indexes = {}
+    self._process_names_per_plugin = {}
     self._processing_configuration = None
     self._session = None
     self._status_update_callback = None
@@ -22,7 +22,7 @@ class AnalysisProcess(task_process.MultiProcessTaskProcess):
   def __init__(
       self, event_queue, analysis_plugin, processing_configuration,
       user_accounts, data_location=None, event_filter_expression=None,
-      **kwargs):
+      number_of_partitions=None, partition_index=None, **kwargs):
     """Initializes an analysis worker process.
 
     Non-specified keyword arguments (kwargs) are directly passed to
@@ -37,6 +37,12 @@ class AnalysisProcess(task_process.MultiProcessTaskProcess):
       data_location (Optional[str]): path to the location that data files
           should be loaded from.
       event_filter_expression (Optional[str]): event filter expression.
+      number_of_partitions (Optional[int]): number of partitions the events
+          are divided in, where None represents that the process analyzes
+          all the events it reads. This is used when every process reads all
+          the events, such as from the event broadcast.
+      partition_index (Optional[int]): index of the partition of the events
+          the process analyzes.
     """
     super(AnalysisProcess, self).__init__(processing_configuration, **kwargs)
     self._abort = False
@@ -47,6 +53,8 @@ class AnalysisProcess(task_process.MultiProcessTaskProcess):
     self._event_queue = event_queue
     self._foreman_status_wait_event = None
     self._number_of_consumed_events = 0
+    self._number_of_partitions = number_of_partitions
+    self._partition_index = partition_index
     self._status = definitions.STATUS_INDICATOR_INITIALIZED
     self._task = None
     self._user_accounts = user_accounts
@@ -120,7 +128,10 @@ class AnalysisProcess(task_process.MultiProcessTaskProcess):
     task = tasks.Task()
     task.storage_format = definitions.STORAGE_FORMAT_SQLITE
     # TODO: temporary solution.
-    task.identifier = self._analysis_plugin.plugin_name
+    # Note that the process name is the name of the analysis plugin, or
+    # the name of the plugin and partition index if the plugin is run by
+    # multiple processes.
+    task.identifier = self._name
 
     self._task = task
 
@@ -147,6 +158,8 @@ class AnalysisProcess(task_process.MultiProcessTaskProcess):
 
     task_storage_writer.AddAttributeContainer(task)
 
+    event_number = 0
+
     try:
       logger.debug(
           '{0!s} (PID: {1:d}) started monitoring event queue.'.format(
@@ -165,6 +178,14 @@ class AnalysisProcess(task_process.MultiProcessTaskProcess):
           logger.debug('ConsumeItems exiting, dequeued QueueAbort object.')
           break
 
+        if self._number_of_partitions:
+          partition_index = self._analysis_plugin.GetEventPartition(
+              event_number, *queued_object, self._number_of_partitions)
+          event_number += 1
+
+          if partition_index != self._partition_index:
+            continue
+
         self._ProcessEvent(self._analysis_mediator, *queued_object)
 
         self._number_of_consumed_events += 1
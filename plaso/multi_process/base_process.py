@@ -8,6 +8,7 @@ import os
 import random
 import signal
 import sys
+import threading
 import time
 
 from plaso.engine import process_info
@@ -15,6 +16,7 @@ from plaso.engine import profilers
 from plaso.lib import loggers
 from plaso.multi_process import logger
 from plaso.multi_process import plaso_xmlrpc
+from plaso.multi_process import status_board
 
 
 class MultiProcessBaseProcess(multiprocessing.Process):
@@ -22,11 +24,19 @@ class MultiProcessBaseProcess(multiprocessing.Process):
 
   Attributes:
     rpc_port (int): port number of the process status RPC server.
+    status_board_name (str): name of the shared memory segment of the process
+        status board or None if the process status RPC server should be used.
+    status_board_slot (int): index of the slot of the process in the process
+        status board or None if the process status RPC server should be used.
   """
 
   _NUMBER_OF_RPC_SERVER_START_ATTEMPTS = 14
   _PROCESS_JOIN_TIMEOUT = 5.0
 
+  # Number of seconds between writes of the status to the process status
+  # board.
+  _STATUS_BOARD_UPDATE_INTERVAL = 0.5
+
   def __init__(
       self, processing_configuration, enable_sigsegv_handler=False, **kwargs):
     """Initializes a process.
@@ -55,9 +65,13 @@ class MultiProcessBaseProcess(multiprocessing.Process):
     self._quiet_mode = False
     self._rpc_server = None
     self._serializers_profiler = None
+    self._status_board = None
+    self._status_board_writer_active = False
+    self._status_board_writer_thread = None
     self._status_is_running = False
     self._storage_profiler = None
     self._tasks_profiler = None
+    self._trace_profiler = None
 
     if self._processing_configuration:
       self._debug_output = self._processing_configuration.debug_output
@@ -72,6 +86,9 @@ class MultiProcessBaseProcess(multiprocessing.Process):
     # We need to share the RPC port number with the engine process.
     self.rpc_port = multiprocessing.Value('I', 0)
 
+    self.status_board_name = None
+    self.status_board_slot = None
+
   @property
   def name(self):
     """str: process name."""
@@ -135,6 +152,41 @@ class MultiProcessBaseProcess(multiprocessing.Process):
     """
     self.SignalAbort()
 
+  def _StartProcessStatusBoardWriter(self):
+    """Starts writing the process status to the process status board.
+
+    Returns:
+      bool: True if the process status is written to the process status
+          board, False if the process status RPC server should be used instead.
+    """
+    if self.status_board_name is None or self.status_board_slot is None:
+      return False
+
+    self._status_board = status_board.ProcessStatusBoard()
+
+    try:
+      self._status_board.Open(self.status_board_name)
+      self._status_board.WriteStatus(self.status_board_slot, self._GetStatus())
+
+    except (IOError, OSError, ValueError) as exception:
+      logger.warning((
+          'Unable to write status of process: {0!s} (PID: {1:d}) to process '
+          'status board with error: {2!s}').format(
+              self._name, self._pid, exception))
+      self._status_board.Close()
+      self._status_board = None
+      return False
+
+    self._status_board_writer_active = True
+    self._status_board_writer_thread = threading.Thread(
+        name='Status board writer', target=self._StatusBoardWriterThreadMain)
+    self._status_board_writer_thread.start()
+
+    logger.debug(
+        'Process: {0!s} process status board writer started'.format(self._name))
+
+    return True
+
   def _StartProcessStatusRPCServer(self):
     """Starts the process status RPC server."""
     if self._rpc_server:
@@ -181,6 +233,10 @@ class MultiProcessBaseProcess(multiprocessing.Process):
     if not configuration:
       return
 
+    if configuration.HaveProfileTrace():
+      self._trace_profiler = profilers.TraceProfiler(self._name, configuration)
+      self._trace_profiler.Start()
+
     if configuration.HaveProfileMemory():
       self._memory_profiler = profilers.MemoryProfiler(
           self._name, configuration)
@@ -196,8 +252,13 @@ class MultiProcessBaseProcess(multiprocessing.Process):
       identifier = '{0:s}-processing'.format(self._name)
       self._processing_profiler = profilers.ProcessingProfiler(
           identifier, configuration)
+      self._processing_profiler.SetTraceProfiler(self._trace_profiler)
       self._processing_profiler.Start()
 
+    elif self._trace_profiler:
+      # Trace the processing phases without profiling their CPU time.
+      self._processing_profiler = self._trace_profiler
+
     if configuration.HaveProfileSerializers():
       identifier = '{0:s}-serializers'.format(self._name)
       self._serializers_profiler = profilers.SerializersProfiler(
@@ -213,6 +274,33 @@ class MultiProcessBaseProcess(multiprocessing.Process):
       self._tasks_profiler = profilers.TasksProfiler(self._name, configuration)
       self._tasks_profiler.Start()
 
+  def _StatusBoardWriterThreadMain(self):
+    """Main function of the process status board writer thread."""
+    while self._status_board_writer_active:
+      time.sleep(self._STATUS_BOARD_UPDATE_INTERVAL)
+      self._status_board.WriteStatus(self.status_board_slot, self._GetStatus())
+
+  def _StopProcessStatusBoardWriter(self):
+    """Stops writing the process status to the process status board."""
+    if not self._status_board:
+      return
+
+    # Make sure the engine gets one more status update so it knows
+    # the worker has completed.
+    self._WaitForStatusNotRunning()
+
+    self._status_board_writer_active = False
+    if self._status_board_writer_thread.is_alive():
+      self._status_board_writer_thread.join()
+    self._status_board_writer_thread = None
+
+    self._status_board.WriteStatus(self.status_board_slot, self._GetStatus())
+    self._status_board.Close()
+    self._status_board = None
+
+    logger.debug(
+        'Process: {0!s} process status board writer stopped'.format(self._name))
+
   def _StopProcessStatusRPCServer(self):
     """Stops the process status RPC server."""
     if not self._rpc_server:
@@ -240,7 +328,8 @@ class MultiProcessBaseProcess(multiprocessing.Process):
       self._analyzers_profiler = None
 
     if self._processing_profiler:
-      self._processing_profiler.Stop()
+      if self._processing_profiler != self._trace_profiler:
+        self._processing_profiler.Stop()
       self._processing_profiler = None
 
     if self._serializers_profiler:
@@ -255,6 +344,10 @@ class MultiProcessBaseProcess(multiprocessing.Process):
       self._tasks_profiler.Stop()
       self._tasks_profiler = None
 
+    if self._trace_profiler:
+      self._trace_profiler.Stop()
+      self._trace_profiler = None
+
   def _WaitForStatusNotRunning(self):
     """Waits for the status is running to change to false."""
     # We wait slightly longer than the status check sleep time.
@@ -318,7 +411,8 @@ class MultiProcessBaseProcess(multiprocessing.Process):
     logger.debug('Process: {0!s} (PID: {1:d}) started'.format(
         self._name, self._pid))
 
-    self._StartProcessStatusRPCServer()
+    if not self._StartProcessStatusBoardWriter():
+      self._StartProcessStatusRPCServer()
 
     logger.debug('Process: {0!s} (PID: {1:d}) enter main'.format(
         self._name, self._pid))
@@ -328,6 +422,7 @@ class MultiProcessBaseProcess(multiprocessing.Process):
     logger.debug('Process: {0!s} (PID: {1:d}) exit main'.format(
         self._name, self._pid))
 
+    self._StopProcessStatusBoardWriter()
     self._StopProcessStatusRPCServer()
 
     logger.debug('Process: {0!s} (PID: {1:d}) stopped'.format(
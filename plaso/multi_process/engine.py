@@ -14,6 +14,7 @@ from plaso.engine import process_info
 from plaso.lib import definitions
 from plaso.multi_process import logger
 from plaso.multi_process import plaso_xmlrpc
+from plaso.multi_process import status_board
 
 
 class MultiProcessEngine(engine.BaseEngine):
@@ -21,7 +22,8 @@ class MultiProcessEngine(engine.BaseEngine):
 
   This class contains functionality to:
   * monitor and manage worker processes;
-  * retrieve a process status information via RPC;
+  * retrieve a process status information via a shared memory status board
+    or RPC;
   * manage the status update thread.
   """
 
@@ -52,6 +54,8 @@ class MultiProcessEngine(engine.BaseEngine):
     self._quiet_mode = False
     self._rpc_clients_per_pid = {}
     self._rpc_errors_per_pid = {}
+    self._status_board = None
+    self._status_board_slots_per_pid = {}
     self._status_update_active = False
     self._status_update_thread = None
     self._storage_writer = None
@@ -92,6 +96,28 @@ class MultiProcessEngine(engine.BaseEngine):
           process.name, pid))
       process.terminate()
 
+  def _AssignStatusBoardSlot(self, process):
+    """Assigns a process status board slot to a process.
+
+    The slot must be assigned before the process is started. If no process
+    status board is available or all its slots are in use, the process uses
+    the process status RPC server instead.
+
+    Args:
+      process (MultiProcessBaseProcess): process.
+    """
+    if not self._status_board:
+      return
+
+    slot_index = self._status_board.AllocateSlot()
+    if slot_index is None:
+      logger.debug('No process status board slot available for: {0:s}'.format(
+          process.name))
+      return
+
+    process.status_board_name = self._status_board.name
+    process.status_board_slot = slot_index
+
   def _CheckStatusWorkerProcess(self, pid):
     """Checks the status of a worker process.
 
@@ -138,11 +164,16 @@ class MultiProcessEngine(engine.BaseEngine):
         process_is_alive = False
 
       if process_is_alive:
-        rpc_port = process.rpc_port.value
-        logger.warning((
-            'Unable to retrieve process: {0:s} (PID: {1:d}) status via '
-            'RPC socket: http://localhost:{2:d}').format(
-                process.name, pid, rpc_port))
+        if pid in self._status_board_slots_per_pid:
+          logger.warning((
+              'Unable to retrieve process: {0:s} (PID: {1:d}) status from '
+              'process status board').format(process.name, pid))
+        else:
+          rpc_port = process.rpc_port.value
+          logger.warning((
+              'Unable to retrieve process: {0:s} (PID: {1:d}) status via '
+              'RPC socket: http://localhost:{2:d}').format(
+                  process.name, pid, rpc_port))
 
         processing_status_string = 'RPC error'
         status_indicator = definitions.STATUS_INDICATOR_RUNNING
@@ -222,6 +253,10 @@ class MultiProcessEngine(engine.BaseEngine):
     if not process_is_alive:
       return None
 
+    slot_index = self._status_board_slots_per_pid.get(process.pid, None)
+    if slot_index is not None:
+      return self._status_board.ReadStatus(slot_index)
+
     rpc_client = self._rpc_clients_per_pid.get(process.pid, None)
     return rpc_client.CallFunction()
 
@@ -309,22 +344,45 @@ class MultiProcessEngine(engine.BaseEngine):
       raise KeyError(
           'RPC client (PID: {0:d}) already exists'.format(pid))
 
-    rpc_client = plaso_xmlrpc.XMLProcessStatusRPCClient()
+    slot_index = None
+    if self._status_board:
+      slot_index = process.status_board_slot
 
-    # Make sure that a worker process has started its RPC server.
-    # The RPC port will be 0 if no server is available.
+    # Make sure that a worker process has written its status to the process
+    # status board or has started its RPC server. The RPC port will be 0 if
+    # no server is available.
+    has_status = False
     rpc_port = process.rpc_port.value
     time_waited_for_process = 0.0
     while not rpc_port:
+      if slot_index is not None:
+        has_status = self._status_board.HasStatus(slot_index)
+        if has_status:
+          break
+
       time.sleep(0.1)
       rpc_port = process.rpc_port.value
       time_waited_for_process += 0.1
 
       if time_waited_for_process >= self._RPC_SERVER_TIMEOUT:
+        if slot_index is not None:
+          self._status_board.FreeSlot(slot_index)
+
         raise IOError(
             'RPC client unable to determine server (PID: {0:d}) port.'.format(
                 pid))
 
+    if has_status:
+      self._status_board_slots_per_pid[pid] = slot_index
+      self._process_information_per_pid[pid] = process_info.ProcessInfo(pid)
+      return
+
+    if slot_index is not None:
+      # The process was unable to use the process status board.
+      self._status_board.FreeSlot(slot_index)
+
+    rpc_client = plaso_xmlrpc.XMLProcessStatusRPCClient()
+
     hostname = 'localhost'
 
     if not rpc_client.Open(hostname, rpc_port):
@@ -335,6 +393,26 @@ class MultiProcessEngine(engine.BaseEngine):
     self._rpc_clients_per_pid[pid] = rpc_client
     self._process_information_per_pid[pid] = process_info.ProcessInfo(pid)
 
+  def _StartStatusBoard(self, number_of_slots):
+    """Starts the process status board.
+
+    If the process status board cannot be created, the processes use
+    the process status RPC server instead.
+
+    Args:
+      number_of_slots (int): number of slots, which should be the maximum
+          number of concurrently running worker processes.
+    """
+    self._status_board = status_board.ProcessStatusBoard()
+
+    try:
+      self._status_board.Create(number_of_slots)
+    except (IOError, OSError, ValueError) as exception:
+      logger.warning((
+          'Unable to create process status board, falling back to RPC, with '
+          'error: {0!s}').format(exception))
+      self._status_board = None
+
   def _StartStatusUpdateThread(self):
     """Starts the status update thread."""
     self._status_update_active = True
@@ -372,6 +450,10 @@ class MultiProcessEngine(engine.BaseEngine):
       rpc_client.Close()
       del self._rpc_clients_per_pid[pid]
 
+    slot_index = self._status_board_slots_per_pid.pop(pid, None)
+    if slot_index is not None:
+      self._status_board.FreeSlot(slot_index)
+
     if pid in self._rpc_errors_per_pid:
       del self._rpc_errors_per_pid[pid]
 
@@ -388,6 +470,18 @@ class MultiProcessEngine(engine.BaseEngine):
 
       self._StopMonitoringProcess(process)
 
+  def _StopStatusBoard(self):
+    """Stops the process status board.
+
+    The process status board should be stopped after the processes that use
+    it have stopped.
+    """
+    if self._status_board:
+      self._status_board.Close()
+      self._status_board = None
+
+    self._status_board_slots_per_pid = {}
+
   def _StopStatusUpdateThread(self):
     """Stops the status update thread."""
     if self._status_update_thread:
@@ -2,23 +2,34 @@
 """The task-based multi-process processing extraction engine."""
 
 import collections
+import concurrent.futures
 import heapq
+import json
 import logging
 import multiprocessing
 import os
+import threading
 import time
 import traceback
 
+from acstore.containers import manager as containers_manager
+
 from dfvfs.lib import definitions as dfvfs_definitions
 from dfvfs.resolver import context
 from dfvfs.resolver import resolver as path_spec_resolver
 
+from plaso.analyzers.hashers import sha256
+from plaso.containers import artifacts
 from plaso.containers import counts
 from plaso.containers import event_sources
 from plaso.containers import events
+from plaso.containers import sessions
+from plaso.containers import tasks
 from plaso.containers import warnings
 from plaso.engine import extractors
 from plaso.engine import path_helper
+from plaso.engine import profilers
+from plaso.engine import storage_counters
 from plaso.engine import timeliner
 from plaso.lib import definitions
 from plaso.lib import errors
@@ -27,13 +38,26 @@ from plaso.multi_process import extraction_process
 from plaso.multi_process import logger
 from plaso.multi_process import merge_helpers
 from plaso.multi_process import plaso_queue
+from plaso.multi_process import task_costs
 from plaso.multi_process import task_engine
 from plaso.multi_process import task_manager
 from plaso.multi_process import zeromq_queue
 
+try:
+  # pylint: disable=ungrouped-imports
+  import redis
+except ModuleNotFoundError:
+  redis = None
+
 
 class _EventSourceHeap(object):
-  """Class that defines an event source heap."""
+  """Class that defines an event source heap.
+
+  Directories are popped first, to keep the workers supplied with event
+  sources, followed by the other event sources in order of decreasing
+  estimated task duration, so that the tasks that are expected to take
+  the longest are started first.
+  """
 
   def __init__(self, maximum_number_of_items=50000):
     """Initializes an event source heap.
@@ -58,21 +82,25 @@ class _EventSourceHeap(object):
     """Pops an event source from the heap.
 
     Returns:
-      EventSource: an event source or None on if no event source is available.
+      tuple[EventSource, TaskCostEstimate]: an event source and the cost
+          estimate of the task to process it or (None, None) on if no event
+          source is available.
     """
     try:
-      _, _, event_source = heapq.heappop(self._heap)
+      _, _, _, event_source, task_estimate = heapq.heappop(self._heap)
 
     except IndexError:
-      return None
+      return None, None
 
-    return event_source
+    return event_source, task_estimate
 
-  def PushEventSource(self, event_source):
+  def PushEventSource(self, event_source, task_estimate=None):
     """Pushes an event source onto the heap.
 
     Args:
       event_source (EventSource): event source.
+      task_estimate (Optional[TaskCostEstimate]): cost estimate of the task
+          to process the event source.
     """
     if event_source.file_entry_type == (
         dfvfs_definitions.FILE_ENTRY_TYPE_DIRECTORY):
@@ -80,7 +108,12 @@ class _EventSourceHeap(object):
     else:
       weight = 100
 
-    heap_values = (weight, time.time(), event_source)
+    estimated_duration = 0.0
+    if task_estimate:
+      estimated_duration = task_estimate.estimated_duration
+
+    heap_values = (
+        weight, -estimated_duration, time.time(), event_source, task_estimate)
     heapq.heappush(self._heap, heap_values)
 
 
@@ -96,13 +129,52 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
   _CONTAINER_TYPE_EVENT_DATA = events.EventData.CONTAINER_TYPE
   _CONTAINER_TYPE_EVENT_DATA_STREAM = events.EventDataStream.CONTAINER_TYPE
   _CONTAINER_TYPE_EVENT_SOURCE = event_sources.EventSource.CONTAINER_TYPE
+  _CONTAINER_TYPE_EVENT_SOURCE_PARTITION = (
+      event_sources.EventSourcePartition.CONTAINER_TYPE)
+  _CONTAINER_TYPE_EXTRACTION_CHECKPOINT = (
+      sessions.ExtractionCheckpoint.CONTAINER_TYPE)
+  _CONTAINER_TYPE_FILE_ENTRY_FINGERPRINT = (
+      event_sources.FileEntryFingerprint.CONTAINER_TYPE)
+  _CONTAINER_TYPE_PARSER_COUNT = counts.ParserCount.CONTAINER_TYPE
+  _CONTAINER_TYPE_TASK_COST_ESTIMATES = tasks.TaskCostEstimates.CONTAINER_TYPE
+  _CONTAINER_TYPE_WINDOWS_EVENTLOG_XML_TEMPLATE = (
+      artifacts.WindowsEventLogXMLTemplateArtifact.CONTAINER_TYPE)
+
+  # Interval in seconds in which an extraction checkpoint is written.
+  _CHECKPOINT_INTERVAL = 60.0
 
   # Maximum number of dfVFS file system objects to cache in the foreman process.
   _FILE_SYSTEM_CACHE_SIZE = 3
 
+  # Number of seconds the Redis key that indicates to worker nodes that
+  # the foreman is active, remains valid without being refreshed.
+  _FOREMAN_REDIS_KEY_EXPIRY = 60
+
+  # Size of the blocks of data read to calculate a digest hash.
+  _HASHING_BLOCK_SIZE = 4 * 1024 * 1024
+
+  # Maximum number of event sources of which the digest hash is being
+  # calculated in incremental digest mode.
+  _MAXIMUM_NUMBER_OF_PENDING_DIGEST_HASHES = 1000
+
   # Maximum number of concurrent tasks.
   _MAXIMUM_NUMBER_OF_TASKS = 10000
 
+  # Maximum number of tasks per worker that are queued but not yet processing.
+  _MAXIMUM_NUMBER_OF_QUEUED_TASKS_PER_WORKER = 4
+
+  # Number of threads that calculate digest hashes in incremental digest mode.
+  _NUMBER_OF_DIGEST_HASH_THREADS = 4
+
+  # Interval in seconds in which the processed task storage is scanned for
+  # completed tasks of which no completion notification was received, for
+  # example because the worker process was killed.
+  _PROCESSED_TASK_STORAGE_SCAN_INTERVAL = 5.0
+
+  # Maximum number of seconds the task scheduler waits for a task completion
+  # notification when there are no tasks to schedule or merge.
+  _TASK_COMPLETION_WAIT_SECONDS = 0.1
+
   _TASK_QUEUE_TIMEOUT_SECONDS = 2
 
   _WORKER_PROCESSES_MINIMUM = 2
@@ -111,20 +183,41 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
   _ZEROMQ_NO_WORKER_REQUEST_TIME_SECONDS = 10 * 60
 
   def __init__(
-      self, maximum_number_of_tasks=None, number_of_worker_processes=0,
-      status_update_callback=None, worker_memory_limit=None,
-      worker_timeout=None):
+      self, enable_checkpoints=False, maximum_number_of_tasks=None,
+      memory_budget=None, number_of_worker_processes=0,
+      status_update_callback=None, use_status_board=False,
+      worker_memory_limit=None, worker_nodes_address=None,
+      worker_nodes_port=None, worker_timeout=None):
     """Initializes an engine.
 
     Args:
+      enable_checkpoints (Optional[bool]): True if extraction checkpoints
+          should be written to the session storage, which allows an
+          interrupted session to be resumed. Checkpoints require a session
+          storage that supports commits, such as SQLite.
       maximum_number_of_tasks (Optional[int]): maximum number of concurrent
           tasks, where 0 represents no limit.
+      memory_budget (Optional[int]): maximum amount of memory the tasks that
+          are scheduled but not yet completed are predicted to consume, where
+          None or 0 represents no budget.
       number_of_worker_processes (Optional[int]): number of worker processes.
       status_update_callback (Optional[function]): callback function for status
           updates.
+      use_status_board (Optional[bool]): True if the worker processes should
+          report their status via a shared memory process status board instead
+          of RPC.
       worker_memory_limit (Optional[int]): maximum amount of memory a worker is
           allowed to consume, where None represents the default memory limit
           and 0 represents no limit.
+      worker_nodes_address (Optional[str]): IP address of the interface to
+          which the task queue is bound when worker nodes are used, where None
+          represents the loopback interface.
+      worker_nodes_port (Optional[int]): TCP port on which the task queue
+          accepts worker processes of worker nodes on other hosts, where None
+          represents that only local worker processes are used. Worker nodes
+          require the Redis task storage. The task queue is not authenticated
+          and tasks are sent pickled, hence worker nodes must only be used on
+          a trusted network.
       worker_timeout (Optional[float]): number of minutes before a worker
           process that is not providing status updates is considered inactive,
           where None or 0.0 represents the default timeout.
@@ -164,34 +257,99 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
       worker_timeout = definitions.DEFAULT_WORKER_TIMEOUT
 
     super(ExtractionMultiProcessEngine, self).__init__()
+    self._checkpoint = None
+    self._collect_only_path_specs = set()
+    self._digest_hash_executor = None
+    self._digest_hash_thread_data = threading.local()
+    self._enable_checkpoints = enable_checkpoints
     self._enable_sigsegv_handler = False
     self._event_data_timeliner = None
+    self._event_source_index = 0
+    self._event_source_partitions = collections.deque()
+    self._extraction_storage_counters = None
     self._extraction_worker = None
+    self._file_entry_fingerprints = {}
     self._file_system_cache = []
+    self._incremental_mode = None
+    self._last_checkpoint_time = 0.0
+    self._last_processed_task_storage_scan_time = 0.0
     self._maximum_number_of_containers = 50
     self._maximum_number_of_tasks = maximum_number_of_tasks
+    self._memory_budget = memory_budget
     self._merge_task = None
     self._merge_task_on_hold = None
     self._number_of_consumed_event_data = 0
     self._number_of_consumed_sources = 0
+    self._number_of_deferred_tasks = 0
     self._number_of_produced_event_data = 0
     self._number_of_produced_events = 0
     self._number_of_produced_sources = 0
+    self._number_of_worker_node_processes = 0
     self._number_of_worker_processes = number_of_worker_processes
     self._path_spec_extractor = extractors.PathSpecExtractor()
+    self._pending_digest_hashes = collections.deque()
+    self._pending_event_source_indexes = {}
     self._resolver_context = context.Context()
+    self._resume_event_source_indexes = collections.deque()
+    self._scanned_task_identifiers = set()
+    self._session_identifier = None
     self._status = definitions.STATUS_INDICATOR_IDLE
     self._status_update_callback = status_update_callback
+    self._stored_file_entry_fingerprints = {}
+    self._stored_sha256_hashes = {}
     self._system_configurations = None
+    self._task_cost_estimates = None
+    self._task_cost_model = task_costs.TaskCostModel()
     self._task_manager = task_manager.TaskManager()
     self._task_merge_helper = None
     self._task_merge_helper_on_hold = None
     self._task_queue = None
+    self._task_queue_hostname = None
     self._task_queue_port = None
     self._task_storage_format = None
+    self._use_status_board = use_status_board
     self._windows_event_log_providers = None
+    self._windows_event_log_xml_template_identifiers = set()
     self._worker_memory_limit = worker_memory_limit
+    self._worker_nodes_address = worker_nodes_address
+    self._worker_nodes_port = worker_nodes_port
     self._worker_timeout = worker_timeout
+    self._written_parsers_counter = collections.Counter()
+
+  def _AddPendingEventSource(self, event_source):
+    """Adds an event source that is pending to be processed.
+
+    Pending event sources are read by the foreman, but the results of their
+    tasks were not yet merged. They are rescheduled when a session is
+    resumed from a checkpoint.
+
+    Args:
+      event_source (EventSource): event source.
+    """
+    if self._enable_checkpoints:
+      event_source_identifier = event_source.GetIdentifier()
+      lookup_key = event_source.path_spec.comparable
+      event_source_indexes = self._pending_event_source_indexes.setdefault(
+          lookup_key, [])
+      event_source_indexes.append(event_source_identifier.sequence_number - 1)
+
+  def _AddPendingEventSourcePartition(self, path_spec):
+    """Adds an event source partition that is pending to be processed.
+
+    The event source that was partitioned remains pending until all its
+    partitions were processed, so that the event source is processed again
+    when resuming from a checkpoint.
+
+    Args:
+      path_spec (dfvfs.PathSpec): path specification of the event source that
+          was partitioned.
+    """
+    if self._enable_checkpoints and path_spec:
+      lookup_key = path_spec.comparable
+      event_source_indexes = self._pending_event_source_indexes.get(
+          lookup_key, None)
+      if event_source_indexes:
+        event_source_indexes.append(event_source_indexes[0])
 
   def _CacheFileSystem(self, file_system):
     """Caches a dfVFS file system object.
@@ -214,6 +372,44 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
       self._file_system_cache.remove(file_system)
       self._file_system_cache.append(file_system)
 
+  def _CalculateDigestHash(self, path_spec):
+    """Calculates the SHA-256 digest hash of the default data stream.
+
+    This function is run by a digest hash thread, which opens the file entry
+    with its own resolver context, since a resolver context cannot be shared
+    between threads.
+
+    Args:
+      path_spec (dfvfs.PathSpec): path specification of the file entry.
+
+    Returns:
+      str: SHA-256 digest hash or None if the file entry has no default data
+          stream.
+    """
+    resolver_context = getattr(
+        self._digest_hash_thread_data, 'resolver_context', None)
+    if not resolver_context:
+      resolver_context = context.Context()
+      self._digest_hash_thread_data.resolver_context = resolver_context
+
+    file_entry = path_spec_resolver.Resolver.OpenFileEntry(
+        path_spec, resolver_context=resolver_context)
+    file_object = None
+    if file_entry:
+      file_object = file_entry.GetFileObject()
+
+    if not file_object:
+      return None
+
+    hasher = sha256.SHA256Hasher()
+
+    data = file_object.read(self._HASHING_BLOCK_SIZE)
+    while data:
+      hasher.Update(data)
+      data = file_object.read(self._HASHING_BLOCK_SIZE)
+
+    return hasher.GetStringDigest()
+
   def _CheckExcludedPathSpec(self, file_system, path_spec):
     """Determines if the path specification should be excluded from extraction.
 
@@ -231,11 +427,54 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
 
     return False
 
-  def _CollectInitialEventSources(self, storage_writer, file_system_path_specs):
+  def _CheckMemoryBudget(self, task_estimate):
+    """Determines if a task fits in the memory budget.
+
+    A task is admitted if the predicted memory usage of the tasks that are
+    scheduled but not yet completed, including the task, does not exceed
+    the memory budget. A task is always admitted if no other tasks are
+    scheduled, to guarantee progress. The estimates of abandoned tasks are
+    dropped, since these tasks are either retried, with a new estimate, or
+    failed.
+
+    Args:
+      task_estimate (TaskCostEstimate): cost estimate of the task.
+
+    Returns:
+      bool: True if the task fits in the memory budget.
+    """
+    if not self._memory_budget or not task_estimate:
+      return True
+
+    for task_identifier in self._task_manager.GetAbandonedTaskIdentifiers():
+      self._task_cost_model.AbandonTask(task_identifier)
+
+    number_of_worker_processes = (
+        self._number_of_worker_processes +
+        self._number_of_worker_node_processes)
+
+    predicted_memory_usage = self._task_cost_model.GetPredictedMemoryUsage(
+        number_of_worker_processes=number_of_worker_processes)
+    if not predicted_memory_usage:
+      return True
+
+    predicted_memory_usage = self._task_cost_model.GetPredictedMemoryUsage(
+        number_of_worker_processes=number_of_worker_processes,
+        task_estimate=task_estimate)
+
+    return predicted_memory_usage <= self._memory_budget
+
+  def _CollectInitialEventSources(
+      self, storage_writer, session_identifier, file_system_path_specs):
     """Collects the initial event sources.
 
+    When resuming from a checkpoint the path specifications that were
+    collected before the checkpoint are skipped.
+
     Args:
       storage_writer (StorageWriter): storage writer for a session storage.
+      session_identifier (str): the identifier of the session the tasks are
+          part of.
       file_system_path_specs (list[dfvfs.PathSpec]): path specifications of
           the source file systems to process.
     """
@@ -243,6 +482,15 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
 
     included_find_specs = self.GetCollectionIncludedFindSpecs()
 
+    number_of_collected_path_specs = 0
+    number_of_skipped_path_specs = 0
+    if self._checkpoint:
+      if self._checkpoint.collection_completed:
+        return
+
+      number_of_skipped_path_specs = (
+          self._checkpoint.number_of_collected_path_specs)
+
     for file_system_path_spec in file_system_path_specs:
       if self._abort:
         break
@@ -258,6 +506,16 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
           if self._abort:
             break
 
+          if self._checkpoint and (
+              number_of_collected_path_specs >= number_of_skipped_path_specs):
+            self._checkpoint.number_of_collected_path_specs = (
+                number_of_collected_path_specs)
+            self._WriteCheckpointIfDue(storage_writer, session_identifier)
+
+          number_of_collected_path_specs += 1
+          if number_of_collected_path_specs <= number_of_skipped_path_specs:
+            continue
+
           if self._CheckExcludedPathSpec(file_system, path_spec):
             display_name = path_helper.PathHelper.GetDisplayNameForPathSpec(
                 path_spec)
@@ -292,40 +550,76 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
             f'unable to process path specification with error: '
             f'{exception!s}'), file_system_path_spec)
 
-  def _CreateTask(self, storage_writer, session_identifier, event_source):
+    if self._checkpoint and not self._abort:
+      self._checkpoint.collection_completed = True
+      self._checkpoint.number_of_collected_path_specs = (
+          number_of_collected_path_specs)
+      self._WriteCheckpoint(storage_writer, session_identifier)
+
+  def _CreateFileEntryFingerprint(self, file_entry):
+    """Creates a fingerprint of a file entry.
+
+    Args:
+      file_entry (dfvfs.FileEntry): file entry.
+
+    Returns:
+      FileEntryFingerprint: file entry fingerprint.
+    """
+    fingerprint = event_sources.FileEntryFingerprint(
+        path_spec=file_entry.path_spec)
+    fingerprint.size = file_entry.size
+
+    modification_time = file_entry.modification_time
+    if modification_time:
+      fingerprint.modification_time = modification_time.CopyToDateTimeString()
+
+    return fingerprint
+
+  def _CreateTask(self, session_identifier, event_source):
     """Creates a task to processes an event source.
 
     Args:
-      storage_writer (StorageWriter): storage writer for a session storage.
       session_identifier (str): the identifier of the session the tasks are
           part of.
       event_source (EventSource): event source.
 
     Returns:
-      Task: task or None if no task could be created.
+      Task: task.
     """
-    file_entry = path_spec_resolver.Resolver.OpenFileEntry(
-        event_source.path_spec, resolver_context=self._resolver_context)
-    if file_entry is None:
-      self._ProduceExtractionWarning(
-          storage_writer, 'Unable to open file entry', event_source.path_spec)
-      return None
+    task = self._task_manager.CreateTask(
+        session_identifier, storage_format=self._task_storage_format)
+    task.file_entry_type = event_source.file_entry_type
+    task.path_spec = event_source.path_spec
 
-    file_system = file_entry.GetFileSystem()
+    if self._collect_only_path_specs:
+      lookup_key = event_source.path_spec.comparable
+      if lookup_key in self._collect_only_path_specs:
+        self._collect_only_path_specs.remove(lookup_key)
+        task.collect_only = True
 
-    if not event_source.path_spec.IsSystemLevel():
-      self._CacheFileSystem(file_system)
+    return task
 
-    if self._CheckExcludedPathSpec(file_system, event_source.path_spec):
-      display_name = path_helper.PathHelper.GetDisplayNameForPathSpec(
-          event_source.path_spec)
-      logger.debug(f'Excluded from extraction: {display_name:s}.')
-      return None
+  def _CreateEventSourcePartitionTask(
+      self, session_identifier, event_source_partition):
+    """Creates a task to process an event source partition.
 
+    Args:
+      session_identifier (str): the identifier of the session the tasks are
+          part of.
+      event_source_partition (EventSourcePartition): event source partition.
+
+    Returns:
+      Task: task.
+    """
     task = self._task_manager.CreateTask(
         session_identifier, storage_format=self._task_storage_format)
-    task.file_entry_type = event_source.file_entry_type
-    task.path_spec = event_source.path_spec
+    task.file_entry_type = event_source_partition.file_entry_type
+    task.parser_name = event_source_partition.parser_name
+    task.partition_end = event_source_partition.partition_end
+    task.partition_start = event_source_partition.partition_start
+    task.path_spec = event_source_partition.path_spec
+    task.SetEventDataStreamIdentifier(
+        event_source_partition.GetEventDataStreamIdentifier())
 
     return task
 
@@ -345,24 +639,27 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
     if self._processing_profiler:
       self._processing_profiler.StartTiming('get_event_source')
 
-    if start_with_first:
-      event_source = storage_writer.GetFirstWrittenEventSource()
-    else:
-      event_source = storage_writer.GetNextWrittenEventSource()
+    event_source = self._GetNextEventSource(
+        storage_writer, start_with_first=start_with_first)
 
     if self._processing_profiler:
       self._processing_profiler.StopTiming('get_event_source')
 
     while event_source:
-      event_source_heap.PushEventSource(event_source)
+      self._PushEventSource(storage_writer, event_source_heap, event_source)
       if event_source_heap.IsFull():
         logger.debug('Event source heap is full.')
         break
 
+      if len(self._pending_digest_hashes) >= (
+          self._MAXIMUM_NUMBER_OF_PENDING_DIGEST_HASHES):
+        logger.debug('Maximum number of pending digest hashes reached.')
+        break
+
       if self._processing_profiler:
         self._processing_profiler.StartTiming('get_event_source')
 
-      event_source = storage_writer.GetNextWrittenEventSource()
+      event_source = self._GetNextEventSource(storage_writer)
 
       if self._processing_profiler:
         self._processing_profiler.StopTiming('get_event_source')
@@ -370,6 +667,64 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
     if self._processing_profiler:
       self._processing_profiler.StopTiming('fill_event_source_heap')
 
+  def _GetCheckpointContainerTypes(self):
+    """Retrieves the attribute container types recorded by a checkpoint.
+
+    Returns:
+      list[str]: attribute container types.
+    """
+    return sorted([
+        container_type
+        for container_type in containers_manager.AttributeContainersManager.
+        GetContainerTypes()
+        if container_type != self._CONTAINER_TYPE_EXTRACTION_CHECKPOINT])
+
+  def _GetNextEventSource(self, storage_writer, start_with_first=False):
+    """Retrieves the next event source to process.
+
+    When resuming from a checkpoint the event sources that were pending and
+    those that were not yet read at the time of the checkpoint are returned
+    first.
+
+    Args:
+      storage_writer (StorageWriter): storage writer for a session storage.
+      start_with_first (Optional[bool]): True if the function should start
+          with the first written event source.
+
+    Returns:
+      EventSource: event source or None if no event source is available.
+    """
+    if self._resume_event_source_indexes:
+      event_source_index = self._resume_event_source_indexes.popleft()
+      event_source = storage_writer.GetAttributeContainerByIndex(
+          self._CONTAINER_TYPE_EVENT_SOURCE, event_source_index)
+
+    elif start_with_first:
+      event_source = storage_writer.GetFirstWrittenEventSource()
+    else:
+      event_source = storage_writer.GetNextWrittenEventSource()
+
+    if self._enable_checkpoints and event_source:
+      event_source_identifier = event_source.GetIdentifier()
+      self._event_source_index = max(
+          self._event_source_index, event_source_identifier.sequence_number)
+
+    return event_source
+
+  def _GetMaximumNumberOfQueuedTasks(self):
+    """Retrieves the maximum number of tasks that are queued.
+
+    Returns:
+      int: maximum number of tasks that are queued but not yet processing,
+          which includes the worker processes of worker nodes.
+    """
+    number_of_worker_processes = (
+        self._number_of_worker_processes +
+        self._number_of_worker_node_processes)
+
+    return max(2, number_of_worker_processes * (
+        self._MAXIMUM_NUMBER_OF_QUEUED_TASKS_PER_WORKER))
+
   def _GetPathSpecificationString(self, path_spec):
     """Retrieves a printable string representation of the path specification.
 
@@ -383,6 +738,78 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
         line.translate(definitions.NON_PRINTABLE_CHARACTER_TRANSLATION_TABLE)
         for line in path_spec.comparable.split('\n')])
 
+  def _GetTasksStatus(self):
+    """Retrieves status information about the tasks.
+
+    Returns:
+      TasksStatus: tasks status information.
+    """
+    tasks_status = self._task_manager.GetStatusInformation()
+    tasks_status.memory_budget = self._memory_budget or 0
+    tasks_status.number_of_deferred_tasks = self._number_of_deferred_tasks
+    tasks_status.predicted_memory_usage = (
+        self._task_cost_model.GetPredictedMemoryUsage(
+            number_of_worker_processes=(
+                self._number_of_worker_processes +
+                self._number_of_worker_node_processes)))
+
+    return tasks_status
+
+  def _GetStoredDigestHash(self, fingerprint):
+    """Retrieves the digest hash of a file entry from a previous session.
+
+    Args:
+      fingerprint (FileEntryFingerprint): fingerprint of the file entry.
+
+    Returns:
+      str: SHA-256 digest hash of the default data stream of the previous
+          session or None if not available or if the size of the file entry
+          changed.
+    """
+    lookup_key = fingerprint.path_spec.comparable
+    stored_fingerprint = self._stored_file_entry_fingerprints.get(
+        lookup_key, None)
+
+    if stored_fingerprint and stored_fingerprint.size != fingerprint.size:
+      return None
+
+    return self._stored_sha256_hashes.get(lookup_key, None)
+
+  def _IsUnchangedFileEntry(self, file_entry, fingerprint):
+    """Determines if a file entry was not changed since a previous session.
+
+    In metadata mode a file entry is unchanged if its size and modification
+    time match those of the previous session. In digest mode only
+    directories are compared by their metadata, since the digest hashes of
+    other file entries are compared after they were calculated by a digest
+    hash thread.
+
+    A changed file entry is extracted again in its entirety. The event data
+    extracted from it by previous sessions is not superseded, hence the
+    events of its unchanged content, such as the earlier lines of an appended
+    log file, are stored again.
+
+    Args:
+      file_entry (dfvfs.FileEntry): file entry.
+      fingerprint (FileEntryFingerprint): fingerprint of the file entry.
+
+    Returns:
+      bool: True if the file entry was not changed.
+    """
+    if (not file_entry.IsDirectory() and
+        self._incremental_mode == definitions.INCREMENTAL_MODE_DIGEST):
+      return False
+
+    lookup_key = file_entry.path_spec.comparable
+    stored_fingerprint = self._stored_file_entry_fingerprints.get(
+        lookup_key, None)
+
+    return bool(
+        stored_fingerprint and fingerprint.modification_time and
+        stored_fingerprint.size == fingerprint.size and
+        stored_fingerprint.modification_time == (
+            fingerprint.modification_time))
+
   def _MergeAttributeContainer(self, storage_writer, merge_helper, container):
     """Merges an attribute container from a task store into the storage writer.
 
@@ -407,6 +834,21 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
             merge_helper.GetAttributeContainerIdentifier(
                 event_data_stream_lookup_key))
 
+      elif merge_helper.event_data_stream_identifier:
+        # The event data of an event source partition is associated with
+        # the event data stream of the event source that was partitioned.
+        event_data_stream_identifier = (
+            merge_helper.event_data_stream_identifier)
+
+        if container.CONTAINER_TYPE == self._CONTAINER_TYPE_EVENT_DATA:
+          event_data_stream = storage_writer.GetAttributeContainerByIdentifier(
+              self._CONTAINER_TYPE_EVENT_DATA_STREAM,
+              event_data_stream_identifier)
+
+          event_values_hash = events.CalculateEventValuesHash(
+              container, event_data_stream)
+          setattr(container, '_event_values_hash', event_values_hash)
+
       if event_data_stream_identifier:
         container.SetEventDataStreamIdentifier(event_data_stream_identifier)
       elif event_data_stream_lookup_key:
@@ -449,6 +891,33 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
             f'message file: {message_file_lookup_key:s} could not be found.'))
         return
 
+    elif container.CONTAINER_TYPE == (
+        self._CONTAINER_TYPE_EVENT_SOURCE_PARTITION):
+      event_data_stream_identifier = container.GetEventDataStreamIdentifier()
+      if event_data_stream_identifier:
+        event_data_stream_identifier = (
+            merge_helper.GetAttributeContainerIdentifier(
+                event_data_stream_identifier.CopyToString()))
+        container.SetEventDataStreamIdentifier(event_data_stream_identifier)
+
+      # Event source partitions are not stored in the session storage but
+      # scheduled as separate tasks.
+      self._AddPendingEventSourcePartition(
+          getattr(self._merge_task, 'path_spec', None))
+      self._event_source_partitions.append(container)
+      return
+
+    elif container.CONTAINER_TYPE == (
+        self._CONTAINER_TYPE_WINDOWS_EVENTLOG_XML_TEMPLATE):
+      # Every task stores the Windows XML EventLog (EVTX) XML templates of its
+      # event data, which only need to be merged once.
+      if (container.identifier in
+          self._windows_event_log_xml_template_identifiers):
+        return
+
+      self._windows_event_log_xml_template_identifiers.add(
+          container.identifier)
+
     lookup_key = None
     if container.CONTAINER_TYPE in (
         self._CONTAINER_TYPE_EVENT_DATA,
@@ -522,31 +991,75 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
 
     return number_of_containers
 
-  def _MergeTaskStorage(self, storage_writer, session_identifier):
+  def _MergeTaskStorage(
+      self, storage_writer, session_identifier, wait_for_completion=False):
     """Merges a task storage with the session storage.
 
     This function checks all task stores that are ready to merge and updates
     the scheduled tasks. Note that to prevent this function holding up
     the task scheduling loop only the first available task storage is merged.
 
+    Task stores are ready to merge when the worker process notifies the task
+    was completed. The processed task storage is scanned periodically for
+    tasks of which the completion notification was lost.
+
     Args:
       storage_writer (StorageWriter): storage writer for a session storage used
           to merge task storage.
       session_identifier (str): the identifier of the session the tasks are
           part of.
+      wait_for_completion (Optional[bool]): True if the function should wait
+          for a task completion notification when none is available.
     """
     if self._processing_profiler:
       self._processing_profiler.StartTiming('merge_check')
 
-    task_identifiers = self._GetProcessedTaskIdentifiers(
-        self._task_storage_format, session_identifier)
+    timeout_seconds = 0.0
+    if wait_for_completion:
+      timeout_seconds = self._TASK_COMPLETION_WAIT_SECONDS
 
-    for task_identifier in task_identifiers:
+    completed_tasks = []
+    for task_identifier, storage_file_size in (
+        self._PopTaskCompletionNotifications(timeout_seconds=timeout_seconds)):
+      if task_identifier in self._scanned_task_identifiers:
+        # The task was already detected by scanning the processed task storage.
+        self._scanned_task_identifiers.remove(task_identifier)
+      else:
+        completed_tasks.append((task_identifier, storage_file_size))
+
+    current_time = time.time()
+    if not self._task_completion_queue or current_time >= (
+        self._last_processed_task_storage_scan_time +
+        self._PROCESSED_TASK_STORAGE_SCAN_INTERVAL):
+      notified_task_identifiers = set(
+          task_identifier for task_identifier, _ in completed_tasks)
+
+      task_identifiers = self._GetProcessedTaskIdentifiers(
+          self._task_storage_format, session_identifier)
+
+      for task_identifier in task_identifiers:
+        if task_identifier not in notified_task_identifiers:
+          if self._task_completion_queue:
+            self._scanned_task_identifiers.add(task_identifier)
+          completed_tasks.append((task_identifier, None))
+
+      self._last_processed_task_storage_scan_time = current_time
+
+    for task_identifier, storage_file_size in completed_tasks:
       try:
         task = self._task_manager.GetProcessedTaskByIdentifier(task_identifier)
 
+        if storage_file_size is not None:
+          task.storage_file_size = storage_file_size
+
         self._task_manager.SampleTaskStatus(task, 'processed')
 
+        task_estimate, actual_duration = self._task_cost_model.CompleteTask(
+            task_identifier)
+        if task_estimate:
+          self._task_manager.SampleTaskDuration(
+              task, task_estimate, actual_duration)
+
         to_merge = self._task_manager.CheckTaskToMerge(task)
         if not to_merge:
           self._RemoveProcessedTaskStorage(self._task_storage_format, task)
@@ -589,7 +1102,9 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
               self._task_storage_format, task)
 
           self._task_merge_helper = merge_helpers.ExtractionTaskMergeHelper(
-              task_storage_reader, task.identifier)
+              task_storage_reader, task.identifier,
+              event_data_stream_identifier=(
+                  task.GetEventDataStreamIdentifier()))
 
           self._task_manager.SampleTaskStatus(task, 'merge_started')
 
@@ -639,6 +1154,10 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
         self._RemoveMergeTaskStorage(
             self._task_storage_format, self._merge_task)
 
+        self._RemovePendingEventSource(self._merge_task.path_spec)
+        self._WriteFileEntryFingerprint(
+            storage_writer, self._merge_task.path_spec)
+
         try:
           self._task_manager.CompleteTask(self._merge_task)
 
@@ -688,8 +1207,6 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
 
     self._status = definitions.STATUS_INDICATOR_RUNNING
 
-    # TODO: make tasks persistent.
-
     # TODO: protect task scheduler loop by catch all and
     # handle abort path.
 
@@ -698,12 +1215,16 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
     self._FillEventSourceHeap(
         storage_writer, event_source_heap, start_with_first=True)
 
-    event_source = event_source_heap.PopEventSource()
+    event_source, task_estimate = event_source_heap.PopEventSource()
 
+    is_deferred = False
+    is_idle = False
     task = None
+    task_cost_estimate = None
     has_pending_tasks = True
 
-    while event_source or has_pending_tasks:
+    while (event_source or self._event_source_partitions or
+           self._pending_digest_hashes or has_pending_tasks):
       if self._abort:
         break
 
@@ -711,11 +1232,41 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
         if not task:
           task = self._task_manager.CreateRetryTask()
 
-        if not task and event_source:
-          task = self._CreateTask(
-              storage_writer, session_identifier, event_source)
+        if not task and self._event_source_partitions:
+          # Event source partitions are scheduled before other event sources
+          # so that the processing of a partitioned event source is completed
+          # first.
+          event_source_partition = self._event_source_partitions.popleft()
+          task = self._CreateEventSourcePartitionTask(
+              session_identifier, event_source_partition)
+
+        if not task and event_source and not self._CheckMemoryBudget(
+            task_estimate):
+          # The event source is kept until its task fits in the memory budget
+          # so that it is not starved by smaller tasks.
+          if not is_deferred:
+            path_spec_string = self._GetPathSpecificationString(
+                event_source.path_spec)
+            logger.debug((
+                f'Deferred task for path specification: {path_spec_string:s} '
+                f'with estimated memory usage: '
+                f'{task_estimate.estimated_memory:d} that does not fit in '
+                f'memory budget.'))
+
+            is_deferred = True
+            self._number_of_deferred_tasks += 1
+
+        elif not task and event_source:
+          is_deferred = False
+
+          task = self._CreateTask(session_identifier, event_source)
+
+          # The estimate is kept with the task it was computed for, since
+          # a retry task can be scheduled before it.
+          task_cost_estimate = task_estimate
 
           event_source = None
+          task_estimate = None
 
           self._number_of_consumed_sources += 1
 
@@ -724,6 +1275,11 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
             self._task_manager.SampleTaskStatus(task, 'schedule_attempted')
 
           else:
+            if task_cost_estimate:
+              self._task_cost_model.StartTask(
+                  task.identifier, task_cost_estimate)
+              task_cost_estimate = None
+
             path_spec_string = self._GetPathSpecificationString(task.path_spec)
             logger.debug((
                 f'Scheduled task: {task.identifier:s} for path specification: '
@@ -733,18 +1289,40 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
 
             task = None
 
-        self._MergeTaskStorage(storage_writer, session_identifier)
+        self._MergeTaskStorage(
+            storage_writer, session_identifier, wait_for_completion=is_idle)
+
+        # A checkpoint is only written when no task storage is partially
+        # merged, so that every task is either merged or pending.
+        if self._checkpoint and not self._task_merge_helper and (
+            not self._task_merge_helper_on_hold):
+          self._WriteCheckpointIfDue(storage_writer, session_identifier)
+
+        if self._pending_digest_hashes:
+          self._PushDigestHashedEventSources(storage_writer, event_source_heap)
 
         if event_source_heap.IsFull():
           logger.debug('Event source heap is full.')
         else:
           self._FillEventSourceHeap(storage_writer, event_source_heap)
 
-        if not task and not event_source:
-          event_source = event_source_heap.PopEventSource()
+        # Only a limited number of tasks is queued so that the event sources
+        # remain ordered by the heap, which schedules the tasks that are
+        # expected to take the longest first.
+        if not task and not event_source and (
+            self._task_manager.GetNumberOfQueuedTasks() <
+            self._GetMaximumNumberOfQueuedTasks()):
+          event_source, task_estimate = event_source_heap.PopEventSource()
 
         has_pending_tasks = self._task_manager.HasPendingTasks()
 
+        # Without a task to schedule or merge, or with an event source that
+        # is deferred until a task completes, the task scheduler waits for
+        # a worker process to complete a task instead of polling.
+        is_idle = bool(
+            not task and (not event_source or is_deferred) and
+            not self._event_source_partitions and not self._task_merge_helper)
+
       except KeyboardInterrupt:
         if self._debug_output:
           traceback.print_exc()
@@ -791,33 +1369,44 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
 
     self._number_of_consumed_event_data = 0
     self._number_of_consumed_sources = 0
+    self._number_of_deferred_tasks = 0
     self._number_of_produced_event_data = 0
     self._number_of_produced_events = 0
     self._number_of_produced_sources = 0
+    self._written_parsers_counter = collections.Counter()
 
-    stored_parsers_counter = collections.Counter({
-        parser_count.name: parser_count
-        for parser_count in storage_writer.GetAttributeContainers(
-            'parser_count')})
+    self._extraction_storage_counters = storage_counters.StorageCounters()
+    storage_writer.SetStorageCounters(self._extraction_storage_counters)
+
+    try:
+      if self._checkpoint:
+        self._WriteCheckpoint(storage_writer, session_identifier)
 
-    self._CollectInitialEventSources(storage_writer, file_system_path_specs)
+      self._CollectInitialEventSources(
+          storage_writer, session_identifier, file_system_path_specs)
 
-    if not self._abort:
-      self._ProcessEventSources(storage_writer, session_identifier)
+      if not self._abort:
+        self._ProcessEventSources(storage_writer, session_identifier)
+
+    finally:
+      storage_writer.SetStorageCounters(None)
 
     if self._abort:
       self._status = definitions.STATUS_INDICATOR_ABORTED
     else:
       self._status = definitions.STATUS_INDICATOR_COMPLETED
 
-    for key, value in self._event_data_timeliner.parsers_counter.items():
-      parser_count = stored_parsers_counter.get(key, None)
-      if parser_count:
-        parser_count.number_of_events += value
-        storage_writer.UpdateAttributeContainer(parser_count)
-      else:
-        parser_count = counts.ParserCount(name=key, number_of_events=value)
-        storage_writer.AddAttributeContainer(parser_count)
+    if self._abort and self._checkpoint:
+      # The attribute containers written after the last checkpoint are
+      # discarded, so that the session can be resumed from the checkpoint.
+      storage_writer.Rollback()
+
+    else:
+      self._WriteParserCounts(storage_writer)
+      self._WriteTaskCostEstimates(storage_writer)
+      self._extraction_storage_counters.WriteCounters(storage_writer)
+
+    self._extraction_storage_counters = None
 
     if self._processing_profiler:
       self._processing_profiler.StopTiming('process_source')
@@ -826,7 +1415,7 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
     # a filter file.
     self._UpdateForemanProcessStatus()
 
-    tasks_status = self._task_manager.GetStatusInformation()
+    tasks_status = self._GetTasksStatus()
     if self._task_queue_profiler:
       self._task_queue_profiler.Sample(tasks_status)
 
@@ -835,6 +1424,248 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
     if self._status_update_callback:
       self._status_update_callback(self._processing_status)
 
+  def _PushDigestHashedEventSources(self, storage_writer, event_source_heap):
+    """Pushes the event sources of which the digest hash was calculated.
+
+    The event sources are handled in the order in which their digest hash
+    calculation was started. Event sources of which the digest hash matches
+    that of the previous session are unchanged and considered consumed,
+    the other event sources are pushed onto the heap.
+
+    Args:
+      storage_writer (StorageWriter): storage writer for a session storage.
+      event_source_heap (_EventSourceHeap): event source heap.
+    """
+    while self._pending_digest_hashes:
+      future, event_source, fingerprint, stored_sha256_hash, task_estimate = (
+          self._pending_digest_hashes[0])
+      if not future.done():
+        break
+
+      self._pending_digest_hashes.popleft()
+
+      try:
+        fingerprint.sha256_hash = future.result()
+
+      # All exceptions need to be caught here to prevent the foreman
+      # from being killed by an uncaught exception.
+      except Exception as exception:  # pylint: disable=broad-except
+        self._ProduceExtractionWarning(storage_writer, (
+            f'unable to calculate digest hash with error: {exception!s}'),
+            event_source.path_spec)
+
+      if fingerprint.sha256_hash and (
+          fingerprint.sha256_hash == stored_sha256_hash):
+        self._processing_status.number_of_unchanged_file_entries += 1
+        self._processing_status.size_of_unchanged_file_entries += (
+            fingerprint.size or 0)
+        self._number_of_consumed_sources += 1
+
+        self._RemovePendingEventSource(event_source.path_spec)
+
+      else:
+        lookup_key = event_source.path_spec.comparable
+        self._file_entry_fingerprints[lookup_key] = fingerprint
+
+        event_source_heap.PushEventSource(
+            event_source, task_estimate=task_estimate)
+
+  def _PushEventSource(self, storage_writer, event_source_heap, event_source):
+    """Pushes an event source onto the heap.
+
+    The file entry of the event source is opened to determine if it should be
+    excluded from extraction and to estimate the cost of the task to process
+    it. Event sources that cannot be opened or are excluded are considered
+    consumed. In incremental digest mode, the event source is only pushed
+    onto the heap after its digest hash was calculated by a digest hash
+    thread, if the digest hash of the previous session is available.
+
+    Args:
+      storage_writer (StorageWriter): storage writer for a session storage.
+      event_source_heap (_EventSourceHeap): event source heap.
+      event_source (EventSource): event source.
+    """
+    future = None
+    stored_sha256_hash = None
+
+    try:
+      file_entry = path_spec_resolver.Resolver.OpenFileEntry(
+          event_source.path_spec, resolver_context=self._resolver_context)
+      if file_entry is None:
+        self._ProduceExtractionWarning(
+            storage_writer, 'Unable to open file entry', event_source.path_spec)
+        self._number_of_consumed_sources += 1
+        return
+
+      file_system = file_entry.GetFileSystem()
+
+      if not event_source.path_spec.IsSystemLevel():
+        self._CacheFileSystem(file_system)
+
+      if self._CheckExcludedPathSpec(file_system, event_source.path_spec):
+        display_name = path_helper.PathHelper.GetDisplayNameForPathSpec(
+            event_source.path_spec)
+        logger.debug(f'Excluded from extraction: {display_name:s}.')
+        self._number_of_consumed_sources += 1
+        return
+
+      fingerprint = self._CreateFileEntryFingerprint(file_entry)
+
+      if (not file_entry.IsDirectory() and
+          self._incremental_mode == definitions.INCREMENTAL_MODE_DIGEST):
+        stored_sha256_hash = self._GetStoredDigestHash(fingerprint)
+
+      lookup_key = event_source.path_spec.comparable
+      if self._incremental_mode and self._IsUnchangedFileEntry(
+          file_entry, fingerprint):
+        self._processing_status.number_of_unchanged_file_entries += 1
+
+        if file_entry.IsDirectory():
+          # The sub file entries of an unchanged directory can have changed.
+          self._collect_only_path_specs.add(lookup_key)
+        else:
+          self._processing_status.size_of_unchanged_file_entries += (
+              fingerprint.size or 0)
+          self._number_of_consumed_sources += 1
+          return
+
+      elif not stored_sha256_hash:
+        self._file_entry_fingerprints[lookup_key] = fingerprint
+
+      task_estimate = None
+      if event_source.file_entry_type != (
+          dfvfs_definitions.FILE_ENTRY_TYPE_DIRECTORY):
+        task_estimate = self._task_cost_model.EstimateFileEntryCost(file_entry)
+
+      if stored_sha256_hash:
+        # The digest hash is calculated by a digest hash thread so that
+        # the task scheduler is not blocked by reading the data stream.
+        future = self._digest_hash_executor.submit(
+            self._CalculateDigestHash, event_source.path_spec)
+
+    # All exceptions need to be caught here to prevent the foreman
+    # from being killed by an uncaught exception.
+    except Exception as exception:  # pylint: disable=broad-except
+      self._ProduceExtractionWarning(storage_writer, (
+          f'unable to process path specification with error: '
+          f'{exception!s}'), event_source.path_spec)
+      self._number_of_consumed_sources += 1
+      return
+
+    self._AddPendingEventSource(event_source)
+
+    if future:
+      self._pending_digest_hashes.append((
+          future, event_source, fingerprint, stored_sha256_hash,
+          task_estimate))
+    else:
+      event_source_heap.PushEventSource(
+          event_source, task_estimate=task_estimate)
+
+  def _ReadStoredFileEntryFingerprints(self, storage_writer):
+    """Reads the file entry fingerprints of previous sessions.
+
+    Args:
+      storage_writer (StorageWriter): storage writer for a session storage.
+    """
+    self._stored_file_entry_fingerprints = {}
+    self._stored_sha256_hashes = {}
+
+    if self._incremental_mode == definitions.INCREMENTAL_MODE_DIGEST:
+      # The digest hashes of event data streams are used for sessions that
+      # did not store fingerprints with digest hashes.
+      for event_data_stream in storage_writer.GetAttributeContainers(
+          self._CONTAINER_TYPE_EVENT_DATA_STREAM):
+        if event_data_stream.path_spec and event_data_stream.sha256_hash:
+          lookup_key = event_data_stream.path_spec.comparable
+          self._stored_sha256_hashes[lookup_key] = event_data_stream.sha256_hash
+
+    for fingerprint in storage_writer.GetAttributeContainers(
+        self._CONTAINER_TYPE_FILE_ENTRY_FINGERPRINT):
+      lookup_key = fingerprint.path_spec.comparable
+      self._stored_file_entry_fingerprints[lookup_key] = fingerprint
+
+      if fingerprint.sha256_hash:
+        self._stored_sha256_hashes[lookup_key] = fingerprint.sha256_hash
+
+  def _ReadStoredTaskCostEstimates(self, storage_writer):
+    """Reads the task cost estimates of previous sessions.
+
+    Args:
+      storage_writer (StorageWriter): storage writer for a session storage.
+    """
+    self._task_cost_estimates = None
+    for task_cost_estimates in storage_writer.GetAttributeContainers(
+        self._CONTAINER_TYPE_TASK_COST_ESTIMATES):
+      self._task_cost_estimates = task_cost_estimates
+
+    if self._task_cost_estimates:
+      self._task_cost_model.SetEstimates(self._task_cost_estimates)
+
+  def _RemovePendingEventSource(self, path_spec):
+    """Removes an event source that is pending to be processed.
+
+    Args:
+      path_spec (dfvfs.PathSpec): path specification of the event source.
+    """
+    if self._enable_checkpoints and path_spec:
+      lookup_key = path_spec.comparable
+      event_source_indexes = self._pending_event_source_indexes.get(
+          lookup_key, None)
+      if event_source_indexes:
+        event_source_indexes.pop(0)
+        if not event_source_indexes:
+          del self._pending_event_source_indexes[lookup_key]
+
+  def _ResumeFromCheckpoint(self, storage_writer, session_identifier):
+    """Resumes a session from its last extraction checkpoint.
+
+    The attribute containers written after the checkpoint, such as the
+    results of tasks that were partially merged, are removed and the event
+    sources that were pending at the time of the checkpoint are rescheduled.
+
+    Args:
+      storage_writer (StorageWriter): storage writer for a session storage.
+      session_identifier (str): the identifier of the session to resume.
+
+    Raises:
+      BadConfigOption: if the session storage has no checkpoint of the session.
+    """
+    checkpoint = None
+    for stored_checkpoint in storage_writer.GetAttributeContainers(
+        self._CONTAINER_TYPE_EXTRACTION_CHECKPOINT):
+      if stored_checkpoint.session_identifier == session_identifier:
+        checkpoint = stored_checkpoint
+
+    if not checkpoint:
+      raise errors.BadConfigOption((
+          f'Unable to resume session: {session_identifier:s} without '
+          f'extraction checkpoint.'))
+
+    for container_type in self._GetCheckpointContainerTypes():
+      number_of_containers = checkpoint.GetNumberOfContainers(container_type)
+      if storage_writer.GetNumberOfAttributeContainers(
+          container_type) > number_of_containers:
+        storage_writer.TruncateAttributeContainers(
+            container_type, number_of_containers)
+
+    number_of_event_sources = storage_writer.GetNumberOfAttributeContainers(
+        self._CONTAINER_TYPE_EVENT_SOURCE)
+
+    self._event_source_index = checkpoint.event_source_index
+    self._resume_event_source_indexes = collections.deque(
+        checkpoint.pending_event_source_indexes or [])
+    self._resume_event_source_indexes.extend(
+        range(self._event_source_index, number_of_event_sources))
+
+    self._checkpoint = checkpoint
+
+    number_of_pending_event_sources = len(
+        checkpoint.pending_event_source_indexes or [])
+    logger.debug((
+        f'Resuming session: {session_identifier:s} with '
+        f'{number_of_pending_event_sources:d} pending event sources.'))
+
   def _ScheduleTask(self, task):
     """Schedules a task.
 
@@ -859,6 +1690,37 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
 
     return is_scheduled
 
+  def _SetUpCollectionFilters(self, storage_writer, processing_configuration):
+    """Sets up the collection filters.
+
+    Args:
+      storage_writer (StorageWriter): storage writer that contains the
+          preprocessing information, such as user accounts.
+      processing_configuration (ProcessingConfiguration): processing
+          configuration.
+
+    Raises:
+      BadConfigOption: if an invalid collection filter was specified.
+    """
+    if not self._artifacts_registry:
+      # TODO: refactor.
+      self.BuildArtifactsRegistry(
+          processing_configuration.artifact_definitions_path,
+          processing_configuration.custom_artifacts_path)
+
+    # TODO: get environment_variables per system_configuration
+    environment_variables = self.knowledge_base.GetEnvironmentVariables()
+    user_accounts = list(storage_writer.GetAttributeContainers('user_account'))
+
+    try:
+      self.BuildCollectionFilters(
+          environment_variables, user_accounts,
+          artifact_filter_names=processing_configuration.artifact_filters,
+          filter_file_path=processing_configuration.filter_file)
+    except errors.InvalidFilter as exception:
+      raise errors.BadConfigOption(
+          f'Unable to build collection filters with error: {exception!s}')
+
   def _StartWorkerProcess(self, process_name):
     """Creates, starts, monitors and registers a worker process.
 
@@ -873,14 +1735,25 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
 
     queue_name = f'{process_name:s} task queue'
     task_queue = zeromq_queue.ZeroMQRequestConnectQueue(
-        delay_open=True, linger_seconds=0, name=queue_name,
-        port=self._task_queue_port,
+        delay_open=True, hostname=self._task_queue_hostname, linger_seconds=0,
+        name=queue_name, port=self._task_queue_port,
         timeout_seconds=self._TASK_QUEUE_TIMEOUT_SECONDS)
 
+    task_completion_queue = None
+    if self._task_completion_queue_port:
+      queue_name = f'{process_name:s} task completion queue'
+      task_completion_queue = zeromq_queue.ZeroMQPushConnectQueue(
+          delay_open=True, linger_seconds=1, name=queue_name,
+          port=self._task_completion_queue_port,
+          timeout_seconds=self._TASK_QUEUE_TIMEOUT_SECONDS)
+
     process = extraction_process.ExtractionWorkerProcess(
         task_queue, self._processing_configuration, self._system_configurations,
         self._windows_event_log_providers, self._registry_find_specs,
-        enable_sigsegv_handler=self._enable_sigsegv_handler, name=process_name)
+        enable_sigsegv_handler=self._enable_sigsegv_handler, name=process_name,
+        task_completion_queue=task_completion_queue)
+
+    self._AssignStatusBoardSlot(process)
 
     # Remove all possible log handlers to prevent a child process from logging
     # to the main process log file and garbling the log. The log handlers are
@@ -929,9 +1802,12 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
     logger.debug('Emptying task queue.')
     self._task_queue.Empty()
 
-    # Wake the processes to make sure that they are not blocking
-    # waiting for the queue new items.
-    for _ in self._processes_per_pid:
+    # Wake the processes, including the worker processes of worker nodes,
+    # to make sure that they are not blocking waiting for the queue new items.
+    number_of_worker_processes = (
+        len(self._processes_per_pid) + self._number_of_worker_node_processes)
+
+    for _ in range(number_of_worker_processes):
       try:
         self._task_queue.PushItem(plaso_queue.QueueAbort(), block=False)
       except errors.QueueFull:
@@ -1033,6 +1909,8 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
 
     try:
       self._task_manager.UpdateTaskAsProcessingByIdentifier(task_identifier)
+      self._task_cost_model.UpdateTaskAsProcessing(
+          task_identifier, used_memory=used_memory)
       return
     except KeyError:
       logger.debug((
@@ -1046,9 +1924,13 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
     for pid in list(self._process_information_per_pid.keys()):
       self._CheckStatusWorkerProcess(pid)
 
+    # The Redis client is not set after the task storage was stopped.
+    if self._worker_nodes_port and self._redis_client:
+      self._UpdateWorkerNodesStatus()
+
     self._UpdateForemanProcessStatus()
 
-    tasks_status = self._task_manager.GetStatusInformation()
+    tasks_status = self._GetTasksStatus()
     if self._task_queue_profiler:
       self._task_queue_profiler.Sample(tasks_status)
 
@@ -1057,10 +1939,189 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
     if self._status_update_callback:
       self._status_update_callback(self._processing_status)
 
+  def _UpdateWorkerNodesStatus(self):
+    """Updates the status of the worker processes of worker nodes.
+
+    The worker nodes publish the status of their worker processes in the Redis
+    task storage. The foreman in turn refreshes a Redis key that indicates to
+    the worker nodes that it is still active.
+    """
+    foreman_key_name = self._GetForemanRedisKeyName(self._session_identifier)
+    worker_status_hash_name = self._GetWorkerStatusRedisHashName(
+        self._session_identifier)
+
+    try:
+      self._redis_client.set(
+          foreman_key_name, self._name, ex=self._FOREMAN_REDIS_KEY_EXPIRY)
+      worker_statuses = self._redis_client.hgetall(worker_status_hash_name)
+
+    except redis.exceptions.RedisError as exception:
+      logger.error(
+          f'Unable to update status of worker nodes with error: {exception!s}')
+      return
+
+    current_timestamp = time.time()
+    number_of_worker_node_processes = 0
+
+    for process_name, process_status in worker_statuses.items():
+      process_name = process_name.decode('utf-8')
+
+      try:
+        process_status = json.loads(process_status)
+      except ValueError:
+        logger.warning(f'Unsupported status of worker: {process_name:s}')
+        continue
+
+      processing_status = process_status.get('processing_status', None)
+      update_timestamp = process_status.get('update_timestamp', 0.0)
+
+      if current_timestamp > update_timestamp + self._worker_timeout:
+        processing_status = definitions.STATUS_INDICATOR_NOT_RESPONDING
+
+      elif processing_status not in (
+          definitions.ERROR_STATUS_INDICATORS |
+          {definitions.STATUS_INDICATOR_COMPLETED}):
+        number_of_worker_node_processes += 1
+
+      used_memory = int(process_status.get('used_memory', None) or 0)
+
+      self._processing_status.UpdateWorkerStatus(
+          process_name, processing_status, process_status.get('pid', 0),
+          used_memory, process_status.get('display_name', ''),
+          process_status.get('number_of_consumed_sources', None),
+          process_status.get('number_of_produced_sources', None),
+          process_status.get('number_of_consumed_event_data', None),
+          process_status.get('number_of_produced_event_data', None),
+          None, None, 0, 0, 0, 0)
+
+      task_identifier = process_status.get('task_identifier', '')
+      if task_identifier:
+        try:
+          self._task_manager.UpdateTaskAsProcessingByIdentifier(
+              task_identifier)
+          self._task_cost_model.UpdateTaskAsProcessing(
+              task_identifier, used_memory=used_memory)
+        except KeyError:
+          logger.debug((
+              f'Worker {process_name:s} is processing unknown task: '
+              f'{task_identifier:s}.'))
+
+    self._number_of_worker_node_processes = number_of_worker_node_processes
+
+  def _WriteCheckpoint(self, storage_writer, session_identifier):
+    """Writes an extraction checkpoint and commits the session storage.
+
+    Args:
+      storage_writer (StorageWriter): storage writer for a session storage.
+      session_identifier (str): the identifier of the session the tasks are
+          part of.
+    """
+    if self._processing_profiler:
+      self._processing_profiler.StartTiming('write_checkpoint')
+
+    # The counters are written as part of the checkpoint since the attribute
+    # containers written after the checkpoint can be discarded.
+    if self._extraction_storage_counters:
+      self._extraction_storage_counters.WriteCounters(storage_writer)
+
+    self._WriteParserCounts(storage_writer)
+
+    container_types = self._GetCheckpointContainerTypes()
+
+    self._checkpoint.checkpoint_time = int(
+        time.time() * definitions.MICROSECONDS_PER_SECOND)
+    self._checkpoint.container_types = container_types
+    self._checkpoint.event_source_index = self._event_source_index
+    self._checkpoint.numbers_of_containers = [
+        storage_writer.GetNumberOfAttributeContainers(container_type)
+        for container_type in container_types]
+    self._checkpoint.pending_event_source_indexes = sorted([
+        event_source_index
+        for event_source_indexes in self._pending_event_source_indexes.values()
+        for event_source_index in event_source_indexes])
+    self._checkpoint.session_identifier = session_identifier
+
+    storage_writer.UpdateAttributeContainer(self._checkpoint)
+    storage_writer.Commit()
+
+    self._last_checkpoint_time = time.time()
+
+    if self._processing_profiler:
+      self._processing_profiler.StopTiming('write_checkpoint')
+
+  def _WriteCheckpointIfDue(self, storage_writer, session_identifier):
+    """Writes an extraction checkpoint if the checkpoint interval has elapsed.
+
+    Args:
+      storage_writer (StorageWriter): storage writer for a session storage.
+      session_identifier (str): the identifier of the session the tasks are
+          part of.
+    """
+    if time.time() >= self._last_checkpoint_time + self._CHECKPOINT_INTERVAL:
+      self._WriteCheckpoint(storage_writer, session_identifier)
+
+  def _WriteFileEntryFingerprint(self, storage_writer, path_spec):
+    """Writes the fingerprint of a file entry that was processed.
+
+    Args:
+      storage_writer (StorageWriter): storage writer for a session storage.
+      path_spec (dfvfs.PathSpec): path specification of the file entry.
+    """
+    if path_spec:
+      fingerprint = self._file_entry_fingerprints.pop(
+          path_spec.comparable, None)
+      if fingerprint:
+        storage_writer.AddAttributeContainer(fingerprint)
+
+  def _WriteParserCounts(self, storage_writer):
+    """Writes the parser counts that were not yet written.
+
+    Args:
+      storage_writer (StorageWriter): storage writer for a session storage.
+    """
+    parsers_counter = self._event_data_timeliner.parsers_counter
+    parsers_counter_delta = parsers_counter - self._written_parsers_counter
+    if not parsers_counter_delta:
+      return
+
+    stored_parsers_counter = {
+        parser_count.name: parser_count
+        for parser_count in storage_writer.GetAttributeContainers(
+            self._CONTAINER_TYPE_PARSER_COUNT)}
+
+    for key, value in parsers_counter_delta.items():
+      parser_count = stored_parsers_counter.get(key, None)
+      if parser_count:
+        parser_count.number_of_events += value
+        storage_writer.UpdateAttributeContainer(parser_count)
+      else:
+        parser_count = counts.ParserCount(name=key, number_of_events=value)
+        storage_writer.AddAttributeContainer(parser_count)
+
+    self._written_parsers_counter = collections.Counter(parsers_counter)
+
+  def _WriteTaskCostEstimates(self, storage_writer):
+    """Writes the task cost estimates learned by the cost model.
+
+    Args:
+      storage_writer (StorageWriter): storage writer for a session storage.
+    """
+    task_cost_estimates = self._task_cost_model.GetEstimates()
+
+    if self._task_cost_estimates:
+      task_cost_estimates.SetIdentifier(
+          self._task_cost_estimates.GetIdentifier())
+      storage_writer.UpdateAttributeContainer(task_cost_estimates)
+    else:
+      storage_writer.AddAttributeContainer(task_cost_estimates)
+
+    self._task_cost_estimates = task_cost_estimates
+
   def ProcessSourceMulti(
       self, storage_writer, session_identifier, processing_configuration,
       system_configurations, file_system_path_specs,
-      enable_sigsegv_handler=False, storage_file_path=None):
+      enable_sigsegv_handler=False, incremental_mode=None, resume=False,
+      storage_file_path=None):
     """Processes file systems within a source.
 
     Args:
@@ -1075,36 +2136,32 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
           the source file systems to process.
       enable_sigsegv_handler (Optional[bool]): True if the SIGSEGV handler
           should be enabled.
+      incremental_mode (Optional[str]): incremental extraction mode, where
+          file entries that were not changed since a previous session in
+          the session storage are not processed again, or None to process
+          all file entries.
+      resume (Optional[bool]): True if the session should be resumed from its
+          last extraction checkpoint.
       storage_file_path (Optional[str]): path to the session storage file.
 
     Returns:
       ProcessingStatus: processing status.
 
     Raises:
-      BadConfigOption: if an invalid collection filter was specified or if
-          the preferred time zone is invalid.
+      BadConfigOption: if an invalid collection filter was specified, if
+          the preferred time zone is invalid, if the session cannot be
+          resumed or if worker nodes are used without the Redis task storage.
     """
+    if self._worker_nodes_port and (
+        processing_configuration.task_storage_format !=
+        definitions.STORAGE_FORMAT_REDIS or not redis):
+      raise errors.BadConfigOption(
+          'Worker nodes require the Redis task storage.')
+
     self._enable_sigsegv_handler = enable_sigsegv_handler
     self._system_configurations = system_configurations
 
-    if not self._artifacts_registry:
-      # TODO: refactor.
-      self.BuildArtifactsRegistry(
-          processing_configuration.artifact_definitions_path,
-          processing_configuration.custom_artifacts_path)
-
-    # TODO: get environment_variables per system_configuration
-    environment_variables = self.knowledge_base.GetEnvironmentVariables()
-    user_accounts = list(storage_writer.GetAttributeContainers('user_account'))
-
-    try:
-      self.BuildCollectionFilters(
-          environment_variables, user_accounts,
-          artifact_filter_names=processing_configuration.artifact_filters,
-          filter_file_path=processing_configuration.filter_file)
-    except errors.InvalidFilter as exception:
-      raise errors.BadConfigOption(
-          f'Unable to build collection filters with error: {exception!s}')
+    self._SetUpCollectionFilters(storage_writer, processing_configuration)
 
     self._event_data_timeliner = timeliner.EventDataTimeliner(
         data_location=processing_configuration.data_location,
@@ -1122,16 +2179,62 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
 
     self._debug_output = processing_configuration.debug_output
     self._log_filename = processing_configuration.log_filename
+    self._session_identifier = session_identifier
     self._storage_file_path = storage_file_path
     self._storage_writer = storage_writer
     self._task_storage_format = processing_configuration.task_storage_format
     self._windows_event_log_providers = list(
         storage_writer.GetAttributeContainers('windows_eventlog_provider'))
+    self._windows_event_log_xml_template_identifiers = set(
+        xml_template.identifier
+        for xml_template in storage_writer.GetAttributeContainers(
+            self._CONTAINER_TYPE_WINDOWS_EVENTLOG_XML_TEMPLATE))
+
+    self._checkpoint = None
+    self._collect_only_path_specs = set()
+    self._event_source_index = 0
+    self._event_source_partitions = collections.deque()
+    self._file_entry_fingerprints = {}
+    self._incremental_mode = incremental_mode
+    self._last_checkpoint_time = time.time()
+    self._pending_event_source_indexes = {}
+    self._resume_event_source_indexes = collections.deque()
+
+    if resume and not self._enable_checkpoints:
+      raise errors.BadConfigOption(
+          'Unable to resume session without extraction checkpoints.')
+
+    if self._enable_checkpoints:
+      storage_writer.EnableWriteAheadLog()
+
+      if resume:
+        self._ResumeFromCheckpoint(storage_writer, session_identifier)
+      else:
+        self._checkpoint = sessions.ExtractionCheckpoint(
+            session_identifier=session_identifier)
+        storage_writer.AddAttributeContainer(self._checkpoint)
+
+        self._event_source_index = (
+            storage_writer.GetNumberOfAttributeContainers(
+                self._CONTAINER_TYPE_EVENT_SOURCE))
+
+    # The fingerprints are read after resuming, so that file entries that
+    # were processed before the checkpoint are considered unchanged.
+    if self._incremental_mode:
+      self._ReadStoredFileEntryFingerprints(storage_writer)
+
+    self._ReadStoredTaskCostEstimates(storage_writer)
+
+    # Set up the task queue. With worker nodes the task queue is bound to
+    # the worker nodes address so that worker processes on other hosts can
+    # connect to it.
+    hostname = None
+    if self._worker_nodes_port:
+      hostname = self._worker_nodes_address
 
-    # Set up the task queue.
     task_outbound_queue = zeromq_queue.ZeroMQBufferedReplyBindQueue(
-        delay_open=True, linger_seconds=0, maximum_items=1,
-        name='main_task_queue',
+        delay_open=True, hostname=hostname, linger_seconds=0, maximum_items=1,
+        name='main_task_queue', port=self._worker_nodes_port,
         timeout_seconds=self._ZEROMQ_NO_WORKER_REQUEST_TIME_SECONDS)
     self._task_queue = task_outbound_queue
 
@@ -1141,8 +2244,13 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
     self._task_queue.Open()
     self._task_queue_port = self._task_queue.port
 
-    # Set up the task storage before the worker processes.
+    # Set up the task storage, task completion queue and process status board
+    # before the worker processes.
     self._StartTaskStorage(self._task_storage_format)
+    self._StartTaskCompletionQueue()
+
+    if self._use_status_board:
+      self._StartStatusBoard(self._number_of_worker_processes)
 
     for worker_number in range(self._number_of_worker_processes):
       process_name = f'Worker_{self._last_worker_number:02d}'
@@ -1162,11 +2270,22 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
 
     self._StartStatusUpdateThread()
 
+    if self._incremental_mode == definitions.INCREMENTAL_MODE_DIGEST:
+      self._digest_hash_executor = concurrent.futures.ThreadPoolExecutor(
+          max_workers=self._NUMBER_OF_DIGEST_HASH_THREADS,
+          thread_name_prefix='digest_hash')
+
     try:
       self._ProcessSource(
           storage_writer, session_identifier, file_system_path_specs)
 
     finally:
+      if self._digest_hash_executor:
+        self._digest_hash_executor.shutdown(wait=True, cancel_futures=True)
+        self._digest_hash_executor = None
+
+      self._pending_digest_hashes = collections.deque()
+
       # Stop the status update thread after close of the storage writer
       # so we include the storage sync to disk in the status updates.
       self._StopStatusUpdateThread()
@@ -1194,6 +2313,21 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
     # close is a failsafe.
     self._task_queue.Close(abort=True)
 
+    self._StopTaskCompletionQueue()
+    self._StopStatusBoard()
+
+    profiling_configuration = self._processing_configuration.profiling
+    if profiling_configuration and profiling_configuration.HaveProfileTrace():
+      # The trace sample files are merged after the worker processes have
+      # stopped and written their remaining spans.
+      identifiers = [self._name]
+      identifiers.extend([
+          f'Worker_{worker_number:02d}'
+          for worker_number in range(self._last_worker_number)])
+
+      profilers.TraceProfiler.MergeSampleFiles(
+          profiling_configuration, identifiers)
+
     if self._processing_status.error_path_specs:
       task_storage_abort = True
     else:
@@ -1212,18 +2346,35 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
     else:
       logger.debug('Processing completed.')
 
+    if self._incremental_mode:
+      logger.info((
+          f'Incremental extraction skipped: '
+          f'{self._processing_status.number_of_unchanged_file_entries:d} '
+          f'unchanged file entries ('
+          f'{self._processing_status.size_of_unchanged_file_entries:d} '
+          f'bytes).'))
+
     # Update the status view one last time.
     self._UpdateStatus()
 
     # Reset values.
+    self._checkpoint = None
+    self._collect_only_path_specs = set()
     self._enable_sigsegv_handler = None
     self._event_data_timeliner = None
+    self._event_source_partitions = collections.deque()
+    self._file_entry_fingerprints = {}
     self._file_system_cache = []
+    self._incremental_mode = None
     self._processing_configuration = None
     self._storage_file_path = None
+    self._stored_file_entry_fingerprints = {}
+    self._stored_sha256_hashes = {}
     self._storage_writer = None
     self._system_configurations = None
+    self._task_cost_estimates = None
     self._task_storage_format = None
     self._windows_event_log_providers = None
+    self._windows_event_log_xml_template_identifiers = set()
 
     return self._processing_status
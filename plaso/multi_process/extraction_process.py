@@ -100,6 +100,9 @@ class ExtractionWorkerProcess(task_process.MultiProcessTaskProcess):
         resolver_context=resolver_context,
         system_configurations=system_configurations)
 
+    # Large data streams can be split into event source partitions that are
+    # processed by separate tasks.
+    parser_mediator.SetEventSourcePartitioning(True)
     parser_mediator.SetExtractWinEvtResources(
         processing_configuration.extraction.extract_winevt_resources)
     parser_mediator.SetExtractWinRegBinaryValues(
@@ -110,6 +113,8 @@ class ExtractionWorkerProcess(task_process.MultiProcessTaskProcess):
         processing_configuration.preferred_language)
     parser_mediator.SetTemporaryDirectory(
         processing_configuration.temporary_directory)
+    parser_mediator.SetWinEvtxXMLTemplates(
+        processing_configuration.extraction.winevtx_xml_templates)
 
     parser_mediator.SetWindowsEventLogProviders(windows_event_log_providers)
 
@@ -139,6 +144,7 @@ class ExtractionWorkerProcess(task_process.MultiProcessTaskProcess):
       last_activity_timestamp = 0.0
       processing_status = self._status
 
+    session_identifier = getattr(self._task, 'session_identifier', '')
     task_identifier = getattr(self._task, 'identifier', '')
 
     if self._process_information:
@@ -166,6 +172,7 @@ class ExtractionWorkerProcess(task_process.MultiProcessTaskProcess):
         'number_of_produced_events': None,
         'number_of_produced_sources': number_of_produced_sources,
         'processing_status': processing_status,
+        'session_identifier': session_identifier,
         'task_identifier': task_identifier,
         'used_memory': used_memory}
 
@@ -210,6 +217,9 @@ class ExtractionWorkerProcess(task_process.MultiProcessTaskProcess):
 
     logger.debug(f'Worker: {self._name!s} (PID: {self._pid:d}) started.')
 
+    if self._task_completion_queue:
+      self._task_completion_queue.Open()
+
     self._status = definitions.STATUS_INDICATOR_RUNNING
 
     try:
@@ -270,13 +280,29 @@ class ExtractionWorkerProcess(task_process.MultiProcessTaskProcess):
     except errors.QueueAlreadyClosed:
       logger.error(f'Queue for {self.name:s} was already closed.')
 
-  def _ProcessPathSpec(self, extraction_worker, parser_mediator, path_spec):
+    if self._task_completion_queue:
+      try:
+        self._task_completion_queue.Close(abort=self._abort)
+      except errors.QueueAlreadyClosed:
+        logger.error((
+            f'Task completion queue for {self.name:s} was already closed.'))
+
+  def _ProcessPathSpec(
+      self, extraction_worker, parser_mediator, path_spec, collect_only=False,
+      parser_name=None, partition=None):
     """Processes a path specification.
 
     Args:
       extraction_worker (worker.ExtractionWorker): extraction worker.
       parser_mediator (ParserMediator): parser mediator.
       path_spec (dfvfs.PathSpec): path specification.
+      collect_only (Optional[bool]): True if only the sub file entries of
+          a directory should be collected.
+      parser_name (Optional[str]): name of the parser that produced the event
+          source partition to process or None if the entire file entry should
+          be processed.
+      partition (Optional[tuple[int, int]]): start and end of the event source
+          partition to process.
     """
     self._current_display_name = parser_mediator.GetDisplayNameForPathSpec(
         path_spec)
@@ -294,7 +320,12 @@ class ExtractionWorkerProcess(task_process.MultiProcessTaskProcess):
         file_system = file_entry.GetFileSystem()
         self._CacheFileSystem(file_system)
 
-      extraction_worker.ProcessFileEntry(parser_mediator, file_entry)
+      if parser_name:
+        extraction_worker.ProcessEventSourcePartition(
+            parser_mediator, file_entry, parser_name, partition)
+      else:
+        extraction_worker.ProcessFileEntry(
+            parser_mediator, file_entry, collect_only=collect_only)
 
     except Exception as exception:  # pylint: disable=broad-except
       parser_mediator.ProduceExtractionWarning((
@@ -318,6 +349,9 @@ class ExtractionWorkerProcess(task_process.MultiProcessTaskProcess):
     if self._tasks_profiler:
       self._tasks_profiler.Sample(task, 'processing_started')
 
+    if self._processing_profiler:
+      self._processing_profiler.StartTiming('process_task')
+
     task.storage_format = self._processing_configuration.task_storage_format
 
     self._task = task
@@ -337,14 +371,21 @@ class ExtractionWorkerProcess(task_process.MultiProcessTaskProcess):
         self._processing_configuration.task_storage_format, task)
     task_storage_writer.Open(
         path=storage_file_path, session_identifier=task.session_identifier,
-        task_identifier=task.identifier)
+        task_identifier=task.identifier,
+        url=self._processing_configuration.redis_url)
 
     try:
       task_storage_writer.AddAttributeContainer(task)
 
+      partition = None
+      if task.parser_name:
+        partition = (task.partition_start, task.partition_end)
+
       # TODO: add support for more task types.
       self._ProcessPathSpec(
-          self._extraction_worker, self._parser_mediator, task.path_spec)
+          self._extraction_worker, self._parser_mediator, task.path_spec,
+          collect_only=task.collect_only, parser_name=task.parser_name,
+          partition=partition)
       self._number_of_consumed_sources += 1
 
     finally:
@@ -361,8 +402,15 @@ class ExtractionWorkerProcess(task_process.MultiProcessTaskProcess):
     except IOError:
       pass
 
+    else:
+      self._NotifyTaskCompleted(
+          self._processing_configuration.task_storage_format, task)
+
     self._task = None
 
+    if self._processing_profiler:
+      self._processing_profiler.StopTiming('process_task')
+
     if self._tasks_profiler:
       self._tasks_profiler.Sample(task, 'processing_completed')
 
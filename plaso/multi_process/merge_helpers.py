@@ -104,7 +104,15 @@ class AnalysisTaskMergeHelper(BaseTaskMergeHelper):
 
 
 class ExtractionTaskMergeHelper(BaseTaskMergeHelper):
-  """Assists in merging attribute containers of an extraction task."""
+  """Assists in merging attribute containers of an extraction task.
+
+  Attributes:
+    event_data_stream_identifier (AttributeContainerIdentifier): identifier
+        of the event data stream, in the session storage, of event data
+        without an event data stream, such as the event data produced by
+        a task that processed an event source partition.
+    task_identifier (str): identifier of the task that is merged.
+  """
 
   # Container types produced by the extraction worker processes that need to be
   # merged. Note that some container types reference other container types and
@@ -114,6 +122,7 @@ class ExtractionTaskMergeHelper(BaseTaskMergeHelper):
   _CONTAINER_TYPES = (
       event_sources.EventSource.CONTAINER_TYPE,
       events.EventDataStream.CONTAINER_TYPE,
+      event_sources.EventSourcePartition.CONTAINER_TYPE,
       # The date-less log helper is needed to generate event from the event
       # data by the timeliner and therefore needs to be merged before event
       # data containers.
@@ -123,4 +132,21 @@ class ExtractionTaskMergeHelper(BaseTaskMergeHelper):
       warnings.RecoveryWarning.CONTAINER_TYPE,
       artifacts.WindowsEventLogMessageFileArtifact.CONTAINER_TYPE,
       artifacts.WindowsEventLogMessageStringArtifact.CONTAINER_TYPE,
+      artifacts.WindowsEventLogXMLTemplateArtifact.CONTAINER_TYPE,
       artifacts.WindowsWevtTemplateEvent.CONTAINER_TYPE)
+
+  def __init__(
+      self, task_storage_reader, task_identifier,
+      event_data_stream_identifier=None):
+    """Initialize a helper for merging extraction task attribute containers.
+
+    Args:
+      task_storage_reader (StorageReader): task storage reader.
+      task_identifier (str): identifier of the task that is merged.
+      event_data_stream_identifier (Optional[AttributeContainerIdentifier]):
+          identifier of the event data stream, in the session storage, of
+          event data without an event data stream.
+    """
+    super(ExtractionTaskMergeHelper, self).__init__(
+        task_storage_reader, task_identifier)
+    self.event_data_stream_identifier = event_data_stream_identifier
@@ -6,6 +6,7 @@ import os
 
 from plaso.containers import events
 from plaso.engine import processing_status
+from plaso.helpers.windows import eventlog_xml_templates
 from plaso.lib import bufferlib
 from plaso.lib import definitions
 from plaso.lib import errors
@@ -214,11 +215,16 @@ class OutputAndFormattingMultiProcessEngine(engine.MultiProcessEngine):
     self._events_status.number_of_filtered_events = 0
     self._events_status.number_of_events_from_time_slice = 0
 
+    xml_templates_helper = (
+        eventlog_xml_templates.WindowsEventLogXMLTemplatesHelper())
+
     for event in storage_reader.GetSortedEvents(time_range=time_slice_range):
       event_data_identifier = event.GetEventDataIdentifier()
       event_data = storage_reader.GetAttributeContainerByIdentifier(
           events.EventData.CONTAINER_TYPE, event_data_identifier)
 
+      xml_templates_helper.RenderXMLString(storage_reader, event_data)
+
       event_data_stream_identifier = event_data.GetEventDataStreamIdentifier()
       if event_data_stream_identifier:
         event_data_stream = storage_reader.GetAttributeContainerByIdentifier(
@@ -0,0 +1,586 @@
+# -*- coding: utf-8 -*-
+"""Shared memory broadcast implementations of the Plaso queue interface."""
+
+import collections
+import pickle
+import struct
+import sys
+import time
+
+from multiprocessing import shared_memory
+
+from plaso.lib import errors
+from plaso.multi_process import plaso_queue
+
+
+class SharedMemoryBroadcastQueue(plaso_queue.Queue):
+  """Interface for a shared memory broadcast queue.
+
+  The queue is a ring buffer in a shared memory segment, that is written by
+  a single writer and read independently by a fixed number of readers. Items
+  are coalesced into batches, which are pickled and written to the ring
+  buffer once, regardless of the number of readers.
+
+  The shared memory segment starts with a header that contains the write
+  position, followed by a read position per reader. A position is the total
+  number of bytes written or read and is only updated by the process that
+  owns it, after the data was written or copied, so that no locking is
+  needed. The writer waits for the slowest reader if the ring buffer is full.
+
+  Attributes:
+    name (str): name to identify the queue.
+    timeout_seconds (int): number of seconds that calls to PopItem and PushItem
+        may block for, before raising an exception.
+  """
+
+  # The header consists of: the write position, the closed flag, the number
+  # of readers and the size of the ring buffer.
+  _HEADER = struct.Struct('<QQQQ')
+
+  _POSITION = struct.Struct('<Q')
+
+  # The header and every read position are stored in a separate 64 bytes
+  # region, which is a common cache line size, so that the processes do not
+  # write to the same cache line.
+  _REGION_SIZE = 64
+
+  # Read position of a reader that is detached from the queue.
+  _DETACHED = 0xffffffffffffffff
+
+  # Every batch is stored as a record that consists of the size of the pickled
+  # batch followed by the pickled batch, padded to a multitude of 8 bytes.
+  _RECORD_HEADER = struct.Struct('<Q')
+
+  # Minimum and maximum number of seconds to wait before checking again if
+  # the queue is no longer full or empty.
+  _MINIMUM_POLL_INTERVAL = 0.0005
+  _MAXIMUM_POLL_INTERVAL = 0.01
+
+  def __init__(self, name='Unnamed', timeout_seconds=5):
+    """Initializes a shared memory broadcast queue.
+
+    Args:
+      name (Optional[str]): name to identify the queue.
+      timeout_seconds (Optional[int]): number of seconds that calls to PopItem
+          and PushItem may block for, before raising an exception.
+    """
+    super(SharedMemoryBroadcastQueue, self).__init__()
+    self._data_offset = 0
+    self._data_size = 0
+    self._number_of_readers = 0
+    self._shared_memory = None
+
+    self.name = name
+    self.timeout_seconds = timeout_seconds
+
+  def _GetReadPositionOffset(self, reader_index):
+    """Retrieves the offset of the read position of a reader.
+
+    Args:
+      reader_index (int): index of the reader.
+
+    Returns:
+      int: offset of the read position in the shared memory segment.
+
+    Raises:
+      ValueError: if the reader index is out of bounds.
+    """
+    if reader_index < 0 or reader_index >= self._number_of_readers:
+      raise ValueError(f'Reader index: {reader_index:d} out of bounds.')
+
+    return (reader_index + 1) * self._REGION_SIZE
+
+  def _IsClosed(self):
+    """Determines if the writer has closed the queue.
+
+    Returns:
+      bool: True if the writer has closed the queue.
+    """
+    return self._POSITION.unpack_from(
+        self._shared_memory.buf, self._POSITION.size)[0] != 0
+
+  def _ReadData(self, position, size):
+    """Reads data from the ring buffer.
+
+    Args:
+      position (int): position of the data.
+      size (int): size of the data.
+
+    Returns:
+      bytes: data.
+    """
+    buffer = self._shared_memory.buf
+    data_offset = position % self._data_size
+    first_size = min(size, self._data_size - data_offset)
+
+    data_offset += self._data_offset
+    data = bytes(buffer[data_offset:data_offset + first_size])
+    if first_size < size:
+      data = b''.join([
+          data, bytes(buffer[
+              self._data_offset:self._data_offset + size - first_size])])
+
+    return data
+
+  def _ReadPosition(self, offset):
+    """Reads a position.
+
+    Args:
+      offset (int): offset of the position in the shared memory segment.
+
+    Returns:
+      int: position.
+    """
+    return self._POSITION.unpack_from(self._shared_memory.buf, offset)[0]
+
+  def _SetLayout(self, number_of_readers, data_size):
+    """Sets the layout of the shared memory segment.
+
+    Args:
+      number_of_readers (int): number of readers.
+      data_size (int): size of the ring buffer.
+    """
+    self._data_offset = (number_of_readers + 1) * self._REGION_SIZE
+    self._data_size = data_size
+    self._number_of_readers = number_of_readers
+
+  def _Wait(self, poll_interval):
+    """Waits before checking again if the queue is no longer full or empty.
+
+    Args:
+      poll_interval (float): number of seconds to wait.
+
+    Returns:
+      float: number of seconds to wait the next time.
+    """
+    time.sleep(poll_interval)
+    return min(poll_interval * 2, self._MAXIMUM_POLL_INTERVAL)
+
+
+class SharedMemoryBroadcastReaderQueue(SharedMemoryBroadcastQueue):
+  """Shared memory broadcast queue that is read from.
+
+  The reader attaches to the shared memory segment the first time it is
+  popped from, so that it can be passed to a child process.
+  """
+
+  def __init__(
+      self, segment_name, reader_index, name='Unnamed', timeout_seconds=5):
+    """Initializes a shared memory broadcast queue that is read from.
+
+    Args:
+      segment_name (str): name of the shared memory segment.
+      reader_index (int): index of the reader.
+      name (Optional[str]): name to identify the queue.
+      timeout_seconds (Optional[int]): number of seconds that calls to PopItem
+          may block for, before raising QueueEmpty.
+    """
+    super(SharedMemoryBroadcastReaderQueue, self).__init__(
+        name=name, timeout_seconds=timeout_seconds)
+    self._items = collections.deque()
+    self._read_position = 0
+    self._read_position_offset = 0
+    self._reader_index = reader_index
+    self._segment_name = segment_name
+
+  def __getstate__(self):
+    """Retrieves the state of the queue for pickling.
+
+    Returns:
+      dict[str, object]: state of the queue.
+    """
+    state = self.__dict__.copy()
+    state['_shared_memory'] = None
+    return state
+
+  def Close(self, abort=False):
+    """Closes the queue.
+
+    The reader is detached from the queue, so that the writer no longer waits
+    for it.
+
+    Args:
+      abort (Optional[bool]): whether the Close is the result of an abort
+          condition. If True, queue contents may be lost.
+    """
+    if not self._shared_memory:
+      try:
+        self.Open()
+      except (IOError, OSError, ValueError):
+        return
+
+    self._POSITION.pack_into(
+        self._shared_memory.buf, self._read_position_offset, self._DETACHED)
+
+    self._items = collections.deque()
+    self._shared_memory.close()
+    self._shared_memory = None
+
+  def IsEmpty(self):
+    """Checks if the queue is empty.
+
+    Returns:
+      bool: True if the queue is empty.
+    """
+    if self._items:
+      return False
+
+    if not self._shared_memory:
+      self.Open()
+
+    return self._read_position >= self._ReadPosition(0)
+
+  def Open(self):
+    """Attaches to the shared memory segment.
+
+    Raises:
+      IOError: if the queue is already open or the shared memory segment
+          cannot be opened.
+      OSError: if the queue is already open or the shared memory segment
+          cannot be opened.
+      ValueError: if the reader index is out of bounds.
+    """
+    if self._shared_memory:
+      raise IOError('Queue already open.')
+
+    kwargs = {}
+    if sys.version_info[0:2] >= (3, 13):
+      # The shared memory segment is removed by the process that created it.
+      kwargs['track'] = False
+
+    self._shared_memory = shared_memory.SharedMemory(
+        name=self._segment_name, **kwargs)
+
+    _, _, number_of_readers, data_size = self._HEADER.unpack_from(
+        self._shared_memory.buf, 0)
+    self._SetLayout(number_of_readers, data_size)
+
+    try:
+      self._read_position_offset = self._GetReadPositionOffset(
+          self._reader_index)
+    except ValueError:
+      self._shared_memory.close()
+      self._shared_memory = None
+      raise
+
+    self._read_position = self._ReadPosition(self._read_position_offset)
+
+  def PopItem(self):
+    """Pops an item off the queue.
+
+    Returns:
+      object: item from the queue.
+
+    Raises:
+      QueueClose: if the writer closed the queue and there are no more items.
+      QueueEmpty: if the queue is empty, and no item could be popped within
+          the queue timeout.
+    """
+    if self._items:
+      return self._items.popleft()
+
+    if not self._shared_memory:
+      self.Open()
+
+    if self._read_position == self._DETACHED:
+      raise errors.QueueClose()
+
+    deadline = time.time() + self.timeout_seconds
+    poll_interval = self._MINIMUM_POLL_INTERVAL
+
+    while self._read_position >= self._ReadPosition(0):
+      if self._IsClosed():
+        raise errors.QueueClose()
+
+      if time.time() > deadline:
+        raise errors.QueueEmpty()
+
+      poll_interval = self._Wait(poll_interval)
+
+    record_header = self._ReadData(
+        self._read_position, self._RECORD_HEADER.size)
+    batch_size = self._RECORD_HEADER.unpack(record_header)[0]
+
+    batch_data = self._ReadData(
+        self._read_position + self._RECORD_HEADER.size, batch_size)
+
+    self._read_position += self._RECORD_HEADER.size + ((batch_size + 7) & ~7)
+    self._POSITION.pack_into(
+        self._shared_memory.buf, self._read_position_offset,
+        self._read_position)
+
+    self._items.extend(pickle.loads(batch_data))
+
+    return self._items.popleft()
+
+  def PushItem(self, item, block=True):
+    """Pushes an item on to the queue.
+
+    Provided for compatibility with the API, but doesn't actually work.
+
+    Args:
+      item (object): item to push on the queue.
+      block (Optional[bool]): whether the push should be performed in blocking
+          or non-blocking mode.
+
+    Raises:
+      WrongQueueType: As Push is not supported this queue.
+    """
+    raise errors.WrongQueueType()
+
+
+class SharedMemoryBroadcastWriterQueue(SharedMemoryBroadcastQueue):
+  """Shared memory broadcast queue that is written to."""
+
+  _DEFAULT_SIZE = 64 * 1024 * 1024
+
+  def __init__(
+      self, number_of_readers, maximum_batch_size=1, name='Unnamed',
+      size=_DEFAULT_SIZE, timeout_seconds=5):
+    """Initializes a shared memory broadcast queue that is written to.
+
+    Args:
+      number_of_readers (int): number of readers.
+      maximum_batch_size (Optional[int]): maximum number of items to write
+          in a single batch.
+      name (Optional[str]): name to identify the queue.
+      size (Optional[int]): size of the ring buffer in bytes.
+      timeout_seconds (Optional[int]): number of seconds that calls to PushItem
+          may block for, before raising QueueFull.
+
+    Raises:
+      ValueError: if the number of readers or size is invalid.
+    """
+    if number_of_readers < 1:
+      raise ValueError(f'Invalid number of readers: {number_of_readers:d}.')
+
+    if size <= 0 or size % 8:
+      raise ValueError(f'Invalid size: {size:d}.')
+
+    super(SharedMemoryBroadcastWriterQueue, self).__init__(
+        name=name, timeout_seconds=timeout_seconds)
+    self._batch = []
+    self._maximum_batch_size = max(maximum_batch_size, 1)
+    self._write_position = 0
+
+    self._SetLayout(number_of_readers, size)
+
+  @property
+  def segment_name(self):
+    """str: name of the shared memory segment or None if not open."""
+    if not self._shared_memory:
+      return None
+
+    return self._shared_memory.name
+
+  def _GetMinimumReadPosition(self):
+    """Retrieves the read position of the slowest reader.
+
+    Returns:
+      int: read position of the slowest attached reader or the write position
+          if no reader is attached.
+    """
+    minimum_read_position = self._write_position
+    for reader_index in range(self._number_of_readers):
+      read_position = self._ReadPosition(
+          self._GetReadPositionOffset(reader_index))
+      if read_position != self._DETACHED:
+        minimum_read_position = min(minimum_read_position, read_position)
+
+    return minimum_read_position
+
+  def _WriteBatch(self, batch, block=True):
+    """Writes a batch of items to the ring buffer.
+
+    A batch that does not fit in the ring buffer is split. The items that
+    were written are removed from the batch, so that if QueueFull is raised
+    the batch only contains the items that still need to be written.
+
+    Args:
+      batch (list[object]): items to write.
+      block (Optional[bool]): whether to wait for the readers if the ring
+          buffer is full.
+
+    Raises:
+      QueueFull: if the ring buffer is full and the batch could not be
+          written, or if a single item does not fit in the ring buffer.
+    """
+    batch_data = pickle.dumps(batch, protocol=pickle.HIGHEST_PROTOCOL)
+    batch_size = len(batch_data)
+    record_size = self._RECORD_HEADER.size + ((batch_size + 7) & ~7)
+
+    if record_size > self._data_size:
+      if len(batch) == 1:
+        raise errors.QueueFull(
+            f'Item of: {batch_size:d} bytes does not fit in queue.')
+
+      middle_index = len(batch) // 2
+      first_half = batch[:middle_index]
+      try:
+        self._WriteBatch(first_half, block=block)
+      finally:
+        del batch[:middle_index - len(first_half)]
+
+      self._WriteBatch(batch, block=block)
+      return
+
+    deadline = time.time() + self.timeout_seconds
+    poll_interval = self._MINIMUM_POLL_INTERVAL
+
+    while (self._write_position + record_size -
+           self._GetMinimumReadPosition()) > self._data_size:
+      if not block or time.time() > deadline:
+        raise errors.QueueFull()
+
+      poll_interval = self._Wait(poll_interval)
+
+    self._WriteData(
+        self._write_position, self._RECORD_HEADER.pack(batch_size))
+    self._WriteData(
+        self._write_position + self._RECORD_HEADER.size, batch_data)
+
+    # The write position is updated after the data was written, so that
+    # the readers only read complete records.
+    self._write_position += record_size
+    self._POSITION.pack_into(self._shared_memory.buf, 0, self._write_position)
+
+    del batch[:]
+
+  def _WriteData(self, position, data):
+    """Writes data to the ring buffer.
+
+    Args:
+      position (int): position of the data.
+      data (bytes): data.
+    """
+    buffer = self._shared_memory.buf
+    data_offset = position % self._data_size
+    first_size = min(len(data), self._data_size - data_offset)
+
+    data_offset += self._data_offset
+    buffer[data_offset:data_offset + first_size] = data[:first_size]
+    if first_size < len(data):
+      buffer[self._data_offset:self._data_offset + len(data) - first_size] = (
+          data[first_size:])
+
+  def Close(self, abort=False):
+    """Closes the queue.
+
+    Items that are held for a batch are written before the queue is closed,
+    unless the close is the result of an abort condition. The shared memory
+    segment is removed, but remains available to the readers that are
+    attached to it.
+
+    Args:
+      abort (Optional[bool]): whether the Close is the result of an abort
+          condition. If True, queue contents may be lost.
+
+    Raises:
+      QueueAlreadyClosed: if the queue is not open.
+    """
+    if not self._shared_memory:
+      raise errors.QueueAlreadyClosed()
+
+    try:
+      if self._batch and not abort:
+        self._WriteBatch(self._batch)
+
+    finally:
+      self._batch = []
+
+      self._POSITION.pack_into(self._shared_memory.buf, self._POSITION.size, 1)
+
+      self._shared_memory.close()
+      self._shared_memory.unlink()
+      self._shared_memory = None
+
+  def DetachReader(self, reader_index):
+    """Detaches a reader, so that the writer no longer waits for it.
+
+    This is used when the process that reads the queue is terminated.
+
+    Args:
+      reader_index (int): index of the reader.
+
+    Raises:
+      ValueError: if the reader index is out of bounds.
+    """
+    if self._shared_memory:
+      self._POSITION.pack_into(
+          self._shared_memory.buf, self._GetReadPositionOffset(reader_index),
+          self._DETACHED)
+
+  def IsEmpty(self):
+    """Checks if the queue is empty.
+
+    Returns:
+      bool: True if all items were read by all attached readers.
+    """
+    if self._batch:
+      return False
+
+    if not self._shared_memory:
+      return True
+
+    return self._GetMinimumReadPosition() >= self._write_position
+
+  def Open(self):
+    """Creates the shared memory segment.
+
+    Raises:
+      IOError: if the queue is already open or the shared memory segment
+          cannot be created.
+      OSError: if the queue is already open or the shared memory segment
+          cannot be created.
+    """
+    if self._shared_memory:
+      raise IOError('Queue already open.')
+
+    self._shared_memory = shared_memory.SharedMemory(
+        create=True, size=self._data_offset + self._data_size)
+    self._write_position = 0
+
+    self._HEADER.pack_into(
+        self._shared_memory.buf, 0, 0, 0, self._number_of_readers,
+        self._data_size)
+
+    for reader_index in range(self._number_of_readers):
+      self._POSITION.pack_into(
+          self._shared_memory.buf, self._GetReadPositionOffset(reader_index),
+          0)
+
+  def PopItem(self):
+    """Pops an item off the queue.
+
+    Provided for compatibility with the API, but doesn't actually work.
+
+    Raises:
+      WrongQueueType: As Pop is not supported by this queue.
+    """
+    raise errors.WrongQueueType()
+
+  def PushItem(self, item, block=True):
+    """Pushes an item on to the queue.
+
+    The item is held until the batch is complete or a QueueAbort is pushed.
+
+    Args:
+      item (object): item to push on the queue.
+      block (Optional[bool]): whether to wait for the readers if the ring
+          buffer is full.
+
+    Raises:
+      QueueAlreadyClosed: if the queue is not open.
+      QueueFull: if the ring buffer is full and the batch could not be
+          written within the queue timeout. The items of the batch that were
+          not written, including the pushed item, are held and written with
+          the next batch.
+    """
+    if not self._shared_memory:
+      raise errors.QueueAlreadyClosed()
+
+    self._batch.append(item)
+
+    if (len(self._batch) >= self._maximum_batch_size or
+        isinstance(item, plaso_queue.QueueAbort)):
+      self._WriteBatch(self._batch, block=block)
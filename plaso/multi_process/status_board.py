@@ -0,0 +1,333 @@
+# -*- coding: utf-8 -*-
+"""Shared memory process status board."""
+
+import struct
+import sys
+import threading
+
+from multiprocessing import shared_memory
+
+
+class ProcessStatusBoard(object):
+  """Shared memory process status board.
+
+  The status board is a shared memory segment with a fixed-layout slot per
+  worker process. A worker process writes its status into its slot in place
+  and the main (foreman) process reads it without any inter-process
+  communication.
+
+  Every slot starts with a sequence number that is odd while the worker
+  process is writing the slot. A reader retries if the sequence number was
+  odd or changed while it was reading, which ensures it never returns a
+  partially written status.
+  """
+
+  # Names of the status attributes that are stored as counters, where a value
+  # of -1 represents None.
+  _COUNTER_NAMES = (
+      'number_of_consumed_event_data',
+      'number_of_consumed_event_tags',
+      'number_of_consumed_events',
+      'number_of_consumed_reports',
+      'number_of_consumed_sources',
+      'number_of_produced_event_data',
+      'number_of_produced_event_tags',
+      'number_of_produced_events',
+      'number_of_produced_reports',
+      'number_of_produced_sources')
+
+  # Names and maximum sizes in bytes of the status attributes that are stored
+  # as UTF-8 encoded strings. Longer strings are truncated.
+  _STRING_FIELDS = (
+      ('display_name', 256),
+      ('identifier', 64),
+      ('processing_status', 32),
+      ('session_identifier', 64),
+      ('task_identifier', 64))
+
+  _SEQUENCE_NUMBER = struct.Struct('<Q')
+
+  # The status follows the sequence number and consists of: the last activity
+  # timestamp, the counters, the used memory and the strings.
+  _STATUS = struct.Struct(''.join([
+      '<d', f'{len(_COUNTER_NAMES):d}q', 'q'] + [
+          f'{size:d}s' for _, size in _STRING_FIELDS]))
+
+  # The slot size is aligned to 64 bytes, which is a common cache line size,
+  # so that worker processes do not write to the same cache line.
+  _SLOT_SIZE = (
+      (_SEQUENCE_NUMBER.size + _STATUS.size + 63) // 64) * 64
+
+  # Maximum number of attempts to read a consistent status.
+  _MAXIMUM_READ_ATTEMPTS = 64
+
+  def __init__(self):
+    """Initializes a process status board."""
+    super(ProcessStatusBoard, self).__init__()
+    self._allocated_slots = set()
+    self._is_owner = False
+    self._lock = threading.Lock()
+    self._shared_memory = None
+
+    self.number_of_slots = 0
+
+  @property
+  def name(self):
+    """str: name of the shared memory segment or None if not open."""
+    if not self._shared_memory:
+      return None
+
+    return self._shared_memory.name
+
+  def _DecodeString(self, byte_string):
+    """Decodes a string stored in a slot.
+
+    Args:
+      byte_string (bytes): NUL-padded UTF-8 encoded string.
+
+    Returns:
+      str: decoded string.
+    """
+    byte_string = byte_string.split(b'\x00', 1)[0]
+    # A string can have been truncated in the middle of a multi-byte UTF-8
+    # sequence.
+    return byte_string.decode('utf-8', errors='ignore')
+
+  def _GetSlotOffset(self, slot_index):
+    """Retrieves the offset of a slot.
+
+    Args:
+      slot_index (int): index of the slot.
+
+    Returns:
+      int: offset of the slot in the shared memory segment.
+
+    Raises:
+      IOError: if the status board is not open.
+      OSError: if the status board is not open.
+      ValueError: if the slot index is out of bounds.
+    """
+    if not self._shared_memory:
+      raise IOError('Status board not open.')
+
+    if slot_index < 0 or slot_index >= self.number_of_slots:
+      raise ValueError(f'Slot index: {slot_index:d} out of bounds.')
+
+    return slot_index * self._SLOT_SIZE
+
+  def AllocateSlot(self):
+    """Allocates a slot.
+
+    The slot is cleared, so that a slot previously used by another worker
+    process has no status.
+
+    Returns:
+      int: index of the slot or None if no slot is available.
+
+    Raises:
+      IOError: if the status board is not open.
+      OSError: if the status board is not open.
+    """
+    if not self._shared_memory:
+      raise IOError('Status board not open.')
+
+    with self._lock:
+      for slot_index in range(self.number_of_slots):
+        if slot_index not in self._allocated_slots:
+          break
+      else:
+        return None
+
+      self._allocated_slots.add(slot_index)
+
+    slot_offset = self._GetSlotOffset(slot_index)
+    self._shared_memory.buf[slot_offset:slot_offset + self._SLOT_SIZE] = bytes(
+        self._SLOT_SIZE)
+
+    return slot_index
+
+  def Close(self):
+    """Closes the status board.
+
+    If the status board was created by this process the shared memory segment
+    is removed as well.
+    """
+    if not self._shared_memory:
+      return
+
+    self._shared_memory.close()
+    if self._is_owner:
+      self._shared_memory.unlink()
+
+    self._allocated_slots = set()
+    self._is_owner = False
+    self._shared_memory = None
+    self.number_of_slots = 0
+
+  def Create(self, number_of_slots):
+    """Creates the status board.
+
+    Args:
+      number_of_slots (int): number of slots.
+
+    Raises:
+      IOError: if the status board is already open or the shared memory
+          segment cannot be created.
+      OSError: if the status board is already open or the shared memory
+          segment cannot be created.
+      ValueError: if the number of slots is invalid.
+    """
+    if self._shared_memory:
+      raise IOError('Status board already open.')
+
+    if number_of_slots < 1:
+      raise ValueError(f'Invalid number of slots: {number_of_slots:d}.')
+
+    self._shared_memory = shared_memory.SharedMemory(
+        create=True, size=number_of_slots * self._SLOT_SIZE)
+    self._is_owner = True
+    self.number_of_slots = number_of_slots
+
+  def FreeSlot(self, slot_index):
+    """Frees a slot.
+
+    Args:
+      slot_index (int): index of the slot.
+    """
+    with self._lock:
+      self._allocated_slots.discard(slot_index)
+
+  def HasStatus(self, slot_index):
+    """Determines if a status was written to a slot.
+
+    Args:
+      slot_index (int): index of the slot.
+
+    Returns:
+      bool: True if a status was written to the slot.
+
+    Raises:
+      IOError: if the status board is not open.
+      OSError: if the status board is not open.
+      ValueError: if the slot index is out of bounds.
+    """
+    slot_offset = self._GetSlotOffset(slot_index)
+    sequence_number = self._SEQUENCE_NUMBER.unpack_from(
+        self._shared_memory.buf, slot_offset)[0]
+    return sequence_number != 0
+
+  def Open(self, name):
+    """Opens an existing status board.
+
+    Args:
+      name (str): name of the shared memory segment.
+
+    Raises:
+      IOError: if the status board is already open or the shared memory
+          segment cannot be opened.
+      OSError: if the status board is already open or the shared memory
+          segment cannot be opened.
+    """
+    if self._shared_memory:
+      raise IOError('Status board already open.')
+
+    kwargs = {}
+    if sys.version_info[0:2] >= (3, 13):
+      # The shared memory segment is removed by the process that created it.
+      kwargs['track'] = False
+
+    self._shared_memory = shared_memory.SharedMemory(name=name, **kwargs)
+    self._is_owner = False
+    # Note that the size of the shared memory segment can have been rounded up
+    # to a multitude of the page size.
+    self.number_of_slots = self._shared_memory.size // self._SLOT_SIZE
+
+  def ReadStatus(self, slot_index):
+    """Reads the status from a slot.
+
+    Args:
+      slot_index (int): index of the slot.
+
+    Returns:
+      dict[str, object]: status attributes, indexed by name, or None if no
+          status was written to the slot or no consistent status could be
+          read.
+
+    Raises:
+      IOError: if the status board is not open.
+      OSError: if the status board is not open.
+      ValueError: if the slot index is out of bounds.
+    """
+    slot_offset = self._GetSlotOffset(slot_index)
+    status_offset = slot_offset + self._SEQUENCE_NUMBER.size
+
+    buffer = self._shared_memory.buf
+    for _ in range(self._MAXIMUM_READ_ATTEMPTS):
+      sequence_number = self._SEQUENCE_NUMBER.unpack_from(
+          buffer, slot_offset)[0]
+      if not sequence_number:
+        return None
+
+      if sequence_number % 2:
+        continue
+
+      values = self._STATUS.unpack_from(buffer, status_offset)
+
+      if sequence_number == self._SEQUENCE_NUMBER.unpack_from(
+          buffer, slot_offset)[0]:
+        break
+
+    else:
+      return None
+
+    number_of_counters = len(self._COUNTER_NAMES)
+
+    status = {'last_activity_timestamp': values[0]}
+    for index, counter_name in enumerate(self._COUNTER_NAMES, start=1):
+      value = values[index]
+      status[counter_name] = None if value < 0 else value
+
+    # The used memory is formatted as a string for parity with the status
+    # returned by the XML-RPC server.
+    status['used_memory'] = f'{values[number_of_counters + 1]:d}'
+
+    for index, (field_name, _) in enumerate(
+        self._STRING_FIELDS, start=number_of_counters + 2):
+      status[field_name] = self._DecodeString(values[index])
+
+    return status
+
+  def WriteStatus(self, slot_index, status):
+    """Writes the status to a slot.
+
+    Only a single process should write to a slot.
+
+    Args:
+      slot_index (int): index of the slot.
+      status (dict[str, object]): status attributes, indexed by name.
+
+    Raises:
+      IOError: if the status board is not open.
+      OSError: if the status board is not open.
+      ValueError: if the slot index is out of bounds.
+    """
+    slot_offset = self._GetSlotOffset(slot_index)
+    status_offset = slot_offset + self._SEQUENCE_NUMBER.size
+
+    values = [float(status.get('last_activity_timestamp', None) or 0.0)]
+    for counter_name in self._COUNTER_NAMES:
+      value = status.get(counter_name, None)
+      values.append(-1 if value is None else int(value))
+
+    values.append(int(status.get('used_memory', None) or 0))
+
+    for field_name, size in self._STRING_FIELDS:
+      value = status.get(field_name, None) or ''
+      values.append(value.encode('utf-8')[:size])
+
+    buffer = self._shared_memory.buf
+    sequence_number = self._SEQUENCE_NUMBER.unpack_from(buffer, slot_offset)[0]
+
+    self._SEQUENCE_NUMBER.pack_into(buffer, slot_offset, sequence_number + 1)
+    self._STATUS.pack_into(buffer, status_offset, *values)
+    self._SEQUENCE_NUMBER.pack_into(buffer, slot_offset, sequence_number + 2)
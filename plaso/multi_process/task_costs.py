@@ -0,0 +1,410 @@
+# -*- coding: utf-8 -*-
+"""The task cost model, which is used to estimate task durations and memory."""
+
+import os
+import threading
+import time
+
+from dfvfs.lib import definitions as dfvfs_definitions
+
+from plaso.containers import tasks
+
+
+class TaskCostEstimate(object):
+  """Estimated cost of a task.
+
+  Attributes:
+    cost_class (str): cost class, which is the lower case extension of
+        the file name, for example ".evtx", or an empty string if the file
+        name has no extension.
+    estimated_duration (float): estimated duration of the task in seconds.
+    estimated_memory (int): estimated peak memory usage of the worker process
+        that processes the task in bytes.
+    size (int): size of the data stream to process in bytes.
+    worker_memory (int): memory usage of an idle worker process in bytes,
+        which is included in the estimated peak memory usage.
+  """
+
+  def __init__(
+      self, cost_class='', estimated_duration=0.0, estimated_memory=0, size=0,
+      worker_memory=0):
+    """Initializes a task cost estimate.
+
+    Args:
+      cost_class (Optional[str]): cost class.
+      estimated_duration (Optional[float]): estimated duration of the task in
+          seconds.
+      estimated_memory (Optional[int]): estimated peak memory usage of the
+          worker process that processes the task in bytes.
+      size (Optional[int]): size of the data stream to process in bytes.
+      worker_memory (Optional[int]): memory usage of an idle worker process
+          in bytes, which is included in the estimated peak memory usage.
+    """
+    super(TaskCostEstimate, self).__init__()
+    self.cost_class = cost_class
+    self.estimated_duration = estimated_duration
+    self.estimated_memory = estimated_memory
+    self.size = size
+    self.worker_memory = worker_memory
+
+
+class TaskCostModel(object):
+  """Task cost model.
+
+  The cost model estimates the duration of a task that processes a file entry
+  based on the size of its data stream, the throughput of the parsers that
+  typically process files of its cost class and the type of the data stream,
+  for example a compressed stream needs to be decompressed while parsing.
+
+  The peak memory usage of a task is estimated as the memory usage of an idle
+  worker process plus the size of the data stream multiplied by the memory
+  factor of its cost class, since parsers of for example SQLite and ESE
+  database files tend to use memory proportional to the size of the file.
+
+  The throughput and memory factor per cost class are initialized with
+  estimates of typical parsers and are adjusted with the durations and peak
+  memory usage of the completed tasks. The adjusted estimates can be stored
+  in the session storage, so that a next run can start with the estimates
+  learned by previous runs.
+  """
+
+  # Default memory usage of a worker process in bytes.
+  _DEFAULT_MEMORY_USAGE = 192 * 1024 * 1024
+
+  # Default throughput in bytes per second.
+  _DEFAULT_THROUGHPUT = 16 * 1024 * 1024
+
+  # Initial throughput estimates in bytes per second of the parsers that
+  # typically process files with the corresponding extension.
+  _INITIAL_THROUGHPUT_PER_COST_CLASS = {
+      '.dat': 4 * 1024 * 1024,
+      '.db': 4 * 1024 * 1024,
+      '.edb': 2 * 1024 * 1024,
+      '.evt': 8 * 1024 * 1024,
+      '.evtx': 1 * 1024 * 1024,
+      '.log': 8 * 1024 * 1024,
+      '.pf': 2 * 1024 * 1024,
+      '.sqlite': 4 * 1024 * 1024,
+      '.sys': 64 * 1024 * 1024}
+
+  # Initial estimates of the memory usage per byte of data stream of the
+  # parsers that typically process files with the corresponding extension.
+  _INITIAL_MEMORY_FACTOR_PER_COST_CLASS = {
+      '.db': 1.0,
+      '.edb': 1.0,
+      '.evtx': 0.5,
+      '.sqlite': 1.0,
+      '.tracev3': 2.0}
+
+  # Cost factors of data stream types that need additional processing, such
+  # as decompression, to be read.
+  _DATA_STREAM_TYPE_COST_FACTORS = {
+      dfvfs_definitions.TYPE_INDICATOR_BZIP2: 4.0,
+      dfvfs_definitions.TYPE_INDICATOR_COMPRESSED_STREAM: 4.0,
+      dfvfs_definitions.TYPE_INDICATOR_CPIO: 1.5,
+      dfvfs_definitions.TYPE_INDICATOR_ENCRYPTED_STREAM: 2.0,
+      dfvfs_definitions.TYPE_INDICATOR_GZIP: 3.0,
+      dfvfs_definitions.TYPE_INDICATOR_TAR: 1.5,
+      dfvfs_definitions.TYPE_INDICATOR_XZ: 4.0,
+      dfvfs_definitions.TYPE_INDICATOR_ZIP: 3.0}
+
+  # Weight of the throughput or memory usage of a completed task when adjusting
+  # the estimates.
+  _ADJUSTMENT_WEIGHT = 0.3
+
+  # Minimum size of a data stream in bytes for its task duration and memory
+  # usage to be used to adjust the estimates of its cost class, since tasks
+  # that process smaller data streams are dominated by the per task overhead.
+  _MINIMUM_SIZE_FOR_ADJUSTMENT = 1024 * 1024
+
+  # Scale of the memory factors stored in the task cost estimates attribute
+  # container, which only supports integer values.
+  _MEMORY_FACTOR_SCALE = 1000000
+
+  # Estimated overhead of a task in seconds.
+  _TASK_OVERHEAD = 0.05
+
+  def __init__(self):
+    """Initializes a task cost model."""
+    super(TaskCostModel, self).__init__()
+    self._lock = threading.Lock()
+    self._memory_factor_per_cost_class = dict(
+        self._INITIAL_MEMORY_FACTOR_PER_COST_CLASS)
+    self._memory_usage = self._DEFAULT_MEMORY_USAGE
+    self._task_estimates = {}
+    self._task_peak_memory_usage = {}
+    self._task_processing_start_times = {}
+    self._throughput_per_cost_class = dict(
+        self._INITIAL_THROUGHPUT_PER_COST_CLASS)
+
+  def _AdjustMemoryEstimates(self, task_estimate, peak_memory_usage):
+    """Adjusts the memory estimates with the peak memory usage of a task.
+
+    The memory usage of an idle worker process is adjusted with tasks that
+    process small data streams, the memory factor of the cost class with tasks
+    that process large data streams.
+
+    Args:
+      task_estimate (TaskCostEstimate): cost estimate of the task.
+      peak_memory_usage (int): peak memory usage of the worker process that
+          processed the task in bytes.
+    """
+    if task_estimate.size < self._MINIMUM_SIZE_FOR_ADJUSTMENT:
+      self._memory_usage = int(
+          (1.0 - self._ADJUSTMENT_WEIGHT) * self._memory_usage +
+          self._ADJUSTMENT_WEIGHT * peak_memory_usage)
+
+    else:
+      memory_factor = max(
+          0.0, peak_memory_usage - self._memory_usage) / task_estimate.size
+
+      estimated_memory_factor = self._memory_factor_per_cost_class.get(
+          task_estimate.cost_class, 0.0)
+
+      self._memory_factor_per_cost_class[task_estimate.cost_class] = (
+          (1.0 - self._ADJUSTMENT_WEIGHT) * estimated_memory_factor +
+          self._ADJUSTMENT_WEIGHT * memory_factor)
+
+  def _AdjustThroughputEstimate(self, task_estimate, actual_duration):
+    """Adjusts the throughput estimate with the actual duration of a task.
+
+    Args:
+      task_estimate (TaskCostEstimate): cost estimate of the task.
+      actual_duration (float): actual duration of the task in seconds.
+    """
+    if (task_estimate.size >= self._MINIMUM_SIZE_FOR_ADJUSTMENT and
+        actual_duration > self._TASK_OVERHEAD):
+      throughput = task_estimate.size / (actual_duration - self._TASK_OVERHEAD)
+
+      estimated_throughput = self._throughput_per_cost_class.get(
+          task_estimate.cost_class, self._DEFAULT_THROUGHPUT)
+
+      self._throughput_per_cost_class[task_estimate.cost_class] = (
+          (1.0 - self._ADJUSTMENT_WEIGHT) * estimated_throughput +
+          self._ADJUSTMENT_WEIGHT * throughput)
+
+  def _GetDataStreamTypeCostFactor(self, path_spec):
+    """Retrieves the cost factor of the data stream type.
+
+    Args:
+      path_spec (dfvfs.PathSpec): path specification.
+
+    Returns:
+      float: cost factor of the data stream type.
+    """
+    cost_factor = 1.0
+    while path_spec:
+      cost_factor *= self._DATA_STREAM_TYPE_COST_FACTORS.get(
+          path_spec.type_indicator, 1.0)
+      path_spec = path_spec.parent
+
+    return cost_factor
+
+  def AbandonTask(self, task_identifier):
+    """Stops tracking a task without adjusting the estimates.
+
+    Args:
+      task_identifier (str): identifier of the task.
+    """
+    with self._lock:
+      self._task_estimates.pop(task_identifier, None)
+      self._task_processing_start_times.pop(task_identifier, None)
+      self._task_peak_memory_usage.pop(task_identifier, None)
+
+  def CompleteTask(self, task_identifier):
+    """Completes a task and adjusts the estimates of its cost class.
+
+    The actual duration of the task is the time between the task was first
+    reported to be processing, or was scheduled if it never was, and its
+    completion.
+
+    Args:
+      task_identifier (str): identifier of the task.
+
+    Returns:
+      tuple[TaskCostEstimate, float]: cost estimate and actual duration of
+          the task in seconds or (None, None) if the task was not started.
+    """
+    completion_time = time.time()
+
+    with self._lock:
+      task_estimate, scheduled_time = self._task_estimates.pop(
+          task_identifier, (None, None))
+      processing_start_time = self._task_processing_start_times.pop(
+          task_identifier, None)
+      peak_memory_usage = self._task_peak_memory_usage.pop(
+          task_identifier, None)
+
+      if not task_estimate:
+        return None, None
+
+      actual_duration = completion_time - (
+          processing_start_time or scheduled_time)
+
+      self._AdjustThroughputEstimate(task_estimate, actual_duration)
+
+      if peak_memory_usage:
+        self._AdjustMemoryEstimates(task_estimate, peak_memory_usage)
+
+    return task_estimate, actual_duration
+
+  def EstimateFileEntryCost(self, file_entry):
+    """Estimates the cost of a task to process a file entry.
+
+    Args:
+      file_entry (dfvfs.FileEntry): file entry.
+
+    Returns:
+      TaskCostEstimate: cost estimate of the task.
+    """
+    _, cost_class = os.path.splitext(file_entry.name or '')
+    cost_class = cost_class.lower()
+
+    size = 0
+    if file_entry.IsFile():
+      size = file_entry.size or 0
+
+    cost_factor = self._GetDataStreamTypeCostFactor(file_entry.path_spec)
+
+    with self._lock:
+      memory_factor = self._memory_factor_per_cost_class.get(cost_class, 0.0)
+      memory_usage = self._memory_usage
+      throughput = self._throughput_per_cost_class.get(
+          cost_class, self._DEFAULT_THROUGHPUT)
+
+    estimated_duration = self._TASK_OVERHEAD + (
+        cost_factor * size / throughput)
+    estimated_memory = memory_usage + int(memory_factor * size)
+
+    return TaskCostEstimate(
+        cost_class=cost_class, estimated_duration=estimated_duration,
+        estimated_memory=estimated_memory, size=size,
+        worker_memory=memory_usage)
+
+  def GetEstimates(self):
+    """Retrieves the estimates of the cost model.
+
+    Returns:
+      TaskCostEstimates: task cost estimates attribute container.
+    """
+    with self._lock:
+      memory_factor_per_cost_class = dict(self._memory_factor_per_cost_class)
+      memory_usage = self._memory_usage
+      throughput_per_cost_class = dict(self._throughput_per_cost_class)
+
+    cost_classes = sorted(
+        set(memory_factor_per_cost_class).union(throughput_per_cost_class))
+
+    task_cost_estimates = tasks.TaskCostEstimates()
+    task_cost_estimates.cost_classes = cost_classes
+    task_cost_estimates.memory_factors = [
+        int(round(memory_factor_per_cost_class.get(cost_class, 0.0) *
+                  self._MEMORY_FACTOR_SCALE))
+        for cost_class in cost_classes]
+    task_cost_estimates.throughputs = [
+        int(round(throughput_per_cost_class.get(
+            cost_class, self._DEFAULT_THROUGHPUT)))
+        for cost_class in cost_classes]
+    task_cost_estimates.worker_memory = memory_usage
+
+    return task_cost_estimates
+
+  def GetPredictedMemoryUsage(
+      self, number_of_worker_processes=None, task_estimate=None):
+    """Retrieves the predicted memory usage of the started tasks.
+
+    The memory usage of an idle worker process is only counted once per
+    worker process, since tasks that exceed the number of worker processes
+    are queued and do not run concurrently.
+
+    Args:
+      number_of_worker_processes (Optional[int]): number of worker processes,
+          where None represents that the memory usage of an idle worker
+          process is counted for every task.
+      task_estimate (Optional[TaskCostEstimate]): cost estimate of a task
+          that is not yet started, to include in the prediction.
+
+    Returns:
+      int: predicted peak memory usage of the tasks that have been started
+          but not yet completed in bytes.
+    """
+    with self._lock:
+      task_estimates = [
+          started_task_estimate
+          for started_task_estimate, _ in self._task_estimates.values()]
+
+    if task_estimate:
+      task_estimates.append(task_estimate)
+
+    if not task_estimates:
+      return 0
+
+    memory_usage = sum(
+        started_task_estimate.estimated_memory -
+        started_task_estimate.worker_memory
+        for started_task_estimate in task_estimates)
+
+    number_of_workers = len(task_estimates)
+    if number_of_worker_processes:
+      number_of_workers = min(number_of_workers, number_of_worker_processes)
+
+    worker_memory = max(
+        started_task_estimate.worker_memory
+        for started_task_estimate in task_estimates)
+
+    return memory_usage + number_of_workers * worker_memory
+
+  def SetEstimates(self, task_cost_estimates):
+    """Sets the estimates of the cost model.
+
+    The estimates of cost classes that are not in the task cost estimates
+    keep their current value.
+
+    Args:
+      task_cost_estimates (TaskCostEstimates): task cost estimates attribute
+          container.
+    """
+    cost_classes = task_cost_estimates.cost_classes or []
+    memory_factors = task_cost_estimates.memory_factors or []
+    throughputs = task_cost_estimates.throughputs or []
+
+    with self._lock:
+      for cost_class, memory_factor, throughput in zip(
+          cost_classes, memory_factors, throughputs):
+        if memory_factor >= 0:
+          self._memory_factor_per_cost_class[cost_class] = (
+              memory_factor / self._MEMORY_FACTOR_SCALE)
+        if throughput > 0:
+          self._throughput_per_cost_class[cost_class] = float(throughput)
+
+      if task_cost_estimates.worker_memory:
+        self._memory_usage = task_cost_estimates.worker_memory
+
+  def StartTask(self, task_identifier, task_estimate):
+    """Starts tracking the duration of a scheduled task.
+
+    Args:
+      task_identifier (str): identifier of the task.
+      task_estimate (TaskCostEstimate): cost estimate of the task.
+    """
+    with self._lock:
+      self._task_estimates[task_identifier] = (task_estimate, time.time())
+
+  def UpdateTaskAsProcessing(self, task_identifier, used_memory=None):
+    """Updates the cost model to reflect the task is processing.
+
+    Args:
+      task_identifier (str): identifier of the task.
+      used_memory (Optional[int]): memory used by the worker process that is
+          processing the task in bytes.
+    """
+    with self._lock:
+      if task_identifier not in self._task_estimates:
+        return
+
+      if task_identifier not in self._task_processing_start_times:
+        self._task_processing_start_times[task_identifier] = time.time()
+
+      if used_memory:
+        self._task_peak_memory_usage[task_identifier] = max(
+            used_memory, self._task_peak_memory_usage.get(task_identifier, 0))
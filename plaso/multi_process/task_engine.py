@@ -5,8 +5,12 @@ import os
 import shutil
 import tempfile
 
+import zmq
+
 from plaso.lib import definitions
 from plaso.multi_process import engine
+from plaso.multi_process import logger
+from plaso.multi_process import zeromq_queue
 from plaso.storage import factory as storage_factory
 
 try:
@@ -22,11 +26,17 @@ class TaskMultiProcessEngine(engine.MultiProcessEngine):
   """Task-based multi-process engine base.
 
   This class contains functionality to:
-  * manage task storage used to store task results.
+  * manage task storage used to store task results;
+  * receive task completion notifications from the worker processes.
   """
 
   # pylint: disable=abstract-method
 
+  # Minimum amount of free space, in bytes, of the task storage directory,
+  # below which the SQLite task storage is created in the directory of
+  # the storage file instead.
+  _MINIMUM_TASK_STORAGE_FREE_SPACE = 1024 * 1024 * 1024
+
   def __init__(self):
     """Initializes a task-based multi-process engine."""
     super(TaskMultiProcessEngine, self).__init__()
@@ -35,6 +45,8 @@ class TaskMultiProcessEngine(engine.MultiProcessEngine):
     self._processed_task_storage_path = None
     self._redis_client = None
     self._storage_file_path = None
+    self._task_completion_queue = None
+    self._task_completion_queue_port = None
     self._task_storage_path = None
 
   # TODO: remove, currently only used by psort.
@@ -65,6 +77,18 @@ class TaskMultiProcessEngine(engine.MultiProcessEngine):
 
     return False
 
+  def _GetForemanRedisKeyName(self, session_identifier):
+    """Retrieves the Redis key name that indicates the foreman is active.
+
+    Args:
+      session_identifier (str): the identifier of the session the tasks are
+          part of.
+
+    Returns:
+      str: Redis key name.
+    """
+    return '{0:s}-foreman'.format(session_identifier)
+
   def _GetMergeTaskStorage(self, task_storage_format, task):
     """Retrieves a task store ready to be merged with the session store.
 
@@ -93,7 +117,8 @@ class TaskMultiProcessEngine(engine.MultiProcessEngine):
 
     task_storage_reader = (
         storage_factory.StorageFactory.CreateTaskStorageReader(
-            task_storage_format, task, merge_storage_file_path))
+            task_storage_format, task, merge_storage_file_path,
+            redis_client=self._redis_client))
     task_storage_reader.SetStorageProfiler(self._storage_profiler)
 
     return task_storage_reader
@@ -188,6 +213,43 @@ class TaskMultiProcessEngine(engine.MultiProcessEngine):
 
     return task_identifiers
 
+  def _GetWorkerStatusRedisHashName(self, session_identifier):
+    """Retrieves the Redis hash name of the status of worker node processes.
+
+    Args:
+      session_identifier (str): the identifier of the session the tasks are
+          part of.
+
+    Returns:
+      str: Redis hash name of the worker status.
+    """
+    return '{0:s}-worker_status'.format(session_identifier)
+
+  def _PopTaskCompletionNotifications(self, timeout_seconds=0.0):
+    """Pops the task completion notifications sent by the worker processes.
+
+    Args:
+      timeout_seconds (Optional[float]): number of seconds to wait for a
+          notification if no notification is available.
+
+    Returns:
+      list[tuple[str, int]]: task identifier and size of the task storage file
+          in bytes, or None if not available, of the tasks that were completed.
+    """
+    if not self._task_completion_queue:
+      return []
+
+    try:
+      return self._task_completion_queue.PopItems(
+          timeout_seconds=timeout_seconds)
+
+    except zmq.error.ZMQError as exception:
+      logger.error((
+          'Unable to pop task completion notifications with error: '
+          '{0!s}').format(exception))
+
+    return []
+
   def _PrepareMergeTaskStorage(self, task_storage_format, task):
     """Prepares a task storage for merging.
 
@@ -223,7 +285,10 @@ class TaskMultiProcessEngine(engine.MultiProcessEngine):
           task_storage_format, task)
       processed_storage_file_path = self._GetProcessedStorageFilePath(task)
 
-      task.storage_file_size = os.path.getsize(processed_storage_file_path)
+      # The size of the task storage file is reported by the worker process
+      # when it notified the task was completed.
+      if task.storage_file_size is None:
+        task.storage_file_size = os.path.getsize(processed_storage_file_path)
 
       try:
         os.rename(processed_storage_file_path, merge_storage_file_path)
@@ -289,6 +354,18 @@ class TaskMultiProcessEngine(engine.MultiProcessEngine):
             'Unable to remove processed task storage file: {0:s} with error: '
             '{1!s}').format(processed_storage_file_path, exception))
 
+  def _StartTaskCompletionQueue(self):
+    """Starts the queue the worker processes send task completions to.
+
+    A worker process pushes the identifier of a task onto this queue once
+    the task storage is ready to be merged, which allows the task storage to
+    be merged without scanning the processed task storage.
+    """
+    self._task_completion_queue = zeromq_queue.ZeroMQPullBindQueue(
+        delay_open=False, linger_seconds=0, name='task completion queue',
+        timeout_seconds=0)
+    self._task_completion_queue_port = self._task_completion_queue.port
+
   def _StartTaskStorage(self, task_storage_format):
     """Starts the task storage.
 
@@ -300,7 +377,9 @@ class TaskMultiProcessEngine(engine.MultiProcessEngine):
       OSError: if the temporary path for the SQLite task storage already exists.
     """
     if task_storage_format == definitions.STORAGE_FORMAT_REDIS and redis_store:
-      url = redis_store.RedisAttributeContainerStore.DEFAULT_REDIS_URL
+      url = (
+          getattr(self._processing_configuration, 'redis_url', None) or
+          redis_store.RedisAttributeContainerStore.DEFAULT_REDIS_URL)
       self._redis_client = redis.from_url(url=url, socket_timeout=60)
       self._redis_client.client_setname('task_engine')
 
@@ -309,6 +388,25 @@ class TaskMultiProcessEngine(engine.MultiProcessEngine):
         raise IOError('SQLite task storage path already exists.')
 
       output_directory = os.path.dirname(self._storage_file_path)
+
+      # A task storage directory, such as a RAM-backed file system, is only
+      # used when it has sufficient free space to store the task results.
+      task_storage_directory = getattr(
+          self._processing_configuration, 'task_storage_directory', None)
+      if task_storage_directory:
+        try:
+          free_space = shutil.disk_usage(task_storage_directory).free
+        except OSError:
+          free_space = 0
+
+        if free_space < self._MINIMUM_TASK_STORAGE_FREE_SPACE:
+          logger.warning((
+              'Insufficient free space in task storage directory: {0:s}, '
+              'using: {1:s} instead.').format(
+                  task_storage_directory, output_directory))
+        else:
+          output_directory = task_storage_directory
+
       self._task_storage_path = tempfile.mkdtemp(dir=output_directory)
 
       self._merge_task_storage_path = os.path.join(
@@ -321,6 +419,14 @@ class TaskMultiProcessEngine(engine.MultiProcessEngine):
 
       self._processing_configuration.task_storage_path = self._task_storage_path
 
+  def _StopTaskCompletionQueue(self):
+    """Stops the queue the worker processes send task completions to."""
+    if self._task_completion_queue:
+      self._task_completion_queue.Close(abort=True)
+
+    self._task_completion_queue = None
+    self._task_completion_queue_port = None
+
   def _StopTaskStorage(
       self, task_storage_format, session_identifier, abort=False):
     """Stops the task storage.
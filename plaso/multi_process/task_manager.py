@@ -164,6 +164,7 @@ class TaskManager(object):
     # being processed by a worker.
     self._tasks_processing = {}
 
+    self._task_durations_profiler = None
     self._tasks_profiler = None
 
     # TODO: implement a limit on the number of tasks.
@@ -358,6 +359,15 @@ class TaskManager(object):
 
       logger.debug('Completed task {0:s}.'.format(task.identifier))
 
+  def GetAbandonedTaskIdentifiers(self):
+    """Retrieves the identifiers of all abandoned tasks.
+
+    Returns:
+      list[str]: task identifiers.
+    """
+    with self._lock:
+      return list(self._tasks_abandoned.keys())
+
   def GetFailedTasks(self):
     """Retrieves all failed tasks.
 
@@ -373,6 +383,15 @@ class TaskManager(object):
       return [task for task in self._tasks_abandoned.values()
               if not task.has_retry]
 
+  def GetNumberOfQueuedTasks(self):
+    """Retrieves the number of queued tasks.
+
+    Returns:
+      int: number of tasks that are waiting to be processed.
+    """
+    with self._lock:
+      return len(self._tasks_queued)
+
   def GetProcessedTaskByIdentifier(self, task_identifier):
     """Retrieves a task that has been processed.
 
@@ -514,6 +533,18 @@ class TaskManager(object):
 
       logger.debug('Removed task {0:s}.'.format(task.identifier))
 
+  def SampleTaskDuration(self, task, task_estimate, actual_duration):
+    """Takes a sample of the predicted and actual duration of the task.
+
+    Args:
+      task (Task): a task.
+      task_estimate (TaskCostEstimate): cost estimate of the task.
+      actual_duration (float): actual duration of the task in seconds.
+    """
+    if self._task_durations_profiler:
+      self._task_durations_profiler.Sample(
+          task, task_estimate, actual_duration)
+
   def SampleTaskStatus(self, task, status):
     """Takes a sample of the status of the task for profiling.
 
@@ -539,12 +570,20 @@ class TaskManager(object):
       self._tasks_profiler = profilers.TasksProfiler(identifier, configuration)
       self._tasks_profiler.Start()
 
+      self._task_durations_profiler = profilers.TaskDurationsProfiler(
+          identifier, configuration)
+      self._task_durations_profiler.Start()
+
   def StopProfiling(self):
     """Stops profiling."""
     if self._tasks_profiler:
       self._tasks_profiler.Stop()
       self._tasks_profiler = None
 
+    if self._task_durations_profiler:
+      self._task_durations_profiler.Stop()
+      self._task_durations_profiler = None
+
   def UpdateTaskAsPendingMerge(self, task):
     """Updates the task manager to reflect that the task is ready to be merged.
 
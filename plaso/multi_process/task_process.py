@@ -4,7 +4,9 @@
 import os
 
 from plaso.lib import definitions
+from plaso.lib import errors
 from plaso.multi_process import base_process
+from plaso.multi_process import logger
 from plaso.storage import factory as storage_factory
 
 try:
@@ -22,7 +24,8 @@ class MultiProcessTaskProcess(base_process.MultiProcessBaseProcess):
   # pylint: disable=abstract-method
 
   def __init__(
-      self, processing_configuration, enable_sigsegv_handler=False, **kwargs):
+      self, processing_configuration, enable_sigsegv_handler=False,
+      task_completion_queue=None, **kwargs):
     """Initializes a process.
 
     Args:
@@ -30,6 +33,9 @@ class MultiProcessTaskProcess(base_process.MultiProcessBaseProcess):
           configuration.
       enable_sigsegv_handler (Optional[bool]): True if the SIGSEGV handler
           should be enabled.
+      task_completion_queue (Optional[ZeroMQPushQueue]): queue to notify
+          the main (foreman) process of completed tasks or None if the main
+          process only scans the processed task storage.
       kwargs (dict[str,object]): keyword arguments to pass to
           multiprocessing.Process.
     """
@@ -42,6 +48,7 @@ class MultiProcessTaskProcess(base_process.MultiProcessBaseProcess):
         processing_configuration, **kwargs)
     self._processed_task_storage_path = processed_task_storage_path
     self._storage_factory = storage_factory.StorageFactory
+    self._task_completion_queue = task_completion_queue
     self._task_storage_path = processing_configuration.task_storage_path
 
   def _FinalizeTaskStorageWriter(self, task_storage_format, task):
@@ -56,7 +63,9 @@ class MultiProcessTaskProcess(base_process.MultiProcessBaseProcess):
       OSError: if the SQLite task storage file cannot be renamed.
     """
     if task.storage_format == definitions.STORAGE_FORMAT_REDIS and redis_store:
-      url = redis_store.RedisAttributeContainerStore.DEFAULT_REDIS_URL
+      url = (
+          self._processing_configuration.redis_url or
+          redis_store.RedisAttributeContainerStore.DEFAULT_REDIS_URL)
       redis_client = redis.from_url(url=url, socket_timeout=60)
       redis_client.client_setname('task_process')
 
@@ -121,3 +130,35 @@ class MultiProcessTaskProcess(base_process.MultiProcessBaseProcess):
       return os.path.join(self._task_storage_path, filename)
 
     return None
+
+  def _NotifyTaskCompleted(self, task_storage_format, task):
+    """Notifies the main (foreman) process that a task was completed.
+
+    The notification is pushed after the task storage was finalized. If the
+    notification cannot be pushed, the main process detects the completed
+    task when it scans the processed task storage.
+
+    Args:
+      task_storage_format (str): storage format used to store task results.
+      task (Task): task that was completed.
+    """
+    if not self._task_completion_queue:
+      return
+
+    storage_file_size = None
+    if task_storage_format == definitions.STORAGE_FORMAT_SQLITE:
+      processed_storage_file_path = self._GetProcessedStorageFilePath(
+          task_storage_format, task)
+
+      try:
+        storage_file_size = os.path.getsize(processed_storage_file_path)
+      except OSError:
+        pass
+
+    try:
+      self._task_completion_queue.PushItem(
+          (task.identifier, storage_file_size), block=False)
+    except errors.QueueFull:
+      logger.warning(
+          'Unable to notify completion of task: {0:s}.'.format(
+              task.identifier))
@@ -0,0 +1,287 @@
+# -*- coding: utf-8 -*-
+"""The multi-process extraction worker node engine."""
+
+import json
+import os
+import socket
+import time
+
+from plaso.lib import definitions
+from plaso.lib import errors
+from plaso.multi_process import extraction_engine
+from plaso.multi_process import logger
+
+try:
+  # pylint: disable=ungrouped-imports
+  import redis
+  from plaso.storage.redis import redis_store
+except ModuleNotFoundError:
+  redis = None
+  redis_store = None
+
+
+class ExtractionWorkerNodeEngine(
+    extraction_engine.ExtractionMultiProcessEngine):
+  """Multi-process extraction worker node engine.
+
+  A worker node runs extraction worker processes for the foreman of an
+  extraction engine on another host. The worker processes connect to the task
+  queue of the foreman, open the source by the path specification of a task
+  and store the task results in the Redis task storage, which the foreman
+  merges into the session storage. The source must therefore be accessible by
+  the same path on the foreman and the worker nodes.
+
+  The worker node publishes the status of its worker processes in the Redis
+  task storage, where the foreman monitors them, and stops once the foreman
+  has stopped its worker processes or is no longer active.
+  """
+
+  # Interval in seconds in which the worker node checks if its worker
+  # processes have stopped and if the foreman is still active.
+  _WORKER_NODE_CHECK_INTERVAL = 1.0
+
+  def __init__(self, worker_node_name=None, **kwargs):
+    """Initializes a worker node engine.
+
+    Args:
+      worker_node_name (Optional[str]): name of the worker node, which is used
+          to identify its worker processes to the foreman, where None
+          represents the hostname.
+      kwargs (dict[str, object]): keyword arguments of the extraction engine.
+    """
+    super(ExtractionWorkerNodeEngine, self).__init__(**kwargs)
+    self._session_identifiers_per_pid = {}
+    self._worker_node_name = worker_node_name or socket.gethostname()
+    self._worker_status_fields = set()
+
+  def _CheckStatusWorkerProcess(self, pid):
+    """Checks the status of a worker process.
+
+    A worker process that exited normally, because the foreman stopped it,
+    is not considered killed and is not replaced.
+
+    Args:
+      pid (int): process ID (PID) of a registered worker process.
+
+    Raises:
+      KeyError: if the process is not registered with the engine.
+    """
+    process = self._processes_per_pid.get(pid, None)
+    if process and not process.is_alive() and process.exitcode == 0:
+      return
+
+    super(ExtractionWorkerNodeEngine, self)._CheckStatusWorkerProcess(pid)
+
+  def _GetWorkerStatusField(self, process):
+    """Retrieves the Redis hash field of the status of a worker process.
+
+    Args:
+      process (MultiProcessBaseProcess): worker process.
+
+    Returns:
+      str: Redis hash field of the status of the worker process.
+    """
+    return f'{self._worker_node_name:s}-{process.name:s}'
+
+  def _IsForemanActive(self):
+    """Determines if the foreman is active.
+
+    Returns:
+      bool: True if the foreman of any of the sessions the worker processes
+          processed tasks of is active or, if no task was processed yet, if
+          the foreman of any session is active.
+    """
+    session_identifiers = set(self._session_identifiers_per_pid.values())
+    if session_identifiers:
+      key_names = [
+          self._GetForemanRedisKeyName(session_identifier)
+          for session_identifier in session_identifiers]
+    else:
+      key_names = self._redis_client.keys(self._GetForemanRedisKeyName('*'))
+
+    return bool(key_names) and self._redis_client.exists(*key_names) > 0
+
+  def _RemoveWorkerStatus(self):
+    """Removes the status of the worker processes from the task storage."""
+    for session_identifier, field in self._worker_status_fields:
+      hash_name = self._GetWorkerStatusRedisHashName(session_identifier)
+      try:
+        self._redis_client.hdel(hash_name, field)
+      except redis.exceptions.RedisError as exception:
+        logger.warning(
+            f'Unable to remove status of worker: {field:s} with error: '
+            f'{exception!s}')
+
+    self._worker_status_fields = set()
+
+  def _UpdateProcessingStatus(self, pid, process_status, used_memory):
+    """Updates the processing status.
+
+    The status of the worker process is also published in the task storage,
+    for the foreman of the session of the last task the worker process
+    processed.
+
+    Args:
+      pid (int): process identifier (PID) of the worker process.
+      process_status (dict[str, object]): status values received from
+          the worker process.
+      used_memory (int): size of used memory in bytes.
+
+    Raises:
+      KeyError: if the process is not registered with the engine.
+    """
+    super(ExtractionWorkerNodeEngine, self)._UpdateProcessingStatus(
+        pid, process_status, used_memory)
+
+    if not process_status:
+      return
+
+    session_identifier = process_status.get('session_identifier', None)
+    if session_identifier:
+      self._session_identifiers_per_pid[pid] = session_identifier
+    else:
+      session_identifier = self._session_identifiers_per_pid.get(pid, None)
+
+    if not session_identifier:
+      return
+
+    process = self._processes_per_pid[pid]
+    field = self._GetWorkerStatusField(process)
+    hash_name = self._GetWorkerStatusRedisHashName(session_identifier)
+
+    worker_status = dict(process_status)
+    worker_status['pid'] = pid
+    worker_status['update_timestamp'] = time.time()
+    worker_status['used_memory'] = used_memory
+
+    try:
+      self._redis_client.hset(hash_name, field, json.dumps(worker_status))
+    except redis.exceptions.RedisError as exception:
+      logger.warning(
+          f'Unable to publish status of worker: {field:s} with error: '
+          f'{exception!s}')
+      return
+
+    self._worker_status_fields.add((session_identifier, field))
+
+  def ProcessTasksMulti(
+      self, storage_writer, processing_configuration, system_configurations,
+      foreman_hostname, foreman_port, enable_sigsegv_handler=False):
+    """Processes the tasks of a foreman on another host.
+
+    Args:
+      storage_writer (StorageWriter): storage writer that contains the results
+          of preprocessing the source, such as the user accounts and Windows
+          EventLog providers.
+      processing_configuration (ProcessingConfiguration): processing
+          configuration.
+      system_configurations (list[SystemConfigurationArtifact]): system
+          configurations.
+      foreman_hostname (str): hostname or IP address of the foreman.
+      foreman_port (int): TCP port of the task queue of the foreman.
+      enable_sigsegv_handler (Optional[bool]): True if the SIGSEGV handler
+          should be enabled.
+
+    Returns:
+      ProcessingStatus: processing status.
+
+    Raises:
+      BadConfigOption: if an invalid collection filter was specified, if the
+          task storage format is not Redis or if the Redis task storage cannot
+          be accessed.
+    """
+    if (processing_configuration.task_storage_format !=
+        definitions.STORAGE_FORMAT_REDIS or not redis_store):
+      raise errors.BadConfigOption(
+          'Worker nodes require the Redis task storage.')
+
+    self._enable_sigsegv_handler = enable_sigsegv_handler
+    self._system_configurations = system_configurations
+
+    self._SetUpCollectionFilters(storage_writer, processing_configuration)
+
+    self._processing_configuration = processing_configuration
+
+    self._debug_output = processing_configuration.debug_output
+    self._log_filename = processing_configuration.log_filename
+    self._task_storage_format = processing_configuration.task_storage_format
+    self._windows_event_log_providers = list(
+        storage_writer.GetAttributeContainers('windows_eventlog_provider'))
+
+    self._task_queue_hostname = foreman_hostname
+    self._task_queue_port = foreman_port
+
+    url = (
+        processing_configuration.redis_url or
+        redis_store.RedisAttributeContainerStore.DEFAULT_REDIS_URL)
+
+    try:
+      self._redis_client = redis.from_url(url=url, socket_timeout=60)
+      self._redis_client.client_setname('worker_node')
+    except redis.exceptions.RedisError as exception:
+      raise errors.BadConfigOption(
+          f'Unable to connect to Redis task storage: {url:s} with error: '
+          f'{exception!s}')
+
+    if self._use_status_board:
+      self._StartStatusBoard(self._number_of_worker_processes)
+
+    for worker_number in range(self._number_of_worker_processes):
+      process_name = f'Worker_{self._last_worker_number:02d}'
+      worker_process = self._StartWorkerProcess(process_name)
+      if not worker_process:
+        logger.error(f'Unable to create worker process: {worker_number:d}')
+
+    self._StartStatusUpdateThread()
+
+    try:
+      # The worker processes stop when the foreman pushes an abort onto
+      # the task queue. If the foreman stops without doing so, for example
+      # because it was killed or it completed before the worker processes
+      # connected, the worker processes are stopped once the foreman is no
+      # longer active. A worker node can be started before the foreman.
+      has_foreman_started = False
+
+      while any(
+          process.is_alive() for process in self._processes_per_pid.values()):
+        if self._IsForemanActive():
+          has_foreman_started = True
+
+        elif has_foreman_started:
+          logger.warning('Foreman is no longer active.')
+          break
+
+        time.sleep(self._WORKER_NODE_CHECK_INTERVAL)
+
+    except KeyboardInterrupt:
+      self._abort = True
+
+    finally:
+      self._StopStatusUpdateThread()
+
+    try:
+      self._StopMonitoringProcesses()
+
+      self._AbortTerminate()
+      self._AbortJoin(timeout=self._PROCESS_JOIN_TIMEOUT)
+      self._AbortKill()
+
+    except KeyboardInterrupt:
+      self._AbortKill()
+
+      # The abort can leave the main process unresponsive
+      # due to incorrectly finalized IPC.
+      self._KillProcess(os.getpid())
+
+    self._StopStatusBoard()
+
+    self._RemoveWorkerStatus()
+    self._redis_client = None
+
+    if self._abort:
+      logger.debug('Processing aborted.')
+      self._processing_status.aborted = True
+    else:
+      logger.debug('Processing completed.')
+
+    return self._processing_status
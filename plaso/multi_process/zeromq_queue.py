@@ -2,7 +2,9 @@
 """ZeroMQ implementations of the Plaso queue interface."""
 
 import abc
+import collections
 import errno
+import pickle
 import queue
 import threading
 import time
@@ -19,6 +21,13 @@ from plaso.multi_process import plaso_queue
 class ZeroMQQueue(plaso_queue.Queue):
   """Interface for a ZeroMQ backed queue.
 
+  Items can be sent individually or coalesced into batches, which are sent
+  as a single multi-part message that consists of a batch marker frame and
+  a frame with the pickled list of items. Pickling the items of a batch at
+  once stores the classes and attribute names shared by the items only once
+  and the batch only incurs the per-message costs of ZeroMQ once. A queue
+  can always receive both individual items and batches.
+
   Attributes:
     name (str): name to identify the queue.
     port (int): TCP port that the queue is connected or bound to. If the queue
@@ -27,6 +36,8 @@ class ZeroMQQueue(plaso_queue.Queue):
         may block for, before returning queue.QueueEmpty.
   """
 
+  _BATCH_MARKER = b'plaso_queue_batch'
+
   _SOCKET_ADDRESS = 'tcp://127.0.0.1'
   _SOCKET_TYPE = None
 
@@ -38,8 +49,9 @@ class ZeroMQQueue(plaso_queue.Queue):
   SOCKET_CONNECTION_TYPE = None
 
   def __init__(
-      self, delay_open=True, linger_seconds=10, maximum_items=1000,
-      name='Unnamed', port=None, timeout_seconds=5):
+      self, delay_open=True, hostname=None, linger_seconds=10,
+      maximum_batch_size=1, maximum_items=1000, name='Unnamed', port=None,
+      timeout_seconds=5):
     """Initializes a ZeroMQ backed queue.
 
     Args:
@@ -47,9 +59,16 @@ class ZeroMQQueue(plaso_queue.Queue):
           the first time the queue is pushed to or popped from, rather than at
           queue object initialization. This is useful if a queue needs to be
           passed to a child process from a parent process.
+      hostname (Optional[str]): hostname or IP address of the host to connect
+          to, or of the interface to bind to, where "*" represents all
+          interfaces. The default is None, which indicates the loopback
+          interface.
       linger_seconds (Optional[int]): number of seconds that the underlying
           ZeroMQ socket can remain open after the queue has been closed,
           to allow queued items to be transferred to other ZeroMQ sockets.
+      maximum_batch_size (Optional[int]): maximum number of items to send
+          in a single batch, where 1 represents that items are sent
+          individually.
       maximum_items (Optional[int]): maximum number of items to queue on the
           ZeroMQ socket. ZeroMQ refers to this value as "high water mark" or
           "hwm". Note that this limit only applies at one "end" of the queue.
@@ -72,7 +91,10 @@ class ZeroMQQueue(plaso_queue.Queue):
     super(ZeroMQQueue, self).__init__()
     self._closed_event = None
     self._high_water_mark = maximum_items
+    self._hostname = hostname
     self._linger_seconds = linger_seconds
+    self._maximum_batch_size = max(1, maximum_batch_size)
+    self._received_items = collections.deque()
     self._terminate_event = None
     self._zmq_context = None
     self._zmq_socket = None
@@ -116,9 +138,55 @@ class ZeroMQQueue(plaso_queue.Queue):
 
     return False
 
+  def _SendItems(self, zmq_socket, items, block=True):
+    """Attempts to send items to a ZeroMQ socket.
+
+    A single item is sent individually, multiple items as a batch.
+
+    Args:
+      zmq_socket (zmq.Socket): used to the send the items.
+      items (list[object]): items to send on the queue. Will be pickled prior
+          to sending.
+      block (Optional[bool]): whether the push should be performed in blocking
+          or non-blocking mode.
+
+    Returns:
+      bool: whether the items were sent successfully.
+    """
+    if len(items) == 1:
+      return self._SendItem(zmq_socket, items[0], block=block)
+
+    frames = [
+        self._BATCH_MARKER,
+        pickle.dumps(items, protocol=pickle.HIGHEST_PROTOCOL)]
+
+    try:
+      logger.debug('{0:s} sending batch of {1:d} items'.format(
+          self.name, len(items)))
+      if block:
+        zmq_socket.send_multipart(frames)
+      else:
+        zmq_socket.send_multipart(frames, zmq.DONTWAIT)
+      logger.debug('{0:s} sent batch'.format(self.name))
+      return True
+
+    except zmq.error.Again:
+      logger.debug('{0:s} could not send a batch'.format(self.name))
+
+    except zmq.error.ZMQError as exception:
+      if exception.errno == errno.EINTR:
+        logger.error(
+            'ZMQ syscall interrupted in {0:s}.'.format(
+                self.name))
+
+    return False
+
   def _ReceiveItemOnActivity(self, zmq_socket):
     """Attempts to receive an item from a ZeroMQ socket.
 
+    If a batch is received, the first item of the batch is returned and
+    the remaining items are kept to be returned by subsequent pops.
+
     Args:
       zmq_socket (zmq.Socket): used to the receive the item.
 
@@ -133,8 +201,13 @@ class ZeroMQQueue(plaso_queue.Queue):
         self._ZMQ_SOCKET_RECEIVE_TIMEOUT_MILLISECONDS)
     if events:
       try:
-        received_object = self._zmq_socket.recv_pyobj()
-        return received_object
+        frames = self._zmq_socket.recv_multipart()
+        if len(frames) == 2 and frames[0] == self._BATCH_MARKER:
+          received_items = pickle.loads(frames[1])
+          self._received_items.extend(received_items[1:])
+          return received_items[0]
+
+        return pickle.loads(frames[0])
 
       except zmq.error.Again:
         logger.error(
@@ -167,9 +240,11 @@ class ZeroMQQueue(plaso_queue.Queue):
     """Sets the high water mark for the socket.
 
     This number is the maximum number of items that will be queued in the socket
-    on this end of the queue.
+    on this end of the queue. Since ZeroMQ counts messages and a batch is sent
+    as one message, the high water mark is divided by the maximum batch size.
     """
-    self._zmq_socket.hwm = self._high_water_mark
+    self._zmq_socket.hwm = max(
+        1, self._high_water_mark // self._maximum_batch_size)
 
   def _CreateZMQSocket(self):
     """Creates a ZeroMQ socket."""
@@ -197,8 +272,12 @@ class ZeroMQQueue(plaso_queue.Queue):
     self._SetSocketTimeouts()
     self._SetSocketHighWaterMark()
 
+    socket_address = self._SOCKET_ADDRESS
+    if self._hostname:
+      socket_address = 'tcp://{0:s}'.format(self._hostname)
+
     if self.port:
-      address = '{0:s}:{1:d}'.format(self._SOCKET_ADDRESS, self.port)
+      address = '{0:s}:{1:d}'.format(socket_address, self.port)
       if self.SOCKET_CONNECTION_TYPE == self.SOCKET_CONNECTION_CONNECT:
         self._zmq_socket.connect(address)
         logger.debug('{0:s} connected to {1:s}'.format(self.name, address))
@@ -207,7 +286,7 @@ class ZeroMQQueue(plaso_queue.Queue):
         logger.debug(
             '{0:s} bound to specified port {1:s}'.format(self.name, address))
     else:
-      self.port = self._zmq_socket.bind_to_random_port(self._SOCKET_ADDRESS)
+      self.port = self._zmq_socket.bind_to_random_port(socket_address)
       logger.debug(
           '{0:s} bound to random port {1:d}'.format(self.name, self.port))
 
@@ -341,6 +420,9 @@ class ZeroMQPullQueue(ZeroMQQueue):
       RuntimeError: if closed or terminate event is missing.
       zmq.error.ZMQError: if a ZeroMQ error occurs.
     """
+    if self._received_items:
+      return self._received_items.popleft()
+
     if not self._zmq_socket:
       self._CreateZMQSocket()
 
@@ -365,6 +447,42 @@ class ZeroMQPullQueue(ZeroMQQueue):
 
     return None
 
+  def PopItems(self, timeout_seconds=0.0):
+    """Pops the items that are available off the queue.
+
+    Unlike PopItem this method does not retry until the queue timeout, which
+    allows the caller to poll the queue without blocking.
+
+    If no ZeroMQ socket has been created, one will be created the first
+    time this method is called.
+
+    Args:
+      timeout_seconds (Optional[float]): number of seconds to wait for an item
+          if no item is available.
+
+    Returns:
+      list[object]: items from the queue, which is empty if no item became
+          available within the timeout.
+
+    Raises:
+      zmq.error.ZMQError: if a ZeroMQ error occurs.
+    """
+    if not self._zmq_socket:
+      self._CreateZMQSocket()
+
+    items = list(self._received_items)
+    self._received_items.clear()
+
+    # Note that timeout must be an integer value.
+    timeout = 0 if items else int(timeout_seconds * 1000)
+    while self._zmq_socket.poll(timeout):
+      items.append(self._ReceiveItemOnActivity(self._zmq_socket))
+      items.extend(self._received_items)
+      self._received_items.clear()
+      timeout = 0
+
+    return items
+
   def PushItem(self, item, block=True):
     """Pushes an item on to the queue.
 
@@ -381,6 +499,14 @@ class ZeroMQPullQueue(ZeroMQQueue):
     raise errors.WrongQueueType()
 
 
+class ZeroMQPullBindQueue(ZeroMQPullQueue):
+  """A Plaso queue backed by a ZeroMQ PULL socket that binds to a port.
+
+  This queue may only be used to pop items, not to push.
+  """
+  SOCKET_CONNECTION_TYPE = ZeroMQQueue.SOCKET_CONNECTION_BIND
+
+
 class ZeroMQPullConnectQueue(ZeroMQPullQueue):
   """A Plaso queue backed by a ZeroMQ PULL socket that connects to a port.
 
@@ -397,10 +523,52 @@ class ZeroMQPushQueue(ZeroMQQueue):
 
   Instances of this class or subclasses may only be used to push items, not to
   pop.
+
+  If batching is enabled, pushed items are held until a batch is complete or
+  a QueueAbort is pushed. The batch size adapts to the depth of the queue:
+  while the ZeroMQ socket is at its high water mark, because the consumer is
+  falling behind, the batch size is doubled up to the maximum batch size and
+  while the batches are sent without waiting it is halved, so that items reach
+  an idle consumer without delay.
   """
 
   _SOCKET_TYPE = zmq.PUSH
 
+  def __init__(self, **kwargs):
+    """Initializes a ZeroMQ PUSH socket backed queue.
+
+    Args:
+      kwargs (dict[str,object]): keyword arguments to pass to ZeroMQQueue.
+    """
+    self._batch = []
+    self._batch_size = 1
+
+    super(ZeroMQPushQueue, self).__init__(**kwargs)
+
+  def Close(self, abort=False):
+    """Closes the queue.
+
+    Items that are held for a batch are sent before the queue is closed,
+    unless the close is the result of an abort condition.
+
+    Args:
+      abort (Optional[bool]): whether the Close is the result of an abort
+          condition. If True, queue contents may be lost.
+
+    Raises:
+      QueueAlreadyClosed: if the queue is not started, or has already been
+          closed.
+      RuntimeError: if closed or terminate event is missing.
+    """
+    if self._batch and not abort and self._zmq_socket:
+      if not self._SendItems(self._zmq_socket, self._batch):
+        logger.error('{0:s} unable to send {1:d} batched items.'.format(
+            self.name, len(self._batch)))
+
+    self._batch = []
+
+    super(ZeroMQPushQueue, self).Close(abort=abort)
+
   def PopItem(self):
     """Pops an item of the queue.
 
@@ -439,16 +607,35 @@ class ZeroMQPushQueue(ZeroMQQueue):
     logger.debug(
         'Push on {0:s} queue, port {1:d}'.format(self.name, self.port))
 
+    self._batch.append(item)
+
+    is_abort = isinstance(item, plaso_queue.QueueAbort)
+    if not is_abort and len(self._batch) < self._batch_size:
+      return
+
+    if not is_abort and self._batch_size < self._maximum_batch_size:
+      if self._SendItems(self._zmq_socket, self._batch, block=False):
+        self._batch = []
+        self._batch_size = max(1, self._batch_size // 2)
+      else:
+        # The consumer is falling behind, hold on to the items and send them
+        # in a larger batch.
+        self._batch_size = min(self._batch_size * 2, self._maximum_batch_size)
+      return
+
     last_retry_timestamp = time.time() + self.timeout_seconds
     while not self._terminate_event.is_set():
       try:
-        send_successful = self._SendItem(self._zmq_socket, item, block)
+        send_successful = self._SendItems(
+            self._zmq_socket, self._batch, block=block)
         if send_successful:
+          self._batch = []
           break
 
         if time.time() > last_retry_timestamp:
-          logger.error('{0:s} unable to push item, raising.'.format(
-              self.name))
+          logger.error('{0:s} unable to push {1:d} item(s), raising.'.format(
+              self.name, len(self._batch)))
+          self._batch = []
           raise errors.QueueFull
 
       except KeyboardInterrupt:
@@ -464,6 +651,14 @@ class ZeroMQPushBindQueue(ZeroMQPushQueue):
   SOCKET_CONNECTION_TYPE = ZeroMQQueue.SOCKET_CONNECTION_BIND
 
 
+class ZeroMQPushConnectQueue(ZeroMQPushQueue):
+  """A Plaso queue backed by a ZeroMQ PUSH socket that connects to a port.
+
+  This queue may only be used to push items, not to pop.
+  """
+  SOCKET_CONNECTION_TYPE = ZeroMQQueue.SOCKET_CONNECTION_CONNECT
+
+
 class ZeroMQRequestQueue(ZeroMQQueue):
   """Parent class for Plaso queues backed by ZeroMQ REQ sockets.
 
@@ -493,6 +688,9 @@ class ZeroMQRequestQueue(ZeroMQQueue):
       RuntimeError: if terminate event is missing.
       zmq.error.ZMQError: if an error occurs in ZeroMQ.
     """
+    if self._received_items:
+      return self._received_items.popleft()
+
     if not self._zmq_socket:
       self._CreateZMQSocket()
 
@@ -565,8 +763,8 @@ class ZeroMQBufferedQueue(ZeroMQQueue):
 
   def __init__(
       self, buffer_timeout_seconds=2, buffer_max_size=10000, delay_open=True,
-      linger_seconds=10, maximum_items=1000, name='Unnamed', port=None,
-      timeout_seconds=5):
+      hostname=None, linger_seconds=10, maximum_batch_size=1,
+      maximum_items=1000, name='Unnamed', port=None, timeout_seconds=5):
     """Initializes a buffered, ZeroMQ backed queue.
 
     Args:
@@ -578,9 +776,15 @@ class ZeroMQBufferedQueue(ZeroMQQueue):
           the first time the queue is pushed to or popped from, rather than at
           queue object initialization. This is useful if a queue needs to be
           passed to a child process from a parent process.
+      hostname (Optional[str]): hostname or IP address of the host to connect
+          to, or of the interface to bind to, where None indicates the
+          loopback interface.
       linger_seconds (Optional[int]): number of seconds that the underlying
           ZeroMQ socket can remain open after the queue object has been closed,
           to allow queued items to be transferred to other ZeroMQ sockets.
+      maximum_batch_size (Optional[int]): maximum number of items to send
+          in a single batch, where 1 represents that items are sent
+          individually.
       maximum_items (Optional[int]): maximum number of items to queue on the
           ZeroMQ socket. ZeroMQ refers to this value as "high water mark" or
           "hwm". Note that this limit only applies at one "end" of the queue.
@@ -598,9 +802,9 @@ class ZeroMQBufferedQueue(ZeroMQQueue):
     # We need to set up the internal buffer queue before we call super, so that
     # if the call to super opens the ZMQSocket, the backing thread will work.
     super(ZeroMQBufferedQueue, self).__init__(
-        delay_open=delay_open, linger_seconds=linger_seconds,
-        maximum_items=maximum_items, name=name, port=port,
-        timeout_seconds=timeout_seconds)
+        delay_open=delay_open, hostname=hostname, linger_seconds=linger_seconds,
+        maximum_batch_size=maximum_batch_size, maximum_items=maximum_items,
+        name=name, port=port, timeout_seconds=timeout_seconds)
 
   def _CreateZMQSocket(self):
     """Creates a ZeroMQ socket as well as a regular queue and a thread."""
@@ -680,6 +884,11 @@ class ZeroMQBufferedReplyQueue(ZeroMQBufferedQueue):
 
   Instances of this class or subclasses may only be used to push items, not to
   pop.
+
+  If batching is enabled, the reply to a request contains up to half of
+  the items in the buffer, limited by the maximum batch size, so that other
+  clients are not starved of items. A batch never contains more than one
+  QueueAbort, since every client should receive its own.
   """
 
   _ZMQ_SOCKET_RECEIVE_TIMEOUT_MILLISECONDS = 4000
@@ -687,6 +896,63 @@ class ZeroMQBufferedReplyQueue(ZeroMQBufferedQueue):
 
   _SOCKET_TYPE = zmq.REP
 
+  def _GetBatch(self, item, source_queue):
+    """Retrieves a batch of items to reply with.
+
+    Args:
+      item (object): first item of the batch.
+      source_queue (queue.Queue): queue to use to pull additional items from.
+
+    Returns:
+      list[object]: items of the batch.
+    """
+    items = [item]
+
+    batch_size = min(self._maximum_batch_size, 1 + source_queue.qsize() // 2)
+    while len(items) < batch_size and not isinstance(
+        items[-1], plaso_queue.QueueAbort):
+      try:
+        items.append(source_queue.get_nowait())
+      except queue.Empty:
+        break
+
+    return items
+
+  def _ReceiveRequestOnActivity(self, zmq_socket):
+    """Attempts to receive a request from a ZeroMQ socket.
+
+    A request only signals that the client wants to receive an item, hence
+    the content of the request is discarded and never unpickled, since it
+    could have been sent by any host that can connect to the socket.
+
+    Args:
+      zmq_socket (zmq.Socket): used to the receive the request.
+
+    Raises:
+      QueueEmpty: if no request could be received within the timeout.
+      zmq.error.ZMQError: if an error occurs in ZeroMQ
+    """
+    events = zmq_socket.poll(
+        self._ZMQ_SOCKET_RECEIVE_TIMEOUT_MILLISECONDS)
+    if not events:
+      raise errors.QueueEmpty
+
+    try:
+      zmq_socket.recv_multipart(copy=False)
+
+    except zmq.error.Again:
+      logger.error(
+          '{0:s}. Failed to receive request in time.'.format(
+              self.name))
+      raise
+
+    except zmq.error.ZMQError as exception:
+      if exception.errno == errno.EINTR:
+        logger.error(
+            'ZMQ syscall interrupted in {0:s}. Queue aborting.'.format(
+                self.name))
+      raise
+
   def _ZeroMQResponder(self, source_queue):
     """Listens for requests and replies to clients.
 
@@ -718,7 +984,7 @@ class ZeroMQBufferedReplyQueue(ZeroMQBufferedQueue):
 
       try:
         # We need to receive a request before we can reply with the item.
-        self._ReceiveItemOnActivity(self._zmq_socket)
+        self._ReceiveRequestOnActivity(self._zmq_socket)
 
       except errors.QueueEmpty:
         if self._closed_event.is_set() and self._queue.empty():
@@ -726,7 +992,8 @@ class ZeroMQBufferedReplyQueue(ZeroMQBufferedQueue):
 
         continue
 
-      sent_successfully = self._SendItem(self._zmq_socket, item)
+      items = self._GetBatch(item, source_queue)
+      sent_successfully = self._SendItems(self._zmq_socket, items)
       item = None
       if not sent_successfully:
         logger.error('Queue {0:s} unable to send item.'.format(self.name))
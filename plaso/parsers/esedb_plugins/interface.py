@@ -54,6 +54,7 @@ class ESEDBPlugin(plugins.BasePlugin, dtfabric_helper.DtFabricHelper):
   def __init__(self):
     """Initializes the ESE database plugin."""
     super(ESEDBPlugin, self).__init__()
+    self._column_plans = {}
     self._tables = {}
     self._tables.update(self.REQUIRED_TABLES)
     self._tables.update(self.OPTIONAL_TABLES)
@@ -154,20 +155,79 @@ class ESEDBPlugin(plugins.BasePlugin, dtfabric_helper.DtFabricHelper):
 
     return dfdatetime_filetime.Filetime(timestamp=filetime)
 
-  def _GetRecordValue(self, record, value_entry):
-    """Retrieves a specific value from the record.
+  def _GetColumnPlan(self, table_name, record, value_mappings=None):
+    """Retrieves the column plan of a table.
+
+    The column plan describes how to retrieve the values of the records of
+    a table and is determined once per table, from the first record.
+
+    Args:
+      table_name (str): name of the table.
+      record (pyesedb.record): ESE record.
+      value_mappings (Optional[dict[str, str]]): value mappings, which map
+          the column name to a callback method.
+
+    Returns:
+      list[tuple[int, str, function, function, str]]: value entry, column
+          name, value reader, value callback and name of the value callback
+          method per column, where the value reader is None if the column
+          name is a duplicate.
+    """
+    lookup_key = (table_name, record.number_of_values)
+
+    cached_value_mappings, column_plan = self._column_plans.get(
+        lookup_key, (None, None))
+    if column_plan is not None and cached_value_mappings is value_mappings:
+      return column_plan
+
+    column_names = set()
+    column_plan = []
+
+    for value_entry in range(0, record.number_of_values):
+      column_name = record.get_column_name(value_entry)
+      if column_name in column_names:
+        column_plan.append((value_entry, column_name, None, None, None))
+        continue
+
+      column_names.add(column_name)
+
+      value_callback = None
+      value_callback_method = None
+      if value_mappings and column_name in value_mappings:
+        value_callback_method = value_mappings.get(column_name)
+        if value_callback_method:
+          value_callback = getattr(self, value_callback_method, None)
+          if value_callback is None:
+            logger.warning((
+                '[{0:s}] missing value callback method: {1:s} for column: '
+                '{2:s} in table: {3:s}').format(
+                    self.NAME, value_callback_method, column_name, table_name))
+
+      column_type = record.get_column_type(value_entry)
+      value_reader = self._GetRecordValueReader(column_type)
+
+      column_plan.append((
+          value_entry, column_name, value_reader, value_callback,
+          value_callback_method))
+
+    self._column_plans[lookup_key] = (value_mappings, column_plan)
+
+    return column_plan
+
+  def _GetLongValue(self, record, value_entry):
+    """Retrieves the long value of a specific value from the record.
 
     Args:
       record (pyesedb.record): ESE record.
       value_entry (int): value entry.
 
     Returns:
-      object: value or None if not available.
+      pyesedb.long_value: long value or None if the value is not stored as
+          a long value.
 
     Raises:
-      ValueError: if the value is not supported.
+      ValueError: if the value is a multi value.
     """
-    column_type = record.get_column_type(value_entry)
     long_value = None
 
     if record.is_long_value(value_entry):
@@ -177,42 +237,54 @@ class ESEDBPlugin(plugins.BasePlugin, dtfabric_helper.DtFabricHelper):
       # TODO: implement
       raise ValueError('Multi value support not implemented yet.')
 
+    return long_value
+
+  def _GetRecordValue(self, record, value_entry):
+    """Retrieves a specific value from the record.
+
+    Args:
+      record (pyesedb.record): ESE record.
+      value_entry (int): value entry.
+
+    Returns:
+      object: value or None if not available.
+
+    Raises:
+      ValueError: if the value is not supported.
+    """
+    column_type = record.get_column_type(value_entry)
+    value_reader = self._GetRecordValueReader(column_type)
+    return value_reader(record, value_entry)
+
+  def _GetRecordValueReader(self, column_type):
+    """Retrieves the value reader of a column type.
+
+    Args:
+      column_type (int): column type.
+
+    Returns:
+      function: value reader, which takes the ESE record and the value entry
+          as arguments.
+    """
     if column_type == pyesedb.column_types.NULL:
-      return None
+      return self._ReadNullRecordValue
 
     if column_type == pyesedb.column_types.BOOLEAN:
-      if long_value:
-        # TODO: implement
-        raise ValueError('Long boolean value not supported.')
-      return record.get_value_data_as_boolean(value_entry)
+      return self._ReadBooleanRecordValue
 
     if column_type in self.INTEGER_COLUMN_TYPES:
-      if long_value:
-        raise ValueError('Long integer value not supported.')
-      return record.get_value_data_as_integer(value_entry)
+      return self._ReadIntegerRecordValue
 
     if column_type == pyesedb.column_types.GUID:
-      if long_value:
-        # TODO: implement
-        raise ValueError('Long GUID value not supported.')
-      value_data = record.get_value_data(value_entry)
-      if value_data:
-        value_data = uuid.UUID(bytes_le=value_data)
-      return value_data
+      return self._ReadGUIDRecordValue
 
     if column_type in self.FLOATING_POINT_COLUMN_TYPES:
-      if long_value:
-        raise ValueError('Long floating point value not supported.')
-      return record.get_value_data_as_floating_point(value_entry)
+      return self._ReadFloatingPointRecordValue
 
     if column_type in self.STRING_COLUMN_TYPES:
-      if long_value:
-        return long_value.get_data_as_string()
-      return record.get_value_data_as_string(value_entry)
+      return self._ReadStringRecordValue
 
-    if long_value:
-      return long_value.get_data()
-    return record.get_value_data(value_entry)
+    return self._ReadBinaryDataRecordValue
 
   def _GetRecordValues(
       self, parser_mediator, table_name, record_index, record,
@@ -231,30 +303,22 @@ class ESEDBPlugin(plugins.BasePlugin, dtfabric_helper.DtFabricHelper):
     Returns:
       dict[str,object]: values per column name.
     """
+    column_plan = self._GetColumnPlan(
+        table_name, record, value_mappings=value_mappings)
+
     record_values = {}
 
-    for value_entry in range(0, record.number_of_values):
+    for (value_entry, column_name, value_reader, value_callback,
+         value_callback_method) in column_plan:
       if parser_mediator.abort:
         break
 
-      column_name = record.get_column_name(value_entry)
-      if column_name in record_values:
+      if not value_reader:
         parser_mediator.ProduceExtractionWarning(
             '[{0:s}] duplicate column: {1:s} in table: {2:s}'.format(
                 self.NAME, column_name, table_name))
         continue
 
-      value_callback = None
-      if value_mappings and column_name in value_mappings:
-        value_callback_method = value_mappings.get(column_name)
-        if value_callback_method:
-          value_callback = getattr(self, value_callback_method, None)
-          if value_callback is None:
-            logger.warning((
-                '[{0:s}] missing value callback method: {1:s} for column: '
-                '{2:s} in table: {3:s}').format(
-                    self.NAME, value_callback_method, column_name, table_name))
-
       if value_callback:
         try:
           value_data = record.get_value_data(value_entry)
@@ -271,7 +335,7 @@ class ESEDBPlugin(plugins.BasePlugin, dtfabric_helper.DtFabricHelper):
 
       else:
         try:
-          value = self._GetRecordValue(record, value_entry)
+          value = value_reader(record, value_entry)
         except ValueError as exception:
           value = None
           parser_mediator.ProduceExtractionWarning((
@@ -329,6 +393,131 @@ class ESEDBPlugin(plugins.BasePlugin, dtfabric_helper.DtFabricHelper):
           parser_mediator, cache=cache, database=database, table=esedb_table,
           **kwargs)
 
+  def _ReadBinaryDataRecordValue(self, record, value_entry):
+    """Reads a binary data value from the record.
+
+    Args:
+      record (pyesedb.record): ESE record.
+      value_entry (int): value entry.
+
+    Returns:
+      bytes: value or None if not available.
+
+    Raises:
+      ValueError: if the value is not supported.
+    """
+    long_value = self._GetLongValue(record, value_entry)
+    if long_value:
+      return long_value.get_data()
+    return record.get_value_data(value_entry)
+
+  def _ReadBooleanRecordValue(self, record, value_entry):
+    """Reads a boolean value from the record.
+
+    Args:
+      record (pyesedb.record): ESE record.
+      value_entry (int): value entry.
+
+    Returns:
+      bool: value or None if not available.
+
+    Raises:
+      ValueError: if the value is not supported.
+    """
+    if self._GetLongValue(record, value_entry):
+      # TODO: implement
+      raise ValueError('Long boolean value not supported.')
+    return record.get_value_data_as_boolean(value_entry)
+
+  def _ReadFloatingPointRecordValue(self, record, value_entry):
+    """Reads a floating-point value from the record.
+
+    Args:
+      record (pyesedb.record): ESE record.
+      value_entry (int): value entry.
+
+    Returns:
+      float: value or None if not available.
+
+    Raises:
+      ValueError: if the value is not supported.
+    """
+    if self._GetLongValue(record, value_entry):
+      raise ValueError('Long floating point value not supported.')
+    return record.get_value_data_as_floating_point(value_entry)
+
+  def _ReadGUIDRecordValue(self, record, value_entry):
+    """Reads a GUID value from the record.
+
+    Args:
+      record (pyesedb.record): ESE record.
+      value_entry (int): value entry.
+
+    Returns:
+      uuid.UUID: value or None if not available.
+
+    Raises:
+      ValueError: if the value is not supported.
+    """
+    if self._GetLongValue(record, value_entry):
+      # TODO: implement
+      raise ValueError('Long GUID value not supported.')
+    value_data = record.get_value_data(value_entry)
+    if value_data:
+      value_data = uuid.UUID(bytes_le=value_data)
+    return value_data
+
+  def _ReadIntegerRecordValue(self, record, value_entry):
+    """Reads an integer value from the record.
+
+    Args:
+      record (pyesedb.record): ESE record.
+      value_entry (int): value entry.
+
+    Returns:
+      int: value or None if not available.
+
+    Raises:
+      ValueError: if the value is not supported.
+    """
+    if self._GetLongValue(record, value_entry):
+      raise ValueError('Long integer value not supported.')
+    return record.get_value_data_as_integer(value_entry)
+
+  def _ReadNullRecordValue(self, record, value_entry):
+    """Reads a NULL value from the record.
+
+    Args:
+      record (pyesedb.record): ESE record.
+      value_entry (int): value entry.
+
+    Returns:
+      None: the value of a NULL column is always None.
+
+    Raises:
+      ValueError: if the value is not supported.
+    """
+    self._GetLongValue(record, value_entry)
+    return None
+
+  def _ReadStringRecordValue(self, record, value_entry):
+    """Reads a string value from the record.
+
+    Args:
+      record (pyesedb.record): ESE record.
+      value_entry (int): value entry.
+
+    Returns:
+      str: value or None if not available.
+
+    Raises:
+      ValueError: if the value is not supported.
+    """
+    long_value = self._GetLongValue(record, value_entry)
+    if long_value:
+      return long_value.get_data_as_string()
+    return record.get_value_data_as_string(value_entry)
+
   def CheckRequiredTables(self, database):
     """Check if the database has the minimal structure required by the plugin.
 
@@ -365,5 +554,9 @@ class ESEDBPlugin(plugins.BasePlugin, dtfabric_helper.DtFabricHelper):
     # This will raise if unhandled keyword arguments are passed.
     super(ESEDBPlugin, self).Process(parser_mediator)
 
+    # The column plans are determined per database since tables with the same
+    # name can have different columns in different databases.
+    self._column_plans = {}
+
     self._ParseESEDatabase(
         parser_mediator, cache=cache, database=database, **kwargs)
@@ -2,9 +2,11 @@
 """The parsers and plugins interface classes."""
 
 import abc
+import importlib
 import os
 
 from plaso.lib import errors
+from plaso.parsers import manifest
 
 
 class BaseFileEntryFilter(object):
@@ -92,6 +94,17 @@ class BaseParser(object):
     self._plugins_per_name = None
     self.EnablePlugins(self.ALL_PLUGINS)
 
+  @classmethod
+  def _ImportPluginModules(cls):
+    """Imports the modules of the plugins defined in the parsers manifest.
+
+    Importing the module of a plugin registers the plugin.
+    """
+    parser_descriptor = manifest.PARSERS.get(cls.NAME, None)
+    if parser_descriptor and parser_descriptor['plugins']:
+      for plugin_descriptor in parser_descriptor['plugins'].values():
+        importlib.import_module(plugin_descriptor['module'])
+
   @classmethod
   def DeregisterPlugin(cls, plugin_class):
     """Deregisters a plugin class.
@@ -121,9 +134,11 @@ class BaseParser(object):
           it exists, is always enabled and cannot be disabled.
     """
     self._plugins_per_name = {}
-    if not self._plugin_classes:
+    if self._plugin_classes is None:
       return
 
+    self._ImportPluginModules()
+
     for plugin_name, plugin_class in self._plugin_classes.items():
       if plugin_name == self._default_plugin_name:
         self._default_plugin = plugin_class()
@@ -154,6 +169,7 @@ class BaseParser(object):
     Returns:
       list[str]: names of the plugins.
     """
+    cls._ImportPluginModules()
     return list(cls._plugin_classes.keys())
 
   @classmethod
@@ -166,6 +182,7 @@ class BaseParser(object):
     Returns:
       BasePlugin: a plugin object or None if not available.
     """
+    cls._ImportPluginModules()
     plugin_class = cls._plugin_classes.get(plugin_name, None)
     if plugin_class:
       return plugin_class()
@@ -179,6 +196,7 @@ class BaseParser(object):
     Yields:
       tuple[str, type]: name and class of the plugin.
     """
+    cls._ImportPluginModules()
     for plugin_name, plugin_class in cls._plugin_classes.items():
       yield plugin_name, plugin_class
 
@@ -1,22 +1,106 @@
 # -*- coding: utf-8 -*-
 """The parsers and plugins manager."""
 
+import importlib
+
 import pysigscan
 
 from plaso.filters import parser_filter
 from plaso.lib import specification
+from plaso.parsers import manifest
 
 
 class ParsersManager(object):
-  """The parsers and plugins manager."""
+  """The parsers and plugins manager.
+
+  The parsers manager uses the parsers manifest to answer queries about
+  the parsers and plugins and to build signature scanners, without importing
+  the modules of the parsers. The module of a parser is only imported, which
+  registers the parser, when the parser itself is needed.
+  """
 
   ALL_PLUGINS = set(['*'])
 
   _parser_classes = {}
 
   @classmethod
-  def _GetParsers(cls, parser_filter_expression=None):
-    """Retrieves the registered parsers and plugins.
+  def _CreateParserDescriptor(cls, parser_class):
+    """Creates a parser descriptor, as stored in the parsers manifest.
+
+    Args:
+      parser_class (type): parser class (subclass of BaseParser).
+
+    Returns:
+      dict[str, object]: parser descriptor.
+    """
+    signatures = []
+    format_specification = parser_class.GetFormatSpecification()
+    if format_specification:
+      signatures = [
+          (signature.pattern, signature.offset)
+          for signature in format_specification.signatures]
+
+    plugins = None
+    if parser_class.SupportsPlugins():
+      plugins = {}
+      for plugin_name, plugin_class in sorted(parser_class.GetPlugins()):
+        plugins[plugin_name] = {
+            'data_format': getattr(plugin_class, 'DATA_FORMAT', ''),
+            'module': plugin_class.__module__}
+
+    return {
+        'data_format': getattr(parser_class, 'DATA_FORMAT', ''),
+        'module': parser_class.__module__,
+        'plugins': plugins,
+        'signatures': signatures}
+
+  @classmethod
+  def _GetDataFormatDescription(cls, data_format):
+    """Retrieves the description of a data format.
+
+    Args:
+      data_format (str): data format supported by a parser or plugin.
+
+    Returns:
+      str: description of the data format.
+    """
+    if not data_format:
+      return ''
+
+    if data_format.endswith(' file'):
+      return 'Parser for {0:s}s.'.format(data_format)
+
+    return 'Parser for {0:s}.'.format(data_format)
+
+  @classmethod
+  def _GetParserClass(cls, parser_name):
+    """Retrieves a parser class.
+
+    If the parser is not registered yet, the module of the parser, as defined
+    by the parsers manifest, is imported to register it.
+
+    Args:
+      parser_name (str): name of the parser.
+
+    Returns:
+      type: parser class (subclass of BaseParser) or None if not available.
+    """
+    parser_class = cls._parser_classes.get(parser_name, None)
+    if not parser_class:
+      parser_descriptor = manifest.PARSERS.get(parser_name, None)
+      if parser_descriptor:
+        importlib.import_module(parser_descriptor['module'])
+        parser_class = cls._parser_classes.get(parser_name, None)
+
+    return parser_class
+
+  @classmethod
+  def _GetParserDescriptors(cls, parser_filter_expression=None):
+    """Retrieves the descriptors of the parsers.
+
+    The descriptors of parsers in the parsers manifest are read from the
+    manifest, the descriptors of other registered parsers are created from
+    their parser class.
 
     Args:
       parser_filter_expression (Optional[str]): parser filter expression,
@@ -33,13 +117,16 @@ class ParsersManager(object):
       tuple: containing:
 
       * str: name of the parser:
-      * type: parser class (subclass of BaseParser).
+      * dict[str, object]: parser descriptor.
     """
     parser_filter_helper = parser_filter.ParserFilterExpressionHelper()
     excludes, includes = parser_filter_helper.SplitExpression(
         parser_filter_expression)
 
-    for parser_name, parser_class in cls._parser_classes.items():
+    parser_names = set(manifest.PARSERS.keys())
+    parser_names.update(cls._parser_classes.keys())
+
+    for parser_name in sorted(parser_names):
       # If there are no includes all parsers are included by default.
       if not includes and parser_name in excludes:
         continue
@@ -47,7 +134,56 @@ class ParsersManager(object):
       if includes and parser_name not in includes:
         continue
 
-      yield parser_name, parser_class
+      parser_descriptor = manifest.PARSERS.get(parser_name, None)
+      if not parser_descriptor:
+        parser_class = cls._parser_classes[parser_name]
+        parser_descriptor = cls._CreateParserDescriptor(parser_class)
+
+      yield parser_name, parser_descriptor
+
+  @classmethod
+  def _GetParsers(cls, parser_filter_expression=None):
+    """Retrieves the parsers.
+
+    The modules of parsers that are not registered yet are imported to
+    register them.
+
+    Args:
+      parser_filter_expression (Optional[str]): parser filter expression,
+          where None represents all parsers and plugins.
+
+          A parser filter expression is a comma separated value string that
+          denotes which parsers and plugins should be used. See
+          filters/parser_filter.py for details of the expression syntax.
+
+          This function does not support presets, and requires a parser
+          filter expression where presets have been expanded.
+
+    Yields:
+      tuple: containing:
+
+      * str: name of the parser:
+      * type: parser class (subclass of BaseParser).
+    """
+    for parser_name, _ in cls._GetParserDescriptors(
+        parser_filter_expression=parser_filter_expression):
+      parser_class = cls._GetParserClass(parser_name)
+      if parser_class:
+        yield parser_name, parser_class
+
+  @classmethod
+  def CreateParsersManifest(cls):
+    """Creates the parsers manifest from the registered parsers.
+
+    The modules of all parsers and plugins need to be imported before creating
+    the manifest.
+
+    Returns:
+      dict[str, dict[str, object]]: parser descriptors per parser name.
+    """
+    return {
+        parser_name: cls._CreateParserDescriptor(parser_class)
+        for parser_name, parser_class in sorted(cls._parser_classes.items())}
 
   @classmethod
   def CreateSignatureScanner(cls, specification_store):
@@ -106,12 +242,13 @@ class ParsersManager(object):
     known_parser_elements = set()
     unknown_parser_elements = set()
 
+    parser_descriptors = dict(cls._GetParserDescriptors())
+
     if not parser_filter_expression:
-      for parser_name, parser_class in cls._parser_classes.items():
+      for parser_name, parser_descriptor in parser_descriptors.items():
         known_parser_elements.add(parser_name)
-        if parser_class.SupportsPlugins():
-          for plugin_name in parser_class.GetPluginNames():
-            known_parser_elements.add('/'.join([parser_name, plugin_name]))
+        for plugin_name in parser_descriptor['plugins'] or []:
+          known_parser_elements.add('/'.join([parser_name, plugin_name]))
 
     else:
       for element in parser_filter_expression.split(','):
@@ -120,13 +257,13 @@ class ParsersManager(object):
           parser_expression = element[1:]
 
         parser_name, _, plugin_name = parser_expression.partition('/')
-        parser_class = cls._parser_classes.get(parser_name, None)
-        if not parser_class:
+        parser_descriptor = parser_descriptors.get(parser_name, None)
+        if not parser_descriptor:
           unknown_parser_elements.add(element)
           continue
 
-        if parser_class.SupportsPlugins():
-          plugins = dict(parser_class.GetPlugins())
+        plugins = parser_descriptor['plugins']
+        if plugins is not None:
           if not plugin_name:
             for plugin in plugins:
               known_parser_elements.add('/'.join([parser_name, plugin]))
@@ -189,11 +326,15 @@ class ParsersManager(object):
     specification_store = specification.FormatSpecificationStore()
     remainder_list = []
 
-    for parser_name, parser_class in cls._GetParsers(
+    for parser_name, parser_descriptor in cls._GetParserDescriptors(
         parser_filter_expression=parser_filter_expression):
-      format_specification = parser_class.GetFormatSpecification()
+      signatures = parser_descriptor['signatures']
+
+      if signatures:
+        format_specification = specification.FormatSpecification(parser_name)
+        for pattern, offset in signatures:
+          format_specification.AddNewSignature(pattern, offset=offset)
 
-      if format_specification and format_specification.signatures:
         specification_store.AddSpecification(format_specification)
         # The plist parser is a special case, where it both defines a signature
         # and also needs to be applied 'brute-force' to non-matching files,
@@ -214,8 +355,8 @@ class ParsersManager(object):
     """
     parser_names = []
 
-    for parser_name, parser_class in cls._GetParsers():
-      if parser_class.SupportsPlugins():
+    for parser_name, parser_descriptor in cls._GetParserDescriptors():
+      if parser_descriptor['plugins'] is not None:
         parser_names.append(parser_name)
 
     return sorted(parser_names)
@@ -239,20 +380,13 @@ class ParsersManager(object):
       list[tuple[str, str]]: pairs of parser plugin names and descriptions.
     """
     parser_plugins_information = []
-    for _, parser_class in cls._GetParsers(
+    for _, parser_descriptor in cls._GetParserDescriptors(
         parser_filter_expression=parser_filter_expression):
-      if parser_class.SupportsPlugins():
-        for plugin_name, plugin_class in parser_class.GetPlugins():
-          description = ''
-
-          data_format = getattr(plugin_class, 'DATA_FORMAT', '')
-          if data_format:
-            if data_format.endswith(' file'):
-              description = 'Parser for {0:s}s.'.format(data_format)
-            else:
-              description = 'Parser for {0:s}.'.format(data_format)
-
-          parser_plugins_information.append((plugin_name, description))
+      plugins = parser_descriptor['plugins'] or {}
+      for plugin_name, plugin_descriptor in plugins.items():
+        description = cls._GetDataFormatDescription(
+            plugin_descriptor['data_format'])
+        parser_plugins_information.append((plugin_name, description))
 
     return parser_plugins_information
 
@@ -275,18 +409,12 @@ class ParsersManager(object):
       dict[str, BaseParser]: parsers per name.
     """
     parser_filter_helper = parser_filter.ParserFilterExpressionHelper()
-    excludes, includes = parser_filter_helper.SplitExpression(
+    _, includes = parser_filter_helper.SplitExpression(
         parser_filter_expression)
 
     parser_objects = {}
-    for parser_name, parser_class in cls._parser_classes.items():
-      # If there are no includes all parsers are included by default.
-      if not includes and parser_name in excludes:
-        continue
-
-      if includes and parser_name not in includes:
-        continue
-
+    for parser_name, parser_class in cls._GetParsers(
+        parser_filter_expression=parser_filter_expression):
       parser_object = parser_class()
       if parser_class.SupportsPlugins():
         plugin_includes = includes.get(parser_name, cls.ALL_PLUGINS)
@@ -304,17 +432,10 @@ class ParsersManager(object):
       list[tuple[str, str]]: parser names and descriptions.
     """
     parsers_information = []
-    for _, parser_class in cls._GetParsers():
-      description = ''
-
-      data_format = getattr(parser_class, 'DATA_FORMAT', '')
-      if data_format:
-        if data_format.endswith(' file'):
-          description = 'Parser for {0:s}s.'.format(data_format)
-        else:
-          description = 'Parser for {0:s}.'.format(data_format)
-
-      parsers_information.append((parser_class.NAME, description))
+    for parser_name, parser_descriptor in cls._GetParserDescriptors():
+      description = cls._GetDataFormatDescription(
+          parser_descriptor['data_format'])
+      parsers_information.append((parser_name, description))
 
     return parsers_information
 
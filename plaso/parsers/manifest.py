@@ -0,0 +1,787 @@
+# -*- coding: utf-8 -*-
+"""The parsers and plugins manifest.
+
+The manifest contains the names, data formats, modules and signatures of
+the parsers and plugins, which allows the parsers manager to answer queries
+and build signature scanners without importing the modules of the parsers.
+
+This file is generated by utils/generate_parsers_manifest.py, do not edit.
+"""
+
+# pylint: disable=line-too-long
+
+PARSERS = {
+    'android_app_usage': {
+        'data_format': 'Android usage history (usage-history.xml) file',
+        'module': 'plaso.parsers.android_app_usage',
+        'plugins': None,
+        'signatures': []},
+    'asl_log': {
+        'data_format': 'Apple System Log (ASL) file',
+        'module': 'plaso.parsers.asl',
+        'plugins': None,
+        'signatures': [(b'ASL DB\x00\x00\x00\x00\x00\x00', 0)]},
+    'bencode': {
+        'data_format': 'Bencoded file',
+        'module': 'plaso.parsers.bencode_parser',
+        'plugins': {
+            'bencode_transmission': {
+                'data_format': 'Transmission BitTorrent activity file',
+                'module': 'plaso.parsers.bencode_plugins.transmission'},
+            'bencode_utorrent': {
+                'data_format': 'uTorrent active torrent file',
+                'module': 'plaso.parsers.bencode_plugins.utorrent'}},
+        'signatures': []},
+    'binary_cookies': {
+        'data_format': 'Safari Binary Cookie file',
+        'module': 'plaso.parsers.safari_cookies',
+        'plugins': None,
+        'signatures': [(b'cook\x00', 0)]},
+    'bodyfile': {
+        'data_format': 'SleuthKit version 3 bodyfile',
+        'module': 'plaso.parsers.bodyfile',
+        'plugins': None,
+        'signatures': []},
+    'bsm_log': {
+        'data_format': 'Basic Security Module (BSM) event auditing file',
+        'module': 'plaso.parsers.bsm',
+        'plugins': None,
+        'signatures': []},
+    'chrome_cache': {
+        'data_format': 'Google Chrome or Chromium Cache file',
+        'module': 'plaso.parsers.chrome_cache',
+        'plugins': None,
+        'signatures': [(b'\xc3\xca\x03\xc1', 0)]},
+    'chrome_preferences': {
+        'data_format': 'Google Chrome Preferences file',
+        'module': 'plaso.parsers.chrome_preferences',
+        'plugins': None,
+        'signatures': []},
+    'cups_ipp': {
+        'data_format': 'CUPS IPP file',
+        'module': 'plaso.parsers.cups_ipp',
+        'plugins': None,
+        'signatures': []},
+    'custom_destinations': {
+        'data_format': 'Custom destinations jump list (.customDestinations-ms) file',
+        'module': 'plaso.parsers.custom_destinations',
+        'plugins': None,
+        'signatures': [(b'\xab\xfb\xbf\xba', -4)]},
+    'czip': {
+        'data_format': 'Compound ZIP file',
+        'module': 'plaso.parsers.czip',
+        'plugins': {
+            'oxml': {
+                'data_format': 'OpenXML (OXML) file',
+                'module': 'plaso.parsers.czip_plugins.oxml'}},
+        'signatures': []},
+    'esedb': {
+        'data_format': 'Extensible Storage Engine (ESE) Database File (EDB) format',
+        'module': 'plaso.parsers.esedb',
+        'plugins': {
+            'file_history': {
+                'data_format': 'Windows 8 File History ESE database file',
+                'module': 'plaso.parsers.esedb_plugins.file_history'},
+            'msie_webcache': {
+                'data_format': 'Internet Explorer WebCache ESE database (WebCacheV01.dat, WebCacheV24.dat) file',
+                'module': 'plaso.parsers.esedb_plugins.msie_webcache'},
+            'srum': {
+                'data_format': 'System Resource Usage Monitor (SRUM) ESE database file',
+                'module': 'plaso.parsers.esedb_plugins.srum'},
+            'user_access_logging': {
+                'data_format': 'Windows User Access Logging ESE database file',
+                'module': 'plaso.parsers.esedb_plugins.user_access_logging'}},
+        'signatures': [(b'\xef\xcd\xab\x89', 4)]},
+    'filestat': {
+        'data_format': 'file system stat information',
+        'module': 'plaso.parsers.filestat',
+        'plugins': None,
+        'signatures': []},
+    'firefox_cache': {
+        'data_format': 'Mozilla Firefox Cache version 1 file (version 31 or earlier)',
+        'module': 'plaso.parsers.firefox_cache',
+        'plugins': None,
+        'signatures': []},
+    'firefox_cache2': {
+        'data_format': 'Mozilla Firefox Cache version 2 file (version 32 or later)',
+        'module': 'plaso.parsers.firefox_cache',
+        'plugins': None,
+        'signatures': []},
+    'fish_history': {
+        'data_format': 'Fish history file',
+        'module': 'plaso.parsers.fish_history',
+        'plugins': None,
+        'signatures': []},
+    'fseventsd': {
+        'data_format': 'MacOS File System Events Disk Log Stream (fseventsd) file',
+        'module': 'plaso.parsers.fseventsd',
+        'plugins': None,
+        'signatures': [(b'1SLD', 0), (b'2SLD', 0)]},
+    'java_idx': {
+        'data_format': 'Java WebStart Cache IDX file',
+        'module': 'plaso.parsers.java_idx',
+        'plugins': None,
+        'signatures': []},
+    'jsonl': {
+        'data_format': 'JSON-L log file',
+        'module': 'plaso.parsers.jsonl_parser',
+        'plugins': {
+            'aws_cloudtrail_log': {
+                'data_format': 'AWS CloudTrail Log',
+                'module': 'plaso.parsers.jsonl_plugins.aws_cloudtrail_log'},
+            'azure_activity_log': {
+                'data_format': 'Azure Activity Log',
+                'module': 'plaso.parsers.jsonl_plugins.azure_activity_log'},
+            'azure_application_gateway_access_log': {
+                'data_format': 'Azure Application Gateway access log',
+                'module': 'plaso.parsers.jsonl_plugins.azure_application_gateway_log'},
+            'docker_container_config': {
+                'data_format': 'Docker container configuration file',
+                'module': 'plaso.parsers.jsonl_plugins.docker_container_config'},
+            'docker_container_log': {
+                'data_format': 'Docker container log file',
+                'module': 'plaso.parsers.jsonl_plugins.docker_container_log'},
+            'docker_layer_config': {
+                'data_format': 'Docker layer configuration file',
+                'module': 'plaso.parsers.jsonl_plugins.docker_layer_config'},
+            'gcp_log': {
+                'data_format': 'Google Cloud (GCP) log',
+                'module': 'plaso.parsers.jsonl_plugins.gcp_log'},
+            'ios_application_privacy': {
+                'data_format': 'iOS Application Privacy report',
+                'module': 'plaso.parsers.jsonl_plugins.ios_app_privacy'},
+            'microsoft_audit_log': {
+                'data_format': 'Microsoft (Office) 365 audit log',
+                'module': 'plaso.parsers.jsonl_plugins.microsoft365_audit_log'}},
+        'signatures': []},
+    'lnk': {
+        'data_format': 'Windows Shortcut (LNK) file',
+        'module': 'plaso.parsers.winlnk',
+        'plugins': None,
+        'signatures': [(b'\x01\x14\x02\x00\x00\x00\x00\x00\xc0\x00\x00\x00\x00\x00\x00F', 4)]},
+    'locate_database': {
+        'data_format': 'Locate database file (updatedb)',
+        'module': 'plaso.parsers.locate',
+        'plugins': None,
+        'signatures': [(b'\x00mlocate', 0)]},
+    'mac_keychain': {
+        'data_format': 'MacOS keychain database file',
+        'module': 'plaso.parsers.macos_keychain',
+        'plugins': None,
+        'signatures': [(b'kych', 0)]},
+    'mcafee_protection': {
+        'data_format': 'McAfee Anti-Virus access protection log file',
+        'module': 'plaso.parsers.mcafeeav',
+        'plugins': None,
+        'signatures': []},
+    'mft': {
+        'data_format': 'NTFS $MFT metadata file',
+        'module': 'plaso.parsers.ntfs',
+        'plugins': None,
+        'signatures': [(b'FILE', 0)]},
+    'msiecf': {
+        'data_format': 'Microsoft Internet Explorer (MSIE) 4 - 9 cache (index.dat) file',
+        'module': 'plaso.parsers.msiecf',
+        'plugins': None,
+        'signatures': [(b'Client UrlCache MMF Ver ', 0)]},
+    'networkminer_fileinfo': {
+        'data_format': 'NetworkMiner .fileinfos file',
+        'module': 'plaso.parsers.networkminer',
+        'plugins': None,
+        'signatures': []},
+    'olecf': {
+        'data_format': 'OLE Compound File (OLECF) format',
+        'module': 'plaso.parsers.olecf',
+        'plugins': {
+            'olecf_automatic_destinations': {
+                'data_format': 'Automatic destinations jump list OLE compound file (.automaticDestinations-ms)',
+                'module': 'plaso.parsers.olecf_plugins.automatic_destinations'},
+            'olecf_default': {
+                'data_format': 'Generic OLE compound item',
+                'module': 'plaso.parsers.olecf_plugins.default'},
+            'olecf_document_summary': {
+                'data_format': 'Document summary information (\\0x05DocumentSummaryInformation)',
+                'module': 'plaso.parsers.olecf_plugins.summary'},
+            'olecf_summary': {
+                'data_format': 'Summary information (\\0x05SummaryInformation) (top-level only)',
+                'module': 'plaso.parsers.olecf_plugins.summary'}},
+        'signatures': [(b'\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1', 0), (b'\x0e\x11\xfc\r\xd0\xcf\x11\x0e', 0)]},
+    'onedrive_log': {
+        'data_format': 'OneDrive Log file',
+        'module': 'plaso.parsers.onedrive',
+        'plugins': None,
+        'signatures': [(b'EBFGONED', 0)]},
+    'opera_global': {
+        'data_format': 'Opera global history (global_history.dat) file',
+        'module': 'plaso.parsers.opera',
+        'plugins': None,
+        'signatures': []},
+    'opera_typed_history': {
+        'data_format': 'Opera typed history (typed_history.xml) file',
+        'module': 'plaso.parsers.opera',
+        'plugins': None,
+        'signatures': []},
+    'pe': {
+        'data_format': 'Portable Executable (PE) file',
+        'module': 'plaso.parsers.pe',
+        'plugins': None,
+        'signatures': [(b'MZ', 0)]},
+    'plist': {
+        'data_format': 'Property list (plist) file',
+        'module': 'plaso.parsers.plist',
+        'plugins': {
+            'airport': {
+                'data_format': 'Airport plist file',
+                'module': 'plaso.parsers.plist_plugins.airport'},
+            'apple_id': {
+                'data_format': 'Apple account information plist file',
+                'module': 'plaso.parsers.plist_plugins.apple_account'},
+            'ios_carplay': {
+                'data_format': 'Apple iOS Car Play application plist file',
+                'module': 'plaso.parsers.plist_plugins.ios_carplay'},
+            'ios_identityservices': {
+                'data_format': 'Idstatuscache plist file',
+                'module': 'plaso.parsers.plist_plugins.ios_identityservices'},
+            'ipod_device': {
+                'data_format': 'iPod, iPad and iPhone plist file',
+                'module': 'plaso.parsers.plist_plugins.ipod'},
+            'launchd_plist': {
+                'data_format': 'Launchd plist file',
+                'module': 'plaso.parsers.plist_plugins.launchd'},
+            'macos_background_items_plist': {
+                'data_format': 'Mac OS backgrounditems.btm or BackgroundItems-v[3-9].btm plist file',
+                'module': 'plaso.parsers.plist_plugins.macos_background_items'},
+            'macos_bluetooth': {
+                'data_format': 'MacOS Bluetooth plist file',
+                'module': 'plaso.parsers.plist_plugins.bluetooth'},
+            'macos_install_history': {
+                'data_format': 'MacOS installation history plist file',
+                'module': 'plaso.parsers.plist_plugins.install_history'},
+            'macos_login_items_plist': {
+                'data_format': 'Mac OS com.apple.loginitems.plist file',
+                'module': 'plaso.parsers.plist_plugins.macos_login_items'},
+            'macos_login_window_plist': {
+                'data_format': 'Mac OS login window plist file',
+                'module': 'plaso.parsers.plist_plugins.macos_login_window'},
+            'macos_software_update': {
+                'data_format': 'MacOS software update plist file',
+                'module': 'plaso.parsers.plist_plugins.software_update'},
+            'macos_startup_item_plist': {
+                'data_format': 'Mac OS startup item plist file',
+                'module': 'plaso.parsers.plist_plugins.macos_startup_item'},
+            'macuser': {
+                'data_format': 'MacOS user plist file',
+                'module': 'plaso.parsers.plist_plugins.macos_user'},
+            'plist_default': {
+                'data_format': 'plist file',
+                'module': 'plaso.parsers.plist_plugins.default'},
+            'safari_downloads': {
+                'data_format': 'Safari Downloads plist file',
+                'module': 'plaso.parsers.plist_plugins.safari_downloads'},
+            'safari_history': {
+                'data_format': 'Safari history plist file',
+                'module': 'plaso.parsers.plist_plugins.safari_history'},
+            'spotlight': {
+                'data_format': 'Spotlight searched terms plist file',
+                'module': 'plaso.parsers.plist_plugins.spotlight_searched_terms'},
+            'spotlight_volume': {
+                'data_format': 'Spotlight volume configuration plist file',
+                'module': 'plaso.parsers.plist_plugins.spotlight_volume'},
+            'time_machine': {
+                'data_format': 'MacOS TimeMachine plist file',
+                'module': 'plaso.parsers.plist_plugins.time_machine'}},
+        'signatures': [(b'bplist', 0)]},
+    'pls_recall': {
+        'data_format': 'PL SQL cache file (PL-SQL developer recall file) format',
+        'module': 'plaso.parsers.pls_recall',
+        'plugins': None,
+        'signatures': []},
+    'prefetch': {
+        'data_format': 'Windows Prefetch File (PF)',
+        'module': 'plaso.parsers.winprefetch',
+        'plugins': None,
+        'signatures': [(b'SCCA', 4), (b'MAM\x04', 0)]},
+    'recycle_bin': {
+        'data_format': 'Windows $Recycle.Bin $I file',
+        'module': 'plaso.parsers.recycler',
+        'plugins': None,
+        'signatures': []},
+    'recycle_bin_info2': {
+        'data_format': 'Windows Recycler INFO2 file',
+        'module': 'plaso.parsers.recycler',
+        'plugins': None,
+        'signatures': []},
+    'rplog': {
+        'data_format': 'Windows Restore Point log (rp.log) file',
+        'module': 'plaso.parsers.winrestore',
+        'plugins': None,
+        'signatures': []},
+    'simatic_s7': {
+        'data_format': 'SIMATIC S7 Log file',
+        'module': 'plaso.parsers.wincc',
+        'plugins': None,
+        'signatures': []},
+    'spotlight_storedb': {
+        'data_format': 'Apple Spotlight store database (store.db) file',
+        'module': 'plaso.parsers.spotlight_storedb',
+        'plugins': None,
+        'signatures': [(b'8tsd', 0)]},
+    'sqlite': {
+        'data_format': 'SQLite database file',
+        'module': 'plaso.parsers.sqlite',
+        'plugins': {
+            'android_app_usage': {
+                'data_format': 'Android app_usage SQLite database (app_usage) file',
+                'module': 'plaso.parsers.sqlite_plugins.android_app_usage'},
+            'android_calls': {
+                'data_format': 'Android call history SQLite database (contacts2.db) file',
+                'module': 'plaso.parsers.sqlite_plugins.android_calls'},
+            'android_sms': {
+                'data_format': 'Android text messages (SMS) SQLite database (mmssms.dbs) file',
+                'module': 'plaso.parsers.sqlite_plugins.android_sms'},
+            'android_turbo': {
+                'data_format': 'Android turbo SQLite database (turbo.db) file',
+                'module': 'plaso.parsers.sqlite_plugins.android_turbo'},
+            'android_webview': {
+                'data_format': 'Android WebView SQLite database file',
+                'module': 'plaso.parsers.sqlite_plugins.android_webview'},
+            'android_webviewcache': {
+                'data_format': 'Android WebViewCache SQLite database file',
+                'module': 'plaso.parsers.sqlite_plugins.android_webviewcache'},
+            'appusage': {
+                'data_format': 'MacOS application usage SQLite database (application_usage.sqlite) file',
+                'module': 'plaso.parsers.sqlite_plugins.macos_appusage'},
+            'chrome_17_cookies': {
+                'data_format': 'Google Chrome 17 - 65 cookies SQLite database file',
+                'module': 'plaso.parsers.sqlite_plugins.chrome_cookies'},
+            'chrome_27_history': {
+                'data_format': 'Google Chrome 27 and later history SQLite database file',
+                'module': 'plaso.parsers.sqlite_plugins.chrome_history'},
+            'chrome_66_cookies': {
+                'data_format': 'Google Chrome 66 and later cookies SQLite database file',
+                'module': 'plaso.parsers.sqlite_plugins.chrome_cookies'},
+            'chrome_8_history': {
+                'data_format': 'Google Chrome 8 - 25 history SQLite database file',
+                'module': 'plaso.parsers.sqlite_plugins.chrome_history'},
+            'chrome_autofill': {
+                'data_format': 'Google Chrome autofill SQLite database (Web Data) file',
+                'module': 'plaso.parsers.sqlite_plugins.chrome_autofill'},
+            'chrome_extension_activity': {
+                'data_format': 'Google Chrome extension activity SQLite database file',
+                'module': 'plaso.parsers.sqlite_plugins.chrome_extension_activity'},
+            'dropbox': {
+                'data_format': 'Dropbox sync history database (sync_history.db) file',
+                'module': 'plaso.parsers.sqlite_plugins.dropbox'},
+            'edge_load_statistics': {
+                'data_format': 'SQLite database file',
+                'module': 'plaso.parsers.sqlite_plugins.edge_load_statistics'},
+            'firefox_10_cookies': {
+                'data_format': 'Mozilla Firefox cookies SQLite database file version 10',
+                'module': 'plaso.parsers.sqlite_plugins.firefox_cookies'},
+            'firefox_118_downloads': {
+                'data_format': 'Mozilla Firefox 118 downloads SQLite database (downloads.sqlite) file',
+                'module': 'plaso.parsers.sqlite_plugins.firefox_downloads'},
+            'firefox_2_cookies': {
+                'data_format': 'Mozilla Firefox cookies SQLite database file version 2',
+                'module': 'plaso.parsers.sqlite_plugins.firefox_cookies'},
+            'firefox_downloads': {
+                'data_format': 'Mozilla Firefox downloads SQLite database (downloads.sqlite) file',
+                'module': 'plaso.parsers.sqlite_plugins.firefox_downloads'},
+            'firefox_history': {
+                'data_format': 'Mozilla Firefox history SQLite database (places.sqlite) file',
+                'module': 'plaso.parsers.sqlite_plugins.firefox_history'},
+            'google_drive': {
+                'data_format': 'Google Drive snapshot SQLite database (snapshot.db) file',
+                'module': 'plaso.parsers.sqlite_plugins.gdrive'},
+            'hangouts_messages': {
+                'data_format': 'Google Hangouts conversations SQLite database (babel.db) file',
+                'module': 'plaso.parsers.sqlite_plugins.android_hangouts'},
+            'imessage': {
+                'data_format': 'MacOS and iOS iMessage database (chat.db, sms.db) file',
+                'module': 'plaso.parsers.sqlite_plugins.imessage'},
+            'ios_datausage': {
+                'data_format': 'iOS data usage SQLite databse (DataUsage.sqlite) file.',
+                'module': 'plaso.parsers.sqlite_plugins.ios_datausage'},
+            'ios_netusage': {
+                'data_format': 'iOS network usage SQLite database (netusage.sqlite) file',
+                'module': 'plaso.parsers.sqlite_plugins.ios_netusage'},
+            'ios_powerlog': {
+                'data_format': 'iOS powerlog SQLite database (CurrentPowerlog.PLSQL) file',
+                'module': 'plaso.parsers.sqlite_plugins.ios_powerlog'},
+            'ios_screentime': {
+                'data_format': 'iOS Screen Time SQLite database (RMAdminStore-Local.sqlite)',
+                'module': 'plaso.parsers.sqlite_plugins.ios_screentime'},
+            'kik_ios': {
+                'data_format': 'iOS Kik messenger SQLite database (kik.sqlite) file',
+                'module': 'plaso.parsers.sqlite_plugins.ios_kik'},
+            'kodi': {
+                'data_format': 'Kodi videos SQLite database (MyVideos.db) file',
+                'module': 'plaso.parsers.sqlite_plugins.kodi'},
+            'ls_quarantine': {
+                'data_format': 'MacOS launch services quarantine events database SQLite database file',
+                'module': 'plaso.parsers.sqlite_plugins.ls_quarantine'},
+            'mac_document_versions': {
+                'data_format': 'MacOS document revisions SQLite database file',
+                'module': 'plaso.parsers.sqlite_plugins.macos_document_versions'},
+            'mac_knowledgec': {
+                'data_format': 'MacOS Duet/KnowledgeC SQLites database file',
+                'module': 'plaso.parsers.sqlite_plugins.macos_knowledgec'},
+            'mac_notes': {
+                'data_format': 'MacOS Notes SQLite database (NotesV7.storedata) file',
+                'module': 'plaso.parsers.sqlite_plugins.macos_notes'},
+            'mac_notificationcenter': {
+                'data_format': 'MacOS Notification Center SQLite database file',
+                'module': 'plaso.parsers.sqlite_plugins.macos_notification_center'},
+            'mackeeper_cache': {
+                'data_format': 'MacOS MacKeeper cache SQLite database file',
+                'module': 'plaso.parsers.sqlite_plugins.mackeeper_cache'},
+            'macostcc': {
+                'data_format': 'MacOS Transparency, Consent, Control (TCC) SQLite database (TCC.db) file',
+                'module': 'plaso.parsers.sqlite_plugins.macos_tcc'},
+            'safari_historydb': {
+                'data_format': 'Safari history SQLite database (History.db) file',
+                'module': 'plaso.parsers.sqlite_plugins.safari'},
+            'skype': {
+                'data_format': 'Skype SQLite database (main.db) file',
+                'module': 'plaso.parsers.sqlite_plugins.skype'},
+            'tango_android_profile': {
+                'data_format': 'Tango on Android profile SQLite database file',
+                'module': 'plaso.parsers.sqlite_plugins.android_tango'},
+            'tango_android_tc': {
+                'data_format': 'Tango on Android TC SQLite database file',
+                'module': 'plaso.parsers.sqlite_plugins.android_tango'},
+            'twitter_android': {
+                'data_format': 'Twitter on Android SQLite database file',
+                'module': 'plaso.parsers.sqlite_plugins.android_twitter'},
+            'twitter_ios': {
+                'data_format': 'Twitter on iOS 8 and later SQLite database (twitter.db) file',
+                'module': 'plaso.parsers.sqlite_plugins.ios_twitter'},
+            'windows_eventtranscript': {
+                'data_format': 'Windows diagnosis EventTranscript SQLite database (EventTranscript.db) file',
+                'module': 'plaso.parsers.sqlite_plugins.windows_eventtranscript'},
+            'windows_push_notification': {
+                'data_format': 'Windows 10 push notification SQLite database (wpndatabase.db) file',
+                'module': 'plaso.parsers.sqlite_plugins.windows_push_notification'},
+            'windows_timeline': {
+                'data_format': 'Windows 10 timeline SQLite database (ActivitiesCache.db) file',
+                'module': 'plaso.parsers.sqlite_plugins.windows_timeline'},
+            'zeitgeist': {
+                'data_format': 'Zeitgeist activity SQLite database file',
+                'module': 'plaso.parsers.sqlite_plugins.zeitgeist'}},
+        'signatures': [(b'SQLite format 3', 0)]},
+    'symantec_scanlog': {
+        'data_format': 'Symantec AV Corporate Edition and Endpoint Protection log file',
+        'module': 'plaso.parsers.symantec',
+        'plugins': None,
+        'signatures': []},
+    'systemd_journal': {
+        'data_format': 'Systemd journal file',
+        'module': 'plaso.parsers.systemd_journal',
+        'plugins': None,
+        'signatures': [(b'LPKSHHRH', 0)]},
+    'text': {
+        'data_format': 'text-based log file',
+        'module': 'plaso.parsers.text_parser',
+        'plugins': {
+            'android_logcat': {
+                'data_format': 'Android logcat file',
+                'module': 'plaso.parsers.text_plugins.android_logcat'},
+            'apache_access': {
+                'data_format': 'Apache access log (access.log) file',
+                'module': 'plaso.parsers.text_plugins.apache_access'},
+            'apt_history': {
+                'data_format': 'Advanced Packaging Tool (APT) History log file',
+                'module': 'plaso.parsers.text_plugins.apt_history'},
+            'aws_elb_access': {
+                'data_format': 'AWS ELB Access log file',
+                'module': 'plaso.parsers.text_plugins.aws_elb_access'},
+            'bash_history': {
+                'data_format': 'Bash history file',
+                'module': 'plaso.parsers.text_plugins.bash_history'},
+            'confluence_access': {
+                'data_format': 'Confluence access log (access.log) file',
+                'module': 'plaso.parsers.text_plugins.confluence_access'},
+            'cri_log': {
+                'data_format': 'Container Runtime Interface log file',
+                'module': 'plaso.parsers.text_plugins.cri'},
+            'dpkg': {
+                'data_format': 'Debian package manager log (dpkg.log) file',
+                'module': 'plaso.parsers.text_plugins.dpkg'},
+            'gdrive_synclog': {
+                'data_format': 'Google Drive Sync log file',
+                'module': 'plaso.parsers.text_plugins.gdrive_synclog'},
+            'googlelog': {
+                'data_format': 'Google-formatted log file',
+                'module': 'plaso.parsers.text_plugins.google_logging'},
+            'ios_lockdownd': {
+                'data_format': 'iOS lockdown daemon log',
+                'module': 'plaso.parsers.text_plugins.ios_lockdownd'},
+            'ios_logd': {
+                'data_format': 'iOS sysdiagnose logd file',
+                'module': 'plaso.parsers.text_plugins.ios_logd'},
+            'ios_sysdiag_log': {
+                'data_format': 'iOS sysdiag log',
+                'module': 'plaso.parsers.text_plugins.ios_sysdiag_log'},
+            'mac_appfirewall_log': {
+                'data_format': 'MacOS Application firewall log (appfirewall.log) file',
+                'module': 'plaso.parsers.text_plugins.macos_appfirewall'},
+            'mac_securityd': {
+                'data_format': 'MacOS security daemon (securityd) log file',
+                'module': 'plaso.parsers.text_plugins.macos_securityd'},
+            'mac_wifi': {
+                'data_format': 'MacOS Wi-Fi log (wifi.log) file',
+                'module': 'plaso.parsers.text_plugins.macos_wifi'},
+            'macos_launchd_log': {
+                'data_format': 'Mac OS launchd log file',
+                'module': 'plaso.parsers.text_plugins.macos_launchd'},
+            'popularity_contest': {
+                'data_format': 'Popularity Contest log file',
+                'module': 'plaso.parsers.text_plugins.popcontest'},
+            'postgresql': {
+                'data_format': 'PostgreSQL application log file',
+                'module': 'plaso.parsers.text_plugins.postgresql'},
+            'powershell_transcript': {
+                'data_format': 'PowerShell transcript event',
+                'module': 'plaso.parsers.text_plugins.powershell_transcript'},
+            'santa': {
+                'data_format': 'Santa log (santa.log) file',
+                'module': 'plaso.parsers.text_plugins.santa'},
+            'sccm': {
+                'data_format': 'System Center Configuration Manager (SCCM) client log file',
+                'module': 'plaso.parsers.text_plugins.sccm'},
+            'selinux': {
+                'data_format': 'SELinux audit log (audit.log) file',
+                'module': 'plaso.parsers.text_plugins.selinux'},
+            'setupapi': {
+                'data_format': 'Windows SetupAPI log file',
+                'module': 'plaso.parsers.text_plugins.setupapi'},
+            'skydrive_log_v1': {
+                'data_format': 'OneDrive (or SkyDrive) version 1 log file',
+                'module': 'plaso.parsers.text_plugins.skydrivelog'},
+            'skydrive_log_v2': {
+                'data_format': 'OneDrive (or SkyDrive) version 2 log file',
+                'module': 'plaso.parsers.text_plugins.skydrivelog'},
+            'snort_fastlog': {
+                'data_format': 'Snort3/Suricata fast-log alert log (fast.log) file',
+                'module': 'plaso.parsers.text_plugins.snort_fastlog'},
+            'sophos_av': {
+                'data_format': 'Sophos anti-virus log file (SAV.txt) file',
+                'module': 'plaso.parsers.text_plugins.sophos_av'},
+            'syslog': {
+                'data_format': 'System log (syslog) file',
+                'module': 'plaso.parsers.text_plugins.syslog'},
+            'syslog_traditional': {
+                'data_format': 'Traditional system log (syslog) file',
+                'module': 'plaso.parsers.text_plugins.syslog'},
+            'teamviewer_application_log': {
+                'data_format': 'TeamViewer application log file parser.',
+                'module': 'plaso.parsers.text_plugins.teamviewer'},
+            'teamviewer_connections_incoming': {
+                'data_format': 'TeamViewer connections_incoming.txt log file',
+                'module': 'plaso.parsers.text_plugins.teamviewer'},
+            'teamviewer_connections_outgoing': {
+                'data_format': 'TeamViewer connections.txt log file',
+                'module': 'plaso.parsers.text_plugins.teamviewer'},
+            'viminfo': {
+                'data_format': 'Viminfo file',
+                'module': 'plaso.parsers.text_plugins.viminfo'},
+            'vsftpd': {
+                'data_format': 'vsftpd log file',
+                'module': 'plaso.parsers.text_plugins.vsftpd'},
+            'winfirewall': {
+                'data_format': 'Windows Firewall log file',
+                'module': 'plaso.parsers.text_plugins.winfirewall'},
+            'winiis': {
+                'data_format': 'Microsoft IIS log file',
+                'module': 'plaso.parsers.text_plugins.iis'},
+            'xchatlog': {
+                'data_format': 'XChat log file',
+                'module': 'plaso.parsers.text_plugins.xchatlog'},
+            'xchatscrollback': {
+                'data_format': 'XChat scrollback log file',
+                'module': 'plaso.parsers.text_plugins.xchatscrollback'},
+            'zsh_extended_history': {
+                'data_format': 'ZSH extended history file',
+                'module': 'plaso.parsers.text_plugins.zsh_extended_history'}},
+        'signatures': []},
+    'trendmicro_url': {
+        'data_format': 'Trend Micro Office Web Reputation log file',
+        'module': 'plaso.parsers.trendmicroav',
+        'plugins': None,
+        'signatures': []},
+    'trendmicro_vd': {
+        'data_format': 'Trend Micro Office Scan Virus Detection log file',
+        'module': 'plaso.parsers.trendmicroav',
+        'plugins': None,
+        'signatures': []},
+    'unified_logging': {
+        'data_format': 'Apple Unified Logging (AUL) 64-bit tracev3 file',
+        'module': 'plaso.parsers.unified_logging',
+        'plugins': None,
+        'signatures': [(b'\x00\x10\x00\x00\x11\x00\x00\x00\xd0\x00\x00\x00\x00\x00\x00\x00', 0)]},
+    'usnjrnl': {
+        'data_format': 'NTFS USN change journal ($UsnJrnl:$J) file system metadata file',
+        'module': 'plaso.parsers.ntfs',
+        'plugins': None,
+        'signatures': []},
+    'utmp': {
+        'data_format': 'Linux libc6 utmp file',
+        'module': 'plaso.parsers.utmp',
+        'plugins': None,
+        'signatures': []},
+    'utmpx': {
+        'data_format': 'Mac OS X 10.5 utmpx file',
+        'module': 'plaso.parsers.utmpx',
+        'plugins': None,
+        'signatures': [(b'utmpx-1.00\x00', 0)]},
+    'wincc_sys': {
+        'data_format': 'WinCC Sys Log file',
+        'module': 'plaso.parsers.wincc',
+        'plugins': None,
+        'signatures': []},
+    'windefender_history': {
+        'data_format': 'Windows Defender scan DetectionHistory file',
+        'module': 'plaso.parsers.windefender_history',
+        'plugins': None,
+        'signatures': [(b'M\x00a\x00g\x00i\x00c\x00.\x00V\x00e\x00r\x00s\x00i\x00o\x00n\x00:\x001\x00.\x002\x00', 48)]},
+    'winevt': {
+        'data_format': 'Windows EventLog (EVT) file',
+        'module': 'plaso.parsers.winevt',
+        'plugins': None,
+        'signatures': [(b'LfLe', 4)]},
+    'winevtx': {
+        'data_format': 'Windows XML EventLog (EVTX) file',
+        'module': 'plaso.parsers.winevtx',
+        'plugins': None,
+        'signatures': [(b'ElfFile\x00', 0)]},
+    'winjob': {
+        'data_format': 'Windows Scheduled Task job (or at-job) file',
+        'module': 'plaso.parsers.winjob',
+        'plugins': None,
+        'signatures': []},
+    'winpca_db0': {
+        'data_format': 'Windows PCA DB0 log file',
+        'module': 'plaso.parsers.winpca',
+        'plugins': None,
+        'signatures': []},
+    'winpca_dic': {
+        'data_format': 'Windows PCA DIC log file',
+        'module': 'plaso.parsers.winpca',
+        'plugins': None,
+        'signatures': []},
+    'winreg': {
+        'data_format': 'Windows NT Registry (REGF) file',
+        'module': 'plaso.parsers.winreg_parser',
+        'plugins': {
+            'amcache': {
+                'data_format': 'AMCache (AMCache.hve)',
+                'module': 'plaso.parsers.winreg_plugins.amcache'},
+            'appcompatcache': {
+                'data_format': 'Application Compatibility Cache Registry data',
+                'module': 'plaso.parsers.winreg_plugins.appcompatcache'},
+            'bagmru': {
+                'data_format': 'BagMRU (or ShellBags) Registry data',
+                'module': 'plaso.parsers.winreg_plugins.bagmru'},
+            'bam': {
+                'data_format': 'Background Activity Moderator (BAM) Registry data',
+                'module': 'plaso.parsers.winreg_plugins.bam'},
+            'ccleaner': {
+                'data_format': 'CCleaner Registry data',
+                'module': 'plaso.parsers.winreg_plugins.ccleaner'},
+            'explorer_mountpoints2': {
+                'data_format': 'Windows Explorer mount points Registry data',
+                'module': 'plaso.parsers.winreg_plugins.mountpoints'},
+            'explorer_programscache': {
+                'data_format': 'Windows Explorer Programs Cache Registry data',
+                'module': 'plaso.parsers.winreg_plugins.programscache'},
+            'microsoft_office_mru': {
+                'data_format': 'Microsoft Office MRU Registry data',
+                'module': 'plaso.parsers.winreg_plugins.officemru'},
+            'microsoft_outlook_mru': {
+                'data_format': 'Microsoft Outlook search MRU Registry data',
+                'module': 'plaso.parsers.winreg_plugins.outlook'},
+            'motherboard_info': {
+                'data_format': 'Motherboard Info Registry data',
+                'module': 'plaso.parsers.winreg_plugins.motherboard_info'},
+            'mrulist_shell_item_list': {
+                'data_format': 'Most Recently Used (MRU) Registry data',
+                'module': 'plaso.parsers.winreg_plugins.mrulist'},
+            'mrulist_string': {
+                'data_format': 'Most Recently Used (MRU) Registry data',
+                'module': 'plaso.parsers.winreg_plugins.mrulist'},
+            'mrulistex_shell_item_list': {
+                'data_format': 'Most Recently Used (MRU) Registry data',
+                'module': 'plaso.parsers.winreg_plugins.mrulistex'},
+            'mrulistex_string': {
+                'data_format': 'Most Recently Used (MRU) Registry data',
+                'module': 'plaso.parsers.winreg_plugins.mrulistex'},
+            'mrulistex_string_and_shell_item': {
+                'data_format': 'Most Recently Used (MRU) Registry data',
+                'module': 'plaso.parsers.winreg_plugins.mrulistex'},
+            'mrulistex_string_and_shell_item_list': {
+                'data_format': 'Most Recently Used (MRU) Registry data',
+                'module': 'plaso.parsers.winreg_plugins.mrulistex'},
+            'msie_zone': {
+                'data_format': 'Microsoft Internet Explorer zone settings Registry data',
+                'module': 'plaso.parsers.winreg_plugins.msie_zones'},
+            'mstsc_rdp': {
+                'data_format': 'Terminal Server Client Connection Registry data',
+                'module': 'plaso.parsers.winreg_plugins.terminal_server'},
+            'mstsc_rdp_mru': {
+                'data_format': 'Terminal Server Client Most Recently Used (MRU) Registry data',
+                'module': 'plaso.parsers.winreg_plugins.terminal_server'},
+            'network_drives': {
+                'data_format': 'Windows network drives Registry data',
+                'module': 'plaso.parsers.winreg_plugins.network_drives'},
+            'networks': {
+                'data_format': 'Windows networks (NetworkList) Registry data',
+                'module': 'plaso.parsers.winreg_plugins.networks'},
+            'userassist': {
+                'data_format': 'User Assist Registry data',
+                'module': 'plaso.parsers.winreg_plugins.userassist'},
+            'windows_boot_execute': {
+                'data_format': 'Boot Execution Registry data',
+                'module': 'plaso.parsers.winreg_plugins.lfu'},
+            'windows_boot_verify': {
+                'data_format': 'Windows boot verification Registry data',
+                'module': 'plaso.parsers.winreg_plugins.lfu'},
+            'windows_run': {
+                'data_format': 'Run and run once Registry data',
+                'module': 'plaso.parsers.winreg_plugins.run'},
+            'windows_sam_users': {
+                'data_format': 'Security Accounts Manager (SAM) users Registry data',
+                'module': 'plaso.parsers.winreg_plugins.sam_users'},
+            'windows_services': {
+                'data_format': 'Windows drivers and services Registry data',
+                'module': 'plaso.parsers.winreg_plugins.services'},
+            'windows_shutdown': {
+                'data_format': 'Windows last shutdown Registry data',
+                'module': 'plaso.parsers.winreg_plugins.shutdown'},
+            'windows_task_cache': {
+                'data_format': 'Windows Task Scheduler cache Registry data',
+                'module': 'plaso.parsers.winreg_plugins.task_scheduler'},
+            'windows_timezone': {
+                'data_format': 'Windows time zone Registry data',
+                'module': 'plaso.parsers.winreg_plugins.timezone'},
+            'windows_typed_urls': {
+                'data_format': 'Windows Explorer typed URLs Registry data',
+                'module': 'plaso.parsers.winreg_plugins.typedurls'},
+            'windows_usb_devices': {
+                'data_format': 'Windows USB device Registry data',
+                'module': 'plaso.parsers.winreg_plugins.usb'},
+            'windows_usbstor_devices': {
+                'data_format': 'Windows USB Plug And Play Manager USBStor Registry data',
+                'module': 'plaso.parsers.winreg_plugins.usbstor'},
+            'windows_version': {
+                'data_format': 'Windows version (product) Registry data',
+                'module': 'plaso.parsers.winreg_plugins.windows_version'},
+            'winlogon': {
+                'data_format': 'Windows log-on Registry data',
+                'module': 'plaso.parsers.winreg_plugins.winlogon'},
+            'winrar_mru': {
+                'data_format': 'WinRAR History Registry data',
+                'module': 'plaso.parsers.winreg_plugins.winrar'},
+            'winreg_default': {
+                'data_format': 'Windows Registry data',
+                'module': 'plaso.parsers.winreg_plugins.default'}},
+        'signatures': [(b'regf', 0)]}}
@@ -6,6 +6,7 @@ import datetime
 import time
 
 from plaso.containers import artifacts
+from plaso.containers import event_sources
 from plaso.containers import events
 from plaso.containers import warnings
 from plaso.engine import path_helper
@@ -56,6 +57,8 @@ class ParserMediator(object):
     self._environment_variables_per_path_spec = None
     self._event_data_stream = None
     self._event_data_stream_identifier = None
+    self._event_source_partition = None
+    self._event_source_partitioning = False
     self._extract_winevt_resources = True
     self._extract_winreg_binary_values = False
     self._file_entry = None
@@ -79,6 +82,8 @@ class ParserMediator(object):
     self._windows_event_log_providers = None
     self._windows_event_log_providers_per_filename = None
     self._windows_event_log_providers_per_path = None
+    self._windows_event_log_xml_template_identifiers = set()
+    self._winevtx_xml_templates = False
 
     self.registry_find_specs = registry_find_specs
     self.last_activity_timestamp = 0.0
@@ -91,6 +96,17 @@ class ParserMediator(object):
     """bool: True if parsing should be aborted."""
     return self._abort
 
+  @property
+  def event_source_partition(self):
+    """tuple[int, int]: start and end of the event source partition to parse
+        or None if the entire data stream should be parsed."""
+    return self._event_source_partition
+
+  @property
+  def event_source_partitioning(self):
+    """bool: True if parsers can produce event source partitions."""
+    return self._event_source_partitioning
+
   @property
   def extract_winevt_resources(self):
     """bool: extract Windows EventLog resources."""
@@ -126,6 +142,11 @@ class ParserMediator(object):
     """str: path of the directory for temporary files."""
     return self._temporary_directory
 
+  @property
+  def winevtx_xml_templates(self):
+    """bool: store Windows XML EventLog (EVTX) XML templates."""
+    return self._winevtx_xml_templates
+
   def _CreateEnvironmentVariablesPerPathSpec(self, system_configurations):
     """Creates the environment variables per path specification lookup table.
 
@@ -230,6 +251,21 @@ class ParserMediator(object):
     """
     self._storage_writer.AddAttributeContainer(message_string)
 
+  def AddWindowsEventLogXMLTemplate(self, xml_template):
+    """Adds a Windows XML EventLog (EVTX) XML template.
+
+    The XML template is only stored once per storage writer.
+
+    Args:
+      xml_template (WindowsEventLogXMLTemplateArtifact): Windows XML EventLog
+          (EVTX) XML template.
+    """
+    if (xml_template.identifier not in
+        self._windows_event_log_xml_template_identifiers):
+      self._storage_writer.AddAttributeContainer(xml_template)
+      self._windows_event_log_xml_template_identifiers.add(
+          xml_template.identifier)
+
   def AddWindowsWevtTemplateEvent(self, event_definition):
     """Adds a Windows WEVT_TEMPLATE event definition.
 
@@ -539,6 +575,38 @@ class ParserMediator(object):
 
     self.last_activity_timestamp = time.time()
 
+  def ProduceEventSourcePartition(
+      self, parser_name, partition_start, partition_end):
+    """Produces an event source partition.
+
+    The event source partition is a part of the default data stream of
+    the active file entry that is to be parsed by a separate task.
+
+    Args:
+      parser_name (str): name of the parser that processes the partition.
+      partition_start (int): start of the partition.
+      partition_end (int): end of the partition.
+
+    Raises:
+      RuntimeError: when storage writer is not set.
+    """
+    if not self._storage_writer:
+      raise RuntimeError('Storage writer not set.')
+
+    event_source_partition = event_sources.EventSourcePartition(
+        file_entry_type=getattr(self._file_entry, 'entry_type', None),
+        parser_name=parser_name, partition_end=partition_end,
+        partition_start=partition_start,
+        path_spec=getattr(self._file_entry, 'path_spec', None))
+
+    if self._event_data_stream_identifier:
+      event_source_partition.SetEventDataStreamIdentifier(
+          self._event_data_stream_identifier)
+
+    self._storage_writer.AddAttributeContainer(event_source_partition)
+
+    self.last_activity_timestamp = time.time()
+
   def ProduceExtractionWarning(self, message, path_spec=None):
     """Produces an extraction warning.
 
@@ -650,6 +718,26 @@ class ParserMediator(object):
     if self._parsers_cpu_time_profiler:
       self._parsers_cpu_time_profiler.StopTiming(parser_name)
 
+  def SetEventSourcePartition(self, event_source_partition):
+    """Sets the event source partition to parse.
+
+    Args:
+      event_source_partition (tuple[int, int]): start and end of the event
+          source partition to parse or None if the entire data stream should
+          be parsed.
+    """
+    self._event_source_partition = event_source_partition
+
+  def SetEventSourcePartitioning(self, event_source_partitioning):
+    """Sets value to allow parsers to produce event source partitions.
+
+    Args:
+      event_source_partitioning (bool): True if parsers can split large data
+          streams into event source partitions that are parsed by separate
+          tasks.
+    """
+    self._event_source_partitioning = event_source_partitioning
+
   def SetExtractWinEvtResources(self, extract_winevt_resources):
     """Sets value to extract Windows EventLog resources.
 
@@ -723,6 +811,10 @@ class ParserMediator(object):
     # contain event data for their events.
     self._last_event_data_hash = None
 
+    # Reset the Windows XML EventLog (EVTX) XML templates. Each storage file
+    # should contain the XML templates of its event data.
+    self._windows_event_log_xml_template_identifiers = set()
+
   def SetTemporaryDirectory(self, temporary_directory):
     """Sets the directory to store temporary files.
 
@@ -731,6 +823,16 @@ class ParserMediator(object):
     """
     self._temporary_directory = temporary_directory
 
+  def SetWinEvtxXMLTemplates(self, winevtx_xml_templates):
+    """Sets value to store Windows XML EventLog (EVTX) XML templates.
+
+    Args:
+      winevtx_xml_templates (bool): True if the XML representation of Windows
+          XML EventLog (EVTX) records should be stored as a XML template and
+          substitution values.
+    """
+    self._winevtx_xml_templates = winevtx_xml_templates
+
   def SignalAbort(self):
     """Signals the parsers to abort."""
     self._abort = True
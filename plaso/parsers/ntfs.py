@@ -114,6 +114,10 @@ class NTFSMFTParser(interface.FileObjectParser):
 
   _NAMESPACE_DOS = 2
 
+  # Number of MFT entries per event source partition, which is 256 MiB of
+  # MFT entries of 1024 bytes.
+  _NUMBER_OF_ENTRIES_PER_PARTITION = 262144
+
   @classmethod
   def GetFormatSpecification(cls):
     """Retrieves the format specification.
@@ -341,7 +345,28 @@ class NTFSMFTParser(interface.FileObjectParser):
           'unable to open $MFT file with error: {0!s}'.format(exception))
       return
 
-    for entry_index in range(0, mft_metadata_file.number_of_file_entries):
+    number_of_file_entries = mft_metadata_file.number_of_file_entries
+
+    partition = parser_mediator.event_source_partition
+    if (not partition and parser_mediator.event_source_partitioning and
+        number_of_file_entries > self._NUMBER_OF_ENTRIES_PER_PARTITION):
+      partition = (0, self._NUMBER_OF_ENTRIES_PER_PARTITION)
+
+      # The remaining partitions are parsed by separate tasks. The path hints
+      # are resolved per partition, since every task opens the entire $MFT.
+      for partition_start in range(
+          self._NUMBER_OF_ENTRIES_PER_PARTITION, number_of_file_entries,
+          self._NUMBER_OF_ENTRIES_PER_PARTITION):
+        partition_end = min(
+            partition_start + self._NUMBER_OF_ENTRIES_PER_PARTITION,
+            number_of_file_entries)
+        parser_mediator.ProduceEventSourcePartition(
+            self.NAME, partition_start, partition_end)
+
+    partition_start, partition_end = partition or (0, number_of_file_entries)
+    partition_end = min(partition_end, number_of_file_entries)
+
+    for entry_index in range(partition_start, partition_end):
       try:
         mft_entry = mft_metadata_file.get_file_entry(entry_index)
         if (not mft_entry.is_empty() and
@@ -369,9 +394,54 @@ class NTFSUsnJrnlParser(
 
   _INITIAL_FILE_OFFSET = None
 
+  # Size of the blocks of the $J data stream. An USN record does not span
+  # multiple blocks and the remainder of a block is padded with 0-byte values.
+  _JOURNAL_BLOCK_SIZE = 0x1000
+
+  # Size of an event source partition of the $J data stream, which is 64 MiB
+  # of USN records.
+  _PARTITION_SIZE = 64 * 1024 * 1024
+
+  # Size of the data read from the $J data stream at once.
+  _READ_SIZE = 256 * _JOURNAL_BLOCK_SIZE
+
+  _SPARSE_EXTENT_FLAG = 0x00000001
+
+  # Size of the USN_RECORD_V2 without the name.
+  _USN_RECORD_V2_SIZE = 60
+
   # TODO: add support for USN_RECORD_V3 and USN_RECORD_V4 when actually
   # seen to be used.
 
+  def _GetDataRanges(self, fsntfs_data_stream):
+    """Determines the ranges of the $J data stream that are not sparse.
+
+    Args:
+      fsntfs_data_stream (pyfsntfs.data_stream): $J data stream.
+
+    Returns:
+      list[tuple[int, int]]: start and end offset, exclusive, of the ranges
+          that are not sparse.
+    """
+    data_stream_size = fsntfs_data_stream.size
+
+    data_ranges = []
+    range_start = 0
+    for extent_index in range(fsntfs_data_stream.number_of_extents):
+      _, extent_size, extent_flags = fsntfs_data_stream.get_extent(
+          extent_index)
+      range_end = min(range_start + extent_size, data_stream_size)
+
+      if not extent_flags & self._SPARSE_EXTENT_FLAG:
+        if data_ranges and data_ranges[-1][1] == range_start:
+          data_ranges[-1] = (data_ranges[-1][0], range_end)
+        elif range_start < range_end:
+          data_ranges.append((range_start, range_end))
+
+      range_start = range_end
+
+    return data_ranges
+
   def _GetDateTime(self, filetime):
     """Retrieves the date and time from a FILETIME timestamp.
 
@@ -386,6 +456,85 @@ class NTFSUsnJrnlParser(
 
     return dfdatetime_filetime.Filetime(timestamp=filetime)
 
+  def _GetPartitions(self, fsntfs_data_stream):
+    """Determines the event source partitions of the USN change journal.
+
+    The partitions are byte ranges of the $J data stream, where the sparse
+    data at the start of the data stream is part of the first partition.
+    The partitions are aligned with the blocks of the $J data stream, so that
+    every USN record is part of exactly one partition.
+
+    Args:
+      fsntfs_data_stream (pyfsntfs.data_stream): $J data stream.
+
+    Returns:
+      list[tuple[int, int]]: start and end offset, exclusive, of
+          the partitions or None if the USN change journal should not be
+          partitioned.
+    """
+    data_ranges = self._GetDataRanges(fsntfs_data_stream)
+    if not data_ranges:
+      return None
+
+    data_stream_size = fsntfs_data_stream.size
+    data_start_offset = data_ranges[0][0]
+
+    partitions = []
+    partition_start = 0
+    for partition_end in range(
+        data_start_offset + self._PARTITION_SIZE, data_stream_size,
+        self._PARTITION_SIZE):
+      partition_end -= partition_end % self._JOURNAL_BLOCK_SIZE
+      partitions.append((partition_start, partition_end))
+      partition_start = partition_end
+
+    partitions.append((partition_start, data_stream_size))
+
+    if len(partitions) < 2:
+      return None
+
+    return partitions
+
+  def _GetUSNChangeJournalDataStream(self, fsntfs_volume):
+    """Retrieves the $J data stream of the USN change journal.
+
+    Args:
+      fsntfs_volume (pyfsntfs.volume): NTFS volume.
+
+    Returns:
+      pyfsntfs.data_stream: $J data stream or None if not available.
+
+    Raises:
+      IOError: if the $J data stream cannot be retrieved.
+    """
+    fsntfs_file_entry = fsntfs_volume.get_file_entry_by_path(
+        '\\$Extend\\$UsnJrnl')
+    if not fsntfs_file_entry:
+      return None
+
+    return fsntfs_file_entry.get_alternate_data_stream_by_name('$J')
+
+  def _GetVolumePartitions(self, fsntfs_volume):
+    """Determines the event source partitions of the USN change journal.
+
+    Args:
+      fsntfs_volume (pyfsntfs.volume): NTFS volume.
+
+    Returns:
+      list[tuple[int, int]]: start and end offset, exclusive, of
+          the partitions or None if the USN change journal should not be
+          partitioned.
+    """
+    try:
+      fsntfs_data_stream = self._GetUSNChangeJournalDataStream(fsntfs_volume)
+    except IOError:
+      return None
+
+    if not fsntfs_data_stream:
+      return None
+
+    return self._GetPartitions(fsntfs_data_stream)
+
   def _ParseUSNChangeJournal(self, parser_mediator, usn_change_journal):
     """Parses an USN change journal.
 
@@ -404,43 +553,160 @@ class NTFSUsnJrnlParser(
 
     usn_record_data = usn_change_journal.read_usn_record()
     while usn_record_data:
-      current_offset = usn_change_journal.get_offset()
+      # The USN change journal reports the offset after the USN record.
+      current_offset = (
+          usn_change_journal.get_offset() - len(usn_record_data))
 
-      try:
-        usn_record = self._ReadStructureFromByteStream(
-            usn_record_data, current_offset, usn_record_map)
-      except (ValueError, errors.ParseError) as exception:
+      self._ParseUSNRecord(
+          parser_mediator, usn_record_map, usn_record_data, current_offset)
+
+      usn_record_data = usn_change_journal.read_usn_record()
+
+  def _ParseUSNChangeJournalBlock(
+      self, parser_mediator, usn_record_map, block_data, block_offset):
+    """Parses the USN records in a block of the $J data stream.
+
+    Args:
+      parser_mediator (ParserMediator): mediates interactions between parsers
+          and other components, such as storage and dfvfs.
+      usn_record_map (dtfabric.DataTypeMap): data type map of the USN record.
+      block_data (bytes): data of the block.
+      block_offset (int): offset of the block relative to the start of
+          the $J data stream.
+
+    Raises:
+      ParseError: if an USN change journal record cannot be parsed.
+    """
+    block_size = len(block_data)
+
+    record_offset = 0
+    while record_offset + 4 <= block_size:
+      record_size = int.from_bytes(
+          block_data[record_offset:record_offset + 4], 'little')
+      if not record_size:
+        record_offset += 8
+        continue
+
+      current_offset = block_offset + record_offset
+
+      if (record_size < self._USN_RECORD_V2_SIZE or
+          record_offset + record_size > block_size):
         raise errors.ParseError((
             'Unable to parse USN record at offset: 0x{0:08x} with error: '
-            '{1!s}').format(current_offset, exception))
+            'unsupported record size: {1:d}').format(
+                current_offset, record_size))
 
-      # Per MSDN we need to use name offset for forward compatibility.
-      name_offset = usn_record.name_offset - 60
-      utf16_stream = usn_record.name[name_offset:usn_record.name_size]
+      usn_record_data = block_data[record_offset:record_offset + record_size]
+      record_offset += record_size
 
-      try:
-        name_string = utf16_stream.decode('utf-16-le')
-      except (UnicodeDecodeError, UnicodeEncodeError) as exception:
-        name_string = utf16_stream.decode('utf-16-le', errors='replace')
-        parser_mediator.ProduceExtractionWarning((
-            'unable to decode USN record name string with error: '
-            '{0:s}. Characters that cannot be decoded will be replaced '
-            'with "?" or "\\ufffd".').format(exception))
-
-      event_data = NTFSUSNChangeEventData()
-      event_data.file_attribute_flags = usn_record.file_attribute_flags
-      event_data.file_reference = usn_record.file_reference
-      event_data.filename = name_string
-      event_data.offset = current_offset
-      event_data.parent_file_reference = usn_record.parent_file_reference
-      event_data.update_time = self._GetDateTime(usn_record.update_date_time)
-      event_data.update_reason_flags = usn_record.update_reason_flags
-      event_data.update_sequence_number = usn_record.update_sequence_number
-      event_data.update_source_flags = usn_record.update_source_flags
+      self._ParseUSNRecord(
+          parser_mediator, usn_record_map, usn_record_data, current_offset)
 
-      parser_mediator.ProduceEventData(event_data)
+  def _ParseUSNChangeJournalPartition(
+      self, parser_mediator, fsntfs_data_stream, partition):
+    """Parses an event source partition of an USN change journal.
 
-      usn_record_data = usn_change_journal.read_usn_record()
+    The USN records are read directly from the $J data stream, starting at
+    the partition, where the sparse ranges of the data stream are skipped.
+    An USN record is part of the partition that contains its start offset.
+
+    Args:
+      parser_mediator (ParserMediator): mediates interactions between parsers
+          and other components, such as storage and dfvfs.
+      fsntfs_data_stream (pyfsntfs.data_stream): $J data stream.
+      partition (tuple[int, int]): start and end offset of the partition.
+
+    Raises:
+      ParseError: if an USN change journal record cannot be parsed.
+    """
+    if not fsntfs_data_stream:
+      return
+
+    data_stream_size = fsntfs_data_stream.size
+    partition_start, partition_end = partition
+
+    usn_record_map = self._GetDataTypeMap('usn_record_v2')
+
+    next_read_offset = partition_start
+    for range_start, range_end in self._GetDataRanges(fsntfs_data_stream):
+      if range_end <= next_read_offset:
+        continue
+      if range_start >= partition_end:
+        break
+
+      # Since an USN record does not span multiple blocks, the blocks that
+      # contain the start and end of the range are read completely.
+      read_offset = range_start - (range_start % self._JOURNAL_BLOCK_SIZE)
+      read_offset = max(read_offset, next_read_offset)
+
+      range_end += (
+          self._JOURNAL_BLOCK_SIZE - range_end) % self._JOURNAL_BLOCK_SIZE
+      range_end = min(range_end, partition_end, data_stream_size)
+
+      while read_offset < range_end:
+        read_size = min(self._READ_SIZE, range_end - read_offset)
+        data = fsntfs_data_stream.read_buffer_at_offset(read_size, read_offset)
+        if not data:
+          break
+
+        for block_offset in range(0, len(data), self._JOURNAL_BLOCK_SIZE):
+          self._ParseUSNChangeJournalBlock(
+              parser_mediator, usn_record_map,
+              data[block_offset:block_offset + self._JOURNAL_BLOCK_SIZE],
+              read_offset + block_offset)
+
+        read_offset += len(data)
+
+      next_read_offset = max(next_read_offset, read_offset)
+
+  def _ParseUSNRecord(
+      self, parser_mediator, usn_record_map, usn_record_data, record_offset):
+    """Parses an USN record.
+
+    Args:
+      parser_mediator (ParserMediator): mediates interactions between parsers
+          and other components, such as storage and dfvfs.
+      usn_record_map (dtfabric.DataTypeMap): data type map of the USN record.
+      usn_record_data (bytes): data of the USN record.
+      record_offset (int): offset of the USN record relative to the start of
+          the $J data stream.
+
+    Raises:
+      ParseError: if the USN record cannot be parsed.
+    """
+    try:
+      usn_record = self._ReadStructureFromByteStream(
+          usn_record_data, record_offset, usn_record_map)
+    except (ValueError, errors.ParseError) as exception:
+      raise errors.ParseError((
+          'Unable to parse USN record at offset: 0x{0:08x} with error: '
+          '{1!s}').format(record_offset, exception))
+
+    # Per MSDN we need to use name offset for forward compatibility.
+    name_offset = usn_record.name_offset - 60
+    utf16_stream = usn_record.name[name_offset:usn_record.name_size]
+
+    try:
+      name_string = utf16_stream.decode('utf-16-le')
+    except (UnicodeDecodeError, UnicodeEncodeError) as exception:
+      name_string = utf16_stream.decode('utf-16-le', errors='replace')
+      parser_mediator.ProduceExtractionWarning((
+          'unable to decode USN record name string with error: '
+          '{0:s}. Characters that cannot be decoded will be replaced '
+          'with "?" or "\\ufffd".').format(exception))
+
+    event_data = NTFSUSNChangeEventData()
+    event_data.file_attribute_flags = usn_record.file_attribute_flags
+    event_data.file_reference = usn_record.file_reference
+    event_data.filename = name_string
+    event_data.offset = record_offset
+    event_data.parent_file_reference = usn_record.parent_file_reference
+    event_data.update_time = self._GetDateTime(usn_record.update_date_time)
+    event_data.update_reason_flags = usn_record.update_reason_flags
+    event_data.update_sequence_number = usn_record.update_sequence_number
+    event_data.update_source_flags = usn_record.update_source_flags
+
+    parser_mediator.ProduceEventData(event_data)
 
   def ParseFileObject(self, parser_mediator, file_object):
     """Parses a NTFS $UsnJrnl metadata file-like object.
@@ -459,8 +725,34 @@ class NTFSUsnJrnlParser(
       return
 
     try:
-      usn_change_journal = fsntfs_volume.get_usn_change_journal()
-      self._ParseUSNChangeJournal(parser_mediator, usn_change_journal)
+      partition = parser_mediator.event_source_partition
+      if not partition and parser_mediator.event_source_partitioning:
+        partitions = self._GetVolumePartitions(fsntfs_volume)
+        if partitions:
+          partition = partitions.pop(0)
+
+          # The remaining partitions are parsed by separate tasks.
+          for partition_start, partition_end in partitions:
+            parser_mediator.ProduceEventSourcePartition(
+                self.NAME, partition_start, partition_end)
+
+      if not partition:
+        usn_change_journal = fsntfs_volume.get_usn_change_journal()
+        self._ParseUSNChangeJournal(parser_mediator, usn_change_journal)
+
+      else:
+        try:
+          fsntfs_data_stream = self._GetUSNChangeJournalDataStream(
+              fsntfs_volume)
+        except IOError as exception:
+          parser_mediator.ProduceExtractionWarning((
+              'unable to retrieve USN change journal with error: '
+              '{0!s}').format(exception))
+          return
+
+        self._ParseUSNChangeJournalPartition(
+            parser_mediator, fsntfs_data_stream, partition)
+
     finally:
       fsntfs_volume.close()
 
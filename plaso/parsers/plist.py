@@ -169,6 +169,7 @@ class PlistParser(interface.FileObjectParser):
           parser_mediator.ProduceExtractionWarning((
               'plugin: {0:s} unable to parse plist file with error: '
               '{1!s}').format(plugin_name, exception))
+          required_format = False
 
       finally:
         parser_mediator.SampleFormatCheckStopTiming(profiling_name)
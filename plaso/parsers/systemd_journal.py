@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 """Parser for Systemd journal files."""
 
+import collections
 import lzma
 import os
 
@@ -81,12 +82,58 @@ class SystemdJournalParser(
 
   _HEADER_INCOMPATIBLE_COMPACT = 16
 
+  # Data objects are deduplicated by the journal, for example the data object
+  # of a _HOSTNAME field is typically shared by all entries.
+  _MAXIMUM_CACHED_DATA_OBJECTS = 16384
+
+  # Maximum size of the data of a data object to cache. Deduplicated fields,
+  # such as _HOSTNAME and _SYSTEMD_UNIT, are small, where larger fields, such
+  # as MESSAGE and COREDUMP, are typically unique.
+  _MAXIMUM_CACHED_DATA_OBJECT_SIZE = 256
+
   def __init__(self):
     """Initializes a parser."""
     super(SystemdJournalParser, self).__init__()
+    self._cached_data_objects = collections.OrderedDict()
     self._maximum_journal_file_offset = 0
     self._is_compact = False
 
+  def _GetDataObjectField(self, file_object, file_offset):
+    """Retrieves the field stored in a data object.
+
+    The fields of small data objects are cached per data object offset for
+    reuse, so that the size of the cache is bounded.
+
+    Args:
+      file_object (dfvfs.FileIO): a file-like object.
+      file_offset (int): offset of the data object relative to the start
+          of the file-like object.
+
+    Returns:
+      tuple[str, str]: key and value of the field.
+
+    Raises:
+      ParseError: if the data object cannot be parsed.
+    """
+    field = self._cached_data_objects.get(file_offset, None)
+    if field:
+      self._cached_data_objects.move_to_end(file_offset, last=False)
+      return field
+
+    data = self._ParseDataObject(file_object, file_offset)
+    event_string = data.decode('utf-8')
+    key, value = event_string.split('=', 1)
+    field = (key, value)
+
+    if len(data) <= self._MAXIMUM_CACHED_DATA_OBJECT_SIZE:
+      if len(self._cached_data_objects) >= self._MAXIMUM_CACHED_DATA_OBJECTS:
+        self._cached_data_objects.popitem(last=True)
+
+      self._cached_data_objects[file_offset] = field
+      self._cached_data_objects.move_to_end(file_offset, last=False)
+
+    return field
+
   def _ParseDataObject(self, file_object, file_offset):
     """Parses a data object.
 
@@ -268,37 +315,59 @@ class SystemdJournalParser(
     """
     entry_object = self._ParseEntryObject(file_object, file_offset)
 
-    # The data is read separately for performance reasons.
+    # The entry items are read separately, in a single read, for performance
+    # reasons.
     if self._is_compact:
       entry_item_map = self._GetDataTypeMap(
           'systemd_journal_entry_item_compact')
     else:
       entry_item_map = self._GetDataTypeMap('systemd_journal_entry_item')
 
+    entry_item_data_size = entry_item_map.GetSizeHint()
+
     file_offset += 64
-    data_end_offset = file_offset + entry_object.data_size - 64
+    data_size = entry_object.data_size - 64
 
-    fields = {'real_time': entry_object.real_time}
+    # The size of the entry items is bounded by the size of the file, so that
+    # a corrupt entry object does not cause an excessive read.
+    if data_size < 0 or file_offset + data_size > file_object.get_size():
+      raise errors.ParseError((
+          'Unsupported entry object data size: {0:d} at offset: '
+          '0x{1:08x}.').format(entry_object.data_size, file_offset - 64))
+
+    try:
+      entry_items_data = self._ReadData(file_object, file_offset, data_size)
+    except (ValueError, errors.ParseError) as exception:
+      raise errors.ParseError((
+          'Unable to read entry items at offset: 0x{0:08x} with error: '
+          '{1!s}').format(file_offset, exception))
 
-    while file_offset < data_end_offset:
+    object_offsets = []
+    for data_offset in range(0, data_size, entry_item_data_size):
       try:
-        entry_item, entry_item_data_size = self._ReadStructureFromFileObject(
-            file_object, file_offset, entry_item_map)
+        entry_item = self._ReadStructureFromByteStream(
+            entry_items_data[data_offset:data_offset + entry_item_data_size],
+            file_offset + data_offset, entry_item_map)
       except (ValueError, errors.ParseError) as exception:
         raise errors.ParseError((
             'Unable to parse entry item at offset: 0x{0:08x} with error: '
-            '{1!s}').format(file_offset, exception))
-
-      file_offset += entry_item_data_size
+            '{1!s}').format(file_offset + data_offset, exception))
 
       if entry_item.object_offset < self._maximum_journal_file_offset:
         raise errors.ParseError(
             'object offset should be after hash tables ({0:d} < {1:d})'.format(
                 entry_item.object_offset, self._maximum_journal_file_offset))
 
-      event_data = self._ParseDataObject(file_object, entry_item.object_offset)
-      event_string = event_data.decode('utf-8')
-      key, value = event_string.split('=', 1)
+      object_offsets.append(entry_item.object_offset)
+
+    # The data objects are read in order of their offset to reduce seeking.
+    fields_per_object_offset = {
+        object_offset: self._GetDataObjectField(file_object, object_offset)
+        for object_offset in sorted(set(object_offsets))}
+
+    fields = {'real_time': entry_object.real_time}
+    for object_offset in object_offsets:
+      key, value = fields_per_object_offset[object_offset]
       fields[key] = value
 
     return fields
@@ -339,8 +408,9 @@ class SystemdJournalParser(
           'Unsupported file header size: {0:d}.'.format(
               file_header.header_size))
 
-    if file_header.incompatible_flags & self._HEADER_INCOMPATIBLE_COMPACT:
-      self._is_compact = True
+    self._cached_data_objects = collections.OrderedDict()
+    self._is_compact = bool(
+        file_header.incompatible_flags & self._HEADER_INCOMPATIBLE_COMPACT)
 
     data_hash_table_end_offset = (
         file_header.data_hash_table_offset +
@@ -190,9 +190,11 @@ class TextLogParser(interface.FileObjectParser):
     """
     self._plugins_per_name = {}
     self._plugins_per_encoding = {}
-    if not self._plugin_classes:
+    if self._plugin_classes is None:
       return
 
+    self._ImportPluginModules()
+
     for plugin_name, plugin_class in self._plugin_classes.items():
       if plugin_name == self._default_plugin_name:
         self._default_plugin = plugin_class()
@@ -1,16 +1,127 @@
 # -*- coding: utf-8 -*-
 """Parser for Windows XML EventLog (EVTX) files."""
 
+import os
+
 import pyevtx
 
 from dfdatetime import filetime as dfdatetime_filetime
 
 from plaso.containers import events
+from plaso.helpers.windows import eventlog_xml_templates
+from plaso.lib import dtfabric_helper
+from plaso.lib import errors
 from plaso.lib import specification
 from plaso.parsers import interface
 from plaso.parsers import manager
 
 
+class WinEvtxPartitionFileObject(object):
+  """File-like object of an event source partition of an EVTX file.
+
+  The file-like object consists of the file header followed by the chunks of
+  the partition, which allows pyevtx to read the event records of the
+  partition without reading the chunks of the other partitions.
+  """
+
+  def __init__(self, file_object, file_header_size, chunks_offset, chunks_size):
+    """Initializes a file-like object.
+
+    Args:
+      file_object (dfvfs.FileIO): file-like object of the EVTX file.
+      file_header_size (int): size of the file header.
+      chunks_offset (int): offset of the chunks of the partition relative to
+          the start of the file.
+      chunks_size (int): size of the chunks of the partition.
+    """
+    super(WinEvtxPartitionFileObject, self).__init__()
+    self._chunks_offset = chunks_offset
+    self._current_offset = 0
+    self._file_header_size = file_header_size
+    self._file_object = file_object
+    self._size = file_header_size + chunks_size
+
+  # Note: that the following functions do not follow the style guide
+  # because they are part of the file-like object interface.
+  # pylint: disable=invalid-name
+
+  def get_size(self):
+    """Retrieves the size of the file-like object.
+
+    Returns:
+      int: size of the file header and chunks of the partition.
+    """
+    return self._size
+
+  def read(self, size=None):
+    """Reads a byte string from the file-like object at the current offset.
+
+    Args:
+      size (Optional[int]): number of bytes to read, where None represents
+          all remaining data.
+
+    Returns:
+      bytes: data read.
+    """
+    if size is None or size < 0:
+      size = self._size - self._current_offset
+
+    size = max(0, min(size, self._size - self._current_offset))
+
+    data_segments = []
+    while size > 0:
+      if self._current_offset < self._file_header_size:
+        file_offset = self._current_offset
+        read_size = min(size, self._file_header_size - self._current_offset)
+      else:
+        file_offset = self._chunks_offset + (
+            self._current_offset - self._file_header_size)
+        read_size = size
+
+      self._file_object.seek(file_offset, os.SEEK_SET)
+      data = self._file_object.read(read_size)
+      if not data:
+        break
+
+      data_segments.append(data)
+      self._current_offset += len(data)
+      size -= len(data)
+
+    return b''.join(data_segments)
+
+  def seek(self, offset, whence=os.SEEK_SET):
+    """Seeks to an offset within the file-like object.
+
+    Args:
+      offset (int): offset to seek to.
+      whence (Optional(int)): value that indicates whether offset is an
+          absolute or relative position within the file.
+
+    Raises:
+      IOError: if the seek failed.
+      OSError: if the seek failed.
+    """
+    if whence == os.SEEK_CUR:
+      offset += self._current_offset
+    elif whence == os.SEEK_END:
+      offset += self._size
+    elif whence != os.SEEK_SET:
+      raise IOError('Unsupported whence.')
+
+    if offset < 0:
+      raise IOError('Invalid offset value less than zero.')
+
+    self._current_offset = offset
+
+  def tell(self):
+    """Retrieves the current offset into the file-like object.
+
+    Returns:
+      int: current offset into the file-like object.
+    """
+    return self._current_offset
+
+
 class WinEvtxRecordEventData(events.EventData):
   """Windows XML EventLog (EVTX) record event data.
 
@@ -33,6 +144,11 @@ class WinEvtxRecordEventData(events.EventData):
     written_time (dfdatetime.DateTimeValues): event record written date and
         time.
     xml_string (str): XML representation of the event.
+    xml_template_identifier (str): identifier of the XML template of
+        the event, when the XML representation is stored as a template and
+        substitution values.
+    xml_values (list[str]): substitution values of the XML template of
+        the event.
   """
 
   DATA_TYPE = 'windows:evtx:record'
@@ -55,13 +171,32 @@ class WinEvtxRecordEventData(events.EventData):
     self.user_sid = None
     self.written_time = None
     self.xml_string = None
+    self.xml_template_identifier = None
+    self.xml_values = None
 
 
-class WinEvtxParser(interface.FileObjectParser):
+class WinEvtxParser(
+    interface.FileObjectParser, dtfabric_helper.DtFabricHelper):
   """Parses Windows XML EventLog (EVTX) files."""
 
+  _DEFINITION_FILE = os.path.join(
+      os.path.dirname(__file__), 'winevtx.yaml')
+
   _INITIAL_FILE_OFFSET = None
 
+  _CHUNK_SIGNATURE = b'ElfChnk\x00'
+
+  _CHUNK_SIZE = 65536
+
+  _FILE_HEADER_SIZE = 4096
+
+  # Number of chunks per event source partition, which is 64 MiB of event
+  # records.
+  _NUMBER_OF_CHUNKS_PER_PARTITION = 1024
+
+  _XML_TEMPLATES_HELPER = (
+      eventlog_xml_templates.WindowsEventLogXMLTemplatesHelper)
+
   NAME = 'winevtx'
   DATA_FORMAT = 'Windows XML EventLog (EVTX) file'
 
@@ -142,12 +277,140 @@ class WinEvtxParser(interface.FileObjectParser):
 
     event_data.strings = list(evtx_record.strings)
 
-    event_data.xml_string = evtx_record.xml_string
+    xml_string = evtx_record.xml_string
+    if not xml_string or not parser_mediator.winevtx_xml_templates:
+      event_data.xml_string = xml_string
+    else:
+      xml_template, xml_values = self._XML_TEMPLATES_HELPER.CreateXMLTemplate(
+          xml_string)
+      parser_mediator.AddWindowsEventLogXMLTemplate(xml_template)
+
+      event_data.xml_template_identifier = xml_template.identifier
+      event_data.xml_values = xml_values
 
     return event_data
 
+  def _GetPartitions(self, file_object, number_of_records):
+    """Determines the event source partitions of the file.
+
+    The partitions are ranges of chunks of which the number of event records
+    is read from the chunk headers. Chunks without event records, such as
+    the unused chunks at the end of the file, are added to the preceding
+    partition.
+
+    Args:
+      file_object (dfvfs.FileIO): a file-like object.
+      number_of_records (int): number of event records in the file.
+
+    Returns:
+      list[tuple[int, int, int]]: first and last chunk index, exclusive, and
+          the number of event records of the partitions or None if the file
+          should not be partitioned.
+    """
+    file_size = file_object.get_size()
+    number_of_chunks = (
+        (file_size - self._FILE_HEADER_SIZE) // self._CHUNK_SIZE)
+    if number_of_chunks <= self._NUMBER_OF_CHUNKS_PER_PARTITION:
+      return None
+
+    chunk_header_map = self._GetDataTypeMap('evtx_chunk_header')
+
+    partitions = []
+    partition_chunk_start = 0
+    partition_number_of_records = 0
+    total_number_of_records = 0
+
+    for chunk_index in range(number_of_chunks):
+      if (partition_number_of_records > 0 and
+          chunk_index % self._NUMBER_OF_CHUNKS_PER_PARTITION == 0):
+        partitions.append((
+            partition_chunk_start, chunk_index, partition_number_of_records))
+        partition_chunk_start = chunk_index
+        partition_number_of_records = 0
+
+      file_offset = self._FILE_HEADER_SIZE + (chunk_index * self._CHUNK_SIZE)
+
+      try:
+        chunk_header, _ = self._ReadStructureFromFileObject(
+            file_object, file_offset, chunk_header_map)
+      except errors.ParseError:
+        continue
+
+      if (chunk_header.signature != self._CHUNK_SIGNATURE or
+          chunk_header.last_event_record_number <
+          chunk_header.first_event_record_number):
+        continue
+
+      number_of_chunk_records = (
+          chunk_header.last_event_record_number -
+          chunk_header.first_event_record_number + 1)
+
+      partition_number_of_records += number_of_chunk_records
+      total_number_of_records += number_of_chunk_records
+
+    if partition_number_of_records > 0 or not partitions:
+      partitions.append((
+          partition_chunk_start, number_of_chunks,
+          partition_number_of_records))
+    else:
+      chunk_start, _, partition_number_of_records = partitions.pop()
+      partitions.append((
+          chunk_start, number_of_chunks, partition_number_of_records))
+
+    # The event records of the partitions are only known to correspond with
+    # the event records of the file if every event record in the chunk
+    # headers was read.
+    if total_number_of_records != number_of_records or len(partitions) < 2:
+      return None
+
+    return partitions
+
+  def _ParsePartition(self, parser_mediator, file_object, partition):
+    """Parses the event records of an event source partition.
+
+    Only the file header and the chunks of the partition are read. The event
+    record indexes are relative to the first event record of the partition.
+
+    Args:
+      parser_mediator (ParserMediator): mediates interactions between parsers
+          and other components, such as storage and dfVFS.
+      file_object (dfvfs.FileIO): a file-like object.
+      partition (tuple[int, int]): first and last chunk index, exclusive, of
+          the partition.
+    """
+    chunk_start, chunk_end = partition
+
+    chunks_offset = chunk_start * self._CHUNK_SIZE
+    chunks_size = min(
+        (chunk_end - chunk_start) * self._CHUNK_SIZE,
+        file_object.get_size() - self._FILE_HEADER_SIZE - chunks_offset)
+
+    partition_file_object = WinEvtxPartitionFileObject(
+        file_object, self._FILE_HEADER_SIZE,
+        self._FILE_HEADER_SIZE + chunks_offset, max(0, chunks_size))
+
+    evtx_file = pyevtx.file()
+    evtx_file.set_ascii_codepage(parser_mediator.GetCodePage())
+
+    try:
+      evtx_file.open_file_object(partition_file_object)
+    except IOError as exception:
+      parser_mediator.ProduceExtractionWarning((
+          'unable to open chunks: {0:d} - {1:d} with error: {2!s}').format(
+              chunk_start, chunk_end, exception))
+      return
+
+    try:
+      self._ParseRecords(
+          parser_mediator, evtx_file, evtx_file.number_of_records,
+          file_offset=chunks_offset)
+
+    finally:
+      evtx_file.close()
+
   def _ParseRecord(
-      self, parser_mediator, record_index, evtx_record, recovered=False):
+      self, parser_mediator, record_index, evtx_record, file_offset=0,
+      recovered=False):
     """Extract data from a Windows XML EventLog (EVTX) record.
 
     Args:
@@ -155,11 +418,19 @@ class WinEvtxParser(interface.FileObjectParser):
           and other components, such as storage and dfVFS.
       record_index (int): event record index.
       evtx_record (pyevtx.record): event record.
+      file_offset (Optional[int]): offset of the chunks of an event source
+          partition relative to the first chunk of the file, which is added
+          to the offset of the event record.
       recovered (Optional[bool]): True if the record was recovered.
     """
     event_data = self._GetEventDataFromRecord(
         parser_mediator, record_index, evtx_record, recovered=recovered)
 
+    # Versions of pyevtx that do not support the offset of an event record
+    # return 0.
+    if event_data.offset:
+      event_data.offset += file_offset
+
     try:
       creation_time = evtx_record.get_creation_time_as_integer()
     except OverflowError as exception:
@@ -196,32 +467,47 @@ class WinEvtxParser(interface.FileObjectParser):
 
     parser_mediator.ProduceEventData(event_data)
 
-  def _ParseRecords(self, parser_mediator, evtx_file):
+  def _ParseRecords(
+      self, parser_mediator, evtx_file, number_of_records, file_offset=0):
     """Parses Windows XML EventLog (EVTX) records.
 
     Args:
       parser_mediator (ParserMediator): mediates interactions between parsers
           and other components, such as storage and dfVFS.
       evtx_file (pyevtx.file): Windows XML EventLog (EVTX) file.
+      number_of_records (int): number of event records to parse.
+      file_offset (Optional[int]): offset of the chunks of an event source
+          partition relative to the first chunk of the file, which is added
+          to the offsets of the event records.
     """
     # To handle errors when parsing a Windows XML EventLog (EVTX) file in the
     # most granular way the following code iterates over every event record.
     # The call to evt_file.get_record() and access to members of evt_record
     # should be called within a try-except.
 
-    for record_index in range(evtx_file.number_of_records):
+    for record_index in range(number_of_records):
       if parser_mediator.abort:
         break
 
       try:
         evtx_record = evtx_file.get_record(record_index)
-        self._ParseRecord(parser_mediator, record_index, evtx_record)
+        self._ParseRecord(
+            parser_mediator, record_index, evtx_record,
+            file_offset=file_offset)
 
       except IOError as exception:
         parser_mediator.ProduceExtractionWarning(
             'unable to parse event record: {0:d} with error: {1!s}'.format(
                 record_index, exception))
 
+  def _ParseRecoveredRecords(self, parser_mediator, evtx_file):
+    """Parses recovered Windows XML EventLog (EVTX) records.
+
+    Args:
+      parser_mediator (ParserMediator): mediates interactions between parsers
+          and other components, such as storage and dfVFS.
+      evtx_file (pyevtx.file): Windows XML EventLog (EVTX) file.
+    """
     for record_index in range(evtx_file.number_of_recovered_records):
       if parser_mediator.abort:
         break
@@ -250,11 +536,22 @@ class WinEvtxParser(interface.FileObjectParser):
   def ParseFileObject(self, parser_mediator, file_object):
     """Parses a Windows XML EventLog (EVTX) file-like object.
 
+    Files that consist of more chunks than fit in a single partition are
+    split into event source partitions when event source partitioning is
+    enabled. The first partition and the recovered event records are parsed
+    by the task that parses the file, the other partitions by separate tasks
+    that only read the chunks of their partition.
+
     Args:
       parser_mediator (ParserMediator): mediates interactions between parsers
           and other components, such as storage and dfVFS.
       file_object (dfvfs.FileIO): a file-like object.
     """
+    partition = parser_mediator.event_source_partition
+    if partition:
+      self._ParsePartition(parser_mediator, file_object, partition)
+      return
+
     code_page = parser_mediator.GetCodePage()
 
     evtx_file = pyevtx.file()
@@ -268,7 +565,21 @@ class WinEvtxParser(interface.FileObjectParser):
       return
 
     try:
-      self._ParseRecords(parser_mediator, evtx_file)
+      number_of_records = evtx_file.number_of_records
+
+      if parser_mediator.event_source_partitioning:
+        partitions = self._GetPartitions(file_object, number_of_records)
+        if partitions:
+          _, _, number_of_records = partitions.pop(0)
+
+          # The remaining partitions are parsed by separate tasks.
+          for chunk_start, chunk_end, _ in partitions:
+            parser_mediator.ProduceEventSourcePartition(
+                self.NAME, chunk_start, chunk_end)
+
+      self._ParseRecords(parser_mediator, evtx_file, number_of_records)
+      self._ParseRecoveredRecords(parser_mediator, evtx_file)
+
     finally:
       evtx_file.close()
 
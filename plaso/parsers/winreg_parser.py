@@ -75,9 +75,11 @@ class WinRegistryParser(interface.FileObjectParser):
     self._plugins_per_key_path = {}
     self._plugins_without_key_paths = []
 
-    if not self._plugin_classes:
+    if self._plugin_classes is None:
       return
 
+    self._ImportPluginModules()
+
     key_paths = []
 
     for plugin_name, plugin_class in self._plugin_classes.items():
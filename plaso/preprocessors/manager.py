@@ -1,6 +1,8 @@
 # -*- coding: utf-8 -*-
 """The preprocess plugins manager."""
 
+import time
+
 from dfvfs.helpers import file_system_searcher
 from dfvfs.helpers import windows_path_resolver
 from dfvfs.lib import errors as dfvfs_errors
@@ -162,6 +164,7 @@ class PreprocessPluginsManager(object):
           f'Running file system preprocessor plugin: {class_name:s} with '
           f'artifact definition: {definition_name:s}'))
 
+      start_time = time.perf_counter()
       try:
         preprocess_plugin.Collect(
             mediator, artifact_definition, searcher, file_system)
@@ -170,6 +173,9 @@ class PreprocessPluginsManager(object):
             f'Preprocessor plugin: {class_name:s} with artifact definition: '
             f'{definition_name:s} was unable to collect value with error: '
             f'{exception!s}'))
+      finally:
+        mediator.AddPluginDuration(
+            class_name, time.perf_counter() - start_time)
 
   @classmethod
   def CollectFromKnowledgeBase(cls, mediator):
@@ -184,11 +190,15 @@ class PreprocessPluginsManager(object):
       logger.debug(
           f'Running knowledge base preprocessor plugin: {class_name:s}')
 
+      start_time = time.perf_counter()
       try:
         preprocess_plugin.Collect(mediator)
       except errors.PreProcessFail as exception:
         logger.warning(
             f'Unable to collect knowledge base value with error: {exception!s}')
+      finally:
+        mediator.AddPluginDuration(
+            class_name, time.perf_counter() - start_time)
 
   @classmethod
   def CollectFromWindowsRegistry(cls, artifacts_registry, mediator, searcher):
@@ -220,6 +230,7 @@ class PreprocessPluginsManager(object):
       logger.debug((
           f'Running Windows Registry preprocessor plugin: '
           f'{preprocess_plugin.ARTIFACT_DEFINITION_NAME:s}'))
+      start_time = time.perf_counter()
       try:
         preprocess_plugin.Collect(mediator, artifact_definition, searcher)
       except (IOError, errors.PreProcessFail) as exception:
@@ -227,6 +238,10 @@ class PreprocessPluginsManager(object):
             f'Unable to collect value from artifact definition: '
             f'{preprocess_plugin.ARTIFACT_DEFINITION_NAME:s} with error: '
             f'{exception!s}'))
+      finally:
+        mediator.AddPluginDuration(
+            preprocess_plugin.__class__.__name__,
+            time.perf_counter() - start_time)
 
   @classmethod
   def DeregisterPlugin(cls, plugin_class):
@@ -30,6 +30,7 @@ class PreprocessMediator(object):
     self._available_time_zones = {}
     self._environment_variables = {}
     self._file_entry = None
+    self._plugin_durations = {}
     self._storage_writer = storage_writer
     self._windows_eventlog_providers_helper = (
         eventlog_providers.WindowsEventLogProvidersHelper())
@@ -86,6 +87,16 @@ class PreprocessMediator(object):
     # TODO: change storage and pre-processor to handle more than 1 hostname.
     self.hostname = hostname_artifact
 
+  def AddPluginDuration(self, plugin_name, duration):
+    """Adds the duration of a run of a preprocess plugin.
+
+    Args:
+      plugin_name (str): name of the preprocess plugin.
+      duration (float): duration of the run in seconds.
+    """
+    self._plugin_durations[plugin_name] = (
+        self._plugin_durations.get(plugin_name, 0.0) + duration)
+
   def AddTimeZoneInformation(self, time_zone_artifact):
     """Adds a time zone defined by the operating system.
 
@@ -184,6 +195,17 @@ class PreprocessMediator(object):
     """
     return self._environment_variables.values()
 
+  def GetPluginDurations(self):
+    """Retrieves the durations of the runs of the preprocess plugins.
+
+    The durations are not reset by Reset, so that they cover all the file
+    systems that were preprocessed.
+
+    Returns:
+      dict[str, float]: total duration in seconds per preprocess plugin name.
+    """
+    return dict(self._plugin_durations)
+
   def GetValue(self, identifier):
     """Retrieves a value by identifier.
 
@@ -17,6 +17,8 @@ from plaso.engine import engine
 from plaso.engine import extractors
 from plaso.engine import logger
 from plaso.engine import process_info
+from plaso.engine import profilers
+from plaso.engine import storage_counters
 from plaso.engine import timeliner
 from plaso.engine import worker
 from plaso.lib import definitions
@@ -428,6 +430,8 @@ class SingleProcessEngine(engine.BaseEngine):
         processing_configuration.preferred_language)
     parser_mediator.SetTemporaryDirectory(
         processing_configuration.temporary_directory)
+    parser_mediator.SetWinEvtxXMLTemplates(
+        processing_configuration.extraction.winevtx_xml_templates)
 
     parser_mediator.SetWindowsEventLogProviders(windows_event_log_providers)
 
@@ -519,12 +523,17 @@ class SingleProcessEngine(engine.BaseEngine):
         for parser_count in self._storage_writer.GetAttributeContainers(
             'parser_count')})
 
+    extraction_storage_counters = storage_counters.StorageCounters()
+    self._storage_writer.SetStorageCounters(extraction_storage_counters)
+
     try:
       self._ProcessSource(parser_mediator, file_system_path_specs)
 
       self._ProcessEventData()
 
     finally:
+      self._storage_writer.SetStorageCounters(None)
+
       # Stop the status update thread after close of the storage writer
       # so we include the storage sync to disk in the status updates.
       self._StopStatusUpdateThread()
@@ -544,6 +553,11 @@ class SingleProcessEngine(engine.BaseEngine):
       self._StopProfiling()
       parser_mediator.StopProfiling()
 
+    profiling_configuration = self._processing_configuration.profiling
+    if profiling_configuration and profiling_configuration.HaveProfileTrace():
+      profilers.TraceProfiler.MergeSampleFiles(
+          profiling_configuration, [self._name])
+
     for key, value in self._event_data_timeliner.parsers_counter.items():
       parser_count = self._parsers_counter.get(key, None)
       if parser_count:
@@ -565,6 +579,8 @@ class SingleProcessEngine(engine.BaseEngine):
         self._parsers_counter[key] = parser_count
         self._storage_writer.AddAttributeContainer(parser_count)
 
+    extraction_storage_counters.WriteCounters(self._storage_writer)
+
     if self._abort:
       logger.debug('Processing aborted.')
       self._processing_status.aborted = True
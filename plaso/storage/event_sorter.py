@@ -0,0 +1,159 @@
+# -*- coding: utf-8 -*-
+"""External merge sort of events in chronological order."""
+
+import array
+import heapq
+import os
+import tempfile
+
+
+class ExternalEventSorter(object):
+  """External merge sort of events in chronological order.
+
+  The sorter sorts the sort keys of the events, that is the timestamp and
+  the index of an event in the store, rather than the events themselves.
+  Sort keys are sorted in memory in runs of a fixed size, that is determined
+  by the memory limit. If there is more than 1 run, the runs are written as
+  compact binary data to a scratch directory and merged.
+
+  The sort keys are ordered by timestamp and then by index, so that events
+  with the same timestamp are returned in the order they were added to
+  the store.
+  """
+
+  # Estimated number of bytes of memory used by an in-memory sort key.
+  _BYTES_PER_SORT_KEY = 64
+
+  _DEFAULT_MEMORY_LIMIT = 256 * 1024 * 1024
+
+  # Number of bits of the index of the event in the store in a sort key.
+  _INDEX_BITS = 40
+
+  _INDEX_MASK = (1 << _INDEX_BITS) - 1
+
+  # Number of sort keys that are read at once from a run file.
+  _NUMBER_OF_SORT_KEYS_PER_READ = 8192
+
+  # Offset that is added to the timestamp to make it an unsigned integer.
+  _TIMESTAMP_OFFSET = 1 << 63
+
+  def __init__(self, memory_limit=None, scratch_path=None):
+    """Initializes an external event sorter.
+
+    Args:
+      memory_limit (Optional[int]): maximum amount of memory, in bytes, used
+          to sort runs in memory, where None represents the default of 256 MiB.
+      scratch_path (Optional[str]): path of the directory in which to create
+          the scratch directory for the run files, where None represents
+          the default temporary directory.
+
+    Raises:
+      ValueError: if the memory limit is too small to sort a run.
+    """
+    memory_limit = memory_limit or self._DEFAULT_MEMORY_LIMIT
+    if memory_limit < self._BYTES_PER_SORT_KEY * 1024:
+      raise ValueError(f'Memory limit: {memory_limit:d} too small.')
+
+    super(ExternalEventSorter, self).__init__()
+    self._run_size = memory_limit // self._BYTES_PER_SORT_KEY
+    self._scratch_path = scratch_path
+
+  def _ReadRun(self, path):
+    """Reads the sort keys of a run file.
+
+    Args:
+      path (str): path of the run file.
+
+    Yields:
+      int: sort key.
+    """
+    read_size = self._NUMBER_OF_SORT_KEYS_PER_READ * 16
+
+    with open(path, 'rb') as file_object:
+      data = file_object.read(read_size)
+      while data:
+        values = array.array('Q')
+        values.frombytes(data)
+
+        for value_index in range(0, len(values), 2):
+          yield (values[value_index] << self._INDEX_BITS) | (
+              values[value_index + 1])
+
+        data = file_object.read(read_size)
+
+  def _WriteRun(self, path, sort_keys):
+    """Writes the sort keys of a run to a run file.
+
+    A sort key is stored as 2 64-bit values: the timestamp, including
+    the offset, and the index.
+
+    Args:
+      path (str): path of the run file.
+      sort_keys (list[int]): sorted sort keys of the run.
+    """
+    with open(path, 'wb') as file_object:
+      for key_index in range(
+          0, len(sort_keys), self._NUMBER_OF_SORT_KEYS_PER_READ):
+        values = array.array('Q')
+        for sort_key in sort_keys[
+            key_index:key_index + self._NUMBER_OF_SORT_KEYS_PER_READ]:
+          values.append(sort_key >> self._INDEX_BITS)
+          values.append(sort_key & self._INDEX_MASK)
+
+        values.tofile(file_object)
+
+  def SortKeys(self, sort_keys):
+    """Sorts sort keys of events.
+
+    Args:
+      sort_keys (iterable[tuple[int, int]]): timestamp and index of
+          the events in the store.
+
+    Yields:
+      tuple[int, int]: timestamp and index of the events in increasing
+          chronological order.
+    """
+    scratch_directory = None
+    run_paths = []
+    run = []
+
+    try:
+      for timestamp, index in sort_keys:
+        timestamp += self._TIMESTAMP_OFFSET
+        run.append((timestamp << self._INDEX_BITS) | index)
+
+        if len(run) >= self._run_size:
+          run.sort()
+
+          # The scratch directory is only created when a run needs to be
+          # written, so that sorting in memory does not touch the disk.
+          if not scratch_directory:
+            scratch_directory = tempfile.TemporaryDirectory(
+                dir=self._scratch_path, prefix='plaso-sort-')
+
+          run_path = os.path.join(
+              scratch_directory.name, f'run{len(run_paths):06d}')
+          self._WriteRun(run_path, run)
+          run_paths.append(run_path)
+
+          run = []
+
+      run.sort()
+
+      # The last run is merged from memory instead of being written to
+      # a run file.
+      if not run_paths:
+        merged_sort_keys = run
+      else:
+        runs = [self._ReadRun(run_path) for run_path in run_paths]
+        runs.append(run)
+        merged_sort_keys = heapq.merge(*runs)
+
+      for sort_key in merged_sort_keys:
+        yield (
+            (sort_key >> self._INDEX_BITS) - self._TIMESTAMP_OFFSET,
+            sort_key & self._INDEX_MASK)
+
+    finally:
+      if scratch_directory:
+        scratch_directory.cleanup()
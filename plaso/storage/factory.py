@@ -86,13 +86,17 @@ class StorageFactory(object):
     return None
 
   @classmethod
-  def CreateTaskStorageReader(cls, storage_format, task, path):
+  def CreateTaskStorageReader(
+      cls, storage_format, task, path, redis_client=None):
     """Creates a task storage reader.
 
     Args:
       storage_format (str): storage format.
       task (Task): task the storage changes are part of.
       path (str): path to the storage file.
+      redis_client (Optional[Redis]): Redis client of the Redis task storage.
+          If not specified a new client will be opened connected to the
+          default Redis instance.
 
     Returns:
       StorageReader: a storage reader or None if the storage file cannot be
@@ -103,7 +107,7 @@ class StorageFactory(object):
 
     if storage_format == definitions.STORAGE_FORMAT_REDIS and redis_reader:
       return redis_reader.RedisStorageReader(
-          task.session_identifier, task.identifier)
+          task.session_identifier, task.identifier, redis_client=redis_client)
 
     return None
 
@@ -4,6 +4,7 @@
 from acstore import fake_store as acstore_fake_store
 
 from plaso.containers import events
+from plaso.storage import event_sorter
 from plaso.storage.fake import event_heap
 
 
@@ -19,6 +20,8 @@ class FakeStore(acstore_fake_store.FakeAttributeContainerStore):
   def __init__(self):
     """Initializes a fake (in-memory only) store."""
     super(FakeStore, self).__init__()
+    self._external_sort_memory_limit = None
+    self._external_sort_scratch_path = None
     self._serializers_profiler = None
     self.serialization_format = None
 
@@ -40,6 +43,23 @@ class FakeStore(acstore_fake_store.FakeAttributeContainerStore):
       raise IOError('Unable to read from closed storage writer.')
 
     generator = self.GetAttributeContainers(self._CONTAINER_TYPE_EVENT)
+
+    if self._external_sort_memory_limit:
+      sort_keys = (
+          (event.timestamp, event_index)
+          for event_index, event in enumerate(generator)
+          if not time_range or (
+              time_range.start_timestamp <= event.timestamp <=
+              time_range.end_timestamp))
+
+      sorter = event_sorter.ExternalEventSorter(
+          memory_limit=self._external_sort_memory_limit,
+          scratch_path=self._external_sort_scratch_path)
+
+      return (
+          self.GetAttributeContainerByIndex(self._CONTAINER_TYPE_EVENT, index)
+          for _, index in sorter.SortKeys(sort_keys))
+
     sorted_events = event_heap.EventHeap()
 
     for event_index, event in enumerate(generator):
@@ -54,6 +74,20 @@ class FakeStore(acstore_fake_store.FakeAttributeContainerStore):
 
     return iter(sorted_events.PopEvents())
 
+  def SetExternalSort(self, memory_limit, scratch_path=None):
+    """Sets the external merge sort of events.
+
+    Args:
+      memory_limit (int): maximum amount of memory, in bytes, used to sort
+          the events, where None or 0 represents the events are sorted on
+          a heap.
+      scratch_path (Optional[str]): path of the directory in which to write
+          the sorted runs, where None represents the default temporary
+          directory.
+    """
+    self._external_sort_memory_limit = memory_limit
+    self._external_sort_scratch_path = scratch_path
+
   def SetSerializersProfiler(self, serializers_profiler):
     """Sets the serializers profiler.
 
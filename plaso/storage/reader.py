@@ -1,6 +1,8 @@
 # -*- coding: utf-8 -*-
 """The storage reader."""
 
+import collections
+
 from plaso.containers import events
 from plaso.containers import sessions
 from plaso.storage import logger
@@ -72,6 +74,26 @@ class StorageReader(object):
     return self._store.GetAttributeContainers(
         container_type, filter_expression=filter_expression)
 
+  def GetAttributeValuesCounts(self, container_type, attribute_names):
+    """Retrieves the number of attribute containers per attribute values.
+
+    Args:
+      container_type (str): attribute container type.
+      attribute_names (list[str]): names of the attributes to group
+          the attribute containers by.
+
+    Yields:
+      tuple[tuple[object], int]: values of the attributes and the number of
+          attribute containers with these values.
+    """
+    values_counter = collections.Counter()
+    for container in self._store.GetAttributeContainers(container_type):
+      values = tuple(
+          getattr(container, name, None) for name in attribute_names)
+      values_counter[values] += 1
+
+    yield from values_counter.items()
+
   def GetEventTagByEventIdentifer(self, event_identifier):
     """Retrieves the event tag of a specific event.
 
@@ -158,6 +180,24 @@ class StorageReader(object):
     """
     return self._store.HasAttributeContainers(container_type)
 
+  def SetExternalSort(self, memory_limit, scratch_path=None):
+    """Sets the external merge sort of events.
+
+    The external merge sort is used by GetSortedEvents to sort the events
+    with a bounded memory footprint, where the sorted runs are written to
+    a scratch directory.
+
+    Args:
+      memory_limit (int): maximum amount of memory, in bytes, used to sort
+          the events, where None or 0 represents the events are sorted by
+          the store.
+      scratch_path (Optional[str]): path of the directory in which to write
+          the sorted runs, where None represents the default temporary
+          directory.
+    """
+    if self._store:
+      self._store.SetExternalSort(memory_limit, scratch_path=scratch_path)
+
   def SetSerializersProfiler(self, serializers_profiler):
     """Sets the serializers profiler.
 
@@ -565,6 +565,21 @@ class RedisAttributeContainerStore(BaseRedisAttributeContainerStore):
       yield self.GetAttributeContainerByIdentifier(
           self._CONTAINER_TYPE_EVENT, identifier)
 
+  # pylint: disable=unused-argument
+  def SetExternalSort(self, memory_limit, scratch_path=None):
+    """Sets the external merge sort of events.
+
+    The Redis store maintains a sorted index of the events and therefore does
+    not use an external merge sort.
+
+    Args:
+      memory_limit (int): maximum amount of memory, in bytes, used to sort
+          the events.
+      scratch_path (Optional[str]): path of the directory in which to write
+          the sorted runs.
+    """
+    return
+
   def SetSerializersProfiler(self, serializers_profiler):
     """Sets the serializers profiler.
 
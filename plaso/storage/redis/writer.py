@@ -81,7 +81,7 @@ class RedisStorageWriter(writer.StorageWriter):
   # pylint: disable=arguments-differ
   def Open(
       self, redis_client=None, session_identifier=None, task_identifier=None,
-      **unused_kwargs):
+      url=None, **unused_kwargs):
     """Opens the storage writer.
 
     Args:
@@ -90,6 +90,8 @@ class RedisStorageWriter(writer.StorageWriter):
           will be opened connected to the Redis instance specified by 'url'.
       session_identifier (Optional[str]): session identifier.
       task_identifier (Optional[str]): task identifier.
+      url (Optional[str]): URL for a Redis database. If not specified, the
+          default Redis URL will be used.
 
     Raises:
       IOError: if the storage writer is already opened.
@@ -108,4 +110,4 @@ class RedisStorageWriter(writer.StorageWriter):
 
     self._store.Open(
         redis_client=redis_client, session_identifier=session_identifier,
-        task_identifier=task_identifier)
+        task_identifier=task_identifier, url=url)
@@ -18,3 +18,18 @@ class SQLiteStorageReader(reader.StorageReader):
     self._path = path
     self._store = sqlite_file.SQLiteStorageFile()
     self._store.Open(path=path)
+
+  def GetAttributeValuesCounts(self, container_type, attribute_names):
+    """Retrieves the number of attribute containers per attribute values.
+
+    Args:
+      container_type (str): attribute container type.
+      attribute_names (list[str]): names of the attributes to group
+          the attribute containers by.
+
+    Yields:
+      tuple[tuple[object], int]: values of the attributes and the number of
+          attribute containers with these values.
+    """
+    yield from self._store.GetAttributeValuesCounts(
+        container_type, attribute_names)
@@ -2,6 +2,7 @@
 """SQLite-based storage file."""
 
 import ast
+import itertools
 import json
 import sqlite3
 import zlib
@@ -12,6 +13,7 @@ from acstore.containers import interface as containers_interface
 from plaso.containers import events
 from plaso.lib import definitions
 from plaso.serializer import json_serializer
+from plaso.storage import event_sorter
 
 
 class SQLiteStorageFile(sqlite_store.SQLiteAttributeContainerStore):
@@ -33,11 +35,38 @@ class SQLiteStorageFile(sqlite_store.SQLiteAttributeContainerStore):
   _CONTAINER_TYPE_EVENT_DATA = events.EventData.CONTAINER_TYPE
   _CONTAINER_TYPE_EVENT_TAG = events.EventTag.CONTAINER_TYPE
 
-  def __init__(self):
-    """Initializes a SQLite-based storage file."""
+  # Maximum number of attribute containers of the same type that are written
+  # by a single query. The number of query parameters is limited to 32766
+  # as of SQLite 3.32 and to 999 before, where an attribute container has
+  # at most 18 columns.
+  _MAXIMUM_WRITE_CACHE_SIZE = (
+      500 if sqlite3.sqlite_version_info >= (3, 32, 0) else 50)
+
+  # Number of events that are read at once when sorted with an external
+  # merge sort.
+  _NUMBER_OF_EVENTS_PER_READ = 512
+
+  # Pragmas that are applied to a task storage file opened for writing.
+  # A task storage file is removed after it has been merged and does not need
+  # to be recoverable, hence no rollback journal and no file locking between
+  # transactions are used.
+  _TASK_STORAGE_PRAGMAS = [
+      'PRAGMA journal_mode=OFF',
+      'PRAGMA locking_mode=EXCLUSIVE']
+
+  def __init__(self, storage_type=definitions.STORAGE_TYPE_SESSION):
+    """Initializes a SQLite-based storage file.
+
+    Args:
+      storage_type (Optional[str]): storage type.
+    """
     super(SQLiteStorageFile, self).__init__()
+    self._external_sort_memory_limit = None
+    self._external_sort_scratch_path = None
     self._serializer = json_serializer.JSONAttributeContainerSerializer
     self._serializers_profiler = None
+    self._storage_type = storage_type
+    self._write_ahead_log = False
 
     self.compression_format = definitions.COMPRESSION_FORMAT_ZLIB
 
@@ -179,6 +208,106 @@ class SQLiteStorageFile(sqlite_store.SQLiteAttributeContainerStore):
 
     return container
 
+  def _ExecuteQuery(self, query, values=None):
+    """Executes a query.
+
+    Args:
+      query (str): SQL query.
+      values (Optional[tuple[object]]): values of the query parameters.
+
+    Raises:
+      IOError: when there is an error querying the storage file.
+      OSError: when there is an error querying the storage file.
+    """
+    try:
+      self._cursor.execute(query, values or ())
+    except (sqlite3.InterfaceError, sqlite3.OperationalError) as exception:
+      raise IOError(f'Unable to query storage file with error: {exception!s}')
+
+  def _GetEventSortKeys(self, filter_expression=None):
+    """Retrieves the sort keys of the events.
+
+    Only the timestamp and identifier columns are read, which is considerably
+    faster than reading and deserializing the events.
+
+    Args:
+      filter_expression (Optional[str]): SQL expression to filter results by.
+
+    Yields:
+      tuple[int, int]: timestamp and index of an event.
+
+    Raises:
+      IOError: when there is an error querying the storage file.
+      OSError: when there is an error querying the storage file.
+    """
+    self._CommitWriteCache(self._CONTAINER_TYPE_EVENT)
+
+    if self._attribute_container_sequence_numbers[self._CONTAINER_TYPE_EVENT]:
+      query = (
+          f'SELECT _identifier, timestamp FROM '
+          f'{self._CONTAINER_TYPE_EVENT:s}')
+      if filter_expression:
+        query = ' WHERE '.join([query, filter_expression])
+
+      # Use a local cursor to prevent another query interrupting the generator.
+      cursor = self._connection.cursor()
+
+      try:
+        cursor.execute(query)
+      except (sqlite3.InterfaceError, sqlite3.OperationalError) as exception:
+        raise IOError(f'Unable to query storage file with error: {exception!s}')
+
+      for identifier, timestamp in cursor:
+        yield timestamp, identifier - 1
+
+  def _GetSortedEventsWithExternalSort(
+      self, column_names, filter_expression=None):
+    """Retrieves the events in increasing chronological order.
+
+    The events are sorted with an external merge sort, which has a bounded
+    memory footprint, instead of by SQLite.
+
+    Args:
+      column_names (list[str]): names of the columns to retrieve.
+      filter_expression (Optional[str]): SQL expression to filter results by.
+
+    Yields:
+      EventObject: event.
+
+    Raises:
+      IOError: when there is an error querying the storage file.
+      OSError: when there is an error querying the storage file.
+    """
+    sorter = event_sorter.ExternalEventSorter(
+        memory_limit=self._external_sort_memory_limit,
+        scratch_path=self._external_sort_scratch_path)
+
+    sort_keys = self._GetEventSortKeys(filter_expression=filter_expression)
+    sorted_sort_keys = sorter.SortKeys(sort_keys)
+
+    # The events are read in batches, by their identifiers, since reading
+    # the events one by one is considerably slower.
+    identifiers = [
+        index + 1 for _, index in itertools.islice(
+            sorted_sort_keys, self._NUMBER_OF_EVENTS_PER_READ)]
+    while identifiers:
+      identifiers_string = ', '.join([
+          f'{identifier:d}' for identifier in identifiers])
+
+      events_per_identifier = {}
+      for event in self._GetAttributeContainersWithFilter(
+          self._CONTAINER_TYPE_EVENT, column_names=column_names,
+          filter_expression=f'_identifier IN ({identifiers_string:s})'):
+        identifier = event.GetIdentifier()
+        events_per_identifier[identifier.sequence_number] = event
+
+      for identifier in identifiers:
+        yield events_per_identifier[identifier]
+
+      identifiers = [
+          index + 1 for _, index in itertools.islice(
+              sorted_sort_keys, self._NUMBER_OF_EVENTS_PER_READ)]
+
   def _ReadAndCheckStorageMetadata(self, check_readable_only=False):
     """Reads storage metadata and checks that the values are valid.
 
@@ -311,6 +440,65 @@ class SQLiteStorageFile(sqlite_store.SQLiteAttributeContainerStore):
 
       self._CacheAttributeContainerByIndex(container, next_sequence_number - 1)
 
+  def Close(self):
+    """Closes the storage file.
+
+    If the write-ahead log was enabled the storage file is reverted to use
+    a rollback journal, so that it can be read without the write-ahead log
+    files.
+
+    Raises:
+      IOError: if the storage file is already closed.
+      OSError: if the storage file is already closed.
+    """
+    if self._is_open and not self._read_only:
+      self.Commit()
+
+    if self._is_open and self._write_ahead_log:
+      self._ExecuteQuery('PRAGMA journal_mode=DELETE')
+      self._write_ahead_log = False
+
+    super(SQLiteStorageFile, self).Close()
+
+  def Commit(self):
+    """Commits the attribute containers written since the last commit.
+
+    Raises:
+      IOError: when there is an error querying the storage file.
+      OSError: when there is an error querying the storage file.
+    """
+    self._RaiseIfNotWritable()
+
+    if self._storage_profiler:
+      self._storage_profiler.StartTiming('commit')
+
+    try:
+      self._Flush()
+    except sqlite3.Error as exception:
+      raise IOError(f'Unable to commit storage file with error: {exception!s}')
+
+    finally:
+      if self._storage_profiler:
+        self._storage_profiler.StopTiming('commit')
+        self._storage_profiler.Sample(
+            'commit', 'write', self._storage_type, 0, 0)
+
+  def EnableWriteAheadLog(self):
+    """Enables the write-ahead log.
+
+    Changes are committed before the write-ahead log is enabled. With
+    the write-ahead log the storage file only contains committed changes if
+    the process writing it is terminated.
+
+    Raises:
+      IOError: when there is an error querying the storage file.
+      OSError: when there is an error querying the storage file.
+    """
+    self.Commit()
+
+    self._ExecuteQuery('PRAGMA journal_mode=WAL')
+    self._write_ahead_log = True
+
   def GetAttributeContainerByIndex(self, container_type, index):
     """Retrieves a specific attribute container.
 
@@ -423,6 +611,56 @@ class SQLiteStorageFile(sqlite_store.SQLiteAttributeContainerStore):
           container_type, column_names=['_data'],
           filter_expression=sql_filter_expression)
 
+  def GetAttributeValuesCounts(self, container_type, attribute_names):
+    """Retrieves the number of attribute containers per attribute values.
+
+    The attribute containers are aggregated by the storage file, which is
+    more efficient than reading and deserializing every attribute container.
+
+    Args:
+      container_type (str): attribute container type.
+      attribute_names (list[str]): names of the attributes to group
+          the attribute containers by.
+
+    Yields:
+      tuple[tuple[object], int]: values of the attributes and the number of
+          attribute containers with these values.
+
+    Raises:
+      IOError: when there is an error querying the storage file or if
+          the attributes are not defined by the attribute container schema.
+      OSError: when there is an error querying the storage file or if
+          the attributes are not defined by the attribute container schema.
+    """
+    schema = self._GetAttributeContainerSchema(container_type)
+    for name in attribute_names:
+      if name not in schema:
+        raise IOError((
+            f'Unsupported attribute container type: {container_type:s} '
+            f'attribute: {name:s}'))
+
+    self._CommitWriteCache(container_type)
+
+    if self._attribute_container_sequence_numbers[container_type]:
+      column_names_string = ', '.join(attribute_names)
+      query = (f'SELECT {column_names_string:s}, COUNT(*) '
+               f'FROM {container_type:s} GROUP BY {column_names_string:s}')
+
+      # Use a local cursor to prevent another query interrupting the generator.
+      cursor = self._connection.cursor()
+
+      try:
+        cursor.execute(query)
+      except (sqlite3.InterfaceError, sqlite3.OperationalError) as exception:
+        raise IOError(f'Unable to query storage file with error: {exception!s}')
+
+      for row in cursor:
+        values = tuple(
+            self._schema_helper.DeserializeValue(schema[name], row[index])
+            for index, name in enumerate(attribute_names))
+
+        yield values, row[-1]
+
   def GetSortedEvents(self, time_range=None):
     """Retrieves the events in increasing chronological order.
 
@@ -448,10 +686,75 @@ class SQLiteStorageFile(sqlite_store.SQLiteAttributeContainerStore):
 
       filter_expression = ' AND '.join(filter_expression)
 
+    if self._external_sort_memory_limit:
+      return self._GetSortedEventsWithExternalSort(
+          column_names, filter_expression=filter_expression)
+
     return self._GetAttributeContainersWithFilter(
         self._CONTAINER_TYPE_EVENT, column_names=column_names,
         filter_expression=filter_expression, order_by='timestamp')
 
+  # pylint: disable=arguments-differ
+  def Open(self, path=None, read_only=True, **unused_kwargs):
+    """Opens the storage file.
+
+    Args:
+      path (Optional[str]): path to the storage file.
+      read_only (Optional[bool]): True if the file should be opened in
+          read-only mode.
+
+    Raises:
+      IOError: if the storage file is already opened or if the database
+          cannot be connected.
+      OSError: if the storage file is already opened or if the database
+          cannot be connected.
+      ValueError: if path is missing.
+    """
+    super(SQLiteStorageFile, self).Open(path=path, read_only=read_only)
+
+    if not read_only and self._storage_type == definitions.STORAGE_TYPE_TASK:
+      for pragma in self._TASK_STORAGE_PRAGMAS:
+        self._ExecuteQuery(pragma)
+
+  def Rollback(self):
+    """Discards the attribute containers written since the last commit.
+
+    Raises:
+      IOError: when there is an error querying the storage file.
+      OSError: when there is an error querying the storage file.
+    """
+    self._RaiseIfNotWritable()
+
+    self._write_cache = {}
+
+    try:
+      self._connection.rollback()
+    except sqlite3.Error as exception:
+      raise IOError(
+          f'Unable to roll back storage file with error: {exception!s}')
+
+    self._attribute_container_cache.clear()
+
+    for container_type in self._containers_manager.GetContainerTypes():
+      next_sequence_number = self._GetNumberOfAttributeContainerRows(
+          container_type)
+      self._SetAttributeContainerNextSequenceNumber(
+          container_type, next_sequence_number)
+
+  def SetExternalSort(self, memory_limit, scratch_path=None):
+    """Sets the external merge sort of events.
+
+    Args:
+      memory_limit (int): maximum amount of memory, in bytes, used to sort
+          the events, where None or 0 represents the events are sorted by
+          SQLite.
+      scratch_path (Optional[str]): path of the directory in which to write
+          the sorted runs, where None represents the default temporary
+          directory.
+    """
+    self._external_sort_memory_limit = memory_limit
+    self._external_sort_scratch_path = scratch_path
+
   def SetSerializersProfiler(self, serializers_profiler):
     """Sets the serializers profiler.
 
@@ -459,3 +762,43 @@ class SQLiteStorageFile(sqlite_store.SQLiteAttributeContainerStore):
       serializers_profiler (SerializersProfiler): serializers profiler.
     """
     self._serializers_profiler = serializers_profiler
+
+  def TruncateAttributeContainers(self, container_type, number_of_containers):
+    """Removes the attribute containers of a type after a number of them.
+
+    Args:
+      container_type (str): attribute container type.
+      number_of_containers (int): number of attribute containers to keep.
+
+    Raises:
+      IOError: when there is an error querying the storage file.
+      OSError: when there is an error querying the storage file.
+    """
+    self._RaiseIfNotWritable()
+
+    self._CommitWriteCache(container_type)
+
+    if not self._HasTable(container_type):
+      return
+
+    self._ExecuteQuery(
+        f'DELETE FROM {container_type:s} WHERE _identifier > ?',
+        (number_of_containers, ))
+
+    # Reset the autoincrement value so that the identifiers of the attribute
+    # containers that are added next match their sequence numbers.
+    self._ExecuteQuery(
+        'UPDATE sqlite_sequence SET seq = ? WHERE name = ?',
+        (number_of_containers, container_type))
+
+    next_sequence_number = self._GetNumberOfAttributeContainerRows(
+        container_type)
+    self._SetAttributeContainerNextSequenceNumber(
+        container_type, next_sequence_number)
+
+    lookup_key_prefix = f'{container_type:s}.'
+    for lookup_key in list(self._attribute_container_cache.keys()):
+      if lookup_key.startswith(lookup_key_prefix):
+        index = int(lookup_key[len(lookup_key_prefix):], 10)
+        if index >= next_sequence_number:
+          del self._attribute_container_cache[lookup_key]
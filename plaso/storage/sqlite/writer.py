@@ -15,12 +15,62 @@ class SQLiteStorageWriter(writer.StorageWriter):
     Args:
       storage_type (Optional[str]): storage type.
     """
-    super(SQLiteStorageWriter, self).__init__()
+    super(SQLiteStorageWriter, self).__init__(storage_type=storage_type)
     self._first_written_event_data_index = 0
     self._first_written_event_source_index = 0
     self._written_event_data_index = 0
     self._written_event_source_index = 0
 
+  def _ResetWrittenIndexes(self):
+    """Resets the indexes of the written event data and event sources.
+
+    The indexes are limited to the number of stored attribute containers,
+    for example after attribute containers were removed.
+    """
+    number_of_containers = self._store.GetNumberOfAttributeContainers(
+        self._CONTAINER_TYPE_EVENT_DATA)
+    self._first_written_event_data_index = min(
+        self._first_written_event_data_index, number_of_containers)
+    self._written_event_data_index = min(
+        self._written_event_data_index, number_of_containers)
+
+    number_of_containers = self._store.GetNumberOfAttributeContainers(
+        self._CONTAINER_TYPE_EVENT_SOURCE)
+    self._first_written_event_source_index = min(
+        self._first_written_event_source_index, number_of_containers)
+    self._written_event_source_index = min(
+        self._written_event_source_index, number_of_containers)
+
+  def Commit(self):
+    """Commits the attribute containers written since the last commit.
+
+    Raises:
+      IOError: when the storage writer is closed or when there is an error
+          writing to the storage file.
+      OSError: when the storage writer is closed or when there is an error
+          writing to the storage file.
+    """
+    self._RaiseIfNotWritable()
+
+    self._store.Commit()
+
+  def EnableWriteAheadLog(self):
+    """Enables the write-ahead log.
+
+    With the write-ahead log the storage file only contains the changes that
+    were committed if the process writing it is terminated, which allows an
+    interrupted session to be resumed.
+
+    Raises:
+      IOError: when the storage writer is closed or when there is an error
+          writing to the storage file.
+      OSError: when the storage writer is closed or when there is an error
+          writing to the storage file.
+    """
+    self._RaiseIfNotWritable()
+
+    self._store.EnableWriteAheadLog()
+
   def GetFirstWrittenEventData(self):
     """Retrieves the first event data that was written after open.
 
@@ -121,7 +171,7 @@ class SQLiteStorageWriter(writer.StorageWriter):
     if self._store:
       raise IOError('Storage writer already opened.')
 
-    self._store = sqlite_file.SQLiteStorageFile()
+    self._store = sqlite_file.SQLiteStorageFile(storage_type=self._storage_type)
 
     if self._serializers_profiler:
       self._store.SetSerializersProfiler(self._serializers_profiler)
@@ -140,3 +190,40 @@ class SQLiteStorageWriter(writer.StorageWriter):
         self._CONTAINER_TYPE_EVENT_SOURCE)
     self._first_written_event_source_index = number_of_containers
     self._written_event_source_index = self._first_written_event_source_index
+
+  def Rollback(self):
+    """Discards the attribute containers written since the last commit.
+
+    Raises:
+      IOError: when the storage writer is closed or when there is an error
+          writing to the storage file.
+      OSError: when the storage writer is closed or when there is an error
+          writing to the storage file.
+    """
+    self._RaiseIfNotWritable()
+
+    self._store.Rollback()
+
+    self._event_tag_per_event_identifier.clear()
+    self._ResetWrittenIndexes()
+
+  def TruncateAttributeContainers(self, container_type, number_of_containers):
+    """Removes the attribute containers of a type after a number of them.
+
+    Args:
+      container_type (str): attribute container type.
+      number_of_containers (int): number of attribute containers to keep.
+
+    Raises:
+      IOError: when the storage writer is closed or when there is an error
+          writing to the storage file.
+      OSError: when the storage writer is closed or when there is an error
+          writing to the storage file.
+    """
+    self._RaiseIfNotWritable()
+
+    self._store.TruncateAttributeContainers(
+        container_type, number_of_containers)
+
+    self._event_tag_per_event_identifier.clear()
+    self._ResetWrittenIndexes()
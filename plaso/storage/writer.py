@@ -39,6 +39,7 @@ class StorageWriter(reader.StorageReader):
     super(StorageWriter, self).__init__()
     self._attribute_containers_counter = collections.Counter()
     self._event_tag_per_event_identifier = collections.OrderedDict()
+    self._storage_counters = None
     self._storage_type = storage_type
 
   def _CacheEventTagByEventIdentifier(self, event_tag, event_identifier):
@@ -119,6 +120,9 @@ class StorageWriter(reader.StorageReader):
 
     self._attribute_containers_counter[container.CONTAINER_TYPE] += 1
 
+    if self._storage_counters:
+      self._storage_counters.CountAttributeContainer(container)
+
   def AddOrUpdateEventTag(self, event_tag):
     """Adds a new or updates an existing event tag.
 
@@ -202,6 +206,16 @@ class StorageWriter(reader.StorageReader):
   def Open(self, **kwargs):
     """Opens the storage writer."""
 
+  def SetStorageCounters(self, storage_counters):
+    """Sets the storage counters.
+
+    Args:
+      storage_counters (StorageCounters): storage counters that tally
+          the attribute containers added to the storage writer or None
+          to disable tallying.
+    """
+    self._storage_counters = storage_counters
+
   def UpdateAttributeContainer(self, container):
     """Updates an existing attribute container.
 
@@ -6,6 +6,7 @@ import collections
 import unittest
 
 from plaso.analysis import browser_search
+from plaso.containers import analysis_results
 from plaso.containers import reports
 from plaso.parsers import sqlite
 
@@ -23,11 +24,11 @@ class BrowserSearchAnalysisTest(test_lib.AnalysisPluginTestCase):
     storage_writer = self._ParseAndAnalyzeFile(
         ['chrome_history', 'History'], parser, plugin)
 
-    analysis_results = list(storage_writer.GetAttributeContainers(
+    stored_results = list(storage_writer.GetAttributeContainers(
         'browser_search_analysis_result'))
-    self.assertEqual(len(analysis_results), 4)
+    self.assertEqual(len(stored_results), 4)
 
-    analysis_result = analysis_results[2]
+    analysis_result = stored_results[2]
     self.assertEqual(analysis_result.search_engine, 'Google Search')
     self.assertEqual(analysis_result.search_term, 'really really funny cats')
     self.assertEqual(analysis_result.number_of_queries, 1)
@@ -50,6 +51,49 @@ class BrowserSearchAnalysisTest(test_lib.AnalysisPluginTestCase):
     self.assertEqual(
         analysis_report.analysis_counter, expected_analysis_counter)
 
+  def testReducePartitions(self):
+    """Tests the ReducePartitions function."""
+    plugin = browser_search.BrowserSearchPlugin()
+
+    partition_reports = []
+    for analysis_counter in (
+        {'Google Search:funny cats': 2},
+        {'Google Search:funny cats': 1, 'Bing:java plugin': 1}):
+      partition_report = reports.AnalysisReport(plugin_name='browser_search')
+      partition_report.analysis_counter = analysis_counter
+      partition_report.time_compiled = 1
+      partition_reports.append(partition_report)
+
+    partition_results = [
+        analysis_results.BrowserSearchAnalysisResult(
+            number_of_queries=2, search_engine='Google Search',
+            search_term='funny cats'),
+        analysis_results.BrowserSearchAnalysisResult(
+            number_of_queries=1, search_engine='Google Search',
+            search_term='funny cats'),
+        analysis_results.BrowserSearchAnalysisResult(
+            number_of_queries=1, search_engine='Bing',
+            search_term='java plugin')]
+
+    analysis_report, reduced_results = plugin.ReducePartitions(
+        partition_reports, partition_results)
+
+    expected_analysis_counter = collections.Counter({
+        'Bing:java plugin': 1,
+        'Google Search:funny cats': 3})
+    self.assertEqual(
+        analysis_report.analysis_counter, expected_analysis_counter)
+
+    self.assertEqual(len(reduced_results), 2)
+
+    number_of_queries = {
+        (analysis_result.search_engine, analysis_result.search_term): (
+            analysis_result.number_of_queries)
+        for analysis_result in reduced_results}
+    self.assertEqual(number_of_queries, {
+        ('Bing', 'java plugin'): 1,
+        ('Google Search', 'funny cats'): 3})
+
 
 if __name__ == '__main__':
   unittest.main()
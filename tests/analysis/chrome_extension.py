@@ -7,6 +7,7 @@ import os
 import unittest
 
 from plaso.analysis import chrome_extension
+from plaso.containers import analysis_results
 from plaso.containers import artifacts
 from plaso.containers import reports
 from plaso.lib import definitions
@@ -118,11 +119,11 @@ class ChromeExtensionTest(test_lib.AnalysisPluginTestCase):
     storage_writer = self._AnalyzeEvents(
         self._MACOS_TEST_EVENTS, plugin, user_accounts=user_accounts)
 
-    analysis_results = list(storage_writer.GetAttributeContainers(
+    stored_results = list(storage_writer.GetAttributeContainers(
         'chrome_extension_analysis_result'))
-    self.assertEqual(len(analysis_results), 2)
+    self.assertEqual(len(stored_results), 2)
 
-    analysis_result = analysis_results[0]
+    analysis_result = stored_results[0]
     self.assertEqual(analysis_result.extension, 'Google Drive')
     self.assertEqual(
         analysis_result.extension_identifier,
@@ -162,11 +163,11 @@ class ChromeExtensionTest(test_lib.AnalysisPluginTestCase):
     storage_writer = self._AnalyzeEvents(
         self._WINDOWS_TEST_EVENTS, plugin, user_accounts=user_accounts)
 
-    analysis_results = list(storage_writer.GetAttributeContainers(
+    stored_results = list(storage_writer.GetAttributeContainers(
         'chrome_extension_analysis_result'))
-    self.assertEqual(len(analysis_results), 3)
+    self.assertEqual(len(stored_results), 3)
 
-    analysis_result = analysis_results[0]
+    analysis_result = stored_results[0]
     self.assertEqual(analysis_result.extension, 'Google Keep - notes and lists')
     self.assertEqual(
         analysis_result.extension_identifier,
@@ -189,6 +190,48 @@ class ChromeExtensionTest(test_lib.AnalysisPluginTestCase):
     self.assertEqual(
         analysis_report.analysis_counter, expected_analysis_counter)
 
+  def testReducePartitions(self):
+    """Tests the ReducePartitions function."""
+    plugin = MockChromeExtensionPlugin()
+
+    partition_reports = []
+    for analysis_counter in ({'dude': 1}, {'dude': 2, 'frank': 1}):
+      partition_report = reports.AnalysisReport(
+          plugin_name='chrome_extension_test')
+      partition_report.analysis_counter = analysis_counter
+      partition_report.time_compiled = 1
+      partition_reports.append(partition_report)
+
+    # The Google Drive extension of dude was found in both partitions.
+    partition_results = [
+        analysis_results.ChromeExtensionAnalysisResult(
+            extension='Google Drive',
+            extension_identifier='apdfllckaahabafndbhieahigkjlhalf',
+            username='dude'),
+        analysis_results.ChromeExtensionAnalysisResult(
+            extension='Google Drive',
+            extension_identifier='apdfllckaahabafndbhieahigkjlhalf',
+            username='dude'),
+        analysis_results.ChromeExtensionAnalysisResult(
+            extension='Google Keep - notes and lists',
+            extension_identifier='hmjkmjkepdijhoojdojkdfohbdgmmhki',
+            username='dude'),
+        analysis_results.ChromeExtensionAnalysisResult(
+            extension='Google Drive',
+            extension_identifier='apdfllckaahabafndbhieahigkjlhalf',
+            username='frank')]
+
+    analysis_report, reduced_results = plugin.ReducePartitions(
+        partition_reports, partition_results)
+
+    self.assertEqual(len(reduced_results), 3)
+
+    expected_analysis_counter = collections.Counter({
+        'dude': 2,
+        'frank': 1})
+    self.assertEqual(
+        analysis_report.analysis_counter, expected_analysis_counter)
+
 
 if __name__ == '__main__':
   unittest.main()
@@ -149,6 +149,29 @@ class HashTaggingAnalysisPluginTest(test_lib.AnalysisPluginTestCase):
       labels.extend(event_tag.labels)
     self.assertEqual(len(labels), 0)
 
+  def testGetEventPartition(self):
+    """Tests the GetEventPartition function."""
+    plugin = TestHashTaggingAnalysisPlugin()
+
+    event_data_stream = events.EventDataStream()
+    event_data_stream.sha256_hash = self._EVENT_1_HASH
+
+    # Events with the same lookup hash are assigned to the same partition.
+    partition_indexes = set()
+    for event_number in range(8):
+      partition_index = plugin.GetEventPartition(
+          event_number, None, None, event_data_stream, 4)
+      partition_indexes.add(partition_index)
+
+    self.assertEqual(len(partition_indexes), 1)
+    self.assertIn(partition_indexes.pop(), range(4))
+
+    # Events without lookup hash are assigned round-robin.
+    partition_indexes = [
+        plugin.GetEventPartition(event_number, None, None, None, 4)
+        for event_number in range(8)]
+    self.assertEqual(partition_indexes, [0, 1, 2, 3, 0, 1, 2, 3])
+
   def testSetLookupHash(self):
     """Tests the SetLookupHash function."""
     plugin = TestHashTaggingAnalysisPlugin()
@@ -56,13 +56,28 @@ Test argument parser.
       _EXPECTED_PROCESSING_OPTIONS = """\
 usage: extraction_tool_test.py [--single_process]
                                [--temporary_directory DIRECTORY]
-                               [--vfs_back_end TYPE]
+                               [--vfs_back_end TYPE] [--worker_node HOST:PORT]
+                               [--worker_nodes_address ADDRESS]
+                               [--worker_nodes_port PORT]
+                               [--memory_budget SIZE] [--shared_memory_status]
                                [--worker_memory_limit SIZE]
                                [--worker_timeout MINUTES] [--workers WORKERS]
 
 Test argument parser.
 
 {0:s}:
+  --memory_budget, --memory-budget SIZE
+                        Maximum amount of memory in bytes that the tasks
+                        scheduled to the worker processes are predicted to
+                        consume, where 0 represents no budget. The default is
+                        no budget. A task is deferred by the main (foreman)
+                        process until its predicted memory usage fits in the
+                        budget.
+  --shared_memory_status, --shared-memory-status
+                        Have the worker processes report their status to the
+                        main (foreman) process via shared memory instead of
+                        XML-RPC. XML-RPC is used as fallback if shared memory
+                        is not available.
   --single_process, --single-process
                         Indicate that the tool should run in a single process.
   --temporary_directory, --temporary-directory DIRECTORY
@@ -77,6 +92,29 @@ Test argument parser.
                         bytes, where 0 represents no limit. The default limit
                         is 2147483648 (2 GiB). If a worker process exceeds
                         this limit it is killed by the main (foreman) process.
+  --worker_node, --worker-node HOST:PORT
+                        Run as a worker node of the main (foreman) process on
+                        another host, of which the task queue is available at
+                        HOST:PORT. The worker processes store the task results
+                        in the Redis task storage. The source must be
+                        available by the same path as on the host of the main
+                        (foreman) process. The tasks received from HOST:PORT
+                        are unpickled, hence only connect to a trusted host.
+  --worker_nodes_address, --worker-nodes-address ADDRESS
+                        IP address of the interface on which the main
+                        (foreman) process accepts worker processes of worker
+                        nodes. The default is 127.0.0.1, which only accepts
+                        worker nodes that connect through a tunnel, such as
+                        SSH port forwarding.
+  --worker_nodes_port, --worker-nodes-port PORT
+                        TCP port on which the main (foreman) process accepts
+                        worker processes of worker nodes on other hosts, in
+                        addition to its own worker processes. Worker nodes
+                        require the Redis task storage. The connection between
+                        the main (foreman) process and the worker nodes is
+                        neither authenticated nor encrypted and tasks are sent
+                        as pickled objects, hence worker nodes must only be
+                        used on a trusted network.
   --worker_timeout, --worker-timeout MINUTES
                         Number of minutes before a worker process that is not
                         providing status updates is considered inactive. The
@@ -91,13 +129,28 @@ Test argument parser.
       _EXPECTED_PROCESSING_OPTIONS = """\
 usage: extraction_tool_test.py [--single_process]
                                [--temporary_directory DIRECTORY]
-                               [--vfs_back_end TYPE]
+                               [--vfs_back_end TYPE] [--worker_node HOST:PORT]
+                               [--worker_nodes_address ADDRESS]
+                               [--worker_nodes_port PORT]
+                               [--memory_budget SIZE] [--shared_memory_status]
                                [--worker_memory_limit SIZE]
                                [--worker_timeout MINUTES] [--workers WORKERS]
 
 Test argument parser.
 
 {0:s}:
+  --memory_budget SIZE, --memory-budget SIZE
+                        Maximum amount of memory in bytes that the tasks
+                        scheduled to the worker processes are predicted to
+                        consume, where 0 represents no budget. The default is
+                        no budget. A task is deferred by the main (foreman)
+                        process until its predicted memory usage fits in the
+                        budget.
+  --shared_memory_status, --shared-memory-status
+                        Have the worker processes report their status to the
+                        main (foreman) process via shared memory instead of
+                        XML-RPC. XML-RPC is used as fallback if shared memory
+                        is not available.
   --single_process, --single-process
                         Indicate that the tool should run in a single process.
   --temporary_directory DIRECTORY, --temporary-directory DIRECTORY
@@ -112,6 +165,29 @@ Test argument parser.
                         bytes, where 0 represents no limit. The default limit
                         is 2147483648 (2 GiB). If a worker process exceeds
                         this limit it is killed by the main (foreman) process.
+  --worker_node HOST:PORT, --worker-node HOST:PORT
+                        Run as a worker node of the main (foreman) process on
+                        another host, of which the task queue is available at
+                        HOST:PORT. The worker processes store the task results
+                        in the Redis task storage. The source must be
+                        available by the same path as on the host of the main
+                        (foreman) process. The tasks received from HOST:PORT
+                        are unpickled, hence only connect to a trusted host.
+  --worker_nodes_address ADDRESS, --worker-nodes-address ADDRESS
+                        IP address of the interface on which the main
+                        (foreman) process accepts worker processes of worker
+                        nodes. The default is 127.0.0.1, which only accepts
+                        worker nodes that connect through a tunnel, such as
+                        SSH port forwarding.
+  --worker_nodes_port PORT, --worker-nodes-port PORT
+                        TCP port on which the main (foreman) process accepts
+                        worker processes of worker nodes on other hosts, in
+                        addition to its own worker processes. Worker nodes
+                        require the Redis task storage. The connection between
+                        the main (foreman) process and the worker nodes is
+                        neither authenticated nor encrypted and tasks are sent
+                        as pickled objects, hence worker nodes must only be
+                        used on a trusted network.
   --worker_timeout MINUTES, --worker-timeout MINUTES
                         Number of minutes before a worker process that is not
                         providing status updates is considered inactive. The
@@ -129,13 +205,23 @@ Test argument parser.
 usage: extraction_tool_test.py [--single_process]
                                [--process_memory_limit SIZE]
                                [--temporary_directory DIRECTORY]
-                               [--vfs_back_end TYPE]
+                               [--vfs_back_end TYPE] [--worker_node HOST:PORT]
+                               [--worker_nodes_address ADDRESS]
+                               [--worker_nodes_port PORT]
+                               [--memory_budget SIZE] [--shared_memory_status]
                                [--worker_memory_limit SIZE]
                                [--worker_timeout MINUTES] [--workers WORKERS]
 
 Test argument parser.
 
 {0:s}:
+  --memory_budget, --memory-budget SIZE
+                        Maximum amount of memory in bytes that the tasks
+                        scheduled to the worker processes are predicted to
+                        consume, where 0 represents no budget. The default is
+                        no budget. A task is deferred by the main (foreman)
+                        process until its predicted memory usage fits in the
+                        budget.
   --process_memory_limit, --process-memory-limit SIZE
                         Maximum amount of memory (data segment) a process is
                         allowed to allocate in bytes, where 0 represents no
@@ -144,6 +230,11 @@ Test argument parser.
                         worker processes. This limit is enforced by the
                         operating system and will supersede the worker memory
                         limit (--worker_memory_limit).
+  --shared_memory_status, --shared-memory-status
+                        Have the worker processes report their status to the
+                        main (foreman) process via shared memory instead of
+                        XML-RPC. XML-RPC is used as fallback if shared memory
+                        is not available.
   --single_process, --single-process
                         Indicate that the tool should run in a single process.
   --temporary_directory, --temporary-directory DIRECTORY
@@ -158,6 +249,29 @@ Test argument parser.
                         bytes, where 0 represents no limit. The default limit
                         is 2147483648 (2 GiB). If a worker process exceeds
                         this limit it is killed by the main (foreman) process.
+  --worker_node, --worker-node HOST:PORT
+                        Run as a worker node of the main (foreman) process on
+                        another host, of which the task queue is available at
+                        HOST:PORT. The worker processes store the task results
+                        in the Redis task storage. The source must be
+                        available by the same path as on the host of the main
+                        (foreman) process. The tasks received from HOST:PORT
+                        are unpickled, hence only connect to a trusted host.
+  --worker_nodes_address, --worker-nodes-address ADDRESS
+                        IP address of the interface on which the main
+                        (foreman) process accepts worker processes of worker
+                        nodes. The default is 127.0.0.1, which only accepts
+                        worker nodes that connect through a tunnel, such as
+                        SSH port forwarding.
+  --worker_nodes_port, --worker-nodes-port PORT
+                        TCP port on which the main (foreman) process accepts
+                        worker processes of worker nodes on other hosts, in
+                        addition to its own worker processes. Worker nodes
+                        require the Redis task storage. The connection between
+                        the main (foreman) process and the worker nodes is
+                        neither authenticated nor encrypted and tasks are sent
+                        as pickled objects, hence worker nodes must only be
+                        used on a trusted network.
   --worker_timeout, --worker-timeout MINUTES
                         Number of minutes before a worker process that is not
                         providing status updates is considered inactive. The
@@ -174,13 +288,23 @@ Test argument parser.
 usage: extraction_tool_test.py [--single_process]
                                [--process_memory_limit SIZE]
                                [--temporary_directory DIRECTORY]
-                               [--vfs_back_end TYPE]
+                               [--vfs_back_end TYPE] [--worker_node HOST:PORT]
+                               [--worker_nodes_address ADDRESS]
+                               [--worker_nodes_port PORT]
+                               [--memory_budget SIZE] [--shared_memory_status]
                                [--worker_memory_limit SIZE]
                                [--worker_timeout MINUTES] [--workers WORKERS]
 
 Test argument parser.
 
 {0:s}:
+  --memory_budget SIZE, --memory-budget SIZE
+                        Maximum amount of memory in bytes that the tasks
+                        scheduled to the worker processes are predicted to
+                        consume, where 0 represents no budget. The default is
+                        no budget. A task is deferred by the main (foreman)
+                        process until its predicted memory usage fits in the
+                        budget.
   --process_memory_limit SIZE, --process-memory-limit SIZE
                         Maximum amount of memory (data segment) a process is
                         allowed to allocate in bytes, where 0 represents no
@@ -189,6 +313,11 @@ Test argument parser.
                         worker processes. This limit is enforced by the
                         operating system and will supersede the worker memory
                         limit (--worker_memory_limit).
+  --shared_memory_status, --shared-memory-status
+                        Have the worker processes report their status to the
+                        main (foreman) process via shared memory instead of
+                        XML-RPC. XML-RPC is used as fallback if shared memory
+                        is not available.
   --single_process, --single-process
                         Indicate that the tool should run in a single process.
   --temporary_directory DIRECTORY, --temporary-directory DIRECTORY
@@ -203,6 +332,29 @@ Test argument parser.
                         bytes, where 0 represents no limit. The default limit
                         is 2147483648 (2 GiB). If a worker process exceeds
                         this limit it is killed by the main (foreman) process.
+  --worker_node HOST:PORT, --worker-node HOST:PORT
+                        Run as a worker node of the main (foreman) process on
+                        another host, of which the task queue is available at
+                        HOST:PORT. The worker processes store the task results
+                        in the Redis task storage. The source must be
+                        available by the same path as on the host of the main
+                        (foreman) process. The tasks received from HOST:PORT
+                        are unpickled, hence only connect to a trusted host.
+  --worker_nodes_address ADDRESS, --worker-nodes-address ADDRESS
+                        IP address of the interface on which the main
+                        (foreman) process accepts worker processes of worker
+                        nodes. The default is 127.0.0.1, which only accepts
+                        worker nodes that connect through a tunnel, such as
+                        SSH port forwarding.
+  --worker_nodes_port PORT, --worker-nodes-port PORT
+                        TCP port on which the main (foreman) process accepts
+                        worker processes of worker nodes on other hosts, in
+                        addition to its own worker processes. Worker nodes
+                        require the Redis task storage. The connection between
+                        the main (foreman) process and the worker nodes is
+                        neither authenticated nor encrypted and tasks are sent
+                        as pickled objects, hence worker nodes must only be
+                        used on a trusted network.
   --worker_timeout MINUTES, --worker-timeout MINUTES
                         Number of minutes before a worker process that is not
                         providing status updates is considered inactive. The
@@ -22,7 +22,7 @@ class ExtractionArgumentsHelperTest(cli_test_lib.CLIToolTestCase):
   if _PYTHON3_13_OR_LATER:
     _EXPECTED_OUTPUT = """\
 usage: cli_helper.py [--extract_winreg_binary] [--preferred_year YEAR]
-                     [--skip_compressed_streams]
+                     [--skip_compressed_streams] [--winevtx_xml_templates]
 
 Test argument parser.
 
@@ -37,12 +37,18 @@ Test argument parser.
   --skip_compressed_streams, --skip-compressed-streams
                         Skip processing file content within compressed
                         streams, such as syslog.gz and syslog.bz2.
+  --winevtx_xml_templates, --winevtx-xml-templates
+                        Store the XML representation of Windows XML EventLog
+                        (EVTX) records as a deduplicated XML template and
+                        substitution values instead of a XML string. This
+                        reduces the size of the storage file, where the XML
+                        string is rendered on output.
 """.format(cli_test_lib.ARGPARSE_OPTIONS)
 
   else:
     _EXPECTED_OUTPUT = """\
 usage: cli_helper.py [--extract_winreg_binary] [--preferred_year YEAR]
-                     [--skip_compressed_streams]
+                     [--skip_compressed_streams] [--winevtx_xml_templates]
 
 Test argument parser.
 
@@ -57,6 +63,12 @@ Test argument parser.
   --skip_compressed_streams, --skip-compressed-streams
                         Skip processing file content within compressed
                         streams, such as syslog.gz and syslog.bz2.
+  --winevtx_xml_templates, --winevtx-xml-templates
+                        Store the XML representation of Windows XML EventLog
+                        (EVTX) records as a deduplicated XML template and
+                        substitution values instead of a XML string. This
+                        reduces the size of the storage file, where the XML
+                        string is rendered on output.
 """.format(cli_test_lib.ARGPARSE_OPTIONS)
 
   def testAddArguments(self):
@@ -77,6 +89,7 @@ Test argument parser.
 
     self.assertIsNone(test_tool._preferred_year)
     self.assertTrue(test_tool._process_compressed_streams)
+    self.assertFalse(test_tool._winevtx_xml_templates)
 
     with self.assertRaises(errors.BadConfigObject):
       extraction.ExtractionArgumentsHelper.ParseOptions(options, None)
@@ -9,6 +9,7 @@ from plaso.cli import tools
 from plaso.cli.helpers import storage_format
 from plaso.lib import errors
 
+from tests import test_lib as shared_test_lib
 from tests.cli import test_lib as cli_test_lib
 
 
@@ -21,14 +22,26 @@ class StorageFormatArgumentsHelperTest(cli_test_lib.CLIToolTestCase):
 
   if _PYTHON3_13_OR_LATER:
     _EXPECTED_OUTPUT = """\
-usage: cli_helper.py [--storage_format FORMAT] [--task_storage_format FORMAT]
+usage: cli_helper.py [--redis_url URL] [--storage_format FORMAT]
+                     [--task_storage_directory DIRECTORY]
+                     [--task_storage_format FORMAT]
 
 Test argument parser.
 
 {0:s}:
+  --redis_url, --redis-url URL
+                        URL of the Redis database used for the redis task
+                        storage, for example: redis://host:6379/0. The default
+                        is the Redis database on the local host.
   --storage_format, --storage-format FORMAT
                         Format of the storage file, the default is: sqlite.
                         Supported options: sqlite
+  --task_storage_directory, --task-storage-directory DIRECTORY
+                        Directory in which to create the sqlite task storage,
+                        for example a RAM-backed file system such as /dev/shm.
+                        The default is the directory of the storage file,
+                        which is also used if the task storage directory has
+                        less than 1 GiB of free space.
   --task_storage_format, --task-storage-format FORMAT
                         Format for task storage, the default is: sqlite.
                         Supported options: redis, sqlite
@@ -36,14 +49,26 @@ Test argument parser.
 
   else:
     _EXPECTED_OUTPUT = """\
-usage: cli_helper.py [--storage_format FORMAT] [--task_storage_format FORMAT]
+usage: cli_helper.py [--redis_url URL] [--storage_format FORMAT]
+                     [--task_storage_directory DIRECTORY]
+                     [--task_storage_format FORMAT]
 
 Test argument parser.
 
 {0:s}:
+  --redis_url URL, --redis-url URL
+                        URL of the Redis database used for the redis task
+                        storage, for example: redis://host:6379/0. The default
+                        is the Redis database on the local host.
   --storage_format FORMAT, --storage-format FORMAT
                         Format of the storage file, the default is: sqlite.
                         Supported options: sqlite
+  --task_storage_directory DIRECTORY, --task-storage-directory DIRECTORY
+                        Directory in which to create the sqlite task storage,
+                        for example a RAM-backed file system such as /dev/shm.
+                        The default is the directory of the storage file,
+                        which is also used if the task storage directory has
+                        less than 1 GiB of free space.
   --task_storage_format FORMAT, --task-storage-format FORMAT
                         Format for task storage, the default is: sqlite.
                         Supported options: redis, sqlite
@@ -70,6 +95,40 @@ Test argument parser.
     self.assertEqual(test_tool._storage_format, options.storage_format)
     self.assertEqual(
         test_tool._task_storage_format, options.task_storage_format)
+    self.assertIsNone(test_tool._redis_url)
+    self.assertIsNone(test_tool._task_storage_directory)
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      options.task_storage_directory = temp_directory
+      storage_format.StorageFormatArgumentsHelper.ParseOptions(
+          options, test_tool)
+
+      self.assertEqual(test_tool._task_storage_directory, temp_directory)
+
+      with self.assertRaises(errors.BadConfigOption):
+        options.task_storage_format = 'redis'
+        storage_format.StorageFormatArgumentsHelper.ParseOptions(
+            options, test_tool)
+
+    with self.assertRaises(errors.BadConfigOption):
+      options.task_storage_format = 'sqlite'
+      storage_format.StorageFormatArgumentsHelper.ParseOptions(
+          options, test_tool)
+
+    options.task_storage_directory = None
+
+    options.redis_url = 'redis://127.0.0.1:6379/0'
+    options.task_storage_format = 'redis'
+    storage_format.StorageFormatArgumentsHelper.ParseOptions(options, test_tool)
+
+    self.assertEqual(test_tool._redis_url, options.redis_url)
+
+    with self.assertRaises(errors.BadConfigOption):
+      options.task_storage_format = 'sqlite'
+      storage_format.StorageFormatArgumentsHelper.ParseOptions(
+          options, test_tool)
+
+    options.redis_url = None
 
     with self.assertRaises(errors.BadConfigObject):
       storage_format.StorageFormatArgumentsHelper.ParseOptions(options, None)
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Tests for the worker nodes CLI arguments helper."""
+
+import sys
+import unittest
+
+from plaso.cli import tools
+from plaso.cli.helpers import worker_nodes
+from plaso.lib import errors
+
+from tests.cli import test_lib as cli_test_lib
+
+
+class WorkerNodesArgumentsHelperTest(cli_test_lib.CLIToolTestCase):
+  """Tests for the worker nodes CLI arguments helper."""
+
+  # pylint: disable=no-member,protected-access
+
+  _PYTHON3_13_OR_LATER = sys.version_info[0:2] >= (3, 13)
+
+  if _PYTHON3_13_OR_LATER:
+    _EXPECTED_OUTPUT = """\
+usage: cli_helper.py [--worker_node HOST:PORT]
+                     [--worker_nodes_address ADDRESS]
+                     [--worker_nodes_port PORT]
+
+Test argument parser.
+
+{0:s}:
+  --worker_node, --worker-node HOST:PORT
+                        Run as a worker node of the main (foreman) process on
+                        another host, of which the task queue is available at
+                        HOST:PORT. The worker processes store the task results
+                        in the Redis task storage. The source must be
+                        available by the same path as on the host of the main
+                        (foreman) process. The tasks received from HOST:PORT
+                        are unpickled, hence only connect to a trusted host.
+  --worker_nodes_address, --worker-nodes-address ADDRESS
+                        IP address of the interface on which the main
+                        (foreman) process accepts worker processes of worker
+                        nodes. The default is 127.0.0.1, which only accepts
+                        worker nodes that connect through a tunnel, such as
+                        SSH port forwarding.
+  --worker_nodes_port, --worker-nodes-port PORT
+                        TCP port on which the main (foreman) process accepts
+                        worker processes of worker nodes on other hosts, in
+                        addition to its own worker processes. Worker nodes
+                        require the Redis task storage. The connection between
+                        the main (foreman) process and the worker nodes is
+                        neither authenticated nor encrypted and tasks are sent
+                        as pickled objects, hence worker nodes must only be
+                        used on a trusted network.
+""".format(cli_test_lib.ARGPARSE_OPTIONS)
+
+  else:
+    _EXPECTED_OUTPUT = """\
+usage: cli_helper.py [--worker_node HOST:PORT]
+                     [--worker_nodes_address ADDRESS]
+                     [--worker_nodes_port PORT]
+
+Test argument parser.
+
+{0:s}:
+  --worker_node HOST:PORT, --worker-node HOST:PORT
+                        Run as a worker node of the main (foreman) process on
+                        another host, of which the task queue is available at
+                        HOST:PORT. The worker processes store the task results
+                        in the Redis task storage. The source must be
+                        available by the same path as on the host of the main
+                        (foreman) process. The tasks received from HOST:PORT
+                        are unpickled, hence only connect to a trusted host.
+  --worker_nodes_address ADDRESS, --worker-nodes-address ADDRESS
+                        IP address of the interface on which the main
+                        (foreman) process accepts worker processes of worker
+                        nodes. The default is 127.0.0.1, which only accepts
+                        worker nodes that connect through a tunnel, such as
+                        SSH port forwarding.
+  --worker_nodes_port PORT, --worker-nodes-port PORT
+                        TCP port on which the main (foreman) process accepts
+                        worker processes of worker nodes on other hosts, in
+                        addition to its own worker processes. Worker nodes
+                        require the Redis task storage. The connection between
+                        the main (foreman) process and the worker nodes is
+                        neither authenticated nor encrypted and tasks are sent
+                        as pickled objects, hence worker nodes must only be
+                        used on a trusted network.
+""".format(cli_test_lib.ARGPARSE_OPTIONS)
+
+  def testAddArguments(self):
+    """Tests the AddArguments function."""
+    argument_parser = self._GetTestArgumentParser('cli_helper.py')
+
+    worker_nodes.WorkerNodesArgumentsHelper.AddArguments(argument_parser)
+
+    output = self._RunArgparseFormatHelp(argument_parser)
+    self.assertEqual(output, self._EXPECTED_OUTPUT)
+
+  def testParseOptions(self):
+    """Tests the ParseOptions function."""
+    options = cli_test_lib.TestOptions()
+
+    test_tool = tools.CLITool()
+    worker_nodes.WorkerNodesArgumentsHelper.ParseOptions(options, test_tool)
+
+    self.assertIsNone(test_tool._worker_node_hostname)
+    self.assertIsNone(test_tool._worker_node_port)
+    self.assertIsNone(test_tool._worker_nodes_address)
+    self.assertIsNone(test_tool._worker_nodes_port)
+
+    options.worker_node = 'foreman.example.com:50000'
+    worker_nodes.WorkerNodesArgumentsHelper.ParseOptions(options, test_tool)
+
+    self.assertEqual(test_tool._worker_node_hostname, 'foreman.example.com')
+    self.assertEqual(test_tool._worker_node_port, 50000)
+
+    options.worker_node = None
+    options.worker_nodes_port = 50000
+    worker_nodes.WorkerNodesArgumentsHelper.ParseOptions(options, test_tool)
+
+    self.assertIsNone(test_tool._worker_node_hostname)
+    self.assertEqual(test_tool._worker_nodes_address, '127.0.0.1')
+    self.assertEqual(test_tool._worker_nodes_port, 50000)
+
+    options.worker_nodes_address = '192.168.1.1'
+    worker_nodes.WorkerNodesArgumentsHelper.ParseOptions(options, test_tool)
+
+    self.assertEqual(test_tool._worker_nodes_address, '192.168.1.1')
+    self.assertEqual(test_tool._worker_nodes_port, 50000)
+
+    with self.assertRaises(errors.BadConfigObject):
+      worker_nodes.WorkerNodesArgumentsHelper.ParseOptions(options, None)
+
+    with self.assertRaises(errors.BadConfigOption):
+      options.worker_node = 'foreman.example.com:50000'
+      worker_nodes.WorkerNodesArgumentsHelper.ParseOptions(options, test_tool)
+
+    options.worker_nodes_port = None
+
+    with self.assertRaises(errors.BadConfigOption):
+      options.worker_node = 'foreman.example.com'
+      worker_nodes.WorkerNodesArgumentsHelper.ParseOptions(options, test_tool)
+
+    with self.assertRaises(errors.BadConfigOption):
+      options.worker_node = 'foreman.example.com:bogus'
+      worker_nodes.WorkerNodesArgumentsHelper.ParseOptions(options, test_tool)
+
+    options.worker_node = None
+
+    with self.assertRaises(errors.BadConfigOption):
+      worker_nodes.WorkerNodesArgumentsHelper.ParseOptions(options, test_tool)
+
+    options.worker_nodes_address = None
+
+    with self.assertRaises(errors.BadConfigOption):
+      options.worker_nodes_port = 70000
+      worker_nodes.WorkerNodesArgumentsHelper.ParseOptions(options, test_tool)
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -21,12 +21,25 @@ class WorkersArgumentsHelperTest(cli_test_lib.CLIToolTestCase):
 
   if _PYTHON3_13_OR_LATER:
     _EXPECTED_OUTPUT = """\
-usage: cli_helper.py [--worker_memory_limit SIZE] [--worker_timeout MINUTES]
+usage: cli_helper.py [--memory_budget SIZE] [--shared_memory_status]
+                     [--worker_memory_limit SIZE] [--worker_timeout MINUTES]
                      [--workers WORKERS]
 
 Test argument parser.
 
 {0:s}:
+  --memory_budget, --memory-budget SIZE
+                        Maximum amount of memory in bytes that the tasks
+                        scheduled to the worker processes are predicted to
+                        consume, where 0 represents no budget. The default is
+                        no budget. A task is deferred by the main (foreman)
+                        process until its predicted memory usage fits in the
+                        budget.
+  --shared_memory_status, --shared-memory-status
+                        Have the worker processes report their status to the
+                        main (foreman) process via shared memory instead of
+                        XML-RPC. XML-RPC is used as fallback if shared memory
+                        is not available.
   --worker_memory_limit, --worker-memory-limit SIZE
                         Maximum amount of memory (data segment and shared
                         memory) a worker process is allowed to consume in
@@ -46,12 +59,25 @@ Test argument parser.
 
   else:
     _EXPECTED_OUTPUT = """\
-usage: cli_helper.py [--worker_memory_limit SIZE] [--worker_timeout MINUTES]
+usage: cli_helper.py [--memory_budget SIZE] [--shared_memory_status]
+                     [--worker_memory_limit SIZE] [--worker_timeout MINUTES]
                      [--workers WORKERS]
 
 Test argument parser.
 
 {0:s}:
+  --memory_budget SIZE, --memory-budget SIZE
+                        Maximum amount of memory in bytes that the tasks
+                        scheduled to the worker processes are predicted to
+                        consume, where 0 represents no budget. The default is
+                        no budget. A task is deferred by the main (foreman)
+                        process until its predicted memory usage fits in the
+                        budget.
+  --shared_memory_status, --shared-memory-status
+                        Have the worker processes report their status to the
+                        main (foreman) process via shared memory instead of
+                        XML-RPC. XML-RPC is used as fallback if shared memory
+                        is not available.
   --worker_memory_limit SIZE, --worker-memory-limit SIZE
                         Maximum amount of memory (data segment and shared
                         memory) a worker process is allowed to consume in
@@ -87,6 +113,11 @@ Test argument parser.
     workers.WorkersArgumentsHelper.ParseOptions(options, test_tool)
 
     self.assertEqual(test_tool._number_of_extraction_workers, options.workers)
+    self.assertFalse(test_tool._shared_memory_status)
+
+    options.shared_memory_status = True
+    workers.WorkersArgumentsHelper.ParseOptions(options, test_tool)
+    self.assertTrue(test_tool._shared_memory_status)
 
     with self.assertRaises(errors.BadConfigObject):
       workers.WorkersArgumentsHelper.ParseOptions(options, None)
@@ -99,6 +130,12 @@ Test argument parser.
       options.workers = -1
       workers.WorkersArgumentsHelper.ParseOptions(options, test_tool)
 
+    with self.assertRaises(errors.BadConfigOption):
+      options.memory_budget = -1
+      workers.WorkersArgumentsHelper.ParseOptions(options, test_tool)
+
+    options.memory_budget = None
+
     with self.assertRaises(errors.BadConfigOption):
       options.worker_memory_limit = 'bogus'
       workers.WorkersArgumentsHelper.ParseOptions(options, test_tool)
@@ -18,6 +18,40 @@ from tests import test_lib as shared_test_lib
 from tests.cli import test_lib
 
 
+class ExportedDigestIndexTest(shared_test_lib.BaseTestCase):
+  """Tests for the index of the digest hashes of exported data streams."""
+
+  def testOpenAddEntryClose(self):
+    """Tests the Open, AddEntry and Close functions."""
+    with shared_test_lib.TempDirectory() as temp_directory:
+      index_path = os.path.join(temp_directory, 'digests.jsonl')
+
+      digest_index = image_export_tool.ExportedDigestIndex()
+      digest_index.Open(index_path)
+
+      with self.assertRaises(IOError):
+        digest_index.Open(index_path)
+
+      digest_index.AddEntry('0123', 'OS:/a_file', 'a_file', True)
+      digest_index.AddEntry('0123', 'OS:/b_file', 'b_file', False)
+      digest_index.Close()
+
+      with self.assertRaises(IOError):
+        digest_index.Close()
+
+      # Simulate a partially written last line.
+      with open(index_path, 'a', encoding='utf-8') as file_object:
+        file_object.write('{"sha256": "4567", "pa')
+
+      digest_index = image_export_tool.ExportedDigestIndex()
+      digest_index.Open(index_path)
+      digest_index.Close()
+
+      self.assertEqual(digest_index.exported_digests, {'0123': 'OS:/a_file'})
+      self.assertEqual(
+          dict(digest_index.paths_by_digest), {'0123': ['a_file', 'b_file']})
+
+
 class ImageExportToolTest(test_lib.CLIToolTestCase):
   """Tests for the image export CLI tool."""
 
@@ -595,6 +629,98 @@ class ImageExportToolTest(test_lib.CLIToolTestCase):
       expected_json_data.sort(key=lambda digest: digest['sha256'])
       self.assertEqual(json_data, expected_json_data)
 
+  def testProcessSourceWithWorkers(self):
+    """Tests the ProcessSource function with worker threads."""
+    test_artifacts_path = self._GetTestFilePath(['artifacts'])
+    self._SkipIfPathNotExists(test_artifacts_path)
+
+    test_file_path = self._GetTestFilePath(['vsstest.qcow2'])
+    self._SkipIfPathNotExists(test_file_path)
+
+    options = test_lib.TestOptions()
+    options.artifact_definitions_path = test_artifacts_path
+    options.image = test_file_path
+    options.quiet = True
+    options.unattended = True
+    options.vss_stores = 'all'
+
+    results = []
+    with shared_test_lib.TempDirectory() as temp_directory:
+      for number_of_workers in (0, 4):
+        options.path = os.path.join(
+            temp_directory, f'workers{number_of_workers:d}')
+        options.workers = number_of_workers
+
+        output_writer = test_lib.TestOutputWriter(encoding='utf-8')
+        test_tool = image_export_tool.ImageExportTool(
+            output_writer=output_writer)
+        test_tool.ParseOptions(options)
+        test_tool.ProcessSource()
+
+        # Which of the duplicate files is exported depends on the order in
+        # which the worker threads process them.
+        number_of_extracted_files = len([
+            path for path in self._RecursiveList(options.path)
+            if os.path.isfile(path)])
+
+        hashes_file_path = os.path.join(options.path, 'hashes.json')
+        with open(hashes_file_path, 'r', encoding='utf-8') as file_object:
+          json_data = json.load(file_object)
+
+        paths_by_hash = {
+            digest['sha256']: sorted(digest['paths']) for digest in json_data}
+
+        results.append((number_of_extracted_files, paths_by_hash))
+
+    self.assertEqual(results[0][0], 36)
+    self.assertEqual(results[0], results[1])
+
+  def testProcessSourceWithDigestIndex(self):
+    """Tests the ProcessSource function with a digest index."""
+    test_artifacts_path = self._GetTestFilePath(['artifacts'])
+    self._SkipIfPathNotExists(test_artifacts_path)
+
+    test_file_path = self._GetTestFilePath(['vsstest.qcow2'])
+    self._SkipIfPathNotExists(test_file_path)
+
+    options = test_lib.TestOptions()
+    options.artifact_definitions_path = test_artifacts_path
+    options.image = test_file_path
+    options.quiet = True
+    options.unattended = True
+    options.vss_stores = 'all'
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      options.digest_index = os.path.join(temp_directory, 'digests.jsonl')
+      options.path = os.path.join(temp_directory, 'export')
+
+      output_writer = test_lib.TestOutputWriter(encoding='utf-8')
+      test_tool = image_export_tool.ImageExportTool(
+          output_writer=output_writer)
+      test_tool.ParseOptions(options)
+      test_tool.ProcessSource()
+
+      expected_extracted_files = sorted(self._RecursiveList(options.path))
+
+      hashes_file_path = os.path.join(options.path, 'hashes.json')
+      with open(hashes_file_path, 'r', encoding='utf-8') as file_object:
+        expected_json_data = json.load(file_object)
+
+      # Restarting the export should not export the same content again.
+      output_writer = test_lib.TestOutputWriter(encoding='utf-8')
+      test_tool = image_export_tool.ImageExportTool(
+          output_writer=output_writer)
+      test_tool.ParseOptions(options)
+      test_tool.ProcessSource()
+
+      extracted_files = sorted(self._RecursiveList(options.path))
+      self.assertEqual(extracted_files, expected_extracted_files)
+
+      with open(hashes_file_path, 'r', encoding='utf-8') as file_object:
+        json_data = json.load(file_object)
+
+      self.assertEqual(json_data, expected_json_data)
+
   def testProcessSourceEnableArtifactsMap(self):
     """Tests the ProcessSource function with atrifacts map enabled.
 
@@ -163,6 +163,63 @@ class Log2TimelineToolTest(test_lib.CLIToolTestCase):
     options.artifact_definitions_path = test_artifacts_path
     options.source = test_file_path
 
+    with self.assertRaises(errors.BadConfigOption):
+      test_tool.ParseOptions(options)
+
+    # ParseOptions will raise if the storage file to resume does not exist.
+    options = test_lib.TestOptions()
+    options.artifact_definitions_path = test_artifacts_path
+    options.resume = True
+    options.source = test_file_path
+    options.storage_file = 'bogus.plaso'
+
+    with self.assertRaises(errors.BadConfigOption):
+      test_tool.ParseOptions(options)
+
+    # ParseOptions will raise if extraction checkpoints are enabled in single
+    # process mode.
+    options = test_lib.TestOptions()
+    options.artifact_definitions_path = test_artifacts_path
+    options.enable_checkpoints = True
+    options.single_process = True
+    options.source = test_file_path
+    options.status_view_interval = 0.5
+    options.status_view_mode = 'none'
+    options.storage_file = 'storage.plaso'
+    options.storage_format = definitions.STORAGE_FORMAT_SQLITE
+    options.task_storage_format = definitions.STORAGE_FORMAT_SQLITE
+
+    with self.assertRaises(errors.BadConfigOption):
+      test_tool.ParseOptions(options)
+
+    # ParseOptions will raise if the storage file to extract incrementally
+    # into does not exist.
+    options = test_lib.TestOptions()
+    options.artifact_definitions_path = test_artifacts_path
+    options.incremental_mode = definitions.INCREMENTAL_MODE_METADATA
+    options.source = test_file_path
+    options.storage_file = 'bogus.plaso'
+
+    with self.assertRaises(errors.BadConfigOption):
+      test_tool.ParseOptions(options)
+
+    # ParseOptions will raise if worker nodes are used without the redis task
+    # storage format.
+    options = test_lib.TestOptions()
+    options.artifact_definitions_path = test_artifacts_path
+    options.source = test_file_path
+    options.status_view_interval = 0.5
+    options.status_view_mode = 'none'
+    options.storage_format = definitions.STORAGE_FORMAT_SQLITE
+    options.task_storage_format = definitions.STORAGE_FORMAT_REDIS
+    options.worker_nodes_port = 50000
+
+    test_tool.ParseOptions(options)
+
+    self.assertEqual(test_tool._worker_nodes_port, 50000)
+
+    options.task_storage_format = definitions.STORAGE_FORMAT_SQLITE
+
     with self.assertRaises(errors.BadConfigOption):
       test_tool.ParseOptions(options)
 
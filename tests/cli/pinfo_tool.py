@@ -5,9 +5,16 @@
 import json
 import unittest
 
+from dfvfs.lib import definitions as dfvfs_definitions
+from dfvfs.path import factory as path_spec_factory
+
 from plaso.cli import views as cli_views
 from plaso.cli import pinfo_tool
+from plaso.containers import counts
+from plaso.containers import events
+from plaso.containers import warnings
 from plaso.lib import errors
+from plaso.storage.fake import writer as fake_writer
 
 from tests import test_lib as shared_test_lib
 from tests.cli import test_lib
@@ -30,9 +37,87 @@ Parser (plugin) name : Number of events
 Storage files are different.
 """
 
-  # TODO: add test for _CalculateStorageCounters.
   # TODO: add test for _CompareStores.
 
+  def testCalculateStorageCounters(self):
+    """Tests the _CalculateStorageCounters function."""
+    test_file_path = self._GetTestFilePath(['psort_test.plaso'])
+    self._SkipIfPathNotExists(test_file_path)
+
+    output_writer = test_lib.TestOutputWriter(encoding='utf-8')
+    test_tool = pinfo_tool.PinfoTool(output_writer=output_writer)
+
+    storage_reader = test_tool._GetStorageReader(test_file_path)
+    try:
+      storage_counters = test_tool._CalculateStorageCounters(storage_reader)
+    finally:
+      storage_reader.Close()
+
+    self.assertNotIn('event_data_types', storage_counters)
+
+    expected_counter = {
+        'type: OS, location: /tmp/test/test_data/syslog\n': 2}
+    self.assertEqual(
+        dict(storage_counters['extraction_warnings_by_path_spec']),
+        expected_counter)
+
+    expected_counter = {'text/syslog_traditional': 2}
+    self.assertEqual(
+        dict(storage_counters['extraction_warnings_by_parser_chain']),
+        expected_counter)
+
+    self.assertEqual(
+        dict(storage_counters['recovery_warnings_by_parser_chain']), {})
+
+    expected_counter = {
+        'filestat': 6, 'syslog_traditional': 32, 'total': 38}
+    self.assertEqual(dict(storage_counters['parsers']), expected_counter)
+
+  def testCalculateStorageCountersWithCounts(self):
+    """Tests the _CalculateStorageCounters function with count containers."""
+    path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_OS, location='/tmp/syslog')
+
+    output_writer = test_lib.TestOutputWriter(encoding='utf-8')
+    test_tool = pinfo_tool.PinfoTool(output_writer=output_writer)
+
+    storage_writer = fake_writer.FakeStorageWriter()
+    storage_writer.Open()
+
+    try:
+      for _ in range(3):
+        storage_writer.AddAttributeContainer(
+            events.EventData(data_type='syslog:line'))
+        storage_writer.AddAttributeContainer(warnings.ExtractionWarning(
+            parser_chain='text/syslog', path_spec=path_spec))
+
+      storage_writer.AddAttributeContainer(counts.EventDataTypeCount(
+          data_type='syslog:line', number_of_event_data=3))
+      storage_writer.AddAttributeContainer(counts.WarningCount(
+          number_of_warnings=3, parser_chain='text/syslog',
+          path_spec=path_spec, warning_type='extraction_warning'))
+
+      storage_counters = test_tool._CalculateStorageCounters(storage_writer)
+
+      self.assertEqual(
+          dict(storage_counters['event_data_types']), {'syslog:line': 3})
+      self.assertEqual(
+          dict(storage_counters['extraction_warnings_by_parser_chain']),
+          {'text/syslog': 3})
+
+      # Stores with incomplete counts fall back to aggregating the warnings.
+      storage_writer.AddAttributeContainer(warnings.ExtractionWarning(
+          parser_chain='olecf', path_spec=path_spec))
+
+      storage_counters = test_tool._CalculateStorageCounters(storage_writer)
+
+      self.assertEqual(
+          dict(storage_counters['extraction_warnings_by_parser_chain']),
+          {'olecf': 1, 'text/syslog': 3})
+
+    finally:
+      storage_writer.Close()
+
   def testGenerateAnalysisResultsReportAsJSON(self):
     """Tests the _GenerateAnalysisResultsReport function."""
     test_file_path = self._GetTestFilePath(['psort_test.plaso'])
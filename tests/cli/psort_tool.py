@@ -100,11 +100,36 @@ class PsortToolTest(test_lib.CLIToolTestCase):
     if _PYTHON3_13_OR_LATER:
       _EXPECTED_PROCESSING_OPTIONS = """\
 usage: psort_test.py [--temporary_directory DIRECTORY]
-                     [--worker_memory_limit SIZE] [--worker_timeout MINUTES]
+                     [--sort_memory_limit SIZE] [--analysis_partitions NUMBER]
+                     [--shared_memory_events] [--worker_memory_limit SIZE]
+                     [--worker_timeout MINUTES]
 
 Test argument parser.
 
 {0:s}:
+  --analysis_partitions, --analysis-partitions NUMBER
+                        Number of analysis processes that run an analysis
+                        plugin that supports partitioning, such as tagging,
+                        where every process analyzes a disjoint partition of
+                        the events and the results of the partitions are
+                        combined afterwards. The default is 1, which
+                        represents a single analysis process per analysis
+                        plugin.
+  --shared_memory_events, --shared-memory-events
+                        Broadcast the events to the analysis processes via a
+                        shared memory ring buffer, that is written once and
+                        read by all analysis processes, instead of a ZeroMQ
+                        queue per analysis process. ZeroMQ queues are used as
+                        fallback if shared memory is not available.
+  --sort_memory_limit, --sort-memory-limit SIZE
+                        Maximum amount of memory in bytes used to sort the
+                        events in chronological order, where 0 represents that
+                        the events are sorted by the storage. If set, the
+                        events are sorted with an external merge sort that
+                        writes sorted runs to the temporary directory when
+                        this limit is exceeded. A limit of 268435456 (256 MiB)
+                        is suited to storage files with hundreds of millions
+                        of events.
   --temporary_directory, --temporary-directory DIRECTORY
                         Path to the directory that should be used to store
                         temporary files created during processing.
@@ -125,11 +150,36 @@ Test argument parser.
     else:
       _EXPECTED_PROCESSING_OPTIONS = """\
 usage: psort_test.py [--temporary_directory DIRECTORY]
-                     [--worker_memory_limit SIZE] [--worker_timeout MINUTES]
+                     [--sort_memory_limit SIZE] [--analysis_partitions NUMBER]
+                     [--shared_memory_events] [--worker_memory_limit SIZE]
+                     [--worker_timeout MINUTES]
 
 Test argument parser.
 
 {0:s}:
+  --analysis_partitions NUMBER, --analysis-partitions NUMBER
+                        Number of analysis processes that run an analysis
+                        plugin that supports partitioning, such as tagging,
+                        where every process analyzes a disjoint partition of
+                        the events and the results of the partitions are
+                        combined afterwards. The default is 1, which
+                        represents a single analysis process per analysis
+                        plugin.
+  --shared_memory_events, --shared-memory-events
+                        Broadcast the events to the analysis processes via a
+                        shared memory ring buffer, that is written once and
+                        read by all analysis processes, instead of a ZeroMQ
+                        queue per analysis process. ZeroMQ queues are used as
+                        fallback if shared memory is not available.
+  --sort_memory_limit SIZE, --sort-memory-limit SIZE
+                        Maximum amount of memory in bytes used to sort the
+                        events in chronological order, where 0 represents that
+                        the events are sorted by the storage. If set, the
+                        events are sorted with an external merge sort that
+                        writes sorted runs to the temporary directory when
+                        this limit is exceeded. A limit of 268435456 (256 MiB)
+                        is suited to storage files with hundreds of millions
+                        of events.
   --temporary_directory DIRECTORY, --temporary-directory DIRECTORY
                         Path to the directory that should be used to store
                         temporary files created during processing.
@@ -152,11 +202,21 @@ Test argument parser.
       _EXPECTED_PROCESSING_OPTIONS = """\
 usage: psort_test.py [--process_memory_limit SIZE]
                      [--temporary_directory DIRECTORY]
-                     [--worker_memory_limit SIZE] [--worker_timeout MINUTES]
+                     [--sort_memory_limit SIZE] [--analysis_partitions NUMBER]
+                     [--shared_memory_events] [--worker_memory_limit SIZE]
+                     [--worker_timeout MINUTES]
 
 Test argument parser.
 
 {0:s}:
+  --analysis_partitions, --analysis-partitions NUMBER
+                        Number of analysis processes that run an analysis
+                        plugin that supports partitioning, such as tagging,
+                        where every process analyzes a disjoint partition of
+                        the events and the results of the partitions are
+                        combined afterwards. The default is 1, which
+                        represents a single analysis process per analysis
+                        plugin.
   --process_memory_limit, --process-memory-limit SIZE
                         Maximum amount of memory (data segment) a process is
                         allowed to allocate in bytes, where 0 represents no
@@ -165,6 +225,21 @@ Test argument parser.
                         worker processes. This limit is enforced by the
                         operating system and will supersede the worker memory
                         limit (--worker_memory_limit).
+  --shared_memory_events, --shared-memory-events
+                        Broadcast the events to the analysis processes via a
+                        shared memory ring buffer, that is written once and
+                        read by all analysis processes, instead of a ZeroMQ
+                        queue per analysis process. ZeroMQ queues are used as
+                        fallback if shared memory is not available.
+  --sort_memory_limit, --sort-memory-limit SIZE
+                        Maximum amount of memory in bytes used to sort the
+                        events in chronological order, where 0 represents that
+                        the events are sorted by the storage. If set, the
+                        events are sorted with an external merge sort that
+                        writes sorted runs to the temporary directory when
+                        this limit is exceeded. A limit of 268435456 (256 MiB)
+                        is suited to storage files with hundreds of millions
+                        of events.
   --temporary_directory, --temporary-directory DIRECTORY
                         Path to the directory that should be used to store
                         temporary files created during processing.
@@ -186,11 +261,21 @@ Test argument parser.
       _EXPECTED_PROCESSING_OPTIONS = """\
 usage: psort_test.py [--process_memory_limit SIZE]
                      [--temporary_directory DIRECTORY]
-                     [--worker_memory_limit SIZE] [--worker_timeout MINUTES]
+                     [--sort_memory_limit SIZE] [--analysis_partitions NUMBER]
+                     [--shared_memory_events] [--worker_memory_limit SIZE]
+                     [--worker_timeout MINUTES]
 
 Test argument parser.
 
 {0:s}:
+  --analysis_partitions NUMBER, --analysis-partitions NUMBER
+                        Number of analysis processes that run an analysis
+                        plugin that supports partitioning, such as tagging,
+                        where every process analyzes a disjoint partition of
+                        the events and the results of the partitions are
+                        combined afterwards. The default is 1, which
+                        represents a single analysis process per analysis
+                        plugin.
   --process_memory_limit SIZE, --process-memory-limit SIZE
                         Maximum amount of memory (data segment) a process is
                         allowed to allocate in bytes, where 0 represents no
@@ -199,6 +284,21 @@ Test argument parser.
                         worker processes. This limit is enforced by the
                         operating system and will supersede the worker memory
                         limit (--worker_memory_limit).
+  --shared_memory_events, --shared-memory-events
+                        Broadcast the events to the analysis processes via a
+                        shared memory ring buffer, that is written once and
+                        read by all analysis processes, instead of a ZeroMQ
+                        queue per analysis process. ZeroMQ queues are used as
+                        fallback if shared memory is not available.
+  --sort_memory_limit SIZE, --sort-memory-limit SIZE
+                        Maximum amount of memory in bytes used to sort the
+                        events in chronological order, where 0 represents that
+                        the events are sorted by the storage. If set, the
+                        events are sorted with an external merge sort that
+                        writes sorted runs to the temporary directory when
+                        this limit is exceeded. A limit of 268435456 (256 MiB)
+                        is suited to storage files with hundreds of millions
+                        of events.
   --temporary_directory DIRECTORY, --temporary-directory DIRECTORY
                         Path to the directory that should be used to store
                         temporary files created during processing.
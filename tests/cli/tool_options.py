@@ -318,6 +318,7 @@ format_checks : Profile CPU time per format check
       storage : Profile storage reads and writes
    task_queue : Profile task queue status (multi-processing only)
         tasks : Profile the status of tasks (multi-processing only)
+        trace : Trace processing phases of all processes in Chrome format
 --------------------------------------------------------------------------------
 """
 
@@ -225,6 +225,28 @@ class WindowsEventLogProviderArtifactTest(shared_test_lib.BaseTestCase):
     self.assertIsNotNone(attribute_container)
 
 
+class WindowsEventLogXMLTemplateArtifactTest(shared_test_lib.BaseTestCase):
+  """Tests for the Windows XML EventLog (EVTX) XML template artifact."""
+
+  def testInitialize(self):
+    """Tests the __init__ function."""
+    attribute_container = artifacts.WindowsEventLogXMLTemplateArtifact()
+    self.assertIsNotNone(attribute_container)
+
+  def testRenderXMLString(self):
+    """Tests the RenderXMLString function."""
+    attribute_container = artifacts.WindowsEventLogXMLTemplateArtifact(
+        fragments=['<EventID Qualifiers="', '">', '</EventID>'],
+        identifier='test')
+
+    xml_string = attribute_container.RenderXMLString(['16384', '7036'])
+    self.assertEqual(
+        xml_string, '<EventID Qualifiers="16384">7036</EventID>')
+
+    with self.assertRaises(ValueError):
+      attribute_container.RenderXMLString(['7036'])
+
+
 class WindowsMountedDeviceArtifactTest(shared_test_lib.BaseTestCase):
   """Tests for the Windows mounted device artifact."""
 
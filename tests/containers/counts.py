@@ -9,6 +9,21 @@ from plaso.containers import counts
 from tests import test_lib as shared_test_lib
 
 
+class EventDataTypeCountTest(shared_test_lib.BaseTestCase):
+  """Tests for the event data type count attribute container."""
+
+  def testGetAttributeNames(self):
+    """Tests the GetAttributeNames function."""
+    attribute_container = counts.EventDataTypeCount()
+
+    expected_attribute_names = [
+        'data_type',
+        'number_of_event_data']
+
+    attribute_names = sorted(attribute_container.GetAttributeNames())
+    self.assertEqual(attribute_names, expected_attribute_names)
+
+
 class EventLabelCountTest(shared_test_lib.BaseTestCase):
   """Tests for the event label count attribute container."""
 
@@ -39,5 +54,22 @@ class ParserCountTest(shared_test_lib.BaseTestCase):
     self.assertEqual(attribute_names, expected_attribute_names)
 
 
+class WarningCountTest(shared_test_lib.BaseTestCase):
+  """Tests for the warning count attribute container."""
+
+  def testGetAttributeNames(self):
+    """Tests the GetAttributeNames function."""
+    attribute_container = counts.WarningCount()
+
+    expected_attribute_names = [
+        'number_of_warnings',
+        'parser_chain',
+        'path_spec',
+        'warning_type']
+
+    attribute_names = sorted(attribute_container.GetAttributeNames())
+    self.assertEqual(attribute_names, expected_attribute_names)
+
+
 if __name__ == '__main__':
   unittest.main()
@@ -24,6 +24,22 @@ class EventSourceTest(shared_test_lib.BaseTestCase):
     self.assertEqual(attribute_names, expected_attribute_names)
 
 
+class EventSourcePartitionTest(shared_test_lib.BaseTestCase):
+  """Tests for the event source partition attribute container."""
+
+  def testGetAttributeNames(self):
+    """Tests the GetAttributeNames function."""
+    attribute_container = event_sources.EventSourcePartition()
+
+    expected_attribute_names = [
+        '_event_data_stream_identifier', 'file_entry_type', 'parser_name',
+        'partition_end', 'partition_start', 'path_spec']
+
+    attribute_names = sorted(attribute_container.GetAttributeNames())
+
+    self.assertEqual(attribute_names, expected_attribute_names)
+
+
 class FileEntryEventSourceTest(shared_test_lib.BaseTestCase):
   """Tests for the file entry event source attribute container."""
 
@@ -39,5 +55,20 @@ class FileEntryEventSourceTest(shared_test_lib.BaseTestCase):
     self.assertEqual(attribute_names, expected_attribute_names)
 
 
+class FileEntryFingerprintTest(shared_test_lib.BaseTestCase):
+  """Tests for the file entry fingerprint attribute container."""
+
+  def testGetAttributeNames(self):
+    """Tests the GetAttributeNames function."""
+    attribute_container = event_sources.FileEntryFingerprint()
+
+    expected_attribute_names = [
+        'modification_time', 'path_spec', 'sha256_hash', 'size']
+
+    attribute_names = sorted(attribute_container.GetAttributeNames())
+
+    self.assertEqual(attribute_names, expected_attribute_names)
+
+
 if __name__ == '__main__':
   unittest.main()
@@ -2,8 +2,12 @@
 # -*- coding: utf-8 -*-
 """Tests for the event attribute containers."""
 
+import copy
+import pickle
 import unittest
 
+from acstore.containers import interface as containers_interface
+
 from plaso.containers import events
 
 from tests import test_lib as shared_test_lib
@@ -128,6 +132,35 @@ class EventDataStreamTest(shared_test_lib.BaseTestCase):
 class EventObjectTest(shared_test_lib.BaseTestCase):
   """Tests for the event attribute container."""
 
+  def _CreateTestEvent(self):
+    """Creates an event for testing.
+
+    Returns:
+      EventObject: event.
+    """
+    attribute_container = events.EventObject()
+    attribute_container.timestamp = 1281643591546875
+    attribute_container.timestamp_desc = 'Content Modification Time'
+
+    event_data_identifier = containers_interface.AttributeContainerIdentifier(
+        name='event_data', sequence_number=5)
+    attribute_container.SetEventDataIdentifier(event_data_identifier)
+
+    return attribute_container
+
+  def testCopyFromDict(self):
+    """Tests the CopyFromDict function."""
+    attribute_container = events.EventObject()
+
+    attribute_container.CopyFromDict({
+        '_identifier': None,
+        'timestamp': 1281643591546875,
+        'unsupported': 'value'})
+
+    self.assertEqual(attribute_container.timestamp, 1281643591546875)
+    self.assertIsNotNone(attribute_container.GetIdentifier())
+    self.assertFalse(hasattr(attribute_container, 'unsupported'))
+
   def testGetAttributeNames(self):
     """Tests the GetAttributeNames function."""
     attribute_container = events.EventObject()
@@ -142,6 +175,37 @@ class EventObjectTest(shared_test_lib.BaseTestCase):
 
     self.assertEqual(attribute_names, expected_attribute_names)
 
+  def testGetAttributes(self):
+    """Tests the GetAttributes function."""
+    attribute_container = self._CreateTestEvent()
+
+    attributes = dict(attribute_container.GetAttributes())
+
+    self.assertEqual(sorted(attributes.keys()), [
+        '_event_data_identifier', 'timestamp', 'timestamp_desc'])
+    self.assertEqual(
+        attributes['_event_data_identifier'].CopyToString(), 'event_data.5')
+
+    # The attributes are stored in slots instead of an attribute dictionary.
+    self.assertEqual(attribute_container.__dict__, {})
+
+    # Attributes that are not defined by the schema are not returned.
+    attribute_container.unsupported = 'value'
+
+    attributes = dict(attribute_container.GetAttributes())
+    self.assertNotIn('unsupported', attributes)
+
+  def testGetAttributeValuesString(self):
+    """Tests the GetAttributeValuesString function."""
+    attribute_container = self._CreateTestEvent()
+
+    expected_string = (
+        '_event_data_identifier: event_data.5, timestamp: 1281643591546875, '
+        'timestamp_desc: Content Modification Time')
+
+    attribute_values_string = attribute_container.GetAttributeValuesString()
+    self.assertEqual(attribute_values_string, expected_string)
+
   def testGetEventDataIdentifier(self):
     """Tests the GetEventDataIdentifier function."""
     attribute_container = events.EventObject()
@@ -149,12 +213,51 @@ class EventObjectTest(shared_test_lib.BaseTestCase):
     identifier = attribute_container.GetEventDataIdentifier()
     self.assertIsNone(identifier)
 
+  def testMatchesExpression(self):
+    """Tests the MatchesExpression function."""
+    attribute_container = self._CreateTestEvent()
+
+    result = attribute_container.MatchesExpression(
+        '_event_data_identifier == "event_data.5"')
+    self.assertTrue(result)
+
+    result = attribute_container.MatchesExpression('timestamp == 0')
+    self.assertFalse(result)
+
+  def testPickle(self):
+    """Tests pickling and copying an event."""
+    attribute_container = self._CreateTestEvent()
+    identifier_string = attribute_container.GetIdentifier().CopyToString()
+
+    for copied_container in (
+        copy.deepcopy(attribute_container),
+        pickle.loads(pickle.dumps(attribute_container))):
+      self.assertEqual(copied_container.timestamp, 1281643591546875)
+      self.assertEqual(
+          copied_container.timestamp_desc, 'Content Modification Time')
+      self.assertEqual(
+          copied_container.GetIdentifier().CopyToString(), identifier_string)
+
+      event_data_identifier = copied_container.GetEventDataIdentifier()
+      self.assertEqual(event_data_identifier.CopyToString(), 'event_data.5')
+
   def testSetEventDataIdentifier(self):
     """Tests the SetEventDataIdentifier function."""
     attribute_container = events.EventObject()
 
+    event_data_identifier = containers_interface.AttributeContainerIdentifier(
+        name='event_data', sequence_number=5)
+    attribute_container.SetEventDataIdentifier(event_data_identifier)
+
+    identifier = attribute_container.GetEventDataIdentifier()
+    self.assertEqual(identifier.name, 'event_data')
+    self.assertEqual(identifier.sequence_number, 5)
+
     attribute_container.SetEventDataIdentifier(None)
 
+    identifier = attribute_container.GetEventDataIdentifier()
+    self.assertIsNone(identifier)
+
 
 class EventTagTest(shared_test_lib.BaseTestCase):
   """Tests for the event tag attribute container."""
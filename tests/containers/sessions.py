@@ -9,6 +9,38 @@ from plaso.containers import sessions
 from tests import test_lib as shared_test_lib
 
 
+class ExtractionCheckpointTest(shared_test_lib.BaseTestCase):
+  """Tests for the extraction checkpoint attribute container."""
+
+  def testGetAttributeNames(self):
+    """Tests the GetAttributeNames function."""
+    attribute_container = sessions.ExtractionCheckpoint()
+
+    expected_attribute_names = [
+        'checkpoint_time',
+        'collection_completed',
+        'container_types',
+        'event_source_index',
+        'number_of_collected_path_specs',
+        'numbers_of_containers',
+        'pending_event_source_indexes',
+        'session_identifier']
+
+    attribute_names = sorted(attribute_container.GetAttributeNames())
+
+    self.assertEqual(attribute_names, expected_attribute_names)
+
+  def testGetNumberOfContainers(self):
+    """Tests the GetNumberOfContainers function."""
+    attribute_container = sessions.ExtractionCheckpoint()
+    self.assertEqual(attribute_container.GetNumberOfContainers('event'), 0)
+
+    attribute_container.container_types = ['event', 'event_data']
+    attribute_container.numbers_of_containers = [5, 3]
+    self.assertEqual(attribute_container.GetNumberOfContainers('event'), 5)
+    self.assertEqual(attribute_container.GetNumberOfContainers('warning'), 0)
+
+
 class SessionTest(shared_test_lib.BaseTestCase):
   """Tests for the session attribute container."""
 
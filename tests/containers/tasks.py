@@ -25,6 +25,7 @@ class TaskTest(shared_test_lib.BaseTestCase):
 
     expected_dict = {
         'aborted': False,
+        'collect_only': False,
         'has_retry': False,
         'identifier': task.identifier,
         'session_identifier': task.session_identifier,
@@ -57,5 +58,22 @@ class TaskTest(shared_test_lib.BaseTestCase):
     self.assertIsNotNone(task.last_processing_time)
 
 
+
+class TaskCostEstimatesTest(shared_test_lib.BaseTestCase):
+  """Tests for the task cost estimates attribute container."""
+
+  def testGetAttributeNames(self):
+    """Tests the GetAttributeNames function."""
+    attribute_container = tasks.TaskCostEstimates()
+
+    expected_attribute_names = [
+        'cost_classes',
+        'memory_factors',
+        'throughputs',
+        'worker_memory']
+
+    attribute_names = sorted(attribute_container.GetAttributeNames())
+    self.assertEqual(attribute_names, expected_attribute_names)
+
 if __name__ == '__main__':
   unittest.main()
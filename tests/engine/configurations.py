@@ -87,6 +87,14 @@ class ProfilingConfigurationTest(unittest.TestCase):
     configuration = configurations.ProfilingConfiguration()
     self.assertFalse(configuration.HaveProfileTasks())
 
+  def testHaveProfileTrace(self):
+    """Tests the HaveProfileTrace function."""
+    configuration = configurations.ProfilingConfiguration()
+    self.assertFalse(configuration.HaveProfileTrace())
+
+    configuration.profilers = set(['trace'])
+    self.assertTrue(configuration.HaveProfileTrace())
+
 
 class ProcessingConfigurationTest(unittest.TestCase):
   """Tests the processing configuration settings."""
@@ -272,6 +272,67 @@ class BaseEngineTest(shared_test_lib.BaseTestCase):
     self.assertEqual(len(source_configurations), 1)
     self.assertEqual(source_configurations[0].operating_system, "Windows NT")
 
+  def testPreprocessSourceWithWorkerProcesses(self):
+    """Tests the PreprocessSource function with worker processes."""
+    test_artifacts_path = shared_test_lib.GetTestFilePath(['artifacts'])
+    self._SkipIfPathNotExists(test_artifacts_path)
+
+    test_engine = engine.BaseEngine()
+    test_engine.BuildArtifactsRegistry(test_artifacts_path, None)
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      source_path_specs = []
+      for hostname in ('host1', 'host2', 'host3'):
+        etc_path = os.path.join(temp_directory, hostname, 'etc')
+        os.makedirs(etc_path)
+
+        with open(
+            os.path.join(etc_path, 'hostname'), 'w',
+            encoding='utf-8') as file_object:
+          file_object.write(f'{hostname:s}\n')
+
+        with open(
+            os.path.join(etc_path, 'passwd'), 'w',
+            encoding='utf-8') as file_object:
+          file_object.write((
+              f'root:x:0:0:root:/root:/bin/bash\n'
+              f'{hostname:s}user:x:1000:1000::/home/{hostname:s}user:'
+              f'/bin/bash\n'))
+
+        source_path_spec = path_spec_factory.Factory.NewPathSpec(
+            dfvfs_definitions.TYPE_INDICATOR_OS,
+            location=os.path.join(temp_directory, hostname))
+        source_path_specs.append(source_path_spec)
+
+      results = []
+      for number_of_worker_processes in (1, 2):
+        storage_writer = fake_writer.FakeStorageWriter()
+        storage_writer.Open()
+
+        try:
+          source_configurations = test_engine.PreprocessSource(
+              source_path_specs, storage_writer,
+              number_of_worker_processes=number_of_worker_processes)
+
+          usernames = [
+              user_account.username for user_account in (
+                  storage_writer.GetAttributeContainers('user_account'))]
+
+        finally:
+          storage_writer.Close()
+
+        hostnames = [
+            source_configuration.hostname.name
+            for source_configuration in source_configurations]
+        results.append((hostnames, usernames))
+
+    # Test that the results of the worker processes are merged in the order
+    # of the source path specifications.
+    self.assertEqual(results[0], (
+        ['host1', 'host2', 'host3'],
+        ['root', 'host1user', 'root', 'host2user', 'root', 'host3user']))
+    self.assertEqual(results[1], results[0])
+
 
 if __name__ == "__main__":
   unittest.main()
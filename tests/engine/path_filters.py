@@ -30,6 +30,44 @@ class PathFilterTest(shared_test_lib.BaseTestCase):
       test_filter = path_filters.PathFilter('bogus')
 
 
+class PathFilterScanTreeTest(shared_test_lib.BaseTestCase):
+  """Tests for the path filter scan tree."""
+
+  def testAddPathSegments(self):
+    """Tests the AddPathSegments function."""
+    scan_tree = path_filters.PathFilterScanTree()
+    self.assertEqual(scan_tree.number_of_paths, 0)
+
+    scan_tree.AddPathSegments(['Windows', 'System32', 'config'])
+    scan_tree.AddPathSegments(['pagefile\\.sys'])
+    self.assertEqual(scan_tree.number_of_paths, 2)
+
+    with self.assertRaises(ValueError):
+      scan_tree.AddPathSegments(['bad re (no close on that parenthesis'])
+
+  def testCheckPathSegments(self):
+    """Tests the CheckPathSegments function."""
+    scan_tree = path_filters.PathFilterScanTree()
+    scan_tree.AddPathSegments(['Windows', 'System32', 'config'])
+    scan_tree.AddPathSegments(['pagefile\\.sys'])
+    scan_tree.AddPathSegments(['Users', '.+', 'AppData'])
+
+    self.assertTrue(scan_tree.CheckPathSegments(['pagefile.sys']))
+    self.assertTrue(scan_tree.CheckPathSegments(['PAGEFILE.SYS']))
+    self.assertFalse(scan_tree.CheckPathSegments(['pagefileXsys']))
+
+    self.assertTrue(scan_tree.CheckPathSegments(
+        ['windows', 'system32', 'config', 'SOFTWARE']))
+    self.assertFalse(scan_tree.CheckPathSegments(['Windows', 'System32']))
+
+    self.assertTrue(scan_tree.CheckPathSegments(
+        ['Users', 'username', 'AppData', 'Local']))
+    self.assertFalse(scan_tree.CheckPathSegments(
+        ['Users', 'username', 'Documents']))
+
+    self.assertFalse(scan_tree.CheckPathSegments([]))
+
+
 class PathCollectionFiltersHelperTest(shared_test_lib.BaseTestCase):
   """Tests for the path collection filters helper."""
 
@@ -2,6 +2,8 @@
 # -*- coding: utf-8 -*-
 """Tests for the profiler classes."""
 
+import json
+import os
 import time
 import unittest
 
@@ -10,6 +12,7 @@ from plaso.containers import tasks
 from plaso.engine import configurations
 from plaso.engine import processing_status
 from plaso.engine import profilers
+from plaso.multi_process import task_costs
 
 from tests import test_lib as shared_test_lib
 
@@ -54,6 +57,8 @@ class SampleFileProfilerTest(shared_test_lib.BaseTestCase):
 class CPUTimeProfilerTest(shared_test_lib.BaseTestCase):
   """Tests for the CPU time profiler."""
 
+  # pylint: disable=protected-access
+
   def testStartStopTiming(self):
     """Tests the StartTiming and StopTiming functions."""
     profiling_configuration = configurations.ProfilingConfiguration()
@@ -73,6 +78,29 @@ class CPUTimeProfilerTest(shared_test_lib.BaseTestCase):
 
       test_profiler.Stop()
 
+  def testStartStopTimingWithTraceProfiler(self):
+    """Tests the StartTiming and StopTiming functions with tracing."""
+    profiling_configuration = configurations.ProfilingConfiguration()
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      profiling_configuration.directory = temp_directory
+
+      trace_profiler = profilers.TraceProfiler(
+          'test', profiling_configuration)
+
+      test_profiler = profilers.CPUTimeProfiler(
+          'test', profiling_configuration)
+      test_profiler.SetTraceProfiler(trace_profiler)
+
+      test_profiler.Start()
+
+      test_profiler.StartTiming('test_profile')
+      test_profiler.StopTiming('test_profile')
+
+      test_profiler.Stop()
+
+      self.assertEqual(len(trace_profiler._spans), 1)
+
 
 class MemoryProfilerTest(shared_test_lib.BaseTestCase):
   """Tests for the memory profiler."""
@@ -189,6 +217,31 @@ class StorageProfilerTest(shared_test_lib.BaseTestCase):
       test_profiler.Stop()
 
 
+class TaskDurationsProfilerTest(shared_test_lib.BaseTestCase):
+  """Tests for the task durations profiler."""
+
+  def testSample(self):
+    """Tests the Sample function."""
+    profiling_configuration = configurations.ProfilingConfiguration()
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      profiling_configuration.directory = temp_directory
+
+      test_profiler = profilers.TaskDurationsProfiler(
+          'test', profiling_configuration)
+
+      test_profiler.Start()
+
+      for _ in range(5):
+        task = tasks.Task()
+        task_estimate = task_costs.TaskCostEstimate(
+            cost_class='.evtx', estimated_duration=1.5, size=1024)
+        test_profiler.Sample(task, task_estimate, 1.25)
+        time.sleep(0.01)
+
+      test_profiler.Stop()
+
+
 class TaskQueueProfilerTest(shared_test_lib.BaseTestCase):
   """Tests for the task queue profiler."""
 
@@ -213,6 +266,115 @@ class TaskQueueProfilerTest(shared_test_lib.BaseTestCase):
       test_profiler.Stop()
 
 
+class TraceProfilerTest(shared_test_lib.BaseTestCase):
+  """Tests for the trace profiler."""
+
+  # pylint: disable=protected-access
+
+  def testStartStopTiming(self):
+    """Tests the StartTiming and StopTiming functions."""
+    profiling_configuration = configurations.ProfilingConfiguration()
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      profiling_configuration.directory = temp_directory
+
+      test_profiler = profilers.TraceProfiler('test', profiling_configuration)
+      test_profiler._MAXIMUM_NUMBER_OF_BUFFERED_SPANS = 4
+
+      test_profiler.Start()
+
+      for _ in range(5):
+        test_profiler.StartTiming('test_profile')
+        time.sleep(0.01)
+        test_profiler.StopTiming('test_profile')
+
+      self.assertEqual(len(test_profiler._spans), 1)
+
+      # A span that was not started is ignored.
+      test_profiler.StopTiming('bogus')
+      self.assertEqual(len(test_profiler._spans), 1)
+
+      test_profiler.Stop()
+
+  def testMergeSampleFiles(self):
+    """Tests the MergeSampleFiles function."""
+    profiling_configuration = configurations.ProfilingConfiguration()
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      profiling_configuration.directory = temp_directory
+
+      for identifier in ('Main', 'Worker_00'):
+        test_profiler = profilers.TraceProfiler(
+            identifier, profiling_configuration)
+        test_profiler.Start()
+
+        test_profiler.StartTiming('test_profile')
+        time.sleep(0.01)
+        test_profiler.StopTiming('test_profile')
+
+        test_profiler.Stop()
+
+      path = profilers.TraceProfiler.MergeSampleFiles(
+          profiling_configuration, ['Main', 'Worker_00', 'Worker_01'])
+      self.assertEqual(path, os.path.join(temp_directory, 'trace.json'))
+
+      with open(path, 'r', encoding='utf-8') as file_object:
+        trace = json.load(file_object)
+
+      trace_events = trace['traceEvents']
+      self.assertEqual(len(trace_events), 4)
+
+      self.assertEqual(trace_events[0]['ph'], 'M')
+      self.assertEqual(trace_events[0]['args'], {'name': 'Main'})
+
+      self.assertEqual(trace_events[1]['ph'], 'X')
+      self.assertEqual(trace_events[1]['name'], 'test_profile')
+      self.assertEqual(trace_events[1]['pid'], 0)
+      self.assertEqual(trace_events[1]['ts'], 0)
+      self.assertGreaterEqual(trace_events[1]['dur'], 10000)
+
+      self.assertEqual(trace_events[3]['pid'], 1)
+      self.assertGreater(trace_events[3]['ts'], 0)
+
+  def testMergeSampleFilesWithTruncatedFile(self):
+    """Tests the MergeSampleFiles function with a truncated sample file."""
+    profiling_configuration = configurations.ProfilingConfiguration()
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      profiling_configuration.directory = temp_directory
+
+      test_profiler = profilers.TraceProfiler(
+          'Worker_00', profiling_configuration)
+      test_profiler.Start()
+
+      for index in range(1000):
+        test_profiler._spans.append((
+            float(index), f'test_profile{index:d}', 0.5))
+
+      test_profiler.Stop()
+
+      # Truncate the sample file as if the process was killed.
+      sample_file_path = os.path.join(
+          temp_directory, 'trace-Worker_00.csv.gz')
+      with open(sample_file_path, 'rb') as file_object:
+        data = file_object.read()
+
+      with open(sample_file_path, 'wb') as file_object:
+        file_object.write(data[:len(data) // 2])
+
+      path = profilers.TraceProfiler.MergeSampleFiles(
+          profiling_configuration, ['Worker_00'])
+
+      with open(path, 'r', encoding='utf-8') as file_object:
+        trace = json.load(file_object)
+
+      trace_events = trace['traceEvents']
+      self.assertGreater(len(trace_events), 1)
+      self.assertLess(len(trace_events), 1001)
+
+      self.assertEqual(trace_events[1]['name'], 'test_profile0')
+
+
 class TasksProfilerTest(shared_test_lib.BaseTestCase):
   """Tests for the tasks profiler."""
 
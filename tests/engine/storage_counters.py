@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Tests for the storage counters."""
+
+import unittest
+
+from dfvfs.lib import definitions as dfvfs_definitions
+from dfvfs.path import factory as path_spec_factory
+
+from plaso.containers import events
+from plaso.containers import warnings
+from plaso.engine import storage_counters
+from plaso.storage.fake import writer as fake_writer
+
+from tests import test_lib as shared_test_lib
+
+
+class StorageCountersTest(shared_test_lib.BaseTestCase):
+  """Tests for the storage counters."""
+
+  def testCountAttributeContainer(self):
+    """Tests the CountAttributeContainer function."""
+    path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_OS, location='/tmp/syslog')
+
+    test_counters = storage_counters.StorageCounters()
+
+    test_counters.CountAttributeContainer(
+        events.EventData(data_type='syslog:line'))
+    test_counters.CountAttributeContainer(
+        events.EventData(data_type='syslog:line'))
+    test_counters.CountAttributeContainer(events.EventDataStream())
+    test_counters.CountAttributeContainer(warnings.ExtractionWarning(
+        parser_chain='text/syslog', path_spec=path_spec))
+    test_counters.CountAttributeContainer(warnings.RecoveryWarning(
+        parser_chain='text/syslog', path_spec=path_spec))
+
+    self.assertEqual(
+        dict(test_counters.event_data_types_counter), {'syslog:line': 2})
+
+    expected_warnings_counter = {
+        ('extraction_warning', 'text/syslog', path_spec): 1,
+        ('recovery_warning', 'text/syslog', path_spec): 1}
+    self.assertEqual(
+        dict(test_counters.warnings_counter), expected_warnings_counter)
+
+  def testWriteCounters(self):
+    """Tests the WriteCounters function."""
+    path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_OS, location='/tmp/syslog')
+
+    storage_writer = fake_writer.FakeStorageWriter()
+    storage_writer.Open()
+
+    try:
+      test_counters = storage_counters.StorageCounters()
+      storage_writer.SetStorageCounters(test_counters)
+
+      for _ in range(2):
+        storage_writer.AddAttributeContainer(
+            events.EventData(data_type='syslog:line'))
+        storage_writer.AddAttributeContainer(warnings.ExtractionWarning(
+            parser_chain='text/syslog', path_spec=path_spec))
+
+        test_counters.WriteCounters(storage_writer)
+
+      storage_writer.SetStorageCounters(None)
+
+      event_data_type_counts = list(storage_writer.GetAttributeContainers(
+          'event_data_type_count'))
+      self.assertEqual(len(event_data_type_counts), 1)
+      self.assertEqual(event_data_type_counts[0].data_type, 'syslog:line')
+      self.assertEqual(event_data_type_counts[0].number_of_event_data, 2)
+
+      warning_counts = list(storage_writer.GetAttributeContainers(
+          'warning_count'))
+      self.assertEqual(len(warning_counts), 1)
+      self.assertEqual(warning_counts[0].number_of_warnings, 2)
+      self.assertEqual(warning_counts[0].parser_chain, 'text/syslog')
+      self.assertEqual(warning_counts[0].path_spec, path_spec)
+      self.assertEqual(warning_counts[0].warning_type, 'extraction_warning')
+
+    finally:
+      storage_writer.Close()
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Tests for the Windows XML EventLog (EVTX) XML templates helper."""
+
+import unittest
+
+from plaso.containers import events
+from plaso.helpers.windows import eventlog_xml_templates
+from plaso.storage.fake import writer as fake_writer
+
+from tests import test_lib as shared_test_lib
+
+
+class WindowsEventLogXMLTemplatesHelperTest(shared_test_lib.BaseTestCase):
+  """Tests for the Windows XML EventLog (EVTX) XML templates helper."""
+
+  _XML_STRING = (
+      '<Event xmlns="http://schemas.microsoft.com/win/2004/08/events/event">\n'
+      '  <System>\n'
+      '    <EventID Qualifiers="16384">7036</EventID>\n'
+      '    <Correlation/>\n'
+      '    <Computer>WKS-WIN764BITB.shieldbase.local</Computer>\n'
+      '  </System>\n'
+      '  <EventData>\n'
+      '    <Data Name="param1">Windows Update</Data>\n'
+      '    <Data Name="param2"></Data>\n'
+      '  </EventData>\n'
+      '</Event>\n')
+
+  def testCreateXMLTemplate(self):
+    """Tests the CreateXMLTemplate function."""
+    test_helper_class = eventlog_xml_templates.WindowsEventLogXMLTemplatesHelper
+
+    xml_template, values = test_helper_class.CreateXMLTemplate(
+        self._XML_STRING)
+
+    self.assertEqual(values, [
+        'http://schemas.microsoft.com/win/2004/08/events/event', '16384',
+        '7036', 'WKS-WIN764BITB.shieldbase.local', 'param1', 'Windows Update',
+        'param2'])
+    self.assertEqual(len(xml_template.fragments), len(values) + 1)
+    self.assertEqual(xml_template.fragments[0], '<Event xmlns="')
+    self.assertEqual(
+        xml_template.identifier, '10d918ca81b480f3521cfa4b40a54400')
+
+    self.assertEqual(
+        xml_template.RenderXMLString(values), self._XML_STRING)
+
+    # Test that records that only differ in their substitution values share
+    # the same template.
+    xml_string = self._XML_STRING.replace('Windows Update', 'Print Spooler')
+    other_xml_template, other_values = test_helper_class.CreateXMLTemplate(
+        xml_string)
+
+    self.assertEqual(other_xml_template.identifier, xml_template.identifier)
+    self.assertEqual(other_values[5], 'Print Spooler')
+
+  def testRenderXMLString(self):
+    """Tests the RenderXMLString function."""
+    test_helper = eventlog_xml_templates.WindowsEventLogXMLTemplatesHelper()
+
+    xml_template, values = test_helper.CreateXMLTemplate(self._XML_STRING)
+
+    storage_writer = fake_writer.FakeStorageWriter()
+    storage_writer.Open()
+
+    try:
+      storage_writer.AddAttributeContainer(xml_template)
+
+      event_data = events.EventData()
+      event_data.xml_template_identifier = xml_template.identifier
+      event_data.xml_values = values
+
+      result = test_helper.RenderXMLString(storage_writer, event_data)
+      self.assertTrue(result)
+      self.assertEqual(event_data.xml_string, self._XML_STRING)
+      self.assertIsNone(event_data.xml_template_identifier)
+      self.assertIsNone(event_data.xml_values)
+
+      result = test_helper.RenderXMLString(storage_writer, event_data)
+      self.assertFalse(result)
+
+      event_data = events.EventData()
+      event_data.xml_template_identifier = 'bogus'
+      event_data.xml_values = values
+
+      result = test_helper.RenderXMLString(storage_writer, event_data)
+      self.assertFalse(result)
+      self.assertIsNone(getattr(event_data, 'xml_string', None))
+
+    finally:
+      storage_writer.Close()
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -2,6 +2,7 @@
 """Tests for the dtFabric format definition helper mix-in."""
 
 import io
+import os
 import unittest
 
 from dtfabric import errors as dtfabric_errors
@@ -62,6 +63,35 @@ class ErrorDataTypeMap(dtfabric_data_maps.DataTypeMap):
         'Unable to map byte stream for testing purposes.')
 
 
+class TestDtFabricHelper(dtfabric_helper.DtFabricHelper):
+  """dtFabric format definition helper for testing."""
+
+  _DEFINITION_FILE = None
+
+
+class StructureReaderTest(test_lib.BaseTestCase):
+  """Precompiled fixed-size structure reader tests."""
+
+  def testRead(self):
+    """Tests the Read function."""
+    data_type_fabric = dtfabric_fabric.DataTypeFabric(
+        yaml_definition=DtFabricHelperTest._DATA_TYPE_FABRIC_DEFINITION)
+    data_type_map = data_type_fabric.CreateDataTypeMap('point3d')
+
+    structure_reader = dtfabric_helper.StructureReader(
+        'point3d', '<III', data_type_map.CreateStructureValues)
+    self.assertEqual(structure_reader.byte_size, 12)
+
+    point3d = structure_reader.Read(
+        b'\x01\x00\x00\x00\x02\x00\x00\x00\x03\x00\x00\x00')
+    self.assertEqual(point3d.x, 1)
+    self.assertEqual(point3d.y, 2)
+    self.assertEqual(point3d.z, 3)
+
+    with self.assertRaises(ValueError):
+      structure_reader.Read(b'\x01\x00\x00\x00\x02\x00\x00\x00')
+
+
 class DtFabricHelperTest(test_lib.BaseTestCase):
   """dtFabric format definition helper mix-in tests."""
 
@@ -119,7 +149,58 @@ members:
         0x00, 0x42, 0x83, 0x29])
     self.assertEqual(ip_address, '2001:0db8:0000:0000:0000:ff00:0042:8329')
 
-  # TODO: add tests for _GetDataTypeMap
+  def testCreateStructureReader(self):
+    """Tests the _CreateStructureReader function."""
+    with test_lib.TempDirectory() as temp_directory:
+      TestDtFabricHelper._DEFINITION_FILE = os.path.join(
+          temp_directory, 'dtfabric.yaml')
+      with open(TestDtFabricHelper._DEFINITION_FILE, 'wb') as file_object:
+        file_object.write(self._DATA_TYPE_FABRIC_DEFINITION)
+
+      try:
+        test_helper = TestDtFabricHelper()
+      finally:
+        TestDtFabricHelper._DEFINITION_FILE = None
+
+    data_type_map = test_helper._fabric.CreateDataTypeMap('point3d')
+    structure_reader = test_helper._CreateStructureReader(
+        'point3d', data_type_map)
+    self.assertIsNotNone(structure_reader)
+    self.assertEqual(structure_reader.byte_size, 12)
+
+    data_type_map = test_helper._fabric.CreateDataTypeMap('shape3d')
+    structure_reader = test_helper._CreateStructureReader(
+        'shape3d', data_type_map)
+    self.assertIsNone(structure_reader)
+
+    data_type_map = test_helper._fabric.CreateDataTypeMap('uint32')
+    structure_reader = test_helper._CreateStructureReader(
+        'uint32', data_type_map)
+    self.assertIsNone(structure_reader)
+
+  def testGetDataTypeMap(self):
+    """Tests the _GetDataTypeMap function."""
+    with test_lib.TempDirectory() as temp_directory:
+      TestDtFabricHelper._DEFINITION_FILE = os.path.join(
+          temp_directory, 'dtfabric.yaml')
+      with open(TestDtFabricHelper._DEFINITION_FILE, 'wb') as file_object:
+        file_object.write(self._DATA_TYPE_FABRIC_DEFINITION)
+
+      try:
+        test_helper1 = TestDtFabricHelper()
+        test_helper2 = TestDtFabricHelper()
+      finally:
+        TestDtFabricHelper._DEFINITION_FILE = None
+
+    data_type_map = test_helper1._GetDataTypeMap('point3d')
+    self.assertIsNotNone(data_type_map)
+    self.assertIn(data_type_map, test_helper1._structure_readers)
+
+    self.assertIs(test_helper2._GetDataTypeMap('point3d'), data_type_map)
+
+    data_type_map = test_helper1._GetDataTypeMap('shape3d')
+    self.assertIsNotNone(data_type_map)
+    self.assertNotIn(data_type_map, test_helper1._structure_readers)
 
   def testReadData(self):
     """Tests the _ReadData function."""
@@ -148,7 +229,23 @@ members:
     with self.assertRaises(errors.ParseError):
       test_helper._ReadData(file_object, 0, 12)
 
-  # TODO: add tests for _ReadDefinitionFile
+  def testReadDefinitionFile(self):
+    """Tests the _ReadDefinitionFile function."""
+    test_helper = dtfabric_helper.DtFabricHelper()
+
+    with test_lib.TempDirectory() as temp_directory:
+      path = os.path.join(temp_directory, 'dtfabric.yaml')
+      with open(path, 'wb') as file_object:
+        file_object.write(self._DATA_TYPE_FABRIC_DEFINITION)
+
+      data_type_fabric = test_helper._ReadDefinitionFile(path)
+      self.assertIsNotNone(data_type_fabric)
+
+      # Test that the data type fabric is shared.
+      self.assertIs(test_helper._ReadDefinitionFile(path), data_type_fabric)
+
+    data_type_fabric = test_helper._ReadDefinitionFile(None)
+    self.assertIsNone(data_type_fabric)
 
   def testReadStructureFromByteStream(self):
     """Tests the _ReadStructureFromByteStream function."""
@@ -177,6 +274,23 @@ members:
           b'\x01\x00\x00\x00\x02\x00\x00\x00\x03\x00\x00\x00', 0,
           data_type_map)
 
+    # Test with a structure reader.
+    data_type_map = self._DATA_TYPE_FABRIC.CreateDataTypeMap('point3d')
+    test_helper._structure_readers[data_type_map] = (
+        dtfabric_helper.StructureReader(
+            'point3d', '<III', data_type_map.CreateStructureValues))
+
+    point3d = test_helper._ReadStructureFromByteStream(
+        b'\x01\x00\x00\x00\x02\x00\x00\x00\x03\x00\x00\x00', 0,
+        data_type_map)
+    self.assertEqual(point3d.x, 1)
+    self.assertEqual(point3d.y, 2)
+    self.assertEqual(point3d.z, 3)
+
+    with self.assertRaises(errors.ParseError):
+      test_helper._ReadStructureFromByteStream(
+          b'\x01\x00\x00\x00\x02\x00\x00\x00', 0, data_type_map)
+
   def testReadStructureFromFileObject(self):
     """Tests the _ReadStructureFromFileObject function."""
     test_helper = dtfabric_helper.DtFabricHelper()
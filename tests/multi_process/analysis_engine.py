@@ -7,6 +7,7 @@ import shutil
 import unittest
 
 from plaso.analysis import tagging
+from plaso.analysis import unique_domains_visited
 from plaso.containers import sessions
 from plaso.engine import configurations
 from plaso.lib import definitions
@@ -123,6 +124,124 @@ class AnalysisEngineMultiProcessEngineTest(test_lib.MultiProcessingTestCase):
       finally:
         storage_writer.Close()
 
+  def testAnalyzeEventsWithEventBroadcast(self):
+    """Tests the AnalyzeEvents function with an event broadcast."""
+    test_file_path = self._GetTestFilePath(['psort_test.plaso'])
+    self._SkipIfPathNotExists(test_file_path)
+
+    test_tagging_file_path = self._GetTestFilePath([
+        'tagging_file', 'valid.txt'])
+    self._SkipIfPathNotExists(test_tagging_file_path)
+
+    session = sessions.Session()
+
+    data_location = ''
+
+    analysis_plugin = tagging.TaggingAnalysisPlugin()
+    analysis_plugin.SetAndLoadTagFile(test_tagging_file_path)
+
+    analysis_plugins = {
+        'tagging': analysis_plugin,
+        'unique_domains_visited': (
+            unique_domains_visited.UniqueDomainsVisitedPlugin())}
+
+    configuration = configurations.ProcessingConfiguration()
+    test_engine = analysis_engine.AnalysisMultiProcessEngine(
+        use_event_broadcast=True)
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      temp_file = os.path.join(temp_directory, 'storage.plaso')
+      shutil.copyfile(test_file_path, temp_file)
+
+      storage_writer = storage_factory.StorageFactory.CreateStorageWriter(
+          definitions.DEFAULT_STORAGE_FORMAT)
+
+      storage_writer.Open(path=temp_file)
+
+      try:
+        number_of_reports = storage_writer.GetNumberOfAttributeContainers(
+            'analysis_report')
+        self.assertEqual(number_of_reports, 2)
+
+        processing_status = test_engine.AnalyzeEvents(
+            session, storage_writer, data_location, analysis_plugins,
+            configuration, storage_file_path=temp_directory)
+
+        self.assertFalse(processing_status.aborted)
+
+        number_of_reports = storage_writer.GetNumberOfAttributeContainers(
+            'analysis_report')
+        self.assertEqual(number_of_reports, 4)
+
+        # Every analysis process read all the events.
+        self.assertEqual(len(processing_status.workers_status), 2)
+        for process_status in processing_status.workers_status:
+          self.assertEqual(process_status.number_of_consumed_events, 38)
+
+      finally:
+        storage_writer.Close()
+
+    self.assertIsNone(test_engine._event_broadcast_queue)
+
+  def testAnalyzeEventsWithPartitions(self):
+    """Tests the AnalyzeEvents function with partitions."""
+    test_file_path = self._GetTestFilePath(['psort_test.plaso'])
+    self._SkipIfPathNotExists(test_file_path)
+
+    test_tagging_file_path = self._GetTestFilePath([
+        'tagging_file', 'valid.txt'])
+    self._SkipIfPathNotExists(test_tagging_file_path)
+
+    data_location = ''
+
+    configuration = configurations.ProcessingConfiguration()
+
+    for use_event_broadcast in (False, True):
+      session = sessions.Session()
+
+      analysis_plugin = tagging.TaggingAnalysisPlugin()
+      analysis_plugin.SetAndLoadTagFile(test_tagging_file_path)
+
+      analysis_plugins = {'tagging': analysis_plugin}
+
+      test_engine = analysis_engine.AnalysisMultiProcessEngine(
+          number_of_partitions=3, use_event_broadcast=use_event_broadcast)
+
+      with shared_test_lib.TempDirectory() as temp_directory:
+        temp_file = os.path.join(temp_directory, 'storage.plaso')
+        shutil.copyfile(test_file_path, temp_file)
+
+        storage_writer = storage_factory.StorageFactory.CreateStorageWriter(
+            definitions.DEFAULT_STORAGE_FORMAT)
+
+        storage_writer.Open(path=temp_file)
+
+        try:
+          processing_status = test_engine.AnalyzeEvents(
+              session, storage_writer, data_location, analysis_plugins,
+              configuration, storage_file_path=temp_directory)
+
+          self.assertFalse(processing_status.aborted)
+
+          # The reports of the partitions are reduced into a single report.
+          number_of_reports = storage_writer.GetNumberOfAttributeContainers(
+              'analysis_report')
+          self.assertEqual(number_of_reports, 3)
+
+          analysis_report = storage_writer.GetAttributeContainerByIndex(
+              'analysis_report', 2)
+          self.assertEqual(analysis_report.plugin_name, 'tagging')
+
+        finally:
+          storage_writer.Close()
+
+      # Every analysis process analyzed a disjoint partition of the events.
+      number_of_consumed_events = {
+          process_status.identifier: process_status.number_of_consumed_events
+          for process_status in processing_status.workers_status}
+      self.assertEqual(number_of_consumed_events, {
+          'tagging-0': 13, 'tagging-1': 13, 'tagging-2': 12})
+
   def testAnalyzeEventsWithEventFilter(self):
     """Tests the AnalyzeEvents function with an event filter."""
     test_file_path = self._GetTestFilePath(['psort_test.plaso'])
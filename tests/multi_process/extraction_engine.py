@@ -9,18 +9,209 @@ import unittest
 from dfvfs.lib import definitions as dfvfs_definitions
 from dfvfs.path import factory as path_spec_factory
 
+from plaso.containers import event_sources
 from plaso.containers import sessions
+from plaso.containers import tasks
 from plaso.lib import definitions
 from plaso.engine import configurations
 from plaso.multi_process import extraction_engine
+from plaso.multi_process import task_costs
+from plaso.storage.fake import writer as fake_writer
 from plaso.storage.sqlite import writer as sqlite_writer
 
 from tests import test_lib as shared_test_lib
 
 
+class TestInterruptedEngine(extraction_engine.ExtractionMultiProcessEngine):
+  """Multi-process engine that is interrupted after writing a checkpoint.
+
+  The engine is interrupted after the first checkpoint that records events.
+  """
+
+  _CHECKPOINT_INTERVAL = 0.0
+
+  def _WriteCheckpoint(self, storage_writer, session_identifier):
+    """Writes an extraction checkpoint and commits the session storage.
+
+    Args:
+      storage_writer (StorageWriter): storage writer for a session storage.
+      session_identifier (str): the identifier of the session the tasks are
+          part of.
+    """
+    super(TestInterruptedEngine, self)._WriteCheckpoint(
+        storage_writer, session_identifier)
+
+    if self._checkpoint.GetNumberOfContainers('event'):
+      self._abort = True
+
+
+class EventSourceHeapTest(shared_test_lib.BaseTestCase):
+  """Tests for the event source heap."""
+
+  # pylint: disable=protected-access
+
+  def testPushPopEventSource(self):
+    """Tests the PushEventSource and PopEventSource functions."""
+    event_source_heap = extraction_engine._EventSourceHeap()
+
+    event_source, task_estimate = event_source_heap.PopEventSource()
+    self.assertIsNone(event_source)
+    self.assertIsNone(task_estimate)
+
+    small_event_source = event_sources.FileEntryEventSource(
+        file_entry_type=dfvfs_definitions.FILE_ENTRY_TYPE_FILE)
+    small_task_estimate = task_costs.TaskCostEstimate(estimated_duration=0.1)
+    event_source_heap.PushEventSource(
+        small_event_source, task_estimate=small_task_estimate)
+
+    large_event_source = event_sources.FileEntryEventSource(
+        file_entry_type=dfvfs_definitions.FILE_ENTRY_TYPE_FILE)
+    large_task_estimate = task_costs.TaskCostEstimate(estimated_duration=10.0)
+    event_source_heap.PushEventSource(
+        large_event_source, task_estimate=large_task_estimate)
+
+    directory_event_source = event_sources.FileEntryEventSource(
+        file_entry_type=dfvfs_definitions.FILE_ENTRY_TYPE_DIRECTORY)
+    event_source_heap.PushEventSource(directory_event_source)
+
+    event_source, task_estimate = event_source_heap.PopEventSource()
+    self.assertEqual(event_source, directory_event_source)
+    self.assertIsNone(task_estimate)
+
+    event_source, task_estimate = event_source_heap.PopEventSource()
+    self.assertEqual(event_source, large_event_source)
+    self.assertEqual(task_estimate, large_task_estimate)
+
+    event_source, task_estimate = event_source_heap.PopEventSource()
+    self.assertEqual(event_source, small_event_source)
+    self.assertEqual(task_estimate, small_task_estimate)
+
+
 class ExtractionMultiProcessEngineTest(shared_test_lib.BaseTestCase):
   """Tests for the task-based multi-process extraction engine."""
 
+  # pylint: disable=protected-access
+
+  def testCheckMemoryBudget(self):
+    """Tests the _CheckMemoryBudget function."""
+    test_engine = extraction_engine.ExtractionMultiProcessEngine(
+        memory_budget=1024)
+
+    task_estimate = task_costs.TaskCostEstimate(estimated_memory=768)
+    self.assertTrue(test_engine._CheckMemoryBudget(task_estimate))
+    self.assertTrue(test_engine._CheckMemoryBudget(None))
+
+    test_engine._task_cost_model.StartTask('task1', task_estimate)
+    self.assertFalse(test_engine._CheckMemoryBudget(task_estimate))
+
+    small_task_estimate = task_costs.TaskCostEstimate(estimated_memory=256)
+    self.assertTrue(test_engine._CheckMemoryBudget(small_task_estimate))
+
+    test_engine = extraction_engine.ExtractionMultiProcessEngine(
+        memory_budget=0)
+    test_engine._task_cost_model.StartTask('task1', task_estimate)
+    self.assertTrue(test_engine._CheckMemoryBudget(task_estimate))
+
+    # Test that the estimate of an abandoned task is dropped, so that a
+    # deferred task is admitted again.
+    test_engine = extraction_engine.ExtractionMultiProcessEngine(
+        memory_budget=1024)
+    task = test_engine._task_manager.CreateTask('session')
+    test_engine._task_cost_model.StartTask(task.identifier, task_estimate)
+    self.assertFalse(test_engine._CheckMemoryBudget(task_estimate))
+
+    test_engine._task_manager._AbandonQueuedTasks()
+    self.assertTrue(test_engine._CheckMemoryBudget(task_estimate))
+    self.assertEqual(
+        test_engine._task_cost_model.GetPredictedMemoryUsage(), 0)
+
+    # Test that the memory usage of an idle worker process is counted once
+    # per worker process.
+    test_engine = extraction_engine.ExtractionMultiProcessEngine(
+        memory_budget=4096, number_of_worker_processes=1)
+    task_estimate = task_costs.TaskCostEstimate(
+        estimated_memory=1536, worker_memory=1024)
+    test_engine._task_cost_model.StartTask('task1', task_estimate)
+    test_engine._task_cost_model.StartTask('task2', task_estimate)
+    self.assertTrue(test_engine._CheckMemoryBudget(task_estimate))
+
+  def testReadStoredAndWriteTaskCostEstimates(self):
+    """Tests the _ReadStoredTaskCostEstimates and _WriteTaskCostEstimates."""
+    test_engine = extraction_engine.ExtractionMultiProcessEngine()
+
+    storage_writer = fake_writer.FakeStorageWriter()
+    storage_writer.Open()
+
+    try:
+      test_engine._ReadStoredTaskCostEstimates(storage_writer)
+      self.assertIsNone(test_engine._task_cost_estimates)
+
+      task_cost_estimates = tasks.TaskCostEstimates()
+      task_cost_estimates.cost_classes = ['.evtx']
+      task_cost_estimates.memory_factors = [250000]
+      task_cost_estimates.throughputs = [3 * 1024 * 1024]
+      task_cost_estimates.worker_memory = 100 * 1024 * 1024
+      storage_writer.AddAttributeContainer(task_cost_estimates)
+
+      test_engine._ReadStoredTaskCostEstimates(storage_writer)
+      self.assertIsNotNone(test_engine._task_cost_estimates)
+
+      cost_model = test_engine._task_cost_model
+      self.assertEqual(cost_model._memory_factor_per_cost_class['.evtx'], 0.25)
+      self.assertEqual(cost_model._memory_usage, 100 * 1024 * 1024)
+      self.assertEqual(
+          cost_model._throughput_per_cost_class['.evtx'], 3 * 1024 * 1024)
+
+      test_engine._WriteTaskCostEstimates(storage_writer)
+
+      number_of_task_cost_estimates = (
+          storage_writer.GetNumberOfAttributeContainers('task_cost_estimates'))
+      self.assertEqual(number_of_task_cost_estimates, 1)
+
+    finally:
+      storage_writer.Close()
+
+  def testStartStopTaskStorage(self):
+    """Tests the _StartTaskStorage and _StopTaskStorage functions."""
+    test_engine = extraction_engine.ExtractionMultiProcessEngine()
+
+    processing_configuration = configurations.ProcessingConfiguration()
+    test_engine._processing_configuration = processing_configuration
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      output_directory = os.path.join(temp_directory, 'output')
+      os.mkdir(output_directory)
+
+      task_storage_directory = os.path.join(temp_directory, 'tmpfs')
+      os.mkdir(task_storage_directory)
+
+      test_engine._storage_file_path = os.path.join(
+          output_directory, 'storage.plaso')
+      processing_configuration.task_storage_directory = task_storage_directory
+
+      test_engine._MINIMUM_TASK_STORAGE_FREE_SPACE = 0
+      test_engine._StartTaskStorage(definitions.STORAGE_FORMAT_SQLITE)
+
+      self.assertEqual(
+          os.path.dirname(test_engine._task_storage_path),
+          task_storage_directory)
+      self.assertEqual(
+          processing_configuration.task_storage_path,
+          test_engine._task_storage_path)
+
+      test_engine._StopTaskStorage(definitions.STORAGE_FORMAT_SQLITE, None)
+      self.assertIsNone(processing_configuration.task_storage_path)
+
+      # The directory of the storage file is used when the task storage
+      # directory has insufficient free space.
+      test_engine._MINIMUM_TASK_STORAGE_FREE_SPACE = 1 << 62
+      test_engine._StartTaskStorage(definitions.STORAGE_FORMAT_SQLITE)
+
+      self.assertEqual(
+          os.path.dirname(test_engine._task_storage_path), output_directory)
+
+      test_engine._StopTaskStorage(definitions.STORAGE_FORMAT_SQLITE, None)
+
   def testProcessSource(self):
     """Tests the PreprocessSource and ProcessSource functions."""
     test_artifacts_path = shared_test_lib.GetTestFilePath(['artifacts'])
@@ -92,6 +283,266 @@ class ExtractionMultiProcessEngineTest(shared_test_lib.BaseTestCase):
         'total': 15})
     self.assertEqual(parsers_counter, expected_parsers_counter)
 
+  def testProcessSourceIncremental(self):
+    """Tests the ProcessSource function with incremental extraction."""
+    test_artifacts_path = shared_test_lib.GetTestFilePath(['artifacts'])
+    self._SkipIfPathNotExists(test_artifacts_path)
+
+    test_engine = extraction_engine.ExtractionMultiProcessEngine(
+        maximum_number_of_tasks=100)
+    test_engine.BuildArtifactsRegistry(test_artifacts_path, None)
+
+    test_file_path = self._GetTestFilePath(['ímynd.dd'])
+    self._SkipIfPathNotExists(test_file_path)
+
+    os_path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_OS, location=test_file_path)
+    source_path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_TSK, location='/',
+        parent=os_path_spec)
+
+    processing_configuration = configurations.ProcessingConfiguration()
+    processing_configuration.data_location = shared_test_lib.DATA_PATH
+    processing_configuration.parser_filter_expression = 'filestat'
+    processing_configuration.task_storage_format = (
+        definitions.STORAGE_FORMAT_SQLITE)
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      temp_file = os.path.join(temp_directory, 'storage.plaso')
+      storage_writer = sqlite_writer.SQLiteStorageWriter()
+      storage_writer.Open(path=temp_file)
+
+      try:
+        session = sessions.Session()
+        processing_status = test_engine.ProcessSourceMulti(
+            storage_writer, session.identifier, processing_configuration,
+            [], [source_path_spec], storage_file_path=temp_directory)
+
+        self.assertFalse(processing_status.aborted)
+        self.assertEqual(processing_status.number_of_unchanged_file_entries, 0)
+
+        number_of_fingerprints = storage_writer.GetNumberOfAttributeContainers(
+            'file_entry_fingerprint')
+
+        number_of_task_cost_estimates = (
+            storage_writer.GetNumberOfAttributeContainers(
+                'task_cost_estimates'))
+        self.assertEqual(number_of_task_cost_estimates, 1)
+
+      finally:
+        storage_writer.Close()
+
+      storage_writer = sqlite_writer.SQLiteStorageWriter()
+      storage_writer.Open(path=temp_file)
+
+      try:
+        test_engine = extraction_engine.ExtractionMultiProcessEngine(
+            maximum_number_of_tasks=100)
+        test_engine.BuildArtifactsRegistry(test_artifacts_path, None)
+
+        session = sessions.Session()
+        processing_status = test_engine.ProcessSourceMulti(
+            storage_writer, session.identifier, processing_configuration,
+            [], [source_path_spec],
+            incremental_mode=definitions.INCREMENTAL_MODE_METADATA,
+            storage_file_path=temp_directory)
+
+        number_of_events = storage_writer.GetNumberOfAttributeContainers(
+            'event')
+
+        # The task cost estimates of the previous session are updated instead
+        # of being added again.
+        number_of_task_cost_estimates = (
+            storage_writer.GetNumberOfAttributeContainers(
+                'task_cost_estimates'))
+        self.assertEqual(number_of_task_cost_estimates, 1)
+
+      finally:
+        storage_writer.Close()
+
+    self.assertGreater(number_of_fingerprints, 0)
+
+    self.assertFalse(processing_status.aborted)
+    self.assertEqual(
+        processing_status.number_of_unchanged_file_entries,
+        number_of_fingerprints)
+
+    # The events of the unchanged file entries are not extracted again.
+    self.assertEqual(number_of_events, 15)
+
+  def testProcessSourceIncrementalDigest(self):
+    """Tests the ProcessSource function with incremental digest extraction."""
+    test_artifacts_path = shared_test_lib.GetTestFilePath(['artifacts'])
+    self._SkipIfPathNotExists(test_artifacts_path)
+
+    test_engine = extraction_engine.ExtractionMultiProcessEngine(
+        maximum_number_of_tasks=100)
+    test_engine.BuildArtifactsRegistry(test_artifacts_path, None)
+
+    test_file_path = self._GetTestFilePath(['ímynd.dd'])
+    self._SkipIfPathNotExists(test_file_path)
+
+    os_path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_OS, location=test_file_path)
+    source_path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_TSK, location='/',
+        parent=os_path_spec)
+
+    processing_configuration = configurations.ProcessingConfiguration()
+    processing_configuration.data_location = shared_test_lib.DATA_PATH
+    processing_configuration.extraction.hasher_names_string = 'sha256'
+    processing_configuration.parser_filter_expression = 'filestat'
+    processing_configuration.task_storage_format = (
+        definitions.STORAGE_FORMAT_SQLITE)
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      temp_file = os.path.join(temp_directory, 'storage.plaso')
+      storage_writer = sqlite_writer.SQLiteStorageWriter()
+      storage_writer.Open(path=temp_file)
+
+      try:
+        session = sessions.Session()
+        processing_status = test_engine.ProcessSourceMulti(
+            storage_writer, session.identifier, processing_configuration,
+            [], [source_path_spec], storage_file_path=temp_directory)
+
+        self.assertFalse(processing_status.aborted)
+
+        number_of_fingerprints = storage_writer.GetNumberOfAttributeContainers(
+            'file_entry_fingerprint')
+
+      finally:
+        storage_writer.Close()
+
+      storage_writer = sqlite_writer.SQLiteStorageWriter()
+      storage_writer.Open(path=temp_file)
+
+      try:
+        test_engine = extraction_engine.ExtractionMultiProcessEngine(
+            maximum_number_of_tasks=100)
+        test_engine.BuildArtifactsRegistry(test_artifacts_path, None)
+
+        session = sessions.Session()
+        processing_status = test_engine.ProcessSourceMulti(
+            storage_writer, session.identifier, processing_configuration,
+            [], [source_path_spec],
+            incremental_mode=definitions.INCREMENTAL_MODE_DIGEST,
+            storage_file_path=temp_directory)
+
+        number_of_events = storage_writer.GetNumberOfAttributeContainers(
+            'event')
+
+      finally:
+        storage_writer.Close()
+
+    self.assertFalse(processing_status.aborted)
+    self.assertIsNone(test_engine._digest_hash_executor)
+    self.assertEqual(len(test_engine._pending_digest_hashes), 0)
+
+    self.assertGreater(number_of_fingerprints, 0)
+    self.assertEqual(
+        processing_status.number_of_unchanged_file_entries,
+        number_of_fingerprints)
+
+    # The files are compared by the digest hashes calculated by the digest
+    # hash threads.
+    self.assertGreater(processing_status.size_of_unchanged_file_entries, 0)
+
+    # The events of the unchanged file entries are not extracted again.
+    self.assertEqual(number_of_events, 15)
+
+
+  def testProcessSourceResume(self):
+    """Tests the ProcessSource function with an interrupted session."""
+    test_artifacts_path = shared_test_lib.GetTestFilePath(['artifacts'])
+    self._SkipIfPathNotExists(test_artifacts_path)
+
+    test_engine = TestInterruptedEngine(
+        enable_checkpoints=True, maximum_number_of_tasks=100)
+    test_engine.BuildArtifactsRegistry(test_artifacts_path, None)
+
+    test_file_path = self._GetTestFilePath(['ímynd.dd'])
+    self._SkipIfPathNotExists(test_file_path)
+
+    os_path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_OS, location=test_file_path)
+    source_path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_TSK, location='/',
+        parent=os_path_spec)
+
+    session = sessions.Session()
+
+    processing_configuration = configurations.ProcessingConfiguration()
+    processing_configuration.data_location = shared_test_lib.DATA_PATH
+    processing_configuration.parser_filter_expression = 'filestat'
+    processing_configuration.task_storage_format = (
+        definitions.STORAGE_FORMAT_SQLITE)
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      temp_file = os.path.join(temp_directory, 'storage.plaso')
+      storage_writer = sqlite_writer.SQLiteStorageWriter()
+      storage_writer.Open(path=temp_file)
+
+      try:
+        processing_status = test_engine.ProcessSourceMulti(
+            storage_writer, session.identifier, processing_configuration,
+            [], [source_path_spec], storage_file_path=temp_directory)
+
+        self.assertTrue(processing_status.aborted)
+
+        checkpoints = list(storage_writer.GetAttributeContainers(
+            'extraction_checkpoint'))
+        self.assertEqual(len(checkpoints), 1)
+
+        # The attribute containers written after the checkpoint are rolled
+        # back.
+        number_of_events = storage_writer.GetNumberOfAttributeContainers(
+            'event')
+        self.assertGreater(number_of_events, 0)
+        self.assertEqual(
+            number_of_events, checkpoints[0].GetNumberOfContainers('event'))
+
+      finally:
+        storage_writer.Close()
+
+      storage_writer = sqlite_writer.SQLiteStorageWriter()
+      storage_writer.Open(path=temp_file)
+
+      try:
+        test_engine = extraction_engine.ExtractionMultiProcessEngine(
+            enable_checkpoints=True, maximum_number_of_tasks=100)
+        test_engine.BuildArtifactsRegistry(test_artifacts_path, None)
+
+        processing_status = test_engine.ProcessSourceMulti(
+            storage_writer, session.identifier, processing_configuration,
+            [], [source_path_spec], resume=True,
+            storage_file_path=temp_directory)
+
+        number_of_events = storage_writer.GetNumberOfAttributeContainers(
+            'event')
+        number_of_event_sources = (
+            storage_writer.GetNumberOfAttributeContainers('event_source'))
+
+        parsers_counter = collections.Counter({
+            parser_count.name: parser_count.number_of_events
+            for parser_count in storage_writer.GetAttributeContainers(
+                'parser_count')})
+
+      finally:
+        storage_writer.Close()
+
+    self.assertFalse(processing_status.aborted)
+
+    # The events of the event sources that were processed before
+    # the checkpoint are not extracted again.
+    self.assertEqual(number_of_events, 15)
+    self.assertEqual(number_of_event_sources, 6)
+
+    expected_parsers_counter = collections.Counter({
+        'filestat': 15,
+        'total': 15})
+    self.assertEqual(parsers_counter, expected_parsers_counter)
+
 
 if __name__ == '__main__':
   unittest.main()
@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Tests for the shared memory broadcast queues."""
+
+import multiprocessing
+import unittest
+
+from plaso.lib import errors
+from plaso.multi_process import plaso_queue
+from plaso.multi_process import shared_memory_queue
+
+from tests import test_lib as shared_test_lib
+
+
+def _ConsumeItems(reader_queue, result_queue):
+  """Pops items off a queue until a QueueAbort is popped.
+
+  Args:
+    reader_queue (SharedMemoryBroadcastReaderQueue): queue to pop items from.
+    result_queue (multiprocessing.Queue): queue to report the popped items to.
+  """
+  items = []
+  while True:
+    item = reader_queue.PopItem()
+    if isinstance(item, plaso_queue.QueueAbort):
+      break
+
+    items.append(item)
+
+  reader_queue.Close()
+  result_queue.put(items)
+
+
+class SharedMemoryBroadcastQueueTest(shared_test_lib.BaseTestCase):
+  """Tests for the shared memory broadcast queues."""
+
+  # pylint: disable=protected-access
+
+  def testInitialize(self):
+    """Tests the __init__ function."""
+    with self.assertRaises(ValueError):
+      shared_memory_queue.SharedMemoryBroadcastWriterQueue(0)
+
+    with self.assertRaises(ValueError):
+      shared_memory_queue.SharedMemoryBroadcastWriterQueue(1, size=100)
+
+  def testPushAndPopItems(self):
+    """Tests the PushItem and PopItem functions."""
+    writer_queue = shared_memory_queue.SharedMemoryBroadcastWriterQueue(
+        2, maximum_batch_size=16, size=1024, timeout_seconds=1)
+
+    with self.assertRaises(errors.QueueAlreadyClosed):
+      writer_queue.PushItem('item')
+
+    writer_queue.Open()
+
+    try:
+      reader_queues = [
+          shared_memory_queue.SharedMemoryBroadcastReaderQueue(
+              writer_queue.segment_name, reader_index, timeout_seconds=0)
+          for reader_index in range(2)]
+
+      with self.assertRaises(errors.WrongQueueType):
+        writer_queue.PopItem()
+
+      with self.assertRaises(errors.WrongQueueType):
+        reader_queues[0].PushItem('item')
+
+      # Items are held until the batch is complete.
+      for index in range(10):
+        writer_queue.PushItem(f'item{index:d}')
+
+      self.assertFalse(writer_queue.IsEmpty())
+      self.assertTrue(reader_queues[0].IsEmpty())
+
+      with self.assertRaises(errors.QueueEmpty):
+        reader_queues[0].PopItem()
+
+      writer_queue.PushItem(plaso_queue.QueueAbort())
+
+      # Every reader reads all the items independently.
+      for reader_queue in reader_queues:
+        items = [reader_queue.PopItem() for _ in range(11)]
+        self.assertEqual(items[:10], [
+            f'item{index:d}' for index in range(10)])
+        self.assertIsInstance(items[10], plaso_queue.QueueAbort)
+
+        self.assertTrue(reader_queue.IsEmpty())
+
+      self.assertTrue(writer_queue.IsEmpty())
+
+      # Test that the records wrap around the end of the ring buffer.
+      for index in range(400):
+        writer_queue.PushItem(index, block=False)
+
+        if index % 16 == 15:
+          for reader_queue in reader_queues:
+            items = [reader_queue.PopItem() for _ in range(16)]
+            self.assertEqual(items, list(range(index - 15, index + 1)))
+
+      self.assertGreater(writer_queue._write_position, 1024)
+
+      for reader_queue in reader_queues:
+        reader_queue.Close()
+
+    finally:
+      writer_queue.Close()
+
+    with self.assertRaises(errors.QueueAlreadyClosed):
+      writer_queue.Close()
+
+  def testPushItemWithSplitBatch(self):
+    """Tests the PushItem function with a batch that needs to be split."""
+    writer_queue = shared_memory_queue.SharedMemoryBroadcastWriterQueue(
+        1, maximum_batch_size=8, size=256, timeout_seconds=0)
+    writer_queue.Open()
+
+    try:
+      reader_queue = shared_memory_queue.SharedMemoryBroadcastReaderQueue(
+          writer_queue.segment_name, 0, timeout_seconds=0)
+
+      expected_items = [f'{index:d}{"x" * 40:s}' for index in range(8)]
+      for item in expected_items[:7]:
+        writer_queue.PushItem(item, block=False)
+
+      # The batch is split in 2 halves, of which only the first fits.
+      with self.assertRaises(errors.QueueFull):
+        writer_queue.PushItem(expected_items[7], block=False)
+
+      items = [reader_queue.PopItem() for _ in range(4)]
+      self.assertEqual(items, expected_items[:4])
+
+      # The items of the first half are not written again.
+      writer_queue.PushItem(plaso_queue.QueueAbort(), block=False)
+
+      items = [reader_queue.PopItem() for _ in range(5)]
+      self.assertEqual(items[:4], expected_items[4:])
+      self.assertIsInstance(items[4], plaso_queue.QueueAbort)
+
+      self.assertTrue(reader_queue.IsEmpty())
+
+      reader_queue.Close()
+
+    finally:
+      writer_queue.Close()
+
+  def testPushItemWithSlowestReader(self):
+    """Tests the PushItem function with back-pressure of the slowest reader."""
+    writer_queue = shared_memory_queue.SharedMemoryBroadcastWriterQueue(
+        2, size=256, timeout_seconds=0)
+    writer_queue.Open()
+
+    try:
+      reader_queues = [
+          shared_memory_queue.SharedMemoryBroadcastReaderQueue(
+              writer_queue.segment_name, reader_index, timeout_seconds=0)
+          for reader_index in range(2)]
+
+      number_of_items = 0
+      with self.assertRaises(errors.QueueFull):
+        while number_of_items < 100:
+          writer_queue.PushItem(number_of_items, block=False)
+          number_of_items += 1
+
+      self.assertGreater(number_of_items, 0)
+
+      # The writer waits for the slowest reader.
+      for index in range(number_of_items):
+        self.assertEqual(reader_queues[0].PopItem(), index)
+
+      # The items that could not be written are held.
+      with self.assertRaises(errors.QueueFull):
+        writer_queue.PushItem('item', block=False)
+
+      # A detached reader is no longer waited for.
+      writer_queue.DetachReader(1)
+      writer_queue.PushItem(plaso_queue.QueueAbort(), block=False)
+
+      self.assertEqual(reader_queues[0].PopItem(), number_of_items)
+      self.assertEqual(reader_queues[0].PopItem(), 'item')
+      self.assertIsInstance(
+          reader_queues[0].PopItem(), plaso_queue.QueueAbort)
+
+      with self.assertRaises(errors.QueueClose):
+        reader_queues[1].PopItem()
+
+      reader_queues[0].Close()
+
+    finally:
+      writer_queue.Close()
+
+    # The writer closed the queue and removed the shared memory segment.
+    self.assertIsNone(writer_queue.segment_name)
+
+  def testPushAndPopItemsInProcesses(self):
+    """Tests pushing and popping items with reader processes."""
+    writer_queue = shared_memory_queue.SharedMemoryBroadcastWriterQueue(
+        3, maximum_batch_size=32, size=4096, timeout_seconds=60)
+    writer_queue.Open()
+
+    try:
+      result_queue = multiprocessing.Queue()
+
+      processes = []
+      for reader_index in range(3):
+        reader_queue = shared_memory_queue.SharedMemoryBroadcastReaderQueue(
+            writer_queue.segment_name, reader_index, timeout_seconds=60)
+
+        process = multiprocessing.Process(
+            target=_ConsumeItems, args=(reader_queue, result_queue))
+        process.start()
+        processes.append(process)
+
+      expected_items = [(index, f'item{index:d}') for index in range(2000)]
+      for item in expected_items:
+        writer_queue.PushItem(item)
+
+      writer_queue.PushItem(plaso_queue.QueueAbort())
+
+      for _ in range(3):
+        items = result_queue.get(timeout=60)
+        self.assertEqual(items, expected_items)
+
+      for process in processes:
+        process.join(timeout=60)
+
+    finally:
+      writer_queue.Close()
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Tests for the shared memory process status board."""
+
+import unittest
+
+from plaso.multi_process import status_board
+
+from tests import test_lib as shared_test_lib
+
+
+class ProcessStatusBoardTest(shared_test_lib.BaseTestCase):
+  """Tests for the shared memory process status board."""
+
+  # pylint: disable=protected-access
+
+  _TEST_STATUS = {
+      'display_name': 'OS:/tmp/test.txt',
+      'identifier': 'Worker_00',
+      'last_activity_timestamp': 1234567890.5,
+      'number_of_consumed_event_data': None,
+      'number_of_consumed_event_tags': None,
+      'number_of_consumed_events': None,
+      'number_of_consumed_sources': 5,
+      'number_of_produced_event_data': 12,
+      'number_of_produced_event_tags': None,
+      'number_of_produced_events': None,
+      'number_of_produced_sources': 0,
+      'processing_status': 'extracting',
+      'session_identifier': 'fedcba9876543210fedcba9876543210',
+      'task_identifier': '0123456789abcdef0123456789abcdef',
+      'used_memory': f'{5 * 1024 * 1024 * 1024:d}'}
+
+  def testAllocateSlot(self):
+    """Tests the AllocateSlot and FreeSlot functions."""
+    test_board = status_board.ProcessStatusBoard()
+
+    with self.assertRaises(IOError):
+      test_board.AllocateSlot()
+
+    test_board.Create(2)
+
+    try:
+      self.assertEqual(test_board.AllocateSlot(), 0)
+      self.assertEqual(test_board.AllocateSlot(), 1)
+      self.assertIsNone(test_board.AllocateSlot())
+
+      test_board.WriteStatus(0, self._TEST_STATUS)
+      self.assertTrue(test_board.HasStatus(0))
+
+      # A reallocated slot is cleared.
+      test_board.FreeSlot(0)
+      self.assertEqual(test_board.AllocateSlot(), 0)
+      self.assertFalse(test_board.HasStatus(0))
+
+    finally:
+      test_board.Close()
+
+  def testCreateAndOpen(self):
+    """Tests the Create, Open and Close functions."""
+    test_board = status_board.ProcessStatusBoard()
+    self.assertIsNone(test_board.name)
+
+    with self.assertRaises(ValueError):
+      test_board.Create(0)
+
+    test_board.Create(4)
+
+    try:
+      self.assertIsNotNone(test_board.name)
+      self.assertEqual(test_board.number_of_slots, 4)
+
+      with self.assertRaises(IOError):
+        test_board.Create(4)
+
+      other_board = status_board.ProcessStatusBoard()
+      other_board.Open(test_board.name)
+
+      try:
+        self.assertGreaterEqual(other_board.number_of_slots, 4)
+
+      finally:
+        other_board.Close()
+
+    finally:
+      test_board.Close()
+
+    self.assertIsNone(test_board.name)
+
+  def testReadAndWriteStatus(self):
+    """Tests the ReadStatus and WriteStatus functions."""
+    test_board = status_board.ProcessStatusBoard()
+    test_board.Create(2)
+
+    try:
+      slot_index = test_board.AllocateSlot()
+      self.assertIsNone(test_board.ReadStatus(slot_index))
+
+      with self.assertRaises(ValueError):
+        test_board.ReadStatus(2)
+
+      writer_board = status_board.ProcessStatusBoard()
+      writer_board.Open(test_board.name)
+
+      try:
+        writer_board.WriteStatus(slot_index, self._TEST_STATUS)
+
+        status = test_board.ReadStatus(slot_index)
+        self.assertIsNotNone(status)
+
+        for key, value in self._TEST_STATUS.items():
+          self.assertEqual(status[key], value, msg=key)
+
+        self.assertIsNone(status['number_of_consumed_reports'])
+
+        # Test that long strings are truncated.
+        writer_board.WriteStatus(slot_index, {
+            'display_name': 'OS:/tmp/' + 'é' * 512,
+            'processing_status': 'idle'})
+
+        status = test_board.ReadStatus(slot_index)
+        self.assertIsNotNone(status)
+        self.assertEqual(status['display_name'], 'OS:/tmp/' + 'é' * 124)
+        self.assertEqual(status['processing_status'], 'idle')
+        self.assertEqual(status['task_identifier'], '')
+        self.assertEqual(status['used_memory'], '0')
+
+        # Test that a status that is being written is not read.
+        slot_offset = test_board._GetSlotOffset(slot_index)
+        test_board._SEQUENCE_NUMBER.pack_into(
+            test_board._shared_memory.buf, slot_offset, 5)
+        self.assertIsNone(test_board.ReadStatus(slot_index))
+
+      finally:
+        writer_board.Close()
+
+    finally:
+      test_board.Close()
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Tests for the task cost model."""
+
+import unittest
+
+from dfvfs.lib import definitions as dfvfs_definitions
+from dfvfs.path import factory as path_spec_factory
+from dfvfs.resolver import resolver as path_spec_resolver
+
+from plaso.multi_process import task_costs
+
+from tests import test_lib as shared_test_lib
+
+
+class TaskCostModelTest(shared_test_lib.BaseTestCase):
+  """Tests for the task cost model."""
+
+  # pylint: disable=protected-access
+
+  def _OpenFileEntry(self, path_segments, compressed=False):
+    """Opens a test file entry.
+
+    Args:
+      path_segments (list[str]): path segments inside the test data directory.
+      compressed (Optional[bool]): True if the test file is gzip compressed.
+
+    Returns:
+      dfvfs.FileEntry: file entry.
+    """
+    test_file_path = self._GetTestFilePath(path_segments)
+    self._SkipIfPathNotExists(test_file_path)
+
+    path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_OS, location=test_file_path)
+    if compressed:
+      path_spec = path_spec_factory.Factory.NewPathSpec(
+          dfvfs_definitions.TYPE_INDICATOR_GZIP, parent=path_spec)
+
+    return path_spec_resolver.Resolver.OpenFileEntry(path_spec)
+
+  def testAdjustMemoryEstimates(self):
+    """Tests the _AdjustMemoryEstimates function."""
+    cost_model = task_costs.TaskCostModel()
+    cost_model._memory_usage = 100 * 1024 * 1024
+
+    task_estimate = task_costs.TaskCostEstimate(
+        cost_class='.sqlite', size=1024)
+    cost_model._AdjustMemoryEstimates(task_estimate, 200 * 1024 * 1024)
+    self.assertEqual(cost_model._memory_usage, 130 * 1024 * 1024)
+
+    task_estimate = task_costs.TaskCostEstimate(
+        cost_class='.sqlite', size=10 * 1024 * 1024)
+    cost_model._AdjustMemoryEstimates(task_estimate, 180 * 1024 * 1024)
+    self.assertAlmostEqual(
+        cost_model._memory_factor_per_cost_class['.sqlite'], 2.2)
+
+  def testGetDataStreamTypeCostFactor(self):
+    """Tests the _GetDataStreamTypeCostFactor function."""
+    cost_model = task_costs.TaskCostModel()
+
+    os_path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_OS, location='/tmp/syslog.gz')
+    cost_factor = cost_model._GetDataStreamTypeCostFactor(os_path_spec)
+    self.assertEqual(cost_factor, 1.0)
+
+    gzip_path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_GZIP, parent=os_path_spec)
+    cost_factor = cost_model._GetDataStreamTypeCostFactor(gzip_path_spec)
+    self.assertEqual(cost_factor, 3.0)
+
+  def testAbandonTask(self):
+    """Tests the AbandonTask function."""
+    cost_model = task_costs.TaskCostModel()
+
+    test_estimate = task_costs.TaskCostEstimate(
+        cost_class='.evtx', estimated_memory=1024, size=8 * 1024 * 1024)
+    cost_model.StartTask('task1', test_estimate)
+    cost_model.UpdateTaskAsProcessing('task1', used_memory=2048)
+
+    cost_model.AbandonTask('task1')
+    self.assertEqual(cost_model.GetPredictedMemoryUsage(), 0)
+    self.assertEqual(cost_model._task_processing_start_times, {})
+    self.assertEqual(cost_model._task_peak_memory_usage, {})
+
+    task_estimate, actual_duration = cost_model.CompleteTask('task1')
+    self.assertIsNone(task_estimate)
+    self.assertIsNone(actual_duration)
+
+    cost_model.AbandonTask('unknown')
+
+  def testEstimateFileEntryCost(self):
+    """Tests the EstimateFileEntryCost function."""
+    cost_model = task_costs.TaskCostModel()
+
+    file_entry = self._OpenFileEntry(['System.evtx'])
+    task_estimate = cost_model.EstimateFileEntryCost(file_entry)
+    self.assertEqual(task_estimate.cost_class, '.evtx')
+    self.assertEqual(task_estimate.size, 1118208)
+    self.assertAlmostEqual(task_estimate.estimated_duration, 1.116406, places=6)
+    self.assertEqual(task_estimate.estimated_memory, 201885696)
+    self.assertEqual(task_estimate.worker_memory, 201326592)
+
+    file_entry = self._OpenFileEntry(['syslog', 'syslog'])
+    task_estimate = cost_model.EstimateFileEntryCost(file_entry)
+    self.assertEqual(task_estimate.cost_class, '')
+    self.assertLess(task_estimate.estimated_duration, 0.1)
+
+    file_entry = self._OpenFileEntry(['syslog.gz'], compressed=True)
+    compressed_task_estimate = cost_model.EstimateFileEntryCost(file_entry)
+    self.assertGreater(
+        compressed_task_estimate.estimated_duration,
+        task_estimate.estimated_duration)
+
+  def testGetAndSetEstimates(self):
+    """Tests the GetEstimates and SetEstimates functions."""
+    cost_model = task_costs.TaskCostModel()
+    cost_model._memory_factor_per_cost_class['.evtx'] = 0.25
+    cost_model._memory_usage = 100 * 1024 * 1024
+    cost_model._throughput_per_cost_class['.evtx'] = 3.5 * 1024 * 1024
+
+    task_cost_estimates = cost_model.GetEstimates()
+    self.assertIn('.evtx', task_cost_estimates.cost_classes)
+    self.assertEqual(
+        len(task_cost_estimates.memory_factors),
+        len(task_cost_estimates.cost_classes))
+    self.assertEqual(
+        len(task_cost_estimates.throughputs),
+        len(task_cost_estimates.cost_classes))
+    self.assertEqual(task_cost_estimates.worker_memory, 100 * 1024 * 1024)
+
+    index = task_cost_estimates.cost_classes.index('.evtx')
+    self.assertEqual(task_cost_estimates.memory_factors[index], 250000)
+    self.assertEqual(task_cost_estimates.throughputs[index], 3670016)
+
+    cost_model = task_costs.TaskCostModel()
+    cost_model.SetEstimates(task_cost_estimates)
+
+    self.assertEqual(cost_model._memory_factor_per_cost_class['.evtx'], 0.25)
+    self.assertEqual(cost_model._memory_usage, 100 * 1024 * 1024)
+    self.assertEqual(
+        cost_model._throughput_per_cost_class['.evtx'], 3.5 * 1024 * 1024)
+
+    # The estimates of cost classes that were not stored are kept.
+    task_cost_estimates.cost_classes = ['.evtx']
+    task_cost_estimates.memory_factors = [500000]
+    task_cost_estimates.throughputs = [0]
+
+    cost_model.SetEstimates(task_cost_estimates)
+
+    self.assertEqual(cost_model._memory_factor_per_cost_class['.evtx'], 0.5)
+    self.assertEqual(
+        cost_model._throughput_per_cost_class['.evtx'], 3.5 * 1024 * 1024)
+    self.assertEqual(
+        cost_model._throughput_per_cost_class['.db'], 4 * 1024 * 1024)
+
+  def testGetPredictedMemoryUsage(self):
+    """Tests the GetPredictedMemoryUsage function."""
+    cost_model = task_costs.TaskCostModel()
+    self.assertEqual(cost_model.GetPredictedMemoryUsage(), 0)
+
+    cost_model.StartTask('task1', task_costs.TaskCostEstimate(
+        estimated_memory=1024))
+    cost_model.StartTask('task2', task_costs.TaskCostEstimate(
+        estimated_memory=2048))
+    self.assertEqual(cost_model.GetPredictedMemoryUsage(), 3072)
+
+    cost_model.CompleteTask('task1')
+    self.assertEqual(cost_model.GetPredictedMemoryUsage(), 2048)
+
+    cost_model.CompleteTask('task2')
+
+    # The memory usage of an idle worker process is counted once per worker.
+    for task_identifier in ('task1', 'task2', 'task3'):
+      cost_model.StartTask(task_identifier, task_costs.TaskCostEstimate(
+          estimated_memory=1536, worker_memory=1024))
+
+    self.assertEqual(cost_model.GetPredictedMemoryUsage(), 4608)
+    self.assertEqual(cost_model.GetPredictedMemoryUsage(
+        number_of_worker_processes=2), 3584)
+
+    task_estimate = task_costs.TaskCostEstimate(
+        estimated_memory=3072, worker_memory=1024)
+    self.assertEqual(cost_model.GetPredictedMemoryUsage(
+        number_of_worker_processes=2, task_estimate=task_estimate), 5632)
+
+  def testStartAndCompleteTask(self):
+    """Tests the StartTask and CompleteTask functions."""
+    cost_model = task_costs.TaskCostModel()
+
+    task_estimate, actual_duration = cost_model.CompleteTask('unknown')
+    self.assertIsNone(task_estimate)
+    self.assertIsNone(actual_duration)
+
+    test_estimate = task_costs.TaskCostEstimate(
+        cost_class='.evtx', estimated_duration=8.0, size=8 * 1024 * 1024)
+    cost_model.StartTask('task1', test_estimate)
+    cost_model.UpdateTaskAsProcessing('task1', used_memory=300 * 1024 * 1024)
+    cost_model.UpdateTaskAsProcessing('task1', used_memory=250 * 1024 * 1024)
+    self.assertEqual(
+        cost_model._task_peak_memory_usage['task1'], 300 * 1024 * 1024)
+
+    # Pretend the task was started 2 seconds ago.
+    task_estimate, start_time = cost_model._task_estimates['task1']
+    cost_model._task_estimates['task1'] = (task_estimate, start_time - 2.0)
+    cost_model._task_processing_start_times['task1'] -= 2.0
+
+    task_estimate, actual_duration = cost_model.CompleteTask('task1')
+    self.assertEqual(task_estimate, test_estimate)
+    self.assertGreaterEqual(actual_duration, 2.0)
+
+    # The task completed faster than predicted, therefore the throughput
+    # estimate of the cost class should have increased.
+    self.assertGreater(
+        cost_model._throughput_per_cost_class['.evtx'], 1024 * 1024)
+
+    task_estimate, actual_duration = cost_model.CompleteTask('task1')
+    self.assertIsNone(task_estimate)
+
+
+if __name__ == '__main__':
+  unittest.main()
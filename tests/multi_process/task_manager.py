@@ -458,6 +458,21 @@ class TaskManagerTest(shared_test_lib.BaseTestCase):
     self.assertEqual(len(manager._tasks_merging), 0)
     self.assertEqual(len(manager._tasks_abandoned), 1)
 
+  def testGetAbandonedTaskIdentifiers(self):
+    """Tests the GetAbandonedTaskIdentifiers function."""
+    manager = task_manager.TaskManager()
+    test_tasks = [
+        manager.CreateTask(self._TEST_SESSION_IDENTIFIER) for _ in range(2)]
+
+    task_identifiers = manager.GetAbandonedTaskIdentifiers()
+    self.assertEqual(task_identifiers, [])
+
+    manager._AbandonQueuedTasks()
+
+    task_identifiers = manager.GetAbandonedTaskIdentifiers()
+    self.assertEqual(
+        set(task_identifiers), set(task.identifier for task in test_tasks))
+
   def testGetFailedTasks(self):
     """Tests the GetFailedTasks function."""
     manager = task_manager.TaskManager()
@@ -478,6 +493,18 @@ class TaskManagerTest(shared_test_lib.BaseTestCase):
     result_tasks = manager.GetFailedTasks()
     self.assertEqual(set(result_tasks), set(test_tasks))
 
+  def testGetNumberOfQueuedTasks(self):
+    """Tests the GetNumberOfQueuedTasks function."""
+    manager = task_manager.TaskManager()
+    self.assertEqual(manager.GetNumberOfQueuedTasks(), 0)
+
+    task = manager.CreateTask(self._TEST_SESSION_IDENTIFIER)
+    manager.CreateTask(self._TEST_SESSION_IDENTIFIER)
+    self.assertEqual(manager.GetNumberOfQueuedTasks(), 2)
+
+    manager.UpdateTaskAsProcessingByIdentifier(task.identifier)
+    self.assertEqual(manager.GetNumberOfQueuedTasks(), 1)
+
   def testGetProcessedTaskByIdentifier(self):
     """Tests the GetProcessedTaskByIdentifier function."""
     manager = task_manager.TaskManager()
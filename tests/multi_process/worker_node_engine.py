@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Tests the multi-process extraction worker node engine."""
+
+import json
+import time
+import unittest
+
+import fakeredis
+
+from plaso.lib import definitions
+from plaso.multi_process import extraction_engine
+from plaso.multi_process import worker_node_engine
+
+from tests import test_lib as shared_test_lib
+
+
+class TestProcess(object):
+  """Worker process for testing.
+
+  Attributes:
+    exitcode (int): exit code of the process.
+    name (str): name of the process.
+    pid (int): process identifier (PID) of the process.
+  """
+
+  def __init__(self, name, pid):
+    """Initializes a worker process for testing.
+
+    Args:
+      name (str): name of the process.
+      pid (int): process identifier (PID) of the process.
+    """
+    super(TestProcess, self).__init__()
+    self.exitcode = None
+    self.name = name
+    self.pid = pid
+
+  def is_alive(self):
+    """Determines if the process is alive.
+
+    Returns:
+      bool: True if the process is alive.
+    """
+    return self.exitcode is None
+
+
+class ExtractionWorkerNodeEngineTest(shared_test_lib.BaseTestCase):
+  """Tests for the multi-process extraction worker node engine."""
+
+  # pylint: disable=protected-access
+
+  _SESSION_IDENTIFIER = '0123456789abcdef0123456789abcdef'
+
+  _PROCESS_STATUS = {
+      'display_name': 'OS:/tmp/test.txt',
+      'identifier': 'Worker_00',
+      'last_activity_timestamp': 0.0,
+      'number_of_consumed_event_data': None,
+      'number_of_consumed_sources': 5,
+      'number_of_produced_event_data': 12,
+      'number_of_produced_sources': 0,
+      'processing_status': definitions.STATUS_INDICATOR_RUNNING,
+      'session_identifier': _SESSION_IDENTIFIER,
+      'task_identifier': 'fedcba9876543210fedcba9876543210',
+      'used_memory': '1024'}
+
+  def _CreateTestEngine(self, redis_client):
+    """Creates a worker node engine with a registered worker process.
+
+    Args:
+      redis_client (Redis): Redis client.
+
+    Returns:
+      tuple[ExtractionWorkerNodeEngine, TestProcess]: worker node engine and
+          its worker process.
+    """
+    test_engine = worker_node_engine.ExtractionWorkerNodeEngine(
+        worker_node_name='node1')
+    test_engine._redis_client = redis_client
+
+    test_process = TestProcess('Worker_00', 1234)
+    test_engine._processes_per_pid[test_process.pid] = test_process
+    test_engine._process_information_per_pid[test_process.pid] = None
+
+    return test_engine, test_process
+
+  def testCheckStatusWorkerProcess(self):
+    """Tests the _CheckStatusWorkerProcess function."""
+    redis_client = fakeredis.FakeStrictRedis()
+    test_engine, test_process = self._CreateTestEngine(redis_client)
+
+    # A worker process that exited normally is not replaced.
+    test_process.exitcode = 0
+    test_engine._CheckStatusWorkerProcess(test_process.pid)
+
+    self.assertEqual(test_engine._processing_status.workers_status, [])
+
+  def testIsForemanActive(self):
+    """Tests the _IsForemanActive function."""
+    redis_client = fakeredis.FakeStrictRedis()
+    test_engine, test_process = self._CreateTestEngine(redis_client)
+
+    self.assertFalse(test_engine._IsForemanActive())
+
+    key_name = test_engine._GetForemanRedisKeyName(self._SESSION_IDENTIFIER)
+    redis_client.set(key_name, 'Main')
+    self.assertTrue(test_engine._IsForemanActive())
+
+    test_engine._session_identifiers_per_pid[test_process.pid] = (
+        'fedcba9876543210fedcba9876543210')
+    self.assertFalse(test_engine._IsForemanActive())
+
+    test_engine._session_identifiers_per_pid[test_process.pid] = (
+        self._SESSION_IDENTIFIER)
+    self.assertTrue(test_engine._IsForemanActive())
+
+  def testUpdateProcessingStatus(self):
+    """Tests the _UpdateProcessingStatus and _RemoveWorkerStatus functions."""
+    redis_client = fakeredis.FakeStrictRedis()
+    test_engine, test_process = self._CreateTestEngine(redis_client)
+
+    test_engine._UpdateProcessingStatus(
+        test_process.pid, self._PROCESS_STATUS, 1024)
+
+    hash_name = test_engine._GetWorkerStatusRedisHashName(
+        self._SESSION_IDENTIFIER)
+    worker_statuses = redis_client.hgetall(hash_name)
+    self.assertEqual(list(worker_statuses.keys()), [b'node1-Worker_00'])
+
+    worker_status = json.loads(worker_statuses[b'node1-Worker_00'])
+    self.assertEqual(worker_status['pid'], 1234)
+    self.assertEqual(worker_status['number_of_consumed_sources'], 5)
+    self.assertEqual(worker_status['used_memory'], 1024)
+
+    # An idle worker process keeps publishing its status for the session of
+    # the last task it processed.
+    process_status = dict(self._PROCESS_STATUS)
+    process_status['processing_status'] = definitions.STATUS_INDICATOR_IDLE
+    process_status['session_identifier'] = ''
+    process_status['task_identifier'] = ''
+
+    test_engine._UpdateProcessingStatus(
+        test_process.pid, process_status, 1024)
+
+    worker_status = json.loads(redis_client.hget(hash_name, 'node1-Worker_00'))
+    self.assertEqual(
+        worker_status['processing_status'], definitions.STATUS_INDICATOR_IDLE)
+
+    test_engine._RemoveWorkerStatus()
+
+    self.assertEqual(redis_client.hgetall(hash_name), {})
+
+  def testUpdateWorkerNodesStatus(self):
+    """Tests the _UpdateWorkerNodesStatus function of the foreman."""
+    redis_client = fakeredis.FakeStrictRedis()
+    test_engine, test_process = self._CreateTestEngine(redis_client)
+
+    test_engine._UpdateProcessingStatus(
+        test_process.pid, self._PROCESS_STATUS, 1024)
+
+    foreman_engine = extraction_engine.ExtractionMultiProcessEngine(
+        worker_nodes_port=50000)
+    foreman_engine._redis_client = redis_client
+    foreman_engine._session_identifier = self._SESSION_IDENTIFIER
+
+    foreman_engine._UpdateWorkerNodesStatus()
+
+    key_name = foreman_engine._GetForemanRedisKeyName(self._SESSION_IDENTIFIER)
+    self.assertTrue(redis_client.exists(key_name))
+
+    self.assertEqual(foreman_engine._number_of_worker_node_processes, 1)
+
+    workers_status = foreman_engine._processing_status.workers_status
+    self.assertEqual(len(workers_status), 1)
+    self.assertEqual(workers_status[0].identifier, 'node1-Worker_00')
+    self.assertEqual(workers_status[0].number_of_consumed_sources, 5)
+    self.assertEqual(
+        workers_status[0].status, definitions.STATUS_INDICATOR_RUNNING)
+
+    # A worker process that has not published its status within the worker
+    # timeout is considered not responding.
+    hash_name = foreman_engine._GetWorkerStatusRedisHashName(
+        self._SESSION_IDENTIFIER)
+    process_status = json.loads(redis_client.hget(hash_name, 'node1-Worker_00'))
+    process_status['update_timestamp'] = (
+        time.time() - foreman_engine._worker_timeout - 1.0)
+    redis_client.hset(hash_name, 'node1-Worker_00', json.dumps(process_status))
+
+    foreman_engine._UpdateWorkerNodesStatus()
+
+    self.assertEqual(foreman_engine._number_of_worker_node_processes, 0)
+
+    workers_status = foreman_engine._processing_status.workers_status
+    self.assertEqual(
+        workers_status[0].status, definitions.STATUS_INDICATOR_NOT_RESPONDING)
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -4,28 +4,17 @@
 
 import unittest
 
+from unittest import mock
+
+import zmq
+
 from plaso.lib import errors
+from plaso.multi_process import plaso_queue
 from plaso.multi_process import zeromq_queue
 
 from tests import test_lib as shared_test_lib
 
 
-class ZeroMQPullBindQueue(zeromq_queue.ZeroMQPullQueue):
-  """A Plaso queue backed by a ZeroMQ PULL socket that binds to a port.
-
-  This queue may only be used to pop items, not to push.
-  """
-  SOCKET_CONNECTION_TYPE = zeromq_queue.ZeroMQQueue.SOCKET_CONNECTION_BIND
-
-
-class ZeroMQPushConnectQueue(zeromq_queue.ZeroMQPushQueue):
-  """A Plaso queue backed by a ZeroMQ PUSH socket that connects to a port.
-
-  This queue may only be used to push items, not to pop.
-  """
-  SOCKET_CONNECTION_TYPE = zeromq_queue.ZeroMQQueue.SOCKET_CONNECTION_CONNECT
-
-
 class ZeroMQRequestBindQueue(zeromq_queue.ZeroMQRequestQueue):
   """A Plaso queue backed by a ZeroMQ REQ socket that binds to a port.
 
@@ -48,7 +37,7 @@ class ZeroMQQueuesTest(shared_test_lib.BaseTestCase):
   # pylint: disable=protected-access
 
   _QUEUE_CLASSES = frozenset([
-      zeromq_queue.ZeroMQPushBindQueue, ZeroMQPullBindQueue,
+      zeromq_queue.ZeroMQPushBindQueue, zeromq_queue.ZeroMQPullBindQueue,
       ZeroMQRequestBindQueue])
 
   def _testItemTransferred(self, push_queue, pop_queue):
@@ -68,6 +57,98 @@ class ZeroMQQueuesTest(shared_test_lib.BaseTestCase):
     with self.assertRaises(errors.QueueAlreadyClosed):
       test_queue.PushItem('This shouldn\'t work')
 
+  def testBatchedPushPullQueues(self):
+    """Tests that batched items are transferred between push and pull queues."""
+    push_queue = zeromq_queue.ZeroMQPushBindQueue(
+        name='batchedpushpull_pushbind', delay_open=False, linger_seconds=1,
+        maximum_batch_size=8)
+    pull_queue = zeromq_queue.ZeroMQPullConnectQueue(
+        name='batchedpushpull_pullconnect', delay_open=False,
+        port=push_queue.port, linger_seconds=1, maximum_batch_size=8)
+
+    try:
+      self.assertEqual(push_queue._zmq_socket.hwm, 125)
+
+      items = [('item', index) for index in range(100)]
+      for item in items:
+        push_queue.PushItem(item)
+
+      # The QueueAbort sends the items that are held for a batch.
+      push_queue.PushItem(plaso_queue.QueueAbort())
+      self.assertEqual(push_queue._batch, [])
+
+      popped_items = [pull_queue.PopItem() for _ in range(len(items))]
+      self.assertEqual(popped_items, items)
+
+      popped_item = pull_queue.PopItem()
+      self.assertIsInstance(popped_item, plaso_queue.QueueAbort)
+
+    finally:
+      push_queue.Close()
+      pull_queue.Close()
+
+  def testBatchedRequestAndBufferedReplyQueues(self):
+    """Tests batched REQ and buffered REP queue pairs."""
+    reply_queue = zeromq_queue.ZeroMQBufferedReplyBindQueue(
+        name='batchedrequestbufferedreply_replybind', delay_open=False,
+        linger_seconds=1, maximum_batch_size=4)
+    request_queue = zeromq_queue.ZeroMQRequestConnectQueue(
+        name='batchedrequestbufferedreply_requestconnect', delay_open=True,
+        port=reply_queue.port, linger_seconds=1)
+
+    try:
+      items = ['item {0:d}'.format(index) for index in range(10)]
+      for item in items:
+        reply_queue.PushItem(item)
+
+      reply_queue.PushItem(plaso_queue.QueueAbort())
+      reply_queue.PushItem(plaso_queue.QueueAbort())
+
+      popped_items = [request_queue.PopItem()]
+      self.assertEqual(len(request_queue._received_items), 3)
+
+      popped_items.extend([
+          request_queue.PopItem() for _ in range(len(items) - 1)])
+      self.assertEqual(popped_items, items)
+
+      # Every QueueAbort is sent in a separate reply.
+      popped_item = request_queue.PopItem()
+      self.assertIsInstance(popped_item, plaso_queue.QueueAbort)
+      self.assertEqual(len(request_queue._received_items), 0)
+
+    finally:
+      reply_queue.Close(abort=True)
+      request_queue.Close(abort=True)
+
+  def testPopItems(self):
+    """Tests the PopItems function."""
+    pull_queue = zeromq_queue.ZeroMQPullBindQueue(
+        name='popitems_pullbind', delay_open=False, linger_seconds=1)
+    push_queue = zeromq_queue.ZeroMQPushConnectQueue(
+        name='popitems_pushconnect', delay_open=False, port=pull_queue.port,
+        linger_seconds=1)
+
+    try:
+      self.assertEqual(pull_queue.PopItems(), [])
+
+      items = [('item', index) for index in range(5)]
+      for item in items:
+        push_queue.PushItem(item)
+
+      popped_items = pull_queue.PopItems(timeout_seconds=5.0)
+      while len(popped_items) < len(items):
+        remaining_items = pull_queue.PopItems(timeout_seconds=5.0)
+        if not remaining_items:
+          break
+        popped_items.extend(remaining_items)
+
+      self.assertEqual(popped_items, items)
+      self.assertEqual(pull_queue.PopItems(), [])
+
+    finally:
+      push_queue.Close()
+      pull_queue.Close()
+
   def testPushPullQueues(self):
     """Tests than an item can be transferred between push and pull queues."""
     push_queue = zeromq_queue.ZeroMQPushBindQueue(
@@ -78,9 +159,9 @@ class ZeroMQQueuesTest(shared_test_lib.BaseTestCase):
     self._testItemTransferred(push_queue, pull_queue)
     push_queue.Close()
     pull_queue.Close()
-    pull_queue = ZeroMQPullBindQueue(
+    pull_queue = zeromq_queue.ZeroMQPullBindQueue(
         name='pushpull_pullbind', delay_open=False, linger_seconds=1)
-    push_queue = ZeroMQPushConnectQueue(
+    push_queue = zeromq_queue.ZeroMQPushConnectQueue(
         name='pushpull_pushconnect', delay_open=False, port=pull_queue.port,
         linger_seconds=1)
     self._testItemTransferred(push_queue, pull_queue)
@@ -120,6 +201,34 @@ class ZeroMQQueuesTest(shared_test_lib.BaseTestCase):
     reply_queue.Close()
     request_queue.Close()
 
+  def testRequestNotUnpickled(self):
+    """Tests that the buffered REP queue does not unpickle requests."""
+    reply_queue = zeromq_queue.ZeroMQBufferedReplyBindQueue(
+        name='requestnotunpickled_replybind', delay_open=False,
+        linger_seconds=1)
+    reply_queue.PushItem('This is a test item.')
+
+    zmq_context = zmq.Context()  # pylint: disable=abstract-class-instantiated
+    zmq_socket = zmq_context.socket(zmq.REQ)
+    zmq_socket.setsockopt(zmq.RCVTIMEO, 5000)
+    zmq_socket.setsockopt(zmq.LINGER, 0)
+
+    try:
+      zmq_socket.connect(f'tcp://127.0.0.1:{reply_queue.port:d}')
+
+      with mock.patch.object(zeromq_queue.pickle, 'loads') as mock_loads:
+        zmq_socket.send(b'\x80\x04garbage')
+        reply = zmq_socket.recv()
+
+      mock_loads.assert_not_called()
+      self.assertEqual(
+          zeromq_queue.pickle.loads(reply), 'This is a test item.')
+
+    finally:
+      zmq_socket.close()
+      zmq_context.term()
+      reply_queue.Close(abort=True)
+
   def testEmptyBufferedQueues(self):
     """Tests the Empty method for buffered queues."""
     queue = zeromq_queue.ZeroMQBufferedReplyBindQueue(
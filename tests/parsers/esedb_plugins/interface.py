@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Tests for the ESE database plugin interface."""
+
+import unittest
+
+import pyesedb
+
+from plaso.parsers import mediator as parsers_mediator
+from plaso.parsers.esedb_plugins import interface
+
+from tests.parsers.esedb_plugins import test_lib
+
+
+class TestESEDBPlugin(interface.ESEDBPlugin):
+  """ESE database plugin for testing purposes."""
+
+  NAME = 'test'
+
+  REQUIRED_TABLES = {
+      'string': ''}
+
+  def _ConvertValueBinaryDataToUpperCase(self, value):
+    """Converts a binary data value into an upper case string.
+
+    Args:
+      value (bytes): binary data value containing an UTF-16 little-endian
+          end-of-string character terminated string or None.
+
+    Returns:
+      str: upper case string or None.
+    """
+    if value:
+      return value.decode('utf-16-le').rstrip('\x00').upper()
+
+    return None
+
+
+class ESEDBPluginTest(test_lib.ESEDBPluginTestCase):
+  """Tests for the ESE database plugin interface."""
+
+  # pylint: disable=protected-access
+
+  _VALUE_MAPPINGS = {
+      'string': '_ConvertValueBinaryDataToUpperCase'}
+
+  def _OpenStringTable(self):
+    """Opens the string table of the test database.
+
+    Returns:
+      tuple[pyesedb.file, pyesedb.table]: ESE database file and its string
+          table.
+    """
+    test_file_path = self._GetTestFilePath(['Catalog1.edb'])
+    self._SkipIfPathNotExists(test_file_path)
+
+    esedb_file = pyesedb.open(test_file_path)
+    return esedb_file, esedb_file.get_table_by_name('string')
+
+  def testGetColumnPlan(self):
+    """Tests the _GetColumnPlan function."""
+    esedb_file, esedb_table = self._OpenStringTable()
+
+    try:
+      plugin = TestESEDBPlugin()
+
+      record = esedb_table.get_record(0)
+      column_plan = plugin._GetColumnPlan('string', record)
+      self.assertEqual(len(column_plan), 2)
+
+      value_entry, column_name, value_reader, value_callback, _ = (
+          column_plan[0])
+      self.assertEqual(value_entry, 0)
+      self.assertEqual(column_name, 'id')
+      self.assertEqual(value_reader, plugin._ReadIntegerRecordValue)
+      self.assertIsNone(value_callback)
+
+      # Test that the column plan is reused for other records of the table.
+      record = esedb_table.get_record(1)
+      self.assertIs(plugin._GetColumnPlan('string', record), column_plan)
+
+      # Test that a column plan with different value mappings is not reused.
+      value_mappings_column_plan = plugin._GetColumnPlan(
+          'string', record, value_mappings=self._VALUE_MAPPINGS)
+      self.assertIsNot(value_mappings_column_plan, column_plan)
+
+      _, column_name, _, value_callback, value_callback_method = (
+          value_mappings_column_plan[1])
+      self.assertEqual(column_name, 'string')
+      self.assertEqual(
+          value_callback, plugin._ConvertValueBinaryDataToUpperCase)
+      self.assertEqual(
+          value_callback_method, '_ConvertValueBinaryDataToUpperCase')
+
+    finally:
+      esedb_file.close()
+
+  def testGetRecordValues(self):
+    """Tests the _GetRecordValues function."""
+    esedb_file, esedb_table = self._OpenStringTable()
+
+    try:
+      parser_mediator = parsers_mediator.ParserMediator()
+
+      storage_writer = self._CreateStorageWriter()
+      parser_mediator.SetStorageWriter(storage_writer)
+
+      plugin = TestESEDBPlugin()
+
+      record = esedb_table.get_record(0)
+      record_values = plugin._GetRecordValues(
+          parser_mediator, 'string', 0, record)
+
+      self.assertEqual(record_values, {
+          'id': plugin._GetRecordValue(record, 0),
+          'string': plugin._GetRecordValue(record, 1)})
+
+      record_values = plugin._GetRecordValues(
+          parser_mediator, 'string', 0, record,
+          value_mappings=self._VALUE_MAPPINGS)
+
+      expected_string = plugin._GetRecordValue(record, 1).upper()
+      self.assertEqual(record_values['string'], expected_string)
+
+    finally:
+      esedb_file.close()
+
+
+if __name__ == '__main__':
+  unittest.main()
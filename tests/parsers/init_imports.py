@@ -1,6 +1,6 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
-"""Tests that all parsers and plugins are imported correctly."""
+"""Tests that all plugins are imported correctly."""
 
 import glob
 import os
@@ -10,7 +10,7 @@ from tests import test_lib
 
 
 class ParserImportTest(test_lib.ImportCheckTestCase):
-  """Tests that parser classes are imported correctly."""
+  """Tests that plugin classes are imported correctly."""
 
   _IGNORABLE_FILES = frozenset([
       'dtfabric_parser.py',
@@ -22,11 +22,6 @@ class ParserImportTest(test_lib.ImportCheckTestCase):
       'plugins.py',
       'presets.py'])
 
-  def testParsersImported(self):
-    """Tests that all parsers are imported."""
-    self._AssertFilesImportedInInit(
-        test_lib.PARSERS_PATH, self._IGNORABLE_FILES)
-
   def testPluginsImported(self):
     """Tests that all plugins are imported."""
     parsers_glob = '{0:s}/*_plugins/'.format(test_lib.PARSERS_PATH)
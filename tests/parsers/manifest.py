@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Tests for the parsers and plugins manifest."""
+
+import importlib
+import pkgutil
+import unittest
+
+from plaso import parsers
+from plaso.parsers import manager
+from plaso.parsers import manifest
+
+from tests import test_lib as shared_test_lib
+
+
+class ParsersManifestTest(shared_test_lib.BaseTestCase):
+  """Tests for the parsers and plugins manifest."""
+
+  def testManifest(self):
+    """Tests that the manifest matches the parsers and plugins."""
+    for module_information in pkgutil.walk_packages(
+        parsers.__path__, prefix='{0:s}.'.format(parsers.__name__)):
+      importlib.import_module(module_information.name)
+
+    parsers_manifest = manager.ParsersManager.CreateParsersManifest()
+
+    error_message = (
+        'Parsers manifest is outdated, regenerate it with: '
+        'utils/generate_parsers_manifest.py')
+    self.assertEqual(
+        sorted(manifest.PARSERS.keys()), sorted(parsers_manifest.keys()),
+        error_message)
+
+    for parser_name, parser_descriptor in parsers_manifest.items():
+      self.assertEqual(
+          manifest.PARSERS[parser_name], parser_descriptor, error_message)
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -168,6 +168,39 @@ class ParsersMediatorTest(test_lib.ParserTestCase):
   # TODO: add tests for ProduceEventDataStream.
   # TODO: add tests for ProduceEventSource.
 
+  def testProduceEventSourcePartition(self):
+    """Tests the ProduceEventSourcePartition method."""
+    parser_mediator = mediator.ParserMediator()
+
+    storage_writer = fake_writer.FakeStorageWriter()
+    parser_mediator.SetStorageWriter(storage_writer)
+
+    storage_writer.Open()
+
+    event_data_stream = events.EventDataStream()
+    parser_mediator.ProduceEventDataStream(event_data_stream)
+
+    parser_mediator.ProduceEventSourcePartition('test_parser', 10, 20)
+
+    number_of_event_source_partitions = (
+        storage_writer.GetNumberOfAttributeContainers('event_source_partition'))
+    self.assertEqual(number_of_event_source_partitions, 1)
+
+    event_source_partition = storage_writer.GetAttributeContainerByIndex(
+        'event_source_partition', 0)
+    self.assertEqual(event_source_partition.parser_name, 'test_parser')
+    self.assertEqual(event_source_partition.partition_end, 20)
+    self.assertEqual(event_source_partition.partition_start, 10)
+
+    event_data_stream_identifier = (
+        event_source_partition.GetEventDataStreamIdentifier())
+    self.assertIsNotNone(event_data_stream_identifier)
+
+    expected_identifier = event_data_stream.GetIdentifier()
+    self.assertEqual(
+        event_data_stream_identifier.CopyToString(),
+        expected_identifier.CopyToString())
+
   def testProduceExtractionWarning(self):
     """Tests the ProduceExtractionWarning method."""
     parser_mediator = mediator.ParserMediator()
@@ -4,17 +4,139 @@
 
 import unittest
 
+from dfdatetime import interface as dfdatetime_interface
+
 from dfvfs.lib import definitions as dfvfs_definitions
 from dfvfs.path import factory as path_spec_factory
+from dfvfs.resolver import resolver as path_spec_resolver
 
+from plaso.parsers import mediator as parsers_mediator
 from plaso.parsers import ntfs
 
 from tests.parsers import test_lib
 
 
+class TestDataStream(object):
+  """$J data stream for testing purposes.
+
+  Attributes:
+    number_of_extents (int): number of extents.
+    read_offsets (list[int]): offsets of the data that was read.
+    size (int): size of the data stream.
+  """
+
+  def __init__(self, data, extents):
+    """Initializes a $J data stream.
+
+    Args:
+      data (bytes): data of the $J data stream.
+      extents (list[tuple[int, int, int]]): offset, size and flags of
+          the extents.
+    """
+    super(TestDataStream, self).__init__()
+    self._data = data
+    self._extents = extents
+    self.number_of_extents = len(extents)
+    self.read_offsets = []
+    self.size = len(data)
+
+  def get_extent(self, extent_index):
+    """Retrieves an extent.
+
+    Args:
+      extent_index (int): index of the extent.
+
+    Returns:
+      tuple[int, int, int]: offset, size and flags of the extent.
+    """
+    return self._extents[extent_index]
+
+  def read_buffer_at_offset(self, size, offset):
+    """Reads a buffer at a specific offset.
+
+    Args:
+      size (int): number of bytes to read.
+      offset (int): offset of the data to read.
+
+    Returns:
+      bytes: data read.
+    """
+    self.read_offsets.append(offset)
+    return self._data[offset:offset + size]
+
+
+class TestUSNChangeJournal(object):
+  """USN change journal for testing purposes.
+
+  The USN change journal reads the USN records of an export of the $J data
+  stream, as pyfsntfs.usn_change_journal does.
+  """
+
+  def __init__(self, data):
+    """Initializes an USN change journal.
+
+    Args:
+      data (bytes): data of the $J data stream.
+    """
+    super(TestUSNChangeJournal, self).__init__()
+    self._data = data
+    self._offset = 0
+
+  def get_offset(self):
+    """Retrieves the current offset.
+
+    Returns:
+      int: current offset.
+    """
+    return self._offset
+
+  def read_usn_record(self):
+    """Reads an USN record.
+
+    Returns:
+      bytes: USN record data or None if no more records are available.
+    """
+    while self._offset < len(self._data):
+      record_size = int.from_bytes(
+          self._data[self._offset:self._offset + 4], 'little')
+      if record_size:
+        usn_record_data = self._data[self._offset:self._offset + record_size]
+        self._offset += record_size
+        return usn_record_data
+
+      self._offset += 8
+
+    return None
+
+
+def _GetPublicEventValues(event_data):
+  """Retrieves the public event values of event data.
+
+  Args:
+    event_data (EventData): event data.
+
+  Returns:
+    dict[str, object]: public event values, where date and time values are
+        represented as ISO 8601 strings.
+  """
+  event_values = {}
+  for name, value in event_data.GetAttributes():
+    if name.startswith('_'):
+      continue
+
+    if isinstance(value, dfdatetime_interface.DateTimeValues):
+      value = value.CopyToDateTimeStringISO8601()
+
+    event_values[name] = value
+
+  return event_values
+
+
 class NTFSMFTParserTest(test_lib.ParserTestCase):
   """Tests for NTFS $MFT metadata file parser."""
 
+  # pylint: disable=protected-access
+
   def testParseFile(self):
     """Tests the Parse function on a stand-alone $MFT file."""
     parser = ntfs.NTFSMFTParser()
@@ -185,10 +307,83 @@ class NTFSMFTParserTest(test_lib.ParserTestCase):
     event_data = storage_writer.GetAttributeContainerByIndex('event_data', 0)
     self.CheckEventData(event_data, expected_event_values)
 
+  def testParseImageWithPartitions(self):
+    """Tests the Parse function on a storage media image with partitions."""
+    test_file_path = self._GetTestFilePath(['vsstest.qcow2'])
+    self._SkipIfPathNotExists(test_file_path)
+
+    os_path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_OS, location=test_file_path)
+    qcow_path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_QCOW, parent=os_path_spec)
+    tsk_path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_TSK, inode=0, location='/$MFT',
+        parent=qcow_path_spec)
+
+    parser = ntfs.NTFSMFTParser()
+    storage_writer = self._ParseFileByPathSpec(tsk_path_spec, parser)
+
+    expected_event_values = sorted([
+        _GetPublicEventValues(event_data)
+        for event_data in storage_writer.GetAttributeContainers('event_data')],
+        key=repr)
+
+    file_entry = path_spec_resolver.Resolver.OpenFileEntry(tsk_path_spec)
+
+    # The $MFT consists of 256 MFT entries.
+    parser = ntfs.NTFSMFTParser()
+    parser._NUMBER_OF_ENTRIES_PER_PARTITION = 64
+
+    storage_writer = self._CreateStorageWriter()
+
+    parser_mediator = parsers_mediator.ParserMediator()
+    parser_mediator.SetEventSourcePartitioning(True)
+    parser_mediator.SetStorageWriter(storage_writer)
+    parser_mediator.SetFileEntry(file_entry)
+
+    file_object = file_entry.GetFileObject()
+    parser.Parse(parser_mediator, file_object)
+
+    event_source_partitions = list(storage_writer.GetAttributeContainers(
+        'event_source_partition'))
+    self.assertEqual(len(event_source_partitions), 3)
+
+    partitions = [
+        (event_source_partition.partition_start,
+         event_source_partition.partition_end)
+        for event_source_partition in event_source_partitions]
+    self.assertEqual(partitions, [(64, 128), (128, 192), (192, 256)])
+
+    for event_source_partition in event_source_partitions:
+      self.assertEqual(event_source_partition.parser_name, 'mft')
+
+      parser_mediator.SetEventSourcePartition((
+          event_source_partition.partition_start,
+          event_source_partition.partition_end))
+
+      file_object = file_entry.GetFileObject()
+      parser.Parse(parser_mediator, file_object)
+
+    number_of_event_data = storage_writer.GetNumberOfAttributeContainers(
+        'event_data')
+    self.assertEqual(number_of_event_data, 71)
+
+    number_of_event_source_partitions = (
+        storage_writer.GetNumberOfAttributeContainers('event_source_partition'))
+    self.assertEqual(number_of_event_source_partitions, 3)
+
+    event_values = sorted([
+        _GetPublicEventValues(event_data)
+        for event_data in storage_writer.GetAttributeContainers('event_data')],
+        key=repr)
+    self.assertEqual(event_values, expected_event_values)
+
 
 class NTFSUsnJrnlParser(test_lib.ParserTestCase):
   """Tests for NTFS $UsnJrnl metadata file parser."""
 
+  # pylint: disable=protected-access
+
   def testParseImage(self):
     """Tests the Parse function on a storage media image."""
     parser = ntfs.NTFSUsnJrnlParser()
@@ -208,9 +403,14 @@ class NTFSUsnJrnlParser(test_lib.ParserTestCase):
     # requires to read directly from the volume.
     storage_writer = self._ParseFileByPathSpec(volume_path_spec, parser)
 
-    number_of_event_data = storage_writer.GetNumberOfAttributeContainers(
-        'event_data')
-    self.assertEqual(number_of_event_data, 19)
+    offsets = [
+        event_data.offset
+        for event_data in storage_writer.GetAttributeContainers('event_data')]
+    self.assertEqual(len(offsets), 19)
+
+    # The offset of the event data is the start offset of the USN record.
+    self.assertEqual(offsets[0], 0)
+    self.assertEqual(offsets[-1], 1664)
 
     number_of_warnings = storage_writer.GetNumberOfAttributeContainers(
         'extraction_warning')
@@ -231,6 +431,84 @@ class NTFSUsnJrnlParser(test_lib.ParserTestCase):
     event_data = storage_writer.GetAttributeContainerByIndex('event_data', 0)
     self.CheckEventData(event_data, expected_event_values)
 
+  def testParseUSNChangeJournal(self):
+    """Tests the _ParseUSNChangeJournal function."""
+    test_file_path = self._GetTestFilePath(['UsnJrnl.raw'])
+    self._SkipIfPathNotExists(test_file_path)
+
+    with open(test_file_path, 'rb') as file_object:
+      data = file_object.read()
+
+    parser = ntfs.NTFSUsnJrnlParser()
+
+    storage_writer = self._CreateStorageWriter()
+    parser_mediator = parsers_mediator.ParserMediator()
+    parser_mediator.SetStorageWriter(storage_writer)
+
+    parser._ParseUSNChangeJournal(parser_mediator, TestUSNChangeJournal(data))
+
+    offsets = [
+        event_data.offset
+        for event_data in storage_writer.GetAttributeContainers('event_data')]
+    self.assertEqual(len(offsets), 19)
+
+    # The offset of the event data is the start offset of the USN record.
+    self.assertEqual(offsets[0], 0)
+    self.assertEqual(offsets[-1], 1664)
+
+  def testParseUSNChangeJournalPartition(self):
+    """Tests the _ParseUSNChangeJournalPartition function."""
+    test_file_path = self._GetTestFilePath(['UsnJrnl.raw'])
+    self._SkipIfPathNotExists(test_file_path)
+
+    with open(test_file_path, 'rb') as file_object:
+      block_data = file_object.read()
+
+    # The $J data stream consists of 2 sparse blocks followed by 2 blocks that
+    # contain USN records and are padded with 0-byte values.
+    block_data = block_data.ljust(0x1000, b'\0')
+    data = b''.join([b'\0' * 0x2000, block_data, block_data])
+    extents = [(0, 0x2000, 0x00000001), (0x10000, 0x2000, 0)]
+
+    parser = ntfs.NTFSUsnJrnlParser()
+
+    # The USN records are parsed with the USN change journal, as pyfsntfs
+    # reads them, to compare against.
+    storage_writer = self._CreateStorageWriter()
+    parser_mediator = parsers_mediator.ParserMediator()
+    parser_mediator.SetStorageWriter(storage_writer)
+
+    parser._ParseUSNChangeJournal(parser_mediator, TestUSNChangeJournal(data))
+
+    expected_event_values = [
+        _GetPublicEventValues(event_data)
+        for event_data in storage_writer.GetAttributeContainers('event_data')]
+    self.assertEqual(len(expected_event_values), 38)
+
+    parser._PARTITION_SIZE = 0x1000
+
+    data_stream = TestDataStream(data, extents)
+    partitions = parser._GetPartitions(data_stream)
+    self.assertEqual(partitions, [(0, 0x3000), (0x3000, 0x4000)])
+
+    # Test that every USN record is parsed by exactly one partition, with
+    # the same values as the USN change journal.
+    storage_writer = self._CreateStorageWriter()
+    parser_mediator = parsers_mediator.ParserMediator()
+    parser_mediator.SetStorageWriter(storage_writer)
+
+    for partition in partitions:
+      data_stream = TestDataStream(data, extents)
+      parser._ParseUSNChangeJournalPartition(
+          parser_mediator, data_stream, partition)
+
+      # Test that the sparse blocks are not read.
+      self.assertEqual(data_stream.read_offsets, [max(partition[0], 0x2000)])
+
+    event_values = [
+        _GetPublicEventValues(event_data)
+        for event_data in storage_writer.GetAttributeContainers('event_data')]
+    self.assertEqual(event_values, expected_event_values)
 
 if __name__ == '__main__':
   unittest.main()
@@ -4,6 +4,8 @@
 
 import unittest
 
+from unittest import mock
+
 from plaso.lib import errors
 from plaso.parsers import plist
 # Register all plugins.
@@ -50,6 +52,30 @@ class PlistParserTest(test_lib.ParserTestCase):
         'recovery_warning')
     self.assertEqual(number_of_warnings, 0)
 
+  def testParseWithCheckRequiredFormatError(self):
+    """Tests the Parse function with a plugin that fails the format check."""
+    parser = plist.PlistParser()
+    parser.EnablePlugins(['launchd_plist'])
+
+    # The launchd plist plugin has no path filters.
+    plugin = parser._plugins_per_name['launchd_plist']
+    with mock.patch.object(
+        plugin, 'CheckRequiredFormat', side_effect=RuntimeError):
+      storage_writer = self._ParseFile(['plist_binary'], parser)
+
+    # The file is parsed by the default plugin.
+    number_of_event_data = storage_writer.GetNumberOfAttributeContainers(
+        'event_data')
+    self.assertEqual(number_of_event_data, 12)
+
+    number_of_warnings = storage_writer.GetNumberOfAttributeContainers(
+        'extraction_warning')
+    self.assertEqual(number_of_warnings, 1)
+
+    number_of_warnings = storage_writer.GetNumberOfAttributeContainers(
+        'recovery_warning')
+    self.assertEqual(number_of_warnings, 0)
+
   def testParseWithTruncatedFile(self):
     """Tests the Parse function on a truncated plist file."""
     parser = plist.PlistParser()
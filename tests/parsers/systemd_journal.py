@@ -2,17 +2,151 @@
 # -*- coding: utf-8 -*-
 """Tests for the Systemd Journal parser."""
 
+import os
 import unittest
 
+from unittest import mock
+
 from plaso.containers import warnings
+from plaso.lib import errors
 from plaso.parsers import systemd_journal
 
+from tests import test_lib as shared_test_lib
 from tests.parsers import test_lib
 
 
 class SystemdJournalParserTest(test_lib.ParserTestCase):
   """Tests for the Systemd Journal parser."""
 
+  # pylint: disable=protected-access
+
+  def _CreateSyntheticJournalFileObject(self, size):
+    """Creates a file-like object of a synthetic Systemd journal.
+
+    Args:
+      size (int): minimum size of the synthetic journal in bytes.
+
+    Returns:
+      dfvfs.FakeFile: file-like object.
+    """
+    systemd_journal_writer = test_lib.SystemdJournalWriter()
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      path = os.path.join(temp_directory, 'system.journal')
+      systemd_journal_writer.WriteFile(path, size)
+
+      with open(path, 'rb') as file_object:
+        data = file_object.read()
+
+    return self._CreateFileObject('system.journal', data)
+
+  def _GetEntryObjectOffsets(self, parser, file_object):
+    """Retrieves the offsets of the entry objects of a Systemd journal.
+
+    Args:
+      parser (SystemdJournalParser): Systemd journal parser.
+      file_object (dfvfs.FileIO): file-like object.
+
+    Returns:
+      list[int]: offsets of the entry objects.
+    """
+    file_header, _ = parser._ReadStructureFromFileObject(
+        file_object, 0, parser._GetDataTypeMap('systemd_journal_file_header'))
+
+    return parser._ParseEntryObjectOffsets(
+        file_object, file_header.entry_array_offset)
+
+  def testGetDataObjectField(self):
+    """Tests the _GetDataObjectField function."""
+    parser = systemd_journal.SystemdJournalParser()
+    parser._MAXIMUM_CACHED_DATA_OBJECTS = 6
+
+    file_object = self._CreateSyntheticJournalFileObject(65536)
+    entry_object_offsets = self._GetEntryObjectOffsets(parser, file_object)
+
+    with mock.patch.object(
+        parser, '_ParseDataObject', wraps=parser._ParseDataObject) as (
+            parse_data_object):
+      parser._ParseJournalEntry(file_object, entry_object_offsets[0])
+      self.assertEqual(parse_data_object.call_count, 7)
+
+      # The data objects of a journal entry that was parsed before are cached,
+      # except for the _CMDLINE data object that exceeds the maximum size of
+      # a cached data object.
+      parse_data_object.reset_mock()
+      parser._ParseJournalEntry(file_object, entry_object_offsets[0])
+      self.assertEqual(parse_data_object.call_count, 1)
+
+      cached_offsets_per_key = {
+          key: data_object_offset
+          for data_object_offset, (key, _) in (
+              parser._cached_data_objects.items())}
+      self.assertNotIn('_CMDLINE', cached_offsets_per_key)
+
+      # The 7th journal entry only differs from the 1st journal entry in its
+      # _PID and MESSAGE fields, of which the cached data objects of the 1st
+      # journal entry are evicted as least recently used.
+      parse_data_object.reset_mock()
+      parser._ParseJournalEntry(file_object, entry_object_offsets[6])
+      self.assertEqual(parse_data_object.call_count, 3)
+
+    self.assertEqual(len(parser._cached_data_objects), 6)
+
+    for key, data_object_offset in cached_offsets_per_key.items():
+      if key in ('_PID', 'MESSAGE'):
+        self.assertNotIn(data_object_offset, parser._cached_data_objects)
+      else:
+        self.assertIn(data_object_offset, parser._cached_data_objects)
+
+  def testParseJournalEntry(self):
+    """Tests the _ParseJournalEntry function."""
+    parser = systemd_journal.SystemdJournalParser()
+
+    file_object = self._CreateSyntheticJournalFileObject(65536)
+    entry_object_offsets = self._GetEntryObjectOffsets(parser, file_object)
+
+    # The entry items of a journal entry are read in a single read.
+    with mock.patch.object(
+        parser, '_ReadData', wraps=parser._ReadData) as read_data:
+      fields = parser._ParseJournalEntry(file_object, entry_object_offsets[1])
+
+    entry_items_offset = entry_object_offsets[1] + 64
+    read_data_sizes = [
+        call.args[2] for call in read_data.call_args_list
+        if call.args[1] == entry_items_offset]
+    self.assertEqual(read_data_sizes, [7 * 16])
+
+    expected_fields = {
+        '_CMDLINE': '/usr/sbin/sshd {0:s}'.format('-v ' * 256),
+        '_HOSTNAME': 'host2',
+        '_PID': '1001',
+        '_SYSTEMD_UNIT': 'ssh.service',
+        'MESSAGE': (
+            'pam_unix(sshd:session): session opened for user root [1]'),
+        'PRIORITY': '6',
+        'SYSLOG_IDENTIFIER': 'sshd',
+        'real_time': 1700000000001000}
+    self.assertEqual(fields, expected_fields)
+
+    # Test with an entry object data size that exceeds the file size.
+    file_object.seek(0, os.SEEK_SET)
+    data = bytearray(file_object.read())
+    data_size_offset = entry_object_offsets[1] + 8
+    data[data_size_offset:data_size_offset + 8] = (
+        0x7fffffffffffffff).to_bytes(8, 'little')
+
+    file_object = self._CreateFileObject('system.journal', bytes(data))
+
+    with mock.patch.object(
+        parser, '_ReadData', wraps=parser._ReadData) as read_data:
+      with self.assertRaises(errors.ParseError):
+        parser._ParseJournalEntry(file_object, entry_object_offsets[1])
+
+    read_data_sizes = [
+        call.args[2] for call in read_data.call_args_list
+        if call.args[1] == entry_items_offset]
+    self.assertEqual(read_data_sizes, [])
+
   def testParse(self):
     """Tests the Parse function."""
     parser = systemd_journal.SystemdJournalParser()
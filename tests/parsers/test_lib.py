@@ -1,6 +1,10 @@
 # -*- coding: utf-8 -*-
 """Parser related functions and classes for testing."""
 
+import lzma
+import os
+import struct
+
 from dfdatetime import interface as dfdatetime_interface
 from dfdatetime import posix_time as dfdatetime_posix_time
 
@@ -19,6 +23,129 @@ from plaso.storage.fake import writer as fake_writer
 from tests import test_lib as shared_test_lib
 
 
+class SystemdJournalWriter(object):
+  """Writer of synthetic Systemd journal files for testing purposes.
+
+  Data objects are deduplicated, as in a journal written by systemd, and
+  the data objects of the command lines are XZ compressed.
+  """
+
+  _OBJECT_COMPRESSED_FLAG_XZ = 1
+
+  _OBJECT_TYPE_DATA = 1
+  _OBJECT_TYPE_ENTRY = 3
+  _OBJECT_TYPE_ENTRY_ARRAY = 6
+
+  # Fields of the entries, where most values are shared by multiple entries,
+  # as is typical for a journal.
+  _HOSTNAMES = ['host1', 'host2']
+  _MESSAGES = [
+      'Started Session {0:d} of user root.',
+      'pam_unix(sshd:session): session opened for user root',
+      'Accepted publickey for root from 192.168.0.{0:d} port 22 ssh2']
+  _UNITS = [
+      ('cron.service', 'CRON'),
+      ('ssh.service', 'sshd'),
+      ('systemd-logind.service', 'systemd-logind')]
+
+  def _WriteObject(self, file_object, object_type, object_flags, object_data):
+    """Writes a Systemd journal object, aligned to 8 bytes.
+
+    Args:
+      file_object (file): file-like object of the Systemd journal.
+      object_type (int): object type.
+      object_flags (int): object flags.
+      object_data (bytes): object data that follows the object header.
+
+    Returns:
+      int: offset of the object.
+    """
+    object_offset = file_object.tell()
+    data_size = 16 + len(object_data)
+    padding_size = (8 - (data_size % 8)) % 8
+
+    file_object.write(struct.pack(
+        '<BB6xQ', object_type, object_flags, data_size))
+    file_object.write(object_data)
+    file_object.write(b'\x00' * padding_size)
+
+    return object_offset
+
+  def WriteFile(self, path, size):
+    """Writes a synthetic Systemd journal file.
+
+    Args:
+      path (str): path of the Systemd journal file.
+      size (int): minimum size of the Systemd journal file in bytes.
+    """
+    data_object_offsets = {}
+    entry_object_offsets = []
+
+    with open(path, 'wb') as file_object:
+      # The file header is written when all entries have been written.
+      file_object.write(b'\x00' * 208)
+
+      entry_index = 0
+      real_time = 1700000000000000
+
+      while file_object.tell() < size:
+        unit, identifier = self._UNITS[entry_index % 3]
+        message = self._MESSAGES[entry_index % 3].format(entry_index % 256)
+
+        fields = [
+            '_HOSTNAME={0:s}'.format(self._HOSTNAMES[entry_index % 2]),
+            '_SYSTEMD_UNIT={0:s}'.format(unit),
+            'SYSLOG_IDENTIFIER={0:s}'.format(identifier),
+            '_PID={0:d}'.format(1000 + (entry_index % 64)),
+            'PRIORITY=6',
+            '_CMDLINE=/usr/sbin/{0:s} {1:s}'.format(identifier, '-v ' * 256),
+            'MESSAGE={0:s} [{1:d}]'.format(message, entry_index)]
+
+        entry_items = []
+        for field in fields:
+          data_object_offset = data_object_offsets.get(field, None)
+          if data_object_offset is None:
+            object_flags = 0
+            payload = field.encode('utf-8')
+            if field.startswith('_CMDLINE='):
+              object_flags = self._OBJECT_COMPRESSED_FLAG_XZ
+              payload = lzma.compress(payload)
+
+            data_object_offset = self._WriteObject(
+                file_object, self._OBJECT_TYPE_DATA, object_flags,
+                b''.join([b'\x00' * 48, payload]))
+
+            # Messages are unique per entry and therefore not deduplicated.
+            if not field.startswith('MESSAGE='):
+              data_object_offsets[field] = data_object_offset
+
+          entry_items.append(struct.pack('<QQ', data_object_offset, 0))
+
+        entry_object_offset = self._WriteObject(
+            file_object, self._OBJECT_TYPE_ENTRY, 0, b''.join([struct.pack(
+                '<QQQ16sQ', entry_index + 1, real_time, entry_index,
+                b'\x00' * 16, 0)] + entry_items))
+        entry_object_offsets.append(entry_object_offset)
+
+        entry_index += 1
+        real_time += 1000
+
+      entry_array_offset = self._WriteObject(
+          file_object, self._OBJECT_TYPE_ENTRY_ARRAY, 0, struct.pack(
+              '<Q{0:d}Q'.format(len(entry_object_offsets)), 0,
+              *entry_object_offsets))
+
+      arena_size = file_object.tell() - 208
+      number_of_objects = len(data_object_offsets) + (2 * entry_index) + 1
+
+      file_object.seek(0, os.SEEK_SET)
+      file_object.write(struct.pack(
+          '<8sIIB7s16s16s16s16s15Q', b'LPKSHHRH', 0, 0, 0, b'', b'', b'',
+          b'', b'', 208, arena_size, 208, 0, 208, 0, entry_array_offset,
+          number_of_objects, entry_index, entry_index, 1, entry_array_offset,
+          1700000000000000, real_time - 1000, entry_index - 1))
+
+
 class ParserTestCase(shared_test_lib.BaseTestCase):
   """Parser test case."""
 
@@ -2,16 +2,109 @@
 # -*- coding: utf-8 -*-
 """Tests for the Windows XML EventLog (EVTX) parser."""
 
+import io
+import os
 import unittest
 
+from dfvfs.lib import definitions as dfvfs_definitions
+from dfvfs.path import factory as path_spec_factory
+from dfvfs.resolver import resolver as path_spec_resolver
+
+from plaso.containers import events
+from plaso.helpers.windows import eventlog_xml_templates
+from plaso.parsers import mediator as parsers_mediator
 from plaso.parsers import winevtx
 
 from tests.parsers import test_lib
 
 
+class TestFileObject(io.BytesIO):
+  """File-like object that records the ranges of the data read.
+
+  Attributes:
+    read_ranges (list[tuple[int, int]]): offset and size of the data read.
+  """
+
+  def __init__(self, data):
+    """Initializes a file-like object.
+
+    Args:
+      data (bytes): data of the file-like object.
+    """
+    super(TestFileObject, self).__init__(data)
+    self.read_ranges = []
+
+  # pylint: disable=invalid-name
+
+  def get_size(self):
+    """Retrieves the size of the file-like object.
+
+    Returns:
+      int: size of the data.
+    """
+    return len(self.getbuffer())
+
+  def read(self, size=-1):
+    """Reads a byte string from the file-like object at the current offset.
+
+    Args:
+      size (Optional[int]): number of bytes to read.
+
+    Returns:
+      bytes: data read.
+    """
+    offset = self.tell()
+    data = super(TestFileObject, self).read(size)
+    if data:
+      self.read_ranges.append((offset, len(data)))
+    return data
+
+
+class WinEvtxPartitionFileObjectTest(test_lib.ParserTestCase):
+  """Tests for the EVTX event source partition file-like object."""
+
+  def testReadAndSeek(self):
+    """Tests the read and seek functions."""
+    file_object = TestFileObject(b'HHHH0000111122223333')
+    partition_file_object = winevtx.WinEvtxPartitionFileObject(
+        file_object, 4, 8, 8)
+
+    self.assertEqual(partition_file_object.get_size(), 12)
+    self.assertEqual(partition_file_object.read(), b'HHHH11112222')
+    self.assertEqual(partition_file_object.read(), b'')
+
+    partition_file_object.seek(2, os.SEEK_SET)
+    self.assertEqual(partition_file_object.read(4), b'HH11')
+    self.assertEqual(partition_file_object.tell(), 6)
+
+    partition_file_object.seek(-2, os.SEEK_END)
+    self.assertEqual(partition_file_object.read(8), b'22')
+
+    partition_file_object.seek(-4, os.SEEK_CUR)
+    self.assertEqual(partition_file_object.read(2), b'22')
+
+    with self.assertRaises(IOError):
+      partition_file_object.seek(-1, os.SEEK_SET)
+
+
 class WinEvtxParserTest(test_lib.ParserTestCase):
   """Tests for the Windows XML EventLog (EVTX) parser."""
 
+  # pylint: disable=protected-access
+
+  def _GetPublicEventValues(self, event_data):
+    """Retrieves the public event values of event data.
+
+    Args:
+      event_data (EventData): event data.
+
+    Returns:
+      dict[str, object]: public event values.
+    """
+    return {
+        name: value for name, value in event_data.GetAttributes()
+        if not name.startswith('_')}
+
   def testParse(self):
     """Tests the Parse function."""
     parser = winevtx.WinEvtxParser()
@@ -130,6 +223,154 @@ class WinEvtxParserTest(test_lib.ParserTestCase):
     event_data = storage_writer.GetAttributeContainerByIndex('event_data', 178)
     self.CheckEventData(event_data, expected_event_values)
 
+  def testParseWithPartitions(self):
+    """Tests the Parse function with event source partitions."""
+    parser = winevtx.WinEvtxParser()
+    storage_writer = self._ParseFile(['System.evtx'], parser)
+
+    expected_event_values = sorted([
+        self._GetPublicEventValues(event_data)
+        for event_data in storage_writer.GetAttributeContainers('event_data')],
+        key=lambda event_values: event_values['record_number'])
+
+    test_file_path = self._GetTestFilePath(['System.evtx'])
+    self._SkipIfPathNotExists(test_file_path)
+
+    path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_OS, location=test_file_path)
+    file_entry = path_spec_resolver.Resolver.OpenFileEntry(path_spec)
+
+    # System.evtx consists of 17 chunks of which 9 are in use.
+    parser = winevtx.WinEvtxParser()
+    parser._NUMBER_OF_CHUNKS_PER_PARTITION = 4
+
+    storage_writer = self._CreateStorageWriter()
+
+    parser_mediator = parsers_mediator.ParserMediator()
+    parser_mediator.SetEventSourcePartitioning(True)
+    parser_mediator.SetStorageWriter(storage_writer)
+    parser_mediator.SetFileEntry(file_entry)
+
+    file_object = file_entry.GetFileObject()
+    parser.Parse(parser_mediator, file_object)
+
+    number_of_event_data = storage_writer.GetNumberOfAttributeContainers(
+        'event_data')
+    self.assertEqual(number_of_event_data, 708)
+
+    event_source_partitions = list(storage_writer.GetAttributeContainers(
+        'event_source_partition'))
+    self.assertEqual(len(event_source_partitions), 2)
+
+    partitions = [
+        (event_source_partition.partition_start,
+         event_source_partition.partition_end)
+        for event_source_partition in event_source_partitions]
+    self.assertEqual(partitions, [(4, 8), (8, 17)])
+
+    for event_source_partition in event_source_partitions:
+      self.assertEqual(event_source_partition.parser_name, 'winevtx')
+      self.assertEqual(event_source_partition.path_spec, path_spec)
+
+      parser_mediator.SetEventSourcePartition((
+          event_source_partition.partition_start,
+          event_source_partition.partition_end))
+
+      file_object = file_entry.GetFileObject()
+      parser.Parse(parser_mediator, file_object)
+
+    number_of_event_data = storage_writer.GetNumberOfAttributeContainers(
+        'event_data')
+    self.assertEqual(number_of_event_data, 1601)
+
+    number_of_event_source_partitions = (
+        storage_writer.GetNumberOfAttributeContainers('event_source_partition'))
+    self.assertEqual(number_of_event_source_partitions, 2)
+
+    event_values = sorted([
+        self._GetPublicEventValues(event_data)
+        for event_data in storage_writer.GetAttributeContainers('event_data')],
+        key=lambda event_values: event_values['record_number'])
+    self.assertEqual(event_values, expected_event_values)
+
+    # The task that parses a partition only reads the file header and the
+    # chunks of the partition.
+    with open(test_file_path, 'rb') as file_object:
+      file_data = file_object.read()
+
+    file_object = TestFileObject(file_data)
+
+    parser_mediator.SetEventSourcePartition((4, 8))
+    parser.Parse(parser_mediator, file_object)
+
+    number_of_event_data = storage_writer.GetNumberOfAttributeContainers(
+        'event_data')
+    self.assertEqual(number_of_event_data, 1601 + 716)
+
+    self.assertTrue(file_object.read_ranges)
+    for offset, size in file_object.read_ranges:
+      if offset < parser._FILE_HEADER_SIZE:
+        self.assertLessEqual(offset + size, parser._FILE_HEADER_SIZE)
+      else:
+        self.assertGreaterEqual(
+            offset, parser._FILE_HEADER_SIZE + (4 * parser._CHUNK_SIZE))
+        self.assertLessEqual(
+            offset + size, parser._FILE_HEADER_SIZE + (8 * parser._CHUNK_SIZE))
+
+  def testParseWithXMLTemplates(self):
+    """Tests the Parse function with XML templates."""
+    parser = winevtx.WinEvtxParser()
+    storage_writer = self._ParseFile(['System.evtx'], parser)
+
+    xml_strings = [
+        event_data.xml_string
+        for event_data in storage_writer.GetAttributeContainers('event_data')]
+
+    test_file_path = self._GetTestFilePath(['System.evtx'])
+    self._SkipIfPathNotExists(test_file_path)
+
+    path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_OS, location=test_file_path)
+
+    parser_mediator = parsers_mediator.ParserMediator()
+
+    storage_writer = self._CreateStorageWriter()
+    parser_mediator.SetStorageWriter(storage_writer)
+
+    file_entry = path_spec_resolver.Resolver.OpenFileEntry(path_spec)
+    parser_mediator.SetFileEntry(file_entry)
+
+    parser_mediator.SetWinEvtxXMLTemplates(True)
+
+    event_data_stream = events.EventDataStream()
+    event_data_stream.path_spec = file_entry.path_spec
+    parser_mediator.ProduceEventDataStream(event_data_stream)
+
+    file_object = file_entry.GetFileObject()
+    parser.Parse(parser_mediator, file_object)
+
+    number_of_event_data = storage_writer.GetNumberOfAttributeContainers(
+        'event_data')
+    self.assertEqual(number_of_event_data, 1601)
+
+    number_of_xml_templates = storage_writer.GetNumberOfAttributeContainers(
+        'windows_eventlog_xml_template')
+    self.assertEqual(number_of_xml_templates, 30)
+
+    event_data = storage_writer.GetAttributeContainerByIndex('event_data', 0)
+    self.assertIsNone(event_data.xml_string)
+    self.assertIsNotNone(event_data.xml_template_identifier)
+    self.assertEqual(event_data.xml_values[10], '12049')
+
+    xml_templates_helper = (
+        eventlog_xml_templates.WindowsEventLogXMLTemplatesHelper())
+
+    for index, event_data in enumerate(
+        storage_writer.GetAttributeContainers('event_data')):
+      result = xml_templates_helper.RenderXMLString(storage_writer, event_data)
+      self.assertTrue(result)
+      self.assertEqual(event_data.xml_string, xml_strings[index])
+
 
 if __name__ == '__main__':
   unittest.main()
@@ -16,6 +16,21 @@ class PreprocessMediatorTest(shared_test_lib.BaseTestCase):
 
   # pylint: disable=protected-access
 
+  def testAddPluginDuration(self):
+    """Tests the AddPluginDuration function."""
+    test_mediator = mediator.PreprocessMediator(None)
+
+    test_mediator.AddPluginDuration('TestPlugin', 1.5)
+    test_mediator.AddPluginDuration('TestPlugin', 0.5)
+    test_mediator.AddPluginDuration('OtherTestPlugin', 2.0)
+
+    # Test that the durations are not reset.
+    test_mediator.Reset()
+
+    plugin_durations = test_mediator.GetPluginDurations()
+    self.assertEqual(plugin_durations, {
+        'OtherTestPlugin': 2.0, 'TestPlugin': 2.0})
+
   def testAddTimeZoneInformation(self):
     """Tests the AddTimeZoneInformation function."""
     storage_writer = fake_writer.FakeStorageWriter()
@@ -349,6 +349,7 @@ class JSONAttributeContainerSerializerTest(JSONSerializerTestCase):
 
     expected_task_dict = {
         'aborted': False,
+        'collect_only': False,
         'has_retry': False,
         'identifier': task.identifier,
         'session_identifier': session_identifier,
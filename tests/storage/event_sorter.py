@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Tests for the external merge sort of events."""
+
+import os
+import random
+import unittest
+
+from plaso.storage import event_sorter
+
+from tests import test_lib as shared_test_lib
+
+
+class ExternalEventSorterTest(shared_test_lib.BaseTestCase):
+  """Tests for the external merge sort of events."""
+
+  def testInitialize(self):
+    """Tests the __init__ function."""
+    test_sorter = event_sorter.ExternalEventSorter()
+    self.assertIsNotNone(test_sorter)
+
+    with self.assertRaises(ValueError):
+      event_sorter.ExternalEventSorter(memory_limit=1024)
+
+  def testSortKeys(self):
+    """Tests the SortKeys function."""
+    random_generator = random.Random(20231018)
+
+    sort_keys = [
+        (random_generator.randint(-(1 << 62), 1 << 62), index)
+        for index in range(0, 5000)]
+
+    # Add sort keys with the same timestamp, that should be returned in
+    # the order of their index.
+    sort_keys.extend([(0, index) for index in range(5000, 5010)])
+    random_generator.shuffle(sort_keys)
+
+    expected_sort_keys = sorted(sort_keys)
+
+    # Test sorting in memory, without a scratch directory.
+    with shared_test_lib.TempDirectory() as temp_directory:
+      test_sorter = event_sorter.ExternalEventSorter(
+          scratch_path=temp_directory)
+
+      generator = test_sorter.SortKeys(sort_keys)
+      sorted_sort_keys = [next(generator)]
+
+      self.assertEqual(os.listdir(temp_directory), [])
+
+      sorted_sort_keys.extend(generator)
+      self.assertEqual(sorted_sort_keys, expected_sort_keys)
+
+    # Test sorting with runs, of 1024 sort keys, written to a scratch
+    # directory.
+    with shared_test_lib.TempDirectory() as temp_directory:
+      test_sorter = event_sorter.ExternalEventSorter(
+          memory_limit=64 * 1024, scratch_path=temp_directory)
+
+      generator = test_sorter.SortKeys(sort_keys)
+      sorted_sort_keys = [next(generator)]
+
+      scratch_directories = os.listdir(temp_directory)
+      self.assertEqual(len(scratch_directories), 1)
+
+      run_filenames = os.listdir(os.path.join(
+          temp_directory, scratch_directories[0]))
+      self.assertEqual(len(run_filenames), 4)
+
+      sorted_sort_keys.extend(generator)
+      self.assertEqual(sorted_sort_keys, expected_sort_keys)
+
+      # Test that the scratch directory is removed.
+      self.assertEqual(os.listdir(temp_directory), [])
+
+      self.assertEqual(list(test_sorter.SortKeys([])), [])
+
+
+if __name__ == '__main__':
+  unittest.main()
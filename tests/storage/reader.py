@@ -7,6 +7,7 @@ import unittest
 from acstore.containers import interface as containers_interface
 
 from plaso.containers import event_sources
+from plaso.containers import warnings
 from plaso.storage import reader
 from plaso.storage.fake import fake_store
 
@@ -89,6 +90,24 @@ class StorageReaderTest(test_lib.StorageTestCase):
     finally:
       test_reader._store.Close()
 
+  def testGetAttributeValuesCounts(self):
+    """Tests the GetAttributeValuesCounts function."""
+    test_reader = reader.StorageReader()
+    test_reader._store = fake_store.FakeStore()
+    test_reader._store.Open()
+
+    try:
+      for parser_chain in ('olecf', 'olecf', 'text/syslog'):
+        warning = warnings.ExtractionWarning(parser_chain=parser_chain)
+        test_reader._store.AddAttributeContainer(warning)
+
+      values_counts = dict(test_reader.GetAttributeValuesCounts(
+          'extraction_warning', ['parser_chain']))
+      self.assertEqual(values_counts, {('olecf',): 2, ('text/syslog',): 1})
+
+    finally:
+      test_reader._store.Close()
+
   def testGetFormatVersion(self):
     """Tests the GetFormatVersion function."""
     test_reader = reader.StorageReader()
@@ -5,8 +5,13 @@
 import os
 import unittest
 
+from dfvfs.lib import definitions as dfvfs_definitions
+from dfvfs.path import factory as path_spec_factory
+
 from plaso.containers import events
+from plaso.containers import warnings
 from plaso.lib import definitions
+from plaso.storage import time_range as time_range_lib
 from plaso.storage.sqlite import sqlite_file
 
 from tests import test_lib as shared_test_lib
@@ -288,6 +293,50 @@ class SQLiteStorageFileTest(test_lib.StorageTestCase):
 
   # TODO: add tests for CheckSupportedFormat
 
+  def testCommitAndRollback(self):
+    """Tests the Commit and Rollback functions."""
+    event_data_stream = events.EventDataStream()
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      test_path = os.path.join(temp_directory, 'plaso.sqlite')
+      test_store = sqlite_file.SQLiteStorageFile()
+      test_store.Open(path=test_path, read_only=False)
+
+      try:
+        test_store.EnableWriteAheadLog()
+
+        test_store.AddAttributeContainer(event_data_stream)
+        test_store.Commit()
+
+        test_store.AddAttributeContainer(events.EventDataStream())
+        number_of_containers = test_store.GetNumberOfAttributeContainers(
+            event_data_stream.CONTAINER_TYPE)
+        self.assertEqual(number_of_containers, 2)
+
+        test_store.Rollback()
+
+        number_of_containers = test_store.GetNumberOfAttributeContainers(
+            event_data_stream.CONTAINER_TYPE)
+        self.assertEqual(number_of_containers, 1)
+
+        test_store.AddAttributeContainer(events.EventDataStream())
+
+      finally:
+        test_store.Close()
+
+      self.assertFalse(os.path.exists(f'{test_path:s}-wal'))
+
+      test_store = sqlite_file.SQLiteStorageFile()
+      test_store.Open(path=test_path)
+
+      try:
+        number_of_containers = test_store.GetNumberOfAttributeContainers(
+            event_data_stream.CONTAINER_TYPE)
+        self.assertEqual(number_of_containers, 2)
+
+      finally:
+        test_store.Close()
+
   def testGetAttributeContainers(self):
     """Tests the GetAttributeContainers function."""
     event_data_stream = events.EventDataStream()
@@ -327,6 +376,38 @@ class SQLiteStorageFileTest(test_lib.StorageTestCase):
       finally:
         test_store.Close()
 
+  def testGetAttributeValuesCounts(self):
+    """Tests the GetAttributeValuesCounts function."""
+    path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_OS, location='/tmp/syslog')
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      test_path = os.path.join(temp_directory, 'plaso.sqlite')
+      test_store = sqlite_file.SQLiteStorageFile()
+      test_store.Open(path=test_path, read_only=False)
+
+      try:
+        values_counts = list(test_store.GetAttributeValuesCounts(
+            'extraction_warning', ['parser_chain', 'path_spec']))
+        self.assertEqual(values_counts, [])
+
+        for parser_chain in ('olecf', 'olecf', 'text/syslog'):
+          warning = warnings.ExtractionWarning(
+              parser_chain=parser_chain, path_spec=path_spec)
+          test_store.AddAttributeContainer(warning)
+
+        values_counts = dict(test_store.GetAttributeValuesCounts(
+            'extraction_warning', ['parser_chain', 'path_spec']))
+        self.assertEqual(values_counts, {
+            ('olecf', path_spec): 2, ('text/syslog', path_spec): 1})
+
+        with self.assertRaises(IOError):
+          list(test_store.GetAttributeValuesCounts(
+              'extraction_warning', ['bogus']))
+
+      finally:
+        test_store.Close()
+
   def testGetAttributeContainerByIdentifier(self):
     """Tests the GetAttributeContainerByIdentifier function."""
     event_data_stream = events.EventDataStream()
@@ -441,6 +522,54 @@ class SQLiteStorageFileTest(test_lib.StorageTestCase):
 
     # TODO: add test with time range.
 
+  def testGetSortedEventsWithExternalSort(self):
+    """Tests the GetSortedEvents function with external sort."""
+    with shared_test_lib.TempDirectory() as temp_directory:
+      test_path = os.path.join(temp_directory, 'plaso.sqlite')
+      test_store = sqlite_file.SQLiteStorageFile()
+      test_store.Open(path=test_path, read_only=False)
+
+      try:
+        for event, event_data, event_data_stream in (
+            containers_test_lib.CreateEventsFromValues(self._TEST_EVENTS)):
+          test_store.AddAttributeContainer(event_data_stream)
+
+          event_data.SetEventDataStreamIdentifier(
+              event_data_stream.GetIdentifier())
+          test_store.AddAttributeContainer(event_data)
+
+          event.SetEventDataIdentifier(event_data.GetIdentifier())
+          test_store.AddAttributeContainer(event)
+
+      finally:
+        test_store.Close()
+
+      test_store = sqlite_file.SQLiteStorageFile()
+      test_store.Open(path=test_path)
+
+      try:
+        expected_timestamps = [
+            event.timestamp for event in test_store.GetSortedEvents()]
+
+        test_store.SetExternalSort(64 * 1024, scratch_path=temp_directory)
+
+        test_events = list(test_store.GetSortedEvents())
+        self.assertEqual(len(test_events), 4)
+
+        timestamps = [event.timestamp for event in test_events]
+        self.assertEqual(timestamps, expected_timestamps)
+        self.assertEqual(timestamps, sorted(timestamps))
+
+        time_range = time_range_lib.TimeRange(
+            expected_timestamps[1], expected_timestamps[2])
+        test_events = list(test_store.GetSortedEvents(time_range=time_range))
+
+        timestamps = [event.timestamp for event in test_events]
+        self.assertEqual(timestamps, expected_timestamps[1:3])
+
+      finally:
+        test_store.Close()
+
   def testHasAttributeContainers(self):
     """Tests the HasAttributeContainers function."""
     event_data_stream = events.EventDataStream()
@@ -467,7 +596,98 @@ class SQLiteStorageFileTest(test_lib.StorageTestCase):
       finally:
         test_store.Close()
 
-  # TODO: add tests for Open and Close
+  def testOpenClose(self):
+    """Tests the Open and Close functions."""
+    event_data_stream = events.EventDataStream()
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      test_path = os.path.join(temp_directory, 'plaso.sqlite')
+      test_store = sqlite_file.SQLiteStorageFile()
+      test_store.Open(path=test_path, read_only=False)
+
+      try:
+        test_store._cursor.execute('PRAGMA journal_mode')
+        self.assertEqual(test_store._cursor.fetchone()[0], 'memory')
+
+        test_store._cursor.execute('PRAGMA locking_mode')
+        self.assertEqual(test_store._cursor.fetchone()[0], 'normal')
+
+      finally:
+        test_store.Close()
+
+      test_path = os.path.join(temp_directory, 'task.sqlite')
+      test_store = sqlite_file.SQLiteStorageFile(
+          storage_type=definitions.STORAGE_TYPE_TASK)
+      test_store.Open(path=test_path, read_only=False)
+
+      try:
+        test_store._cursor.execute('PRAGMA journal_mode')
+        self.assertEqual(test_store._cursor.fetchone()[0], 'off')
+
+        test_store._cursor.execute('PRAGMA locking_mode')
+        self.assertEqual(test_store._cursor.fetchone()[0], 'exclusive')
+
+        test_store.AddAttributeContainer(event_data_stream)
+
+      finally:
+        test_store.Close()
+
+      test_store = sqlite_file.SQLiteStorageFile()
+      test_store.Open(path=test_path)
+
+      try:
+        number_of_containers = test_store.GetNumberOfAttributeContainers(
+            event_data_stream.CONTAINER_TYPE)
+        self.assertEqual(number_of_containers, 1)
+
+      finally:
+        test_store.Close()
+
+  def testTruncateAttributeContainers(self):
+    """Tests the TruncateAttributeContainers function."""
+    with shared_test_lib.TempDirectory() as temp_directory:
+      test_path = os.path.join(temp_directory, 'plaso.sqlite')
+      test_store = sqlite_file.SQLiteStorageFile()
+      test_store.Open(path=test_path, read_only=False)
+
+      try:
+        for _ in range(5):
+          test_store.AddAttributeContainer(events.EventDataStream())
+
+        test_store.TruncateAttributeContainers('event_data_stream', 2)
+
+        number_of_containers = test_store.GetNumberOfAttributeContainers(
+            'event_data_stream')
+        self.assertEqual(number_of_containers, 2)
+
+        container = test_store.GetAttributeContainerByIndex(
+            'event_data_stream', 2)
+        self.assertIsNone(container)
+
+        # Sequence numbers of new attribute containers continue after the
+        # remaining attribute containers.
+        event_data_stream = events.EventDataStream()
+        test_store.AddAttributeContainer(event_data_stream)
+
+        identifier = event_data_stream.GetIdentifier()
+        self.assertEqual(identifier.sequence_number, 3)
+
+        # Truncating an attribute container type without a table is a no-op.
+        test_store.TruncateAttributeContainers('bogus', 0)
+
+      finally:
+        test_store.Close()
+
+      test_store = sqlite_file.SQLiteStorageFile()
+      test_store.Open(path=test_path)
+
+      try:
+        number_of_containers = test_store.GetNumberOfAttributeContainers(
+            'event_data_stream')
+        self.assertEqual(number_of_containers, 3)
+
+      finally:
+        test_store.Close()
 
   def testUpdateAttributeContainer(self):
     """Tests the UpdateAttributeContainer function."""
@@ -0,0 +1,1342 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Script to benchmark the performance of the parsers and tools.
+
+The script measures the throughput and peak memory usage of every parser and
+parser plugin on the test data and on synthetic inputs, generated by scaling
+up test data of line-based formats or written for binary formats, and of
+complete log2timeline and psort runs. The results are written as JSON and can
+be compared against the results of a previous run, the baseline, to detect
+performance regressions.
+"""
+
+import argparse
+import datetime
+import json
+import multiprocessing
+import os
+import platform
+import queue
+import random
+import shlex
+import subprocess
+import sys
+import tempfile
+import time
+
+try:
+  import resource
+except ImportError:
+  resource = None
+
+from dfvfs.lib import definitions as dfvfs_definitions
+from dfvfs.path import factory as path_spec_factory
+from dfvfs.resolver import resolver as path_spec_resolver
+
+import plaso
+
+from plaso import parsers  # pylint: disable=unused-import
+from plaso.containers import events
+from plaso.engine import extractors
+from plaso.filters import parser_filter
+from plaso.lib import definitions
+from plaso.parsers import manager as parsers_manager
+from plaso.parsers import mediator as parsers_mediator
+from plaso.parsers import ntfs as ntfs_parser
+from plaso.storage import factory as storage_factory
+from plaso.storage.fake import writer as fake_writer
+
+# The synthetic Systemd journal is written by the parser test helpers.
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(
+    __file__))))
+
+# pylint: disable=wrong-import-position
+from tests.parsers import test_lib as parsers_test_lib
+# pylint: enable=wrong-import-position
+
+
+class BenchmarkResultsComparer(object):
+  """Compares benchmark results against a baseline."""
+
+  def __init__(
+      self, maximum_memory_increase=20.0, maximum_slowdown=20.0,
+      minimum_duration=0.5):
+    """Initializes a benchmark results comparer.
+
+    Args:
+      maximum_memory_increase (Optional[float]): maximum increase of the peak
+          memory usage, as a percentage of the baseline, before it is
+          considered a regression.
+      maximum_slowdown (Optional[float]): maximum increase of the duration or
+          decrease of the throughput, as a percentage of the baseline, before
+          it is considered a regression.
+      minimum_duration (Optional[float]): minimum duration of the baseline
+          benchmark, in seconds, for its duration and throughput to be
+          compared, since shorter benchmarks are dominated by noise.
+    """
+    super(BenchmarkResultsComparer, self).__init__()
+    self._maximum_memory_increase = maximum_memory_increase
+    self._maximum_slowdown = maximum_slowdown
+    self._minimum_duration = minimum_duration
+
+  def _CompareBenchmark(self, name, result, baseline_result):
+    """Compares the result of a benchmark against its baseline.
+
+    Args:
+      name (str): name of the benchmark.
+      result (dict[str, object]): result of the benchmark.
+      baseline_result (dict[str, object]): baseline result of the benchmark.
+
+    Returns:
+      list[str]: descriptions of the regressions.
+    """
+    regressions = []
+
+    baseline_duration = baseline_result.get('duration', None) or 0.0
+    if baseline_duration >= self._minimum_duration:
+      duration = result.get('duration', None) or 0.0
+      maximum_duration = baseline_duration * (
+          1.0 + (self._maximum_slowdown / 100.0))
+      if duration > maximum_duration:
+        regressions.append((
+            f'{name:s}: duration: {duration:.2f}s exceeds baseline: '
+            f'{baseline_duration:.2f}s by more than '
+            f'{self._maximum_slowdown:.0f}%'))
+
+      for key in ('bytes_per_second', 'events_per_second'):
+        baseline_value = baseline_result.get(key, None) or 0.0
+        if not baseline_value:
+          continue
+
+        value = result.get(key, None) or 0.0
+        minimum_value = baseline_value * (
+            1.0 - (self._maximum_slowdown / 100.0))
+        if value < minimum_value:
+          regressions.append((
+              f'{name:s}: {key:s}: {value:.1f} is below baseline: '
+              f'{baseline_value:.1f} by more than '
+              f'{self._maximum_slowdown:.0f}%'))
+
+    baseline_peak_rss = baseline_result.get('peak_rss', None) or 0
+    peak_rss = result.get('peak_rss', None) or 0
+    if baseline_peak_rss and peak_rss:
+      maximum_peak_rss = baseline_peak_rss * (
+          1.0 + (self._maximum_memory_increase / 100.0))
+      if peak_rss > maximum_peak_rss:
+        regressions.append((
+            f'{name:s}: peak RSS: {peak_rss:d} bytes exceeds baseline: '
+            f'{baseline_peak_rss:d} bytes by more than '
+            f'{self._maximum_memory_increase:.0f}%'))
+
+    return regressions
+
+  def Compare(self, results, baseline):
+    """Compares benchmark results against a baseline.
+
+    Benchmarks that are not in both the results and the baseline are ignored.
+
+    Args:
+      results (dict[str, object]): benchmark results.
+      baseline (dict[str, object]): baseline benchmark results.
+
+    Returns:
+      list[str]: descriptions of the regressions.
+    """
+    regressions = []
+    for category in ('parsers', 'storage', 'synthetic', 'tools'):
+      category_results = results.get(category, None) or {}
+      baseline_category_results = baseline.get(category, None) or {}
+
+      for name, result in sorted(category_results.items()):
+        baseline_result = baseline_category_results.get(name, None)
+        if baseline_result:
+          regressions.extend(self._CompareBenchmark(
+              f'{category:s}/{name:s}', result, baseline_result))
+
+    return regressions
+
+
+class USNChangeJournalDataStream(object):
+  """$J data stream of a synthetic USN change journal.
+
+  The data stream starts with a sparse range, as the $J data stream of
+  a USN change journal that has wrapped does, followed by the data of a file.
+
+  Attributes:
+    number_of_extents (int): number of extents.
+    size (int): size of the data stream.
+  """
+
+  _SPARSE_EXTENT_FLAG = 0x00000001
+
+  def __init__(self, file_object, sparse_size):
+    """Initializes a $J data stream.
+
+    Args:
+      file_object (file): file object of the data of the data stream.
+      sparse_size (int): size of the sparse range at the start of the data
+          stream.
+    """
+    file_object.seek(0, os.SEEK_END)
+    data_size = file_object.tell()
+
+    super(USNChangeJournalDataStream, self).__init__()
+    self._data_size = data_size
+    self._file_object = file_object
+    self._sparse_size = sparse_size
+    self.number_of_extents = 2
+    self.size = sparse_size + data_size
+
+  def get_extent(self, extent_index):
+    """Retrieves an extent.
+
+    Args:
+      extent_index (int): index of the extent.
+
+    Returns:
+      tuple[int, int, int]: offset, size and flags of the extent.
+    """
+    if extent_index == 0:
+      return 0, self._sparse_size, self._SPARSE_EXTENT_FLAG
+
+    return 0, self._data_size, 0
+
+  def read_buffer_at_offset(self, size, offset):
+    """Reads a buffer at a specific offset.
+
+    Args:
+      size (int): number of bytes to read.
+      offset (int): offset of the data to read.
+
+    Returns:
+      bytes: data read.
+    """
+    data = b''
+    if offset < self._sparse_size:
+      data = b'\0' * min(size, self._sparse_size - offset)
+      size -= len(data)
+      offset += len(data)
+
+    if size > 0:
+      self._file_object.seek(offset - self._sparse_size, os.SEEK_SET)
+      data = b''.join([data, self._file_object.read(size)])
+
+    return data
+
+
+class ParsersBenchmark(object):
+  """Benchmarks the parsers and parser plugins.
+
+  Every parser or parser plugin is benchmarked in a separate process, so that
+  its peak memory usage can be determined, and is used on the files in the
+  same way the extraction worker uses it, that is with signature scanning.
+  """
+
+  # Path segments of line-based test data that can be scaled up, by repeating
+  # its lines, per parser filter expression.
+  _SYNTHETIC_INPUTS = {
+      'jsonl/aws_cloudtrail_log': ['aws_cloudtrail.jsonl'],
+      'jsonl/gcp_log': ['gcp_logging.jsonl'],
+      'text/apache_access': ['apache_access.log'],
+      'text/dpkg': ['dpkg.log'],
+      'text/selinux': ['selinux.log'],
+      'text/snort_fastlog': ['snort3_alert_fast.log'],
+      'text/syslog': ['syslog', 'syslog_rsyslog'],
+      'text/vsftpd': ['vsftpd.log']}
+
+  _MFT_ENTRY_SIZE = 1024
+
+  # Number of MFT entries that are reserved for the NTFS metadata files.
+  _MFT_NUMBER_OF_RESERVED_ENTRIES = 16
+
+  # Number of event source partitions the synthetic $MFT is split into.
+  _MFT_NUMBER_OF_PARTITIONS = 4
+
+  _USN_JOURNAL_BLOCK_SIZE = 0x1000
+
+  # Number of event source partitions the synthetic USN change journal is
+  # split into.
+  _USN_NUMBER_OF_PARTITIONS = 4
+
+  def __init__(self, test_data_path):
+    """Initializes a parsers benchmark.
+
+    Args:
+      test_data_path (str): path of the test data directory.
+    """
+    super(ParsersBenchmark, self).__init__()
+    self._test_data_path = test_data_path
+
+  def _BenchmarkMFTPartitions(self, path, result_queue):
+    """Benchmarks the $MFT parser with event source partitions.
+
+    The $MFT is split into partitions of MFT entries that are parsed one after
+    the other, as separate extraction tasks would. Since the tasks run in
+    parallel during extraction, the duration of the slowest partition, the
+    critical path, approximates the duration of a parallel extraction.
+
+    Args:
+      path (str): path of the $MFT.
+      result_queue (multiprocessing.Queue): queue to report the result to.
+    """
+    number_of_entries = os.path.getsize(path) // self._MFT_ENTRY_SIZE
+
+    # pylint: disable=protected-access
+    ntfs_parser.NTFSMFTParser._NUMBER_OF_ENTRIES_PER_PARTITION = -(
+        -number_of_entries // self._MFT_NUMBER_OF_PARTITIONS)
+
+    extractor = extractors.EventDataExtractor(parser_filter_expression='mft')
+
+    storage_writer = fake_writer.FakeStorageWriter()
+    storage_writer.Open()
+
+    parser_mediator = parsers_mediator.ParserMediator()
+    parser_mediator.SetEventSourcePartitioning(True)
+    parser_mediator.SetStorageWriter(storage_writer)
+
+    path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_OS, location=path)
+    file_entry = path_spec_resolver.Resolver.OpenFileEntry(
+        path_spec, resolver_context=parser_mediator.resolver_context)
+    parser_mediator.SetFileEntry(file_entry)
+
+    event_data_stream = events.EventDataStream()
+    event_data_stream.path_spec = file_entry.path_spec
+    parser_mediator.ProduceEventDataStream(event_data_stream)
+
+    start_time = time.perf_counter()
+    extractor.ParseDataStream(parser_mediator, file_entry, '')
+    durations = [time.perf_counter() - start_time]
+
+    for event_source_partition in list(storage_writer.GetAttributeContainers(
+        'event_source_partition')):
+      parser_mediator.SetEventSourcePartition((
+          event_source_partition.partition_start,
+          event_source_partition.partition_end))
+
+      start_time = time.perf_counter()
+      extractor.ParseEventSourcePartition(parser_mediator, file_entry, 'mft')
+      durations.append(time.perf_counter() - start_time)
+
+    parser_mediator.SetEventSourcePartition(None)
+
+    number_of_event_data = storage_writer.GetNumberOfAttributeContainers(
+        'event_data')
+
+    storage_writer.Close()
+
+    duration = sum(durations)
+    critical_path_duration = max(durations)
+
+    result_queue.put({
+        'critical_path_duration': critical_path_duration,
+        'duration': duration,
+        'events_per_second': (
+            number_of_event_data / duration if duration else 0.0),
+        'number_of_event_data': number_of_event_data,
+        'number_of_partitions': len(durations),
+        'peak_rss': _GetPeakRSS()})
+
+  def _BenchmarkParser(self, parser_filter_expression, paths, result_queue):
+    """Benchmarks a parser or parser plugin.
+
+    Args:
+      parser_filter_expression (str): parser filter expression of the parser
+          or parser plugin.
+      paths (list[str]): paths of the files to parse.
+      result_queue (multiprocessing.Queue): queue to report the result to.
+    """
+    # The UsnJrnl parser is only used on a file if it is forced.
+    extractor = extractors.EventDataExtractor(
+        force_parser=parser_filter_expression == 'usnjrnl',
+        parser_filter_expression=parser_filter_expression)
+
+    number_of_bytes = 0
+    number_of_event_data = 0
+    number_of_parsed_files = 0
+
+    start_time = time.perf_counter()
+
+    for path in paths:
+      storage_writer = fake_writer.FakeStorageWriter()
+      storage_writer.Open()
+
+      parser_mediator = parsers_mediator.ParserMediator()
+      parser_mediator.SetStorageWriter(storage_writer)
+
+      path_spec = path_spec_factory.Factory.NewPathSpec(
+          dfvfs_definitions.TYPE_INDICATOR_OS, location=path)
+      file_entry = path_spec_resolver.Resolver.OpenFileEntry(
+          path_spec, resolver_context=parser_mediator.resolver_context)
+      parser_mediator.SetFileEntry(file_entry)
+
+      event_data_stream = events.EventDataStream()
+      event_data_stream.path_spec = file_entry.path_spec
+      parser_mediator.ProduceEventDataStream(event_data_stream)
+
+      try:
+        extractor.ParseFileEntryMetadata(parser_mediator, file_entry)
+        extractor.ParseDataStream(parser_mediator, file_entry, '')
+      except RuntimeError:
+        pass
+
+      number_of_file_event_data = (
+          storage_writer.GetNumberOfAttributeContainers('event_data'))
+      if number_of_file_event_data:
+        number_of_bytes += file_entry.size
+        number_of_event_data += number_of_file_event_data
+        number_of_parsed_files += 1
+
+      storage_writer.Close()
+
+    duration = time.perf_counter() - start_time
+
+    result_queue.put({
+        'bytes_per_second': number_of_bytes / duration if duration else 0.0,
+        'duration': duration,
+        'events_per_second': (
+            number_of_event_data / duration if duration else 0.0),
+        'number_of_bytes': number_of_bytes,
+        'number_of_event_data': number_of_event_data,
+        'number_of_files': len(paths),
+        'number_of_parsed_files': number_of_parsed_files,
+        'peak_rss': _GetPeakRSS()})
+
+  def _BenchmarkUSNChangeJournalPartitions(self, path, result_queue):
+    """Benchmarks the UsnJrnl parser with event source partitions.
+
+    The $J data stream is split into partitions that are parsed one after
+    the other, as separate extraction tasks would. Since a partition is read
+    directly from its offset in the $J data stream, the duration of every
+    partition should be about the same.
+
+    Args:
+      path (str): path of the data of the synthetic $J data stream.
+      result_queue (multiprocessing.Queue): queue to report the result to.
+    """
+    # The $J data stream starts with a sparse range that is larger than
+    # the data, as is typical for a USN change journal that has wrapped.
+    sparse_size = os.path.getsize(path) * 4
+
+    parser = ntfs_parser.NTFSUsnJrnlParser()
+
+    storage_writer = fake_writer.FakeStorageWriter()
+    storage_writer.Open()
+
+    parser_mediator = parsers_mediator.ParserMediator()
+    parser_mediator.SetStorageWriter(storage_writer)
+
+    with open(path, 'rb') as file_object:
+      data_stream = USNChangeJournalDataStream(file_object, sparse_size)
+
+      # pylint: disable=protected-access
+      parser._PARTITION_SIZE = -(
+          -os.path.getsize(path) // self._USN_NUMBER_OF_PARTITIONS)
+
+      durations = []
+      partitions = parser._GetPartitions(data_stream) or [
+          (0, data_stream.size)]
+
+      for partition in partitions:
+        start_time = time.perf_counter()
+        parser._ParseUSNChangeJournalPartition(
+            parser_mediator, data_stream, partition)
+        durations.append(time.perf_counter() - start_time)
+
+    number_of_event_data = storage_writer.GetNumberOfAttributeContainers(
+        'event_data')
+
+    storage_writer.Close()
+
+    duration = sum(durations)
+    critical_path_duration = max(durations)
+
+    result_queue.put({
+        'critical_path_duration': critical_path_duration,
+        'duration': duration,
+        'events_per_second': (
+            number_of_event_data / duration if duration else 0.0),
+        'number_of_event_data': number_of_event_data,
+        'number_of_partitions': len(durations),
+        'peak_rss': _GetPeakRSS()})
+
+  def _GenerateSyntheticInput(self, path, output_path, size):
+    """Generates a synthetic input by repeating the lines of a file.
+
+    Args:
+      path (str): path of the file with the lines to repeat.
+      output_path (str): path of the synthetic input.
+      size (int): minimum size of the synthetic input in bytes.
+    """
+    with open(path, 'rb') as file_object:
+      data = file_object.read()
+
+    if not data.endswith(b'\n'):
+      data = b''.join([data, b'\n'])
+
+    with open(output_path, 'wb') as file_object:
+      output_size = 0
+      while output_size < size:
+        file_object.write(data)
+        output_size += len(data)
+
+  def _GenerateSyntheticMFT(self, output_path, size):
+    """Generates a synthetic $MFT.
+
+    The MFT entries of the NTFS metadata files of the $MFT of the test image
+    are written once and the other MFT entries are repeated.
+
+    Args:
+      output_path (str): path of the synthetic input.
+      size (int): minimum size of the synthetic input in bytes.
+
+    Returns:
+      bool: True if the synthetic input was generated or False if the test
+          image is missing.
+    """
+    path = os.path.join(self._test_data_path, 'vsstest.qcow2')
+    if not os.path.isfile(path):
+      print(f'Missing synthetic benchmark input: {path:s}.')
+      return False
+
+    os_path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_OS, location=path)
+    qcow_path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_QCOW, parent=os_path_spec)
+    tsk_path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_TSK, inode=0, location='/$MFT',
+        parent=qcow_path_spec)
+
+    file_object = path_spec_resolver.Resolver.OpenFileObject(tsk_path_spec)
+    data = file_object.read()
+
+    reserved_size = self._MFT_NUMBER_OF_RESERVED_ENTRIES * self._MFT_ENTRY_SIZE
+    mft_entries_data = b''.join([
+        data[offset:offset + self._MFT_ENTRY_SIZE]
+        for offset in range(reserved_size, len(data), self._MFT_ENTRY_SIZE)
+        if data[offset:offset + 4] == b'FILE'])
+
+    with open(output_path, 'wb') as output_file_object:
+      output_file_object.write(data[:reserved_size])
+
+      output_size = reserved_size
+      while output_size < size:
+        output_file_object.write(mft_entries_data)
+        output_size += len(mft_entries_data)
+
+    return True
+
+  def _GenerateSyntheticUSNChangeJournal(self, output_path, size):
+    """Generates the data of a synthetic $J data stream.
+
+    The USN records of the test USN change journal are repeated, where every
+    block contains the USN records once and is padded with 0-byte values.
+
+    Args:
+      output_path (str): path of the synthetic input.
+      size (int): minimum size of the synthetic input in bytes.
+
+    Returns:
+      bool: True if the synthetic input was generated or False if the test
+          USN change journal is missing.
+    """
+    path = os.path.join(self._test_data_path, 'UsnJrnl.raw')
+    if not os.path.isfile(path):
+      print(f'Missing synthetic benchmark input: {path:s}.')
+      return False
+
+    with open(path, 'rb') as file_object:
+      data = file_object.read()
+
+    block_data = data.ljust(self._USN_JOURNAL_BLOCK_SIZE, b'\0')
+
+    with open(output_path, 'wb') as file_object:
+      output_size = 0
+      while output_size < size:
+        file_object.write(block_data)
+        output_size += len(block_data)
+
+    return True
+
+  def _GetTestDataPaths(self):
+    """Retrieves the paths of the files in the test data directory.
+
+    Returns:
+      list[str]: paths of the files.
+    """
+    paths = []
+    for directory_path, _, filenames in os.walk(self._test_data_path):
+      for filename in filenames:
+        path = os.path.join(directory_path, filename)
+        if os.path.isfile(path) and not os.path.islink(path):
+          paths.append(path)
+
+    return sorted(paths)
+
+  def _RunBenchmark(self, parser_filter_expression, paths):
+    """Runs the benchmark of a parser or parser plugin in a separate process.
+
+    Args:
+      parser_filter_expression (str): parser filter expression of the parser
+          or parser plugin.
+      paths (list[str]): paths of the files to parse.
+
+    Returns:
+      dict[str, object]: result of the benchmark or None if the benchmark
+          failed.
+    """
+    return _RunBenchmarkProcess(
+        self._BenchmarkParser, parser_filter_expression, paths)
+
+  def _RunSyntheticBenchmark(self, parser_filter_expression, path):
+    """Runs the benchmark of a parser or parser plugin on a synthetic input.
+
+    Args:
+      parser_filter_expression (str): parser filter expression of the parser
+          or parser plugin.
+      path (str): path of the synthetic input, which is removed after
+          the benchmark.
+
+    Returns:
+      dict[str, object]: result of the benchmark or None if the benchmark
+          failed.
+    """
+    result = self._RunBenchmark(parser_filter_expression, [path])
+    os.remove(path)
+
+    if not result:
+      print(f'Synthetic benchmark of: {parser_filter_expression:s} failed.')
+    else:
+      _PrintResult(f'{parser_filter_expression:s} (synthetic)', result)
+
+    return result
+
+  def GetParserFilterExpressions(self, parser_filter_expression=None):
+    """Retrieves the parser filter expressions of the parsers and plugins.
+
+    Args:
+      parser_filter_expression (Optional[str]): parser filter expression to
+          select the parsers and plugins to benchmark, where None represents
+          all parsers and plugins.
+
+    Returns:
+      list[str]: parser filter expressions of the individual parsers and
+          parser plugins.
+    """
+    parser_filter_helper = parser_filter.ParserFilterExpressionHelper()
+    _, includes = parser_filter_helper.SplitExpression(
+        parser_filter_expression)
+
+    parser_filter_expressions = []
+    for parser_name, parser_object in sorted(
+        parsers_manager.ParsersManager.GetParserObjects(
+            parser_filter_expression=parser_filter_expression).items()):
+      if not parser_object.SupportsPlugins():
+        parser_filter_expressions.append(parser_name)
+        continue
+
+      # The default plugin is used with every plugin of the parser and
+      # therefore is not benchmarked separately.
+      default_plugin_name = f'{parser_name:s}_default'
+      plugin_includes = includes.get(
+          parser_name, parsers_manager.ParsersManager.ALL_PLUGINS)
+
+      for plugin_name in sorted(parser_object.GetPluginNames()):
+        if plugin_name == default_plugin_name:
+          continue
+
+        if (plugin_includes != parsers_manager.ParsersManager.ALL_PLUGINS and
+            plugin_name not in plugin_includes):
+          continue
+
+        parser_filter_expressions.append(f'{parser_name:s}/{plugin_name:s}')
+
+    return parser_filter_expressions
+
+  def Run(self, parser_filter_expression=None, synthetic_size=0):
+    """Runs the parsers benchmarks.
+
+    Args:
+      parser_filter_expression (Optional[str]): parser filter expression to
+          select the parsers and plugins to benchmark, where None represents
+          all parsers and plugins.
+      synthetic_size (Optional[int]): size of the synthetic inputs in bytes,
+          where 0 represents no synthetic inputs should be benchmarked.
+
+    Returns:
+      tuple[dict[str, object], dict[str, object]]: results of the benchmarks
+          on the test data and on the synthetic inputs, per parser filter
+          expression.
+    """
+    parser_filter_expressions = self.GetParserFilterExpressions(
+        parser_filter_expression=parser_filter_expression)
+
+    paths = self._GetTestDataPaths()
+
+    results = {}
+    for expression in parser_filter_expressions:
+      result = self._RunBenchmark(expression, paths)
+      if not result:
+        print(f'Benchmark of: {expression:s} failed.')
+        continue
+
+      results[expression] = result
+      _PrintResult(expression, result)
+
+    synthetic_results = {}
+    if synthetic_size:
+      with tempfile.TemporaryDirectory() as temporary_directory:
+        for expression, path_segments in sorted(
+            self._SYNTHETIC_INPUTS.items()):
+          if expression not in parser_filter_expressions:
+            continue
+
+          path = os.path.join(self._test_data_path, *path_segments)
+          if not os.path.isfile(path):
+            print(f'Missing synthetic benchmark input: {path:s}.')
+            continue
+
+          output_path = os.path.join(temporary_directory, path_segments[-1])
+          self._GenerateSyntheticInput(path, output_path, synthetic_size)
+
+          result = self._RunSyntheticBenchmark(expression, output_path)
+          if result:
+            synthetic_results[expression] = result
+
+        if 'systemd_journal' in parser_filter_expressions:
+          output_path = os.path.join(temporary_directory, 'system.journal')
+          systemd_journal_writer = parsers_test_lib.SystemdJournalWriter()
+          systemd_journal_writer.WriteFile(output_path, synthetic_size)
+
+          result = self._RunSyntheticBenchmark('systemd_journal', output_path)
+          if result:
+            synthetic_results['systemd_journal'] = result
+
+        if 'mft' in parser_filter_expressions:
+          output_path = os.path.join(temporary_directory, '$MFT')
+          if self._GenerateSyntheticMFT(output_path, synthetic_size):
+            partitioned_result = _RunBenchmarkProcess(
+                self._BenchmarkMFTPartitions, output_path)
+
+            result = self._RunSyntheticBenchmark('mft', output_path)
+            if result:
+              synthetic_results['mft'] = result
+
+            if not partitioned_result:
+              print('Synthetic benchmark of: mft (partitioned) failed.')
+            else:
+              _PrintResult('mft (synthetic, partitioned)', partitioned_result)
+              synthetic_results['mft (partitioned)'] = partitioned_result
+
+              if result and partitioned_result['critical_path_duration']:
+                speedup = result['duration'] / (
+                    partitioned_result['critical_path_duration'])
+                number_of_partitions = partitioned_result[
+                    'number_of_partitions']
+                print((
+                    f'mft (synthetic, partitioned): critical path: '
+                    f'{partitioned_result["critical_path_duration"]:.3f}s, '
+                    f'estimated speedup with {number_of_partitions:d} '
+                    f'parallel tasks: {speedup:.1f}x'))
+
+        if 'usnjrnl' in parser_filter_expressions:
+          output_path = os.path.join(temporary_directory, 'UsnJrnl')
+          if self._GenerateSyntheticUSNChangeJournal(
+              output_path, synthetic_size):
+            result = _RunBenchmarkProcess(
+                self._BenchmarkUSNChangeJournalPartitions, output_path)
+            os.remove(output_path)
+
+            if not result:
+              print('Synthetic benchmark of: usnjrnl (partitioned) failed.')
+            else:
+              _PrintResult('usnjrnl (synthetic, partitioned)', result)
+              synthetic_results['usnjrnl (partitioned)'] = result
+
+              print((
+                  f'usnjrnl (synthetic, partitioned): critical path: '
+                  f'{result["critical_path_duration"]:.3f}s with '
+                  f'{result["number_of_partitions"]:d} partitions'))
+
+    return results, synthetic_results
+
+
+class StorageBenchmark(object):
+  """Benchmarks writing and iterating events of a synthetic storage file.
+
+  The events of the synthetic storage file are added in random chronological
+  order, so that they need to be sorted. Every benchmark is run in a separate
+  process, so that its peak memory usage can be determined.
+  """
+
+  # Memory limit of the external merge sort, which is smaller than needed to
+  # sort the sort keys of the events in memory, so that runs are written to
+  # the scratch directory.
+  _EXTERNAL_SORT_MEMORY_LIMIT = 16 * 1024 * 1024
+
+  def _BenchmarkInMemoryEvents(self, path, result_queue):
+    """Benchmarks reading all events into memory.
+
+    The peak memory usage of this benchmark is dominated by the memory used
+    by the event attribute containers.
+
+    Args:
+      path (str): path of the storage file.
+      result_queue (multiprocessing.Queue): queue to report the result to.
+    """
+    storage_reader = storage_factory.StorageFactory.CreateStorageReaderForFile(
+        path)
+
+    start_time = time.perf_counter()
+
+    try:
+      in_memory_events = list(storage_reader.GetAttributeContainers(
+          events.EventObject.CONTAINER_TYPE))
+
+    finally:
+      storage_reader.Close()
+
+    duration = time.perf_counter() - start_time
+    number_of_events = len(in_memory_events)
+
+    result_queue.put({
+        'duration': duration,
+        'events_per_second': number_of_events / duration if duration else 0.0,
+        'number_of_events': number_of_events,
+        'peak_rss': _GetPeakRSS()})
+
+  def _BenchmarkSortedEvents(
+      self, path, memory_limit, scratch_path, result_queue):
+    """Benchmarks sorted event iteration.
+
+    Args:
+      path (str): path of the storage file.
+      memory_limit (int): memory limit of the external merge sort in bytes,
+          where 0 represents the events are sorted by the storage file.
+      scratch_path (str): path of the scratch directory of the external
+          merge sort.
+      result_queue (multiprocessing.Queue): queue to report the result to.
+    """
+    storage_reader = storage_factory.StorageFactory.CreateStorageReaderForFile(
+        path)
+
+    if memory_limit:
+      storage_reader.SetExternalSort(memory_limit, scratch_path=scratch_path)
+
+    number_of_events = 0
+    last_timestamp = None
+    sorted_in_order = True
+
+    start_time = time.perf_counter()
+
+    try:
+      for event in storage_reader.GetSortedEvents():
+        if last_timestamp is not None and event.timestamp < last_timestamp:
+          sorted_in_order = False
+        last_timestamp = event.timestamp
+        number_of_events += 1
+
+    finally:
+      storage_reader.Close()
+
+    duration = time.perf_counter() - start_time
+
+    result_queue.put({
+        'duration': duration,
+        'events_per_second': number_of_events / duration if duration else 0.0,
+        'number_of_events': number_of_events,
+        'peak_rss': _GetPeakRSS(),
+        'sorted_in_order': sorted_in_order})
+
+  def _BenchmarkWriteEvents(
+      self, path, number_of_events, storage_type, result_queue):
+    """Benchmarks writing events to a storage file.
+
+    Args:
+      path (str): path of the storage file.
+      number_of_events (int): number of events to write.
+      storage_type (str): storage type.
+      result_queue (multiprocessing.Queue): queue to report the result to.
+    """
+    start_time = time.perf_counter()
+
+    self._GenerateSyntheticStorageFile(
+        path, number_of_events, storage_type=storage_type)
+
+    duration = time.perf_counter() - start_time
+
+    result_queue.put({
+        'duration': duration,
+        'events_per_second': number_of_events / duration if duration else 0.0,
+        'number_of_events': number_of_events,
+        'peak_rss': _GetPeakRSS()})
+
+  def _GenerateSyntheticStorageFile(
+      self, path, number_of_events,
+      storage_type=definitions.STORAGE_TYPE_SESSION):
+    """Generates a synthetic storage file.
+
+    Args:
+      path (str): path of the storage file.
+      number_of_events (int): number of events to add.
+      storage_type (Optional[str]): storage type.
+    """
+    random_generator = random.Random(number_of_events)
+
+    if storage_type == definitions.STORAGE_TYPE_TASK:
+      storage_writer = storage_factory.StorageFactory.CreateTaskStorageWriter(
+          definitions.STORAGE_FORMAT_SQLITE)
+    else:
+      storage_writer = storage_factory.StorageFactory.CreateStorageWriter(
+          definitions.DEFAULT_STORAGE_FORMAT)
+
+    storage_writer.Open(path=path)
+
+    try:
+      event_data = events.EventData(data_type='test:event')
+      storage_writer.AddAttributeContainer(event_data)
+
+      event_data_identifier = event_data.GetIdentifier()
+
+      for _ in range(number_of_events):
+        event = events.EventObject()
+        event.timestamp = random_generator.randint(
+            1000000000000000, 1700000000000000)
+        event.timestamp_desc = definitions.TIME_DESCRIPTION_WRITTEN
+        event.SetEventDataIdentifier(event_data_identifier)
+        storage_writer.AddAttributeContainer(event)
+
+    finally:
+      storage_writer.Close()
+
+  def Run(self, number_of_events):
+    """Runs the storage benchmarks.
+
+    Args:
+      number_of_events (int): number of events of the synthetic storage file.
+
+    Returns:
+      dict[str, object]: results of the benchmarks per name.
+    """
+    results = {}
+
+    with tempfile.TemporaryDirectory() as temporary_directory:
+      for storage_type in (
+          definitions.STORAGE_TYPE_SESSION, definitions.STORAGE_TYPE_TASK):
+        name = f'write events ({storage_type:s} storage)'
+        path = os.path.join(temporary_directory, f'{storage_type:s}.plaso')
+        result = _RunBenchmarkProcess(
+            self._BenchmarkWriteEvents, path, number_of_events, storage_type)
+
+        if os.path.exists(path):
+          os.remove(path)
+
+        if not result:
+          print(f'Benchmark of: {name:s} failed.')
+          continue
+
+        results[name] = result
+        _PrintResult(name, result)
+
+      path = os.path.join(temporary_directory, 'benchmark.plaso')
+      self._GenerateSyntheticStorageFile(path, number_of_events)
+
+      name = 'in-memory events'
+      result = _RunBenchmarkProcess(self._BenchmarkInMemoryEvents, path)
+      if not result:
+        print(f'Benchmark of: {name:s} failed.')
+      else:
+        results[name] = result
+        _PrintResult(name, result)
+
+      for name, memory_limit in (
+          ('sorted events', 0),
+          ('sorted events (external sort)', self._EXTERNAL_SORT_MEMORY_LIMIT)):
+        result = _RunBenchmarkProcess(
+            self._BenchmarkSortedEvents, path, memory_limit,
+            temporary_directory)
+        if not result:
+          print(f'Benchmark of: {name:s} failed.')
+          continue
+
+        if not result['sorted_in_order']:
+          print(f'Benchmark of: {name:s} returned events out of order.')
+
+        results[name] = result
+        _PrintResult(name, result)
+
+    return results
+
+
+class ToolsBenchmark(object):
+  """Benchmarks complete log2timeline and psort runs."""
+
+  def __init__(self, tools_path):
+    """Initializes a tools benchmark.
+
+    Args:
+      tools_path (str): path of the directory that contains the tool scripts.
+    """
+    super(ToolsBenchmark, self).__init__()
+    self._tools_path = tools_path
+
+  def _RunTool(self, tool_name, arguments):
+    """Runs a tool.
+
+    Args:
+      tool_name (str): name of the tool, such as "log2timeline".
+      arguments (list[str]): command line arguments of the tool.
+
+    Returns:
+      tuple[float, int]: duration in seconds and peak memory usage in bytes
+          of the tool, where the peak memory usage is that of the largest
+          process of the tool or None if not available.
+
+    Raises:
+      RuntimeError: if the tool failed.
+    """
+    script_path = os.path.join(self._tools_path, f'{tool_name:s}.py')
+    command = [sys.executable, script_path]
+    command.extend(arguments)
+
+    peak_rss = None
+
+    with tempfile.TemporaryFile() as error_file_object:
+      start_time = time.perf_counter()
+
+      process = subprocess.Popen(  # pylint: disable=consider-using-with
+          command, stdout=subprocess.DEVNULL, stderr=error_file_object)
+
+      if hasattr(os, 'wait4'):
+        # The resource usage of the tool contains the maximum resident set
+        # size of its largest process, including its worker processes.
+        _, status, resource_usage = os.wait4(process.pid, 0)
+        process.returncode = os.waitstatus_to_exitcode(status)
+        peak_rss = _NormalizeMaximumResidentSetSize(resource_usage.ru_maxrss)
+      else:
+        process.wait()
+
+      duration = time.perf_counter() - start_time
+
+      if process.returncode != 0:
+        error_file_object.seek(0, os.SEEK_SET)
+        error_output = error_file_object.read().decode(
+            'utf-8', errors='replace')
+        raise RuntimeError(
+            f'{tool_name:s} failed with exit code: {process.returncode:d} '
+            f'and output:\n{error_output:s}')
+
+    return duration, peak_rss
+
+  def Run(self, source_path, log2timeline_options=None, psort_options=None):
+    """Runs the tools benchmarks.
+
+    Args:
+      source_path (str): path of the source to extract events from.
+      log2timeline_options (Optional[str]): additional command line options
+          of log2timeline.
+      psort_options (Optional[str]): additional command line options of
+          psort.
+
+    Returns:
+      dict[str, object]: results of the benchmarks per tool.
+
+    Raises:
+      RuntimeError: if a tool failed.
+    """
+    results = {}
+
+    with tempfile.TemporaryDirectory() as temporary_directory:
+      storage_file = os.path.join(temporary_directory, 'benchmark.plaso')
+
+      arguments = [
+          '--logfile', os.path.join(temporary_directory, 'log2timeline.log'),
+          '--quiet', '--status_view', 'none', '--storage_file', storage_file,
+          '--unattended']
+      arguments.extend(shlex.split(log2timeline_options or ''))
+      arguments.append(source_path)
+
+      duration, peak_rss = self._RunTool('log2timeline', arguments)
+
+      storage_reader = (
+          storage_factory.StorageFactory.CreateStorageReaderForFile(
+              storage_file))
+      try:
+        number_of_events = storage_reader.GetNumberOfAttributeContainers(
+            'event')
+      finally:
+        storage_reader.Close()
+
+      results['log2timeline'] = {
+          'duration': duration,
+          'events_per_second': number_of_events / duration if duration else 0.0,
+          'number_of_events': number_of_events,
+          'peak_rss': peak_rss}
+      _PrintResult('log2timeline', results['log2timeline'])
+
+      arguments = [
+          '--logfile', os.path.join(temporary_directory, 'psort.log'),
+          '--output_format', 'null', '--quiet', '--status_view', 'none',
+          '--unattended']
+      arguments.extend(shlex.split(psort_options or ''))
+      arguments.append(storage_file)
+
+      duration, peak_rss = self._RunTool('psort', arguments)
+
+      results['psort'] = {
+          'duration': duration,
+          'events_per_second': number_of_events / duration if duration else 0.0,
+          'number_of_events': number_of_events,
+          'peak_rss': peak_rss}
+      _PrintResult('psort', results['psort'])
+
+    return results
+
+
+def _GetPeakRSS():
+  """Retrieves the peak memory usage of the current process.
+
+  Returns:
+    int: maximum resident set size in bytes or None if not available.
+  """
+  if not resource:
+    return None
+
+  peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+  return _NormalizeMaximumResidentSetSize(peak_rss)
+
+
+def _NormalizeMaximumResidentSetSize(maximum_resident_set_size):
+  """Normalizes a maximum resident set size to bytes.
+
+  Args:
+    maximum_resident_set_size (int): maximum resident set size as reported by
+        getrusage, which is in bytes on Mac OS and in kilobytes otherwise.
+
+  Returns:
+    int: maximum resident set size in bytes.
+  """
+  if sys.platform == 'darwin':
+    return maximum_resident_set_size
+
+  return maximum_resident_set_size * 1024
+
+
+def _PrintResult(name, result):
+  """Prints the result of a benchmark.
+
+  Args:
+    name (str): name of the benchmark.
+    result (dict[str, object]): result of the benchmark.
+  """
+  peak_rss = result.get('peak_rss', None)
+  if peak_rss is None:
+    peak_rss_string = 'N/A'
+  else:
+    peak_rss_string = f'{peak_rss / (1024 * 1024):.1f} MiB'
+
+  values = [
+      f'{result["duration"]:.3f}s',
+      f'{result["events_per_second"]:.1f} events/s']
+
+  bytes_per_second = result.get('bytes_per_second', None)
+  if bytes_per_second is not None:
+    values.append(f'{bytes_per_second / 1024:.1f} KiB/s')
+
+  values.append(f'peak RSS: {peak_rss_string:s}')
+
+  print(f'{name:s}: {", ".join(values):s}')
+
+
+def _RunBenchmarkProcess(target, *args):
+  """Runs a benchmark in a separate process.
+
+  Args:
+    target (function): function that runs the benchmark, which is passed
+        the arguments followed by the queue to report the result to.
+    args (list[object]): arguments of the function.
+
+  Returns:
+    dict[str, object]: result of the benchmark or None if the benchmark
+        failed.
+  """
+  result_queue = multiprocessing.Queue()
+  process = multiprocessing.Process(
+      target=target, args=(*args, result_queue))
+  process.start()
+
+  result = None
+  while result is None and (process.is_alive() or not result_queue.empty()):
+    try:
+      result = result_queue.get(timeout=1.0)
+    except queue.Empty:
+      pass
+
+  process.join()
+
+  return result
+
+
+def Main():
+  """The main program function.
+
+  Returns:
+    bool: True if successful and no regressions were detected or False if not.
+  """
+  data_path = os.path.join(os.path.dirname(os.path.dirname(
+      os.path.abspath(__file__))), 'test_data')
+  tools_path = os.path.join(os.path.dirname(plaso.__file__), 'scripts')
+
+  argument_parser = argparse.ArgumentParser(description=(
+      'Benchmarks the performance of the parsers and tools.'))
+
+  argument_parser.add_argument(
+      '--baseline', dest='baseline', type=str, action='store',
+      metavar='PATH', default=None, help=(
+          'path of a JSON file with the results of a previous run, to compare '
+          'the results against.'))
+
+  argument_parser.add_argument(
+      '--log2timeline_options', '--log2timeline-options',
+      dest='log2timeline_options', type=str, action='store', default='',
+      metavar='OPTIONS', help=(
+          'additional command line options of log2timeline, for example: '
+          '--log2timeline_options="--workers 4".'))
+
+  argument_parser.add_argument(
+      '--maximum_memory_increase', '--maximum-memory-increase',
+      dest='maximum_memory_increase', type=float, action='store', default=20.0,
+      metavar='PERCENTAGE', help=(
+          'maximum increase of the peak memory usage compared to the baseline '
+          'before it is considered a regression.'))
+
+  argument_parser.add_argument(
+      '--maximum_slowdown', '--maximum-slowdown', dest='maximum_slowdown',
+      type=float, action='store', default=20.0, metavar='PERCENTAGE', help=(
+          'maximum increase of the duration or decrease of the throughput '
+          'compared to the baseline before it is considered a regression.'))
+
+  argument_parser.add_argument(
+      '--minimum_duration', '--minimum-duration', dest='minimum_duration',
+      type=float, action='store', default=0.5, metavar='SECONDS', help=(
+          'minimum duration of a baseline benchmark for its duration and '
+          'throughput to be compared.'))
+
+  argument_parser.add_argument(
+      '--no_tools', '--no-tools', dest='no_tools', action='store_true',
+      default=False, help='do not benchmark log2timeline and psort.')
+
+  argument_parser.add_argument(
+      '-o', '--output', dest='output', type=str, action='store',
+      metavar='PATH', default=None, help=(
+          'path of the JSON file to write the results to.'))
+
+  argument_parser.add_argument(
+      '--parsers', dest='parsers', type=str, action='store', default=None,
+      metavar='EXPRESSION', help=(
+          'parser filter expression of the parsers and plugins to benchmark, '
+          'where by default all parsers and plugins are benchmarked. Use '
+          '"none" to not benchmark parsers.'))
+
+  argument_parser.add_argument(
+      '--psort_options', '--psort-options', dest='psort_options', type=str,
+      action='store', default='', metavar='OPTIONS', help=(
+          'additional command line options of psort, for example: '
+          '--psort_options="--analysis tagging".'))
+
+  argument_parser.add_argument(
+      '--sorted_events', '--sorted-events', dest='sorted_events', type=int,
+      action='store', default=100000, metavar='NUMBER', help=(
+          'number of events of the synthetic storage file to benchmark sorted '
+          'and in-memory event iteration with, where 0 disables the storage '
+          'benchmarks.'))
+
+  argument_parser.add_argument(
+      '--source', dest='source', type=str, action='store', default=data_path,
+      metavar='PATH', help=(
+          'path of the source to benchmark log2timeline and psort with, where '
+          'by default the test data directory is used.'))
+
+  argument_parser.add_argument(
+      '--synthetic_size', '--synthetic-size', dest='synthetic_size', type=int,
+      action='store', default=16, metavar='MIB', help=(
+          'size of the synthetic inputs in MiB, where 0 disables the '
+          'benchmarks on synthetic inputs.'))
+
+  argument_parser.add_argument(
+      'test_data', nargs='?', action='store', metavar='PATH',
+      default=data_path, help='path of the test data directory.')
+
+  options = argument_parser.parse_args()
+
+  if not os.path.isdir(options.test_data):
+    print(f'No such test data directory: {options.test_data:s}')
+    print('')
+    return False
+
+  baseline = None
+  if options.baseline:
+    try:
+      with open(options.baseline, 'r', encoding='utf-8') as file_object:
+        baseline = json.load(file_object)
+    except (IOError, ValueError) as exception:
+      print(f'Unable to read baseline: {options.baseline:s} with error: '
+            f'{exception!s}')
+      print('')
+      return False
+
+  results = {
+      'metadata': {
+          'date_time': datetime.datetime.now(
+              datetime.timezone.utc).isoformat(),
+          'platform': platform.platform(),
+          'plaso_version': plaso.__version__,
+          'python_version': platform.python_version()}}
+
+  if options.parsers != 'none':
+    parsers_benchmark = ParsersBenchmark(options.test_data)
+    results['parsers'], results['synthetic'] = parsers_benchmark.Run(
+        parser_filter_expression=options.parsers,
+        synthetic_size=options.synthetic_size * 1024 * 1024)
+
+  if options.sorted_events > 0:
+    storage_benchmark = StorageBenchmark()
+    results['storage'] = storage_benchmark.Run(options.sorted_events)
+
+  if not options.no_tools:
+    tools_benchmark = ToolsBenchmark(tools_path)
+    try:
+      results['tools'] = tools_benchmark.Run(
+          options.source, log2timeline_options=options.log2timeline_options,
+          psort_options=options.psort_options)
+    except RuntimeError as exception:
+      print(exception)
+      print('')
+      return False
+
+  if options.output:
+    with open(options.output, 'w', encoding='utf-8') as file_object:
+      json.dump(results, file_object, indent=2, sort_keys=True)
+
+  if baseline:
+    comparer = BenchmarkResultsComparer(
+        maximum_memory_increase=options.maximum_memory_increase,
+        maximum_slowdown=options.maximum_slowdown,
+        minimum_duration=options.minimum_duration)
+    regressions = comparer.Compare(results, baseline)
+    if regressions:
+      print('')
+      print('Performance regressions compared to the baseline:')
+      for regression in regressions:
+        print(f'  {regression:s}')
+      print('')
+      return False
+
+  return True
+
+
+if __name__ == '__main__':
+  if not Main():
+    sys.exit(1)
+  else:
+    sys.exit(0)
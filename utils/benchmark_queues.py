@@ -0,0 +1,400 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Script to benchmark the throughput of the ZeroMQ queues.
+
+The script transfers events, as used by the analysis event queues, and tasks,
+as used by the extraction task queue, from the main process to a consumer
+process and compares items sent individually with items sent in batches.
+
+The script also transfers events to multiple consumer processes, as used by
+analysis processes, and compares a batched ZeroMQ queue per consumer process
+with a shared memory broadcast queue that is read by all consumer processes.
+"""
+
+import argparse
+import multiprocessing
+import sys
+import time
+
+from dfdatetime import posix_time as dfdatetime_posix_time
+
+from dfvfs.lib import definitions as dfvfs_definitions
+from dfvfs.path import factory as path_spec_factory
+
+from plaso.containers import events
+from plaso.containers import tasks
+from plaso.multi_process import plaso_queue
+from plaso.multi_process import shared_memory_queue
+from plaso.multi_process import zeromq_queue
+
+
+def _CreateEvent(index):
+  """Creates an event, as pushed onto an analysis event queue.
+
+  Args:
+    index (int): index of the event.
+
+  Returns:
+    tuple[EventObject, EventData, EventDataStream]: event, event data and
+        event data stream.
+  """
+  path_spec = path_spec_factory.Factory.NewPathSpec(
+      dfvfs_definitions.TYPE_INDICATOR_OS,
+      location=f'/var/log/syslog.{index % 16:d}')
+
+  event_data_stream = events.EventDataStream()
+  event_data_stream.path_spec = path_spec
+
+  event_data = events.EventData(data_type='syslog:line')
+  event_data.body = f'Test message: {index:d}'
+  event_data.hostname = 'myhost'
+  event_data.parser = 'text/syslog'
+  event_data.pid = 1234
+  event_data.reporter = 'test'
+
+  event = events.EventObject()
+  event.date_time = dfdatetime_posix_time.PosixTime(
+      timestamp=1600000000 + index)
+  event.timestamp = event.date_time.GetPlasoTimestamp()
+  event.timestamp_desc = 'Content Modification Time'
+
+  return event, event_data, event_data_stream
+
+
+def _CreateTask(index):
+  """Creates a task, as pushed onto the extraction task queue.
+
+  Args:
+    index (int): index of the task.
+
+  Returns:
+    Task: task.
+  """
+  task = tasks.Task(session_identifier='0123456789abcdef0123456789abcdef')
+  task.file_entry_type = dfvfs_definitions.FILE_ENTRY_TYPE_FILE
+  task.path_spec = path_spec_factory.Factory.NewPathSpec(
+      dfvfs_definitions.TYPE_INDICATOR_OS, location=f'/tmp/file{index:d}')
+  task.storage_format = 'sqlite'
+  return task
+
+
+def _ConsumeItems(queue_class, maximum_batch_size, port, result_queue):
+  """Pops items off a queue until a QueueAbort is popped.
+
+  Args:
+    queue_class (type): class of the ZeroMQ queue to pop items from.
+    maximum_batch_size (int): maximum batch size of the queue.
+    port (int): port of the queue to connect to.
+    result_queue (multiprocessing.Queue): queue to report the number of
+        popped items to.
+  """
+  pop_queue = queue_class(
+      delay_open=True, linger_seconds=0, maximum_batch_size=maximum_batch_size,
+      name='benchmark consumer', port=port, timeout_seconds=60)
+
+  number_of_items = 0
+  while True:
+    item = pop_queue.PopItem()
+    if item is None or isinstance(item, plaso_queue.QueueAbort):
+      break
+
+    number_of_items += 1
+
+  pop_queue.Close(abort=True)
+  result_queue.put(number_of_items)
+
+
+def _ConsumeSharedMemoryItems(segment_name, reader_index, result_queue):
+  """Pops items off a shared memory broadcast queue until a QueueAbort.
+
+  Args:
+    segment_name (str): name of the shared memory segment of the queue.
+    reader_index (int): index of the reader.
+    result_queue (multiprocessing.Queue): queue to report the number of
+        popped items to.
+  """
+  reader_queue = shared_memory_queue.SharedMemoryBroadcastReaderQueue(
+      segment_name, reader_index, name='benchmark consumer',
+      timeout_seconds=60)
+
+  number_of_items = 0
+  while True:
+    item = reader_queue.PopItem()
+    if isinstance(item, plaso_queue.QueueAbort):
+      break
+
+    number_of_items += 1
+
+  reader_queue.Close()
+  result_queue.put(number_of_items)
+
+
+def _BenchmarkEventBroadcast(items, maximum_batch_size, number_of_consumers):
+  """Benchmarks a shared memory broadcast queue.
+
+  Args:
+    items (list[object]): items to transfer.
+    maximum_batch_size (int): maximum batch size.
+    number_of_consumers (int): number of consumer processes.
+
+  Returns:
+    float: number of seconds it took to transfer the items to all consumers.
+  """
+  writer_queue = shared_memory_queue.SharedMemoryBroadcastWriterQueue(
+      number_of_consumers, maximum_batch_size=maximum_batch_size,
+      name='benchmark event broadcast queue', timeout_seconds=60)
+  writer_queue.Open()
+
+  result_queue = multiprocessing.Queue()
+  processes = []
+  for reader_index in range(number_of_consumers):
+    process = multiprocessing.Process(
+        target=_ConsumeSharedMemoryItems, args=(
+            writer_queue.segment_name, reader_index, result_queue))
+    process.start()
+    processes.append(process)
+
+  start_time = time.perf_counter()
+
+  for item in items:
+    writer_queue.PushItem(item)
+  writer_queue.PushItem(plaso_queue.QueueAbort())
+
+  numbers_of_items = [result_queue.get() for _ in processes]
+  duration = time.perf_counter() - start_time
+
+  for process in processes:
+    process.join()
+  writer_queue.Close(abort=True)
+
+  for number_of_items in numbers_of_items:
+    if number_of_items != len(items):
+      print((f'Event broadcast queue transferred {number_of_items:d} of '
+             f'{len(items):d} items.'))
+
+  return duration
+
+
+def _BenchmarkEventQueues(items, maximum_batch_size, number_of_consumers):
+  """Benchmarks a PUSH and PULL queue pair per consumer process.
+
+  Every item is pushed onto the queue of every consumer process, as the
+  analysis engine does with its analysis processes.
+
+  Args:
+    items (list[object]): items to transfer.
+    maximum_batch_size (int): maximum batch size.
+    number_of_consumers (int): number of consumer processes.
+
+  Returns:
+    float: number of seconds it took to transfer the items to all consumers.
+  """
+  result_queue = multiprocessing.Queue()
+  processes = []
+  push_queues = []
+  for _ in range(number_of_consumers):
+    push_queue = zeromq_queue.ZeroMQPushBindQueue(
+        delay_open=False, linger_seconds=0,
+        maximum_batch_size=maximum_batch_size, name='benchmark event queue',
+        timeout_seconds=60)
+    push_queues.append(push_queue)
+
+    process = multiprocessing.Process(target=_ConsumeItems, args=(
+        zeromq_queue.ZeroMQPullConnectQueue, maximum_batch_size,
+        push_queue.port, result_queue))
+    process.start()
+    processes.append(process)
+
+  start_time = time.perf_counter()
+
+  for item in items:
+    for push_queue in push_queues:
+      push_queue.PushItem(item)
+
+  for push_queue in push_queues:
+    push_queue.PushItem(plaso_queue.QueueAbort())
+
+  numbers_of_items = [result_queue.get() for _ in processes]
+  duration = time.perf_counter() - start_time
+
+  for process in processes:
+    process.join()
+  for push_queue in push_queues:
+    push_queue.Close(abort=True)
+
+  for number_of_items in numbers_of_items:
+    if number_of_items != len(items):
+      print((f'Event queues transferred {number_of_items:d} of '
+             f'{len(items):d} items.'))
+
+  return duration
+
+
+def _BenchmarkEventQueue(items, maximum_batch_size):
+  """Benchmarks a PUSH and PULL queue pair.
+
+  Args:
+    items (list[object]): items to transfer.
+    maximum_batch_size (int): maximum batch size.
+
+  Returns:
+    float: number of seconds it took to transfer the items.
+  """
+  push_queue = zeromq_queue.ZeroMQPushBindQueue(
+      delay_open=False, linger_seconds=0, maximum_batch_size=maximum_batch_size,
+      name='benchmark event queue', timeout_seconds=60)
+
+  result_queue = multiprocessing.Queue()
+  process = multiprocessing.Process(target=_ConsumeItems, args=(
+      zeromq_queue.ZeroMQPullConnectQueue, maximum_batch_size, push_queue.port,
+      result_queue))
+  process.start()
+
+  start_time = time.perf_counter()
+
+  for item in items:
+    push_queue.PushItem(item)
+  push_queue.PushItem(plaso_queue.QueueAbort())
+
+  number_of_items = result_queue.get()
+  duration = time.perf_counter() - start_time
+
+  process.join()
+  push_queue.Close(abort=True)
+
+  if number_of_items != len(items):
+    print((f'Event queue transferred {number_of_items:d} of {len(items):d} '
+           f'items.'))
+
+  return duration
+
+
+def _BenchmarkTaskQueue(items, maximum_batch_size):
+  """Benchmarks a buffered REP and REQ queue pair.
+
+  Args:
+    items (list[object]): items to transfer.
+    maximum_batch_size (int): maximum batch size.
+
+  Returns:
+    float: number of seconds it took to transfer the items.
+  """
+  reply_queue = zeromq_queue.ZeroMQBufferedReplyBindQueue(
+      buffer_max_size=len(items) + 1, delay_open=False, linger_seconds=0,
+      maximum_batch_size=maximum_batch_size, maximum_items=1,
+      name='benchmark task queue', timeout_seconds=60)
+
+  for item in items:
+    reply_queue.PushItem(item)
+  reply_queue.PushItem(plaso_queue.QueueAbort())
+
+  result_queue = multiprocessing.Queue()
+  process = multiprocessing.Process(target=_ConsumeItems, args=(
+      zeromq_queue.ZeroMQRequestConnectQueue, maximum_batch_size,
+      reply_queue.port, result_queue))
+
+  start_time = time.perf_counter()
+
+  process.start()
+  number_of_items = result_queue.get()
+
+  duration = time.perf_counter() - start_time
+
+  process.join()
+  reply_queue.Close(abort=True)
+
+  if number_of_items != len(items):
+    print((f'Task queue transferred {number_of_items:d} of {len(items):d} '
+           f'items.'))
+
+  return duration
+
+
+def Main():
+  """The main program function.
+
+  Returns:
+    bool: True if successful or False if not.
+  """
+  argument_parser = argparse.ArgumentParser(description=(
+      'Benchmarks the throughput of the ZeroMQ queues.'))
+
+  argument_parser.add_argument(
+      '--batch_size', '--batch-size', dest='batch_size', type=int,
+      action='store', default=256, metavar='SIZE', help=(
+          'maximum number of items per batch of the batched queues.'))
+
+  argument_parser.add_argument(
+      '--consumers', dest='consumers', type=str, action='store',
+      default='1,4,8', metavar='NUMBERS', help=(
+          'comma separated numbers of consumer processes to benchmark the '
+          'event broadcast with, where "none" disables the benchmark.'))
+
+  argument_parser.add_argument(
+      '--events', dest='number_of_events', type=int, action='store',
+      default=100000, metavar='NUMBER', help='number of events to transfer.')
+
+  argument_parser.add_argument(
+      '--tasks', dest='number_of_tasks', type=int, action='store',
+      default=10000, metavar='NUMBER', help='number of tasks to transfer.')
+
+  options = argument_parser.parse_args()
+
+  if options.batch_size < 1:
+    print('Invalid batch size value cannot be less than 1.')
+    return False
+
+  numbers_of_consumers = []
+  if options.consumers != 'none':
+    try:
+      numbers_of_consumers = [
+          int(number) for number in options.consumers.split(',')]
+    except ValueError:
+      numbers_of_consumers = [0]
+
+    if min(numbers_of_consumers) < 1:
+      print(f'Invalid consumers value: {options.consumers:s}.')
+      return False
+
+  benchmarks = [
+      ('event queue', _BenchmarkEventQueue, [
+          _CreateEvent(index) for index in range(options.number_of_events)]),
+      ('task queue', _BenchmarkTaskQueue, [
+          _CreateTask(index) for index in range(options.number_of_tasks)])]
+
+  print('Queue\t\tMaximum batch size\tItems\tDuration (s)\tItems per second')
+
+  for name, benchmark_function, items in benchmarks:
+    if not items:
+      continue
+
+    for maximum_batch_size in (1, options.batch_size):
+      duration = benchmark_function(items, maximum_batch_size)
+      items_per_second = len(items) / duration
+      print((f'{name:s}\t{maximum_batch_size:d}\t\t\t{len(items):d}\t'
+             f'{duration:.3f}\t\t{items_per_second:.0f}'))
+
+  if numbers_of_consumers and options.number_of_events:
+    items = benchmarks[0][2]
+
+    print('')
+    print('Broadcast\t\tConsumers\tItems\tDuration (s)\tItems per second')
+
+    for number_of_consumers in numbers_of_consumers:
+      for name, benchmark_function in (
+          ('ZeroMQ queues', _BenchmarkEventQueues),
+          ('shared memory', _BenchmarkEventBroadcast)):
+        duration = benchmark_function(
+            items, options.batch_size, number_of_consumers)
+        items_per_second = len(items) / duration
+        print((f'{name:s}\t\t{number_of_consumers:d}\t\t{len(items):d}\t'
+               f'{duration:.3f}\t\t{items_per_second:.0f}'))
+
+  return True
+
+
+if __name__ == '__main__':
+  if not Main():
+    sys.exit(1)
+  else:
+    sys.exit(0)
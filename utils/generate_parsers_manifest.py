@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Script to generate the parsers and plugins manifest."""
+
+import argparse
+import importlib
+import os
+import pkgutil
+import sys
+
+import plaso
+
+from plaso import parsers
+from plaso.parsers import manager as parsers_manager
+
+
+_MANIFEST_HEADER = '''# -*- coding: utf-8 -*-
+"""The parsers and plugins manifest.
+
+The manifest contains the names, data formats, modules and signatures of
+the parsers and plugins, which allows the parsers manager to answer queries
+and build signature scanners without importing the modules of the parsers.
+
+This file is generated by utils/generate_parsers_manifest.py, do not edit.
+"""
+
+# pylint: disable=line-too-long
+
+'''
+
+
+def _ImportParserModules():
+  """Imports the modules of all parsers and plugins, which registers them."""
+  for module_information in pkgutil.walk_packages(
+      parsers.__path__, prefix=f'{parsers.__name__:s}.'):
+    importlib.import_module(module_information.name)
+
+
+def _WriteManifest(output_writer, parsers_manifest):
+  """Writes the parsers manifest.
+
+  Args:
+    output_writer (file): output writer.
+    parsers_manifest (dict[str, dict[str, object]]): parser descriptors per
+        parser name.
+  """
+  output_writer.write(_MANIFEST_HEADER)
+  output_writer.write('PARSERS = {\n')
+
+  parser_names = sorted(parsers_manifest.keys())
+  for parser_index, parser_name in enumerate(parser_names):
+    parser_descriptor = parsers_manifest[parser_name]
+
+    output_writer.write(f'    {parser_name!r}: {{\n')
+    output_writer.write(
+        f'        \'data_format\': {parser_descriptor["data_format"]!r},\n')
+    output_writer.write(
+        f'        \'module\': {parser_descriptor["module"]!r},\n')
+
+    plugins = parser_descriptor['plugins']
+    if not plugins:
+      output_writer.write(f'        \'plugins\': {plugins!r},\n')
+    else:
+      output_writer.write('        \'plugins\': {\n')
+
+      plugin_names = sorted(plugins.keys())
+      for plugin_index, plugin_name in enumerate(plugin_names):
+        plugin_descriptor = plugins[plugin_name]
+        closing_braces = '}' if plugin_index < len(plugin_names) - 1 else '}}'
+        output_writer.write((
+            f'            {plugin_name!r}: {{\n'
+            f'                \'data_format\': '
+            f'{plugin_descriptor["data_format"]!r},\n'
+            f'                \'module\': {plugin_descriptor["module"]!r}'
+            f'{closing_braces:s},\n'))
+
+    signatures = ', '.join([
+        f'({pattern!r}, {offset!r})'
+        for pattern, offset in parser_descriptor['signatures']])
+    closing_braces = '}' if parser_index < len(parser_names) - 1 else '}}'
+    output_writer.write(
+        f'        \'signatures\': [{signatures:s}]{closing_braces:s}')
+
+    if parser_index < len(parser_names) - 1:
+      output_writer.write(',\n')
+    else:
+      output_writer.write('\n')
+
+
+def Main():
+  """The main program function.
+
+  Returns:
+    bool: True if successful or False if not.
+  """
+  manifest_path = os.path.join(
+      os.path.dirname(plaso.__file__), 'parsers', 'manifest.py')
+
+  argument_parser = argparse.ArgumentParser(description=(
+      'Generates the parsers and plugins manifest.'))
+
+  argument_parser.add_argument(
+      '-o', '--output', dest='output', type=str, action='store',
+      metavar='PATH', default=manifest_path, help=(
+          'path of the manifest file to write, where by default the manifest '
+          'of the parsers package is overwritten.'))
+
+  options = argument_parser.parse_args()
+
+  _ImportParserModules()
+
+  parsers_manifest = parsers_manager.ParsersManager.CreateParsersManifest()
+
+  with open(options.output, 'w', encoding='utf-8') as file_object:
+    _WriteManifest(file_object, parsers_manifest)
+
+  print(f'Wrote manifest of {len(parsers_manifest):d} parsers to: '
+        f'{options.output:s}')
+
+  return True
+
+
+if __name__ == '__main__':
+  if not Main():
+    sys.exit(1)
+  else:
+    sys.exit(0)